@@ -0,0 +1,126 @@
+"""
+Benchmark de compresión de historiales
+
+Genera series de peso y temperatura como las de los sensores y compara
+la codificación estilo Gorilla (SerieComprimida) contra las listas de
+floats planas y los array('d') del buffer de Historial: bytes por
+lectura (instante + valor), tamaño del pickle y lecturas por segundo al
+codificar y decodificar. Se mide con instantes a ritmo fijo (reloj
+virtual del MotorEventos) y con instantes con jitter (hora del sistema).
+
+Uso:
+    python3 benchmarks/benchmark_compresion.py [lecturas] [semilla]
+"""
+
+import os
+import pickle
+import random
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constantes import INTERVALO_SENSOR_PESO, INTERVALO_SENSOR_TEMP
+from entidades.compresion import SerieComprimida
+
+
+def generar_series(lecturas: int, semilla: int, jitter: bool) -> dict:
+    """
+    Genera las series de peso y temperatura de un animal.
+
+    Args:
+        lecturas: Lecturas por serie
+        semilla: Semilla del generador
+        jitter: Si los instantes varían como con la hora del sistema
+
+    Returns:
+        Diccionario serie -> (instantes, valores)
+    """
+    aleatorio = random.Random(semilla)
+    inicio = 1_700_000_000.0
+
+    def instantes(intervalo: float) -> list:
+        actual, salida = inicio, []
+        for _ in range(lecturas):
+            actual += intervalo + (aleatorio.uniform(-0.05, 0.05) if jitter else 0.0)
+            salida.append(actual)
+        return salida
+
+    pesos, peso = [], 250.0
+    for _ in range(lecturas):
+        peso += aleatorio.uniform(0.5, 1.5)
+        pesos.append(peso)
+    temperaturas = [38.5 + aleatorio.uniform(-0.5, 1.5) for _ in range(lecturas)]
+    return {
+        "peso": (instantes(INTERVALO_SENSOR_PESO), pesos),
+        "temperatura": (instantes(INTERVALO_SENSOR_TEMP), temperaturas)
+    }
+
+
+def bytes_lista(instantes: list, valores: list) -> int:
+    """
+    Returns:
+        Bytes de dos listas de floats (contenedores más objetos float)
+    """
+    return (sys.getsizeof(instantes) + sys.getsizeof(valores) +
+            sum(sys.getsizeof(x) for x in instantes) + sum(sys.getsizeof(x) for x in valores))
+
+
+def medir(nombre: str, instantes: list, valores: list):
+    """
+    Imprime tamaño y velocidad de cada codificación para una serie.
+
+    Args:
+        nombre: Nombre de la serie
+        instantes: Instantes de las lecturas
+        valores: Valores de las lecturas
+    """
+    cantidad = len(valores)
+    arreglos = (array('d', instantes), array('d', valores))
+
+    t0 = time.perf_counter()
+    serie = SerieComprimida()
+    serie.extender(instantes, valores)
+    codificar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in serie:
+        pass
+    decodificar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in zip(instantes, valores):
+        pass
+    recorrer_lista = time.perf_counter() - t0
+
+    # Sin pérdida en los valores; instantes al milisegundo
+    assert all(v == original for (_, v), original in zip(serie, valores))
+
+    print(f"  {nombre} ({cantidad:,} lecturas)")
+    print(f"    {'Codificación':<14}{'bytes/lectura':>15}{'pickle B/lect.':>16}")
+    print(f"    {'lista':<14}{bytes_lista(instantes, valores) / cantidad:>15.2f}"
+          f"{len(pickle.dumps((instantes, valores))) / cantidad:>16.2f}")
+    print(f"    {'array(d)':<14}{sum(sys.getsizeof(a) for a in arreglos) / cantidad:>15.2f}"
+          f"{len(pickle.dumps(arreglos)) / cantidad:>16.2f}")
+    print(f"    {'gorilla':<14}{serie.bytes_usados() / cantidad:>15.2f}"
+          f"{len(pickle.dumps(serie)) / cantidad:>16.2f}")
+    print(f"    Codificar: {cantidad / codificar:>12,.0f} lecturas/s")
+    print(f"    Decodificar: {cantidad / decodificar:>10,.0f} lecturas/s "
+          f"(recorrer la lista: {cantidad / recorrer_lista:,.0f} lecturas/s)")
+
+
+def main():
+    """Función principal"""
+    lecturas = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    semilla = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+
+    for jitter in (False, True):
+        print("Instantes con jitter (hora del sistema)" if jitter
+              else "Instantes a ritmo fijo (reloj virtual)")
+        for nombre, (instantes, valores) in generar_series(lecturas, semilla, jitter).items():
+            medir(nombre, instantes, valores)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark de concurrencia: estadísticas del rodeo con sensores en hilos
+
+Pone a leer los sensores de peso y temperatura de un rodeo con el
+PlanificadorSensores (pool de hilos, intervalos muy cortos) y, a la vez,
+hilos "veterinarios" que dan de alta y ponen en tratamiento animales al
+azar, como Veterinario y SaludObserver. Mientras tanto el hilo principal
+llama una y otra vez a FeedlotSystem.verificar_estadisticas, que compara
+EstadisticasRodeo contra un recálculo completo. Al terminar comprueba
+también los agregados de cada corral y el índice por salud. Una
+diferencia (una variación aplicada dos veces por escritores que se
+cruzan) corta el benchmark con FeedlotException o AssertionError.
+
+Uso:
+    python3 benchmarks/benchmark_concurrencia.py [animales] [segundos] [veterinarios]
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entidades.animal import Animal
+from entidades.salud import EstadoSalud
+from entidades.sensor import SensorPeso, SensorTemperatura
+from consola import consola
+from servicios.feedlot_service import FeedlotSystem
+from servicios.planificador_sensores import PlanificadorSensores
+from servicios.reloj_service import Reloj
+
+CAPACIDAD_CORRAL = 50
+INTERVALO_SENSOR = 0.001
+ESTADOS_VETERINARIO = (EstadoSalud.SALUDABLE, EstadoSalud.BAJO_OBSERVACION,
+                       EstadoSalud.EN_TRATAMIENTO | EstadoSalud.FIEBRE)
+
+
+def veterinario(animales, semilla: int, activo: threading.Event, contador: list):
+    """
+    Cambia el estado de salud de animales al azar hasta que se baje activo.
+
+    Args:
+        animales: Animales del rodeo
+        semilla: Semilla propia del hilo
+        activo: Evento que mantiene vivo el hilo
+        contador: Lista de un elemento donde se suman los cambios hechos
+    """
+    generador = random.Random(semilla)
+    cambios = 0
+    while activo.is_set():
+        animal = generador.choice(animales)
+        animal.salud = generador.choice(ESTADOS_VETERINARIO)
+        cambios += 1
+    contador[0] += cambios
+
+
+def verificar_corrales(sistema: FeedlotSystem):
+    """Comprueba los agregados de cada corral y el índice por salud."""
+    for corral in sistema.corrales.values():
+        enfermos = [a for a in corral.animales if a.esta_enfermo()]
+        assert corral.cantidad_enfermos == len(enfermos), corral
+        assert abs(corral.peso_total - sum(a.peso for a in corral.animales)) < 1e-6, corral
+    indexados = {a.id for a in sistema.indices.por_salud(EstadoSalud.ATENCION)}
+    assert indexados == {a.id for a in sistema.animales.values() if a.esta_enfermo()}
+    for animal in sistema.indices.por_salud(EstadoSalud.FIEBRE):
+        assert animal.tiene_condicion(EstadoSalud.FIEBRE), animal
+
+
+def main():
+    """Función principal"""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    segundos = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    veterinarios = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+    consola.configurar(modo="silencioso")
+    sistema = FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+    sistema.usar_planificador(PlanificadorSensores(num_trabajadores=8))
+    animales = [Animal(i + 1, ("Ternero", "Novillo", "Toro")[i % 3], 200.0 + (i % 250))
+                for i in range(cantidad)]
+    sistema.agregar_animales(animales, CAPACIDAD_CORRAL)
+    for animal in animales:
+        sistema.agregar_sensor(SensorPeso(animal, INTERVALO_SENSOR))
+        sistema.agregar_sensor(SensorTemperatura(animal, INTERVALO_SENSOR))
+
+    activo = threading.Event()
+    activo.set()
+    cambios = [0]
+    hilos = [threading.Thread(target=veterinario, args=(animales, semilla, activo, cambios))
+             for semilla in range(veterinarios)]
+    sistema.iniciar_monitoreo()
+    for hilo in hilos:
+        hilo.start()
+
+    verificaciones = 0
+    inicio = time.perf_counter()
+    try:
+        while time.perf_counter() - inicio < segundos:
+            sistema.verificar_estadisticas()
+            verificaciones += 1
+    finally:
+        activo.clear()
+        for hilo in hilos:
+            hilo.join()
+        sistema.detener_monitoreo()
+    sistema.verificar_estadisticas()
+    verificar_corrales(sistema)
+
+    lecturas = sistema.planificador.lecturas_realizadas
+    print(f"Rodeo: {cantidad:,} animales, {len(sistema.sensores):,} sensores, "
+          f"{veterinarios} veterinarios, {segundos:.1f} s")
+    print(f"{'Lecturas de sensores':<32}{lecturas:>12,}")
+    print(f"{'Cambios de salud (veterinarios)':<32}{cambios[0]:>12,}")
+    print(f"{'verificar_estadisticas':<32}{verificaciones:>12,}")
+    print("Estadísticas del rodeo, corrales e índices coinciden con el recálculo")
+
+
+if __name__ == "__main__":
+    main()
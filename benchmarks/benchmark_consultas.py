@@ -0,0 +1,175 @@
+"""
+Benchmark de consultas ad hoc: ConsultaRodeo contra listas por comprensión
+
+Arma un rodeo grande con historial de temperatura y mide cada consulta
+con el motor (que elige entre índices, columnas vectorizadas y objetos)
+y con la lista por comprensión equivalente sobre FeedlotSystem.animales.
+Verifica que den los mismos animales y muestra el plan de cada consulta.
+
+Uso:
+    python3 benchmarks/benchmark_consultas.py [animales] [repeticiones]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entidades.animal import Animal
+from entidades.salud import EstadoSalud
+from consola import consola
+from servicios.consulta_service import UMBRAL_FIEBRE
+from servicios.feedlot_service import FeedlotSystem
+from servicios.reloj_service import Reloj
+
+CAPACIDAD_CORRAL = 500
+LECTURAS = 6
+# Segundos entre lecturas de temperatura (las primeras quedan fuera de las 24 h)
+INTERVALO = 8 * 3600
+
+
+def armar_sistema(cantidad: int) -> FeedlotSystem:
+    """
+    Args:
+        cantidad: Animales del rodeo
+
+    Returns:
+        Sistema con los animales repartidos en corrales y una lectura de
+        temperatura cada INTERVALO; el reloj queda en la última
+    """
+    sistema = FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+    generador = random.Random(42)
+    inicio = sistema.reloj.ahora()
+    instantes = [inicio + INTERVALO * (i + 1) for i in range(LECTURAS)]
+    for numero in range(1, cantidad // CAPACIDAD_CORRAL + 2):
+        sistema.crear_corral(numero, CAPACIDAD_CORRAL)
+    for i in range(cantidad):
+        animal = Animal(i + 1, ("Ternero", "Novillo", "Toro")[i % 3], generador.uniform(180, 420))
+        sistema.agregar_animal(animal, numero_corral=i // CAPACIDAD_CORRAL + 1)
+        animal.actualizar_peso(generador.uniform(0, 30))
+        for instante in instantes:
+            temperatura = generador.gauss(38.6, 0.45)
+            animal.historial_temperatura.append(temperatura, instante)
+            animal.temperatura = temperatura
+        if animal.temperatura >= UMBRAL_FIEBRE:
+            animal.salud = EstadoSalud.FIEBRE
+        animal.racion_actual = ("Normal", "Intensiva", "Mantenimiento")[i % 7 % 3]
+    sistema.reloj.usar(lambda: instantes[-1])
+    return sistema
+
+
+def fiebre_24h(animal: Animal, desde: float) -> bool:
+    """Lo mismo que ConsultaRodeo.con_fiebre, escrito a mano."""
+    return any(t >= UMBRAL_FIEBRE for t in animal.historial_temperatura.rango(desde)[1])
+
+
+def consultas(sistema: FeedlotSystem):
+    """
+    Returns:
+        (nombre, consulta del motor, lista por comprensión) para cada pregunta
+    """
+    animales = sistema.animales
+    desde = sistema.reloj.ahora() - 24 * 3600
+    return (
+        ("Novillos corral 2 <300 kg con fiebre 24 h",
+         sistema.consultar().donde("tipo", "==", "Novillo").donde("corral", "==", 2)
+         .donde("peso", "<", 300).con_fiebre(horas=24),
+         lambda: [a for a in animales.values()
+                  if a.tipo == "Novillo" and sistema.corral_por_animal[a.id] == 2
+                  and a.peso < 300 and fiebre_24h(a, desde)]),
+        ("Toros >=350 kg con ganancia >20",
+         sistema.consultar().donde("tipo", "==", "Toro").donde("peso", ">=", 350)
+         .donde("ganancia", ">", 20),
+         lambda: [a for a in animales.values()
+                  if a.tipo == "Toro" and a.peso >= 350 and a.ganancia_peso_total() > 20]),
+        ("Con fiebre y ración intensiva",
+         sistema.consultar().donde("salud", "tiene", EstadoSalud.FIEBRE)
+         .donde("racion", "==", "Intensiva"),
+         lambda: [a for a in animales.values()
+                  if a.tiene_condicion(EstadoSalud.FIEBRE) and a.racion_actual == "Intensiva"]),
+        ("Temperatura entre 38 y 38.5",
+         sistema.consultar().donde("temperatura", ">=", 38.0).donde("temperatura", "<", 38.5),
+         lambda: [a for a in animales.values() if 38.0 <= a.temperatura < 38.5]),
+    )
+
+
+def agrupamientos(sistema: FeedlotSystem):
+    """
+    Returns:
+        (nombre, consulta del motor, equivalente a mano) para los agregados por grupo
+    """
+    animales = sistema.animales
+
+    def peso_por_tipo():
+        grupos = {}
+        for a in animales.values():
+            fila = grupos.setdefault(a.tipo, [0, 0.0])
+            fila[0] += 1
+            fila[1] += a.peso
+        return {tipo: {"animales": n, "peso_medio": suma / n} for tipo, (n, suma) in grupos.items()}
+
+    def ganancia_por_corral():
+        grupos = {}
+        for a in animales.values():
+            if a.peso < 300:
+                grupos.setdefault(sistema.corral_por_animal[a.id], []).append(a.ganancia_peso_total())
+        return {corral: {"maxima": max(g)} for corral, g in grupos.items()}
+
+    return (
+        ("Cantidad y peso medio por tipo",
+         sistema.consultar().agrupar_por("tipo")
+         .agregar(animales="cantidad", peso_medio=("promedio", "peso")),
+         peso_por_tipo),
+        ("Ganancia máxima por corral (<300 kg)",
+         sistema.consultar().donde("peso", "<", 300).agrupar_por("corral")
+         .agregar(maxima=("maximo", "ganancia")),
+         ganancia_por_corral),
+    )
+
+
+def cronometrar(funcion, repeticiones: int) -> float:
+    """
+    Returns:
+        Milisegundos por llamada
+    """
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def main():
+    """Función principal"""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    consola.configurar(modo="silencioso")
+    inicio = time.perf_counter()
+    sistema = armar_sistema(cantidad)
+    print(f"Rodeo: {cantidad:,} animales en {len(sistema.corrales):,} corrales "
+          f"(armado en {time.perf_counter() - inicio:.1f} s)")
+
+    print(f"\n{'Consulta':<44}{'filas':>8}{'motor (ms)':>13}{'comprensión (ms)':>19}")
+    for nombre, consulta, comprension in consultas(sistema):
+        esperado = sorted(a.id for a in comprension())
+        assert sorted(a.id for a in consulta.animales()) == esperado, nombre
+        motor = cronometrar(consulta.animales, repeticiones)
+        mano = cronometrar(comprension, repeticiones)
+        print(f"{nombre:<44}{len(esperado):>8,}{motor:>13.3f}{mano:>19.1f}")
+    for nombre, consulta, a_mano in agrupamientos(sistema):
+        esperado = a_mano()
+        obtenido = consulta.agrupado()
+        assert obtenido.keys() == esperado.keys(), nombre
+        motor = cronometrar(consulta.agrupado, repeticiones)
+        mano = cronometrar(a_mano, repeticiones)
+        print(f"{nombre:<44}{len(esperado):>8,}{motor:>13.3f}{mano:>19.1f}")
+
+    print("\nPlanes (explicar con analizar=True)")
+    for nombre, consulta, _ in consultas(sistema) + agrupamientos(sistema):
+        print(f"\n{nombre}\n{consulta.explicar(analizar=True)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark de altas, transferencias y bajas de animales
+
+Mide FeedlotSystem.agregar_animal, transferir_animal y remover_animal
+sobre un rodeo grande repartido en corrales. Con el índice por ID de
+cada corral y el índice inverso animal -> corral cada operación es O(1),
+así que el tiempo por animal no debe crecer con el tamaño del rodeo.
+
+Uso:
+    python3 benchmarks/benchmark_corrales.py [animales] [capacidad_corral]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entidades.animal import Animal
+from consola import consola
+from servicios.feedlot_service import FeedlotSystem
+from servicios.reloj_service import Reloj
+
+
+def cronometrar(nombre: str, cantidad: int, operacion):
+    """
+    Ejecuta una operación por animal e imprime el costo.
+
+    Args:
+        nombre: Nombre de la operación
+        cantidad: Animales a procesar
+        operacion: Función que recibe el ID del animal
+    """
+    inicio = time.perf_counter()
+    for id_animal in range(1, cantidad + 1):
+        operacion(id_animal)
+    total = time.perf_counter() - inicio
+    print(f"  {nombre:<26}{total:>9.2f} s{total / cantidad * 1e6:>12.1f} µs/animal")
+
+
+def main():
+    """Función principal"""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    capacidad = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+
+    consola.configurar(modo="silencioso")
+    sistema = FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+    corrales = -(-cantidad // capacidad)
+    for numero in range(1, 2 * corrales + 1):
+        sistema.crear_corral(numero, capacidad)
+
+    print(f"Rodeo: {cantidad:,} animales, {2 * corrales:,} corrales de {capacidad:,}")
+    cronometrar("agregar_animal", cantidad,
+                lambda i: sistema.agregar_animal(Animal(i, "Novillo", 300.0),
+                                                 numero_corral=(i - 1) // capacidad + 1))
+    cronometrar("transferir_animal", cantidad,
+                lambda i: sistema.transferir_animal(i, corrales + (i - 1) // capacidad + 1))
+    cronometrar("obtener_corral_de_animal", cantidad, sistema.obtener_corral_de_animal)
+    cronometrar("remover_animal", cantidad, sistema.remover_animal)
+
+
+if __name__ == "__main__":
+    main()
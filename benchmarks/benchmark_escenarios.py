@@ -0,0 +1,140 @@
+"""
+Benchmark de escenarios: varios feedlots independientes en un proceso
+
+Compara políticas de ración (asignación automática o una ración fija
+para todo el rodeo) con varias semillas. Cada escenario es un
+FeedlotSystem independiente del RegistroFeedlots con su propio
+MotorEventos, y la misma lista de escenarios se corre tres veces:
+uno tras otro, a la vez en hilos del mismo proceso y en un pool de
+procesos. Verifica que las tres den la misma ganancia por escenario
+(los feedlots no comparten estado) y muestra el tiempo de cada forma y
+la ganancia media de cada política. No hace falta
+SingletonMeta.reset_instances entre escenarios.
+
+Uso:
+    python3 benchmarks/benchmark_escenarios.py [dias] [animales] [semillas] [procesos]
+"""
+
+import contextlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constantes import INTERVALO_SENSOR_PESO, INTERVALO_SENSOR_TEMP, INTERVALO_REPORTES
+from entidades.animal import Animal
+from entidades.sensor import SensorPeso, SensorTemperatura
+from servicios.aleatorio_service import FuenteAleatoria
+from consola import consola
+from servicios.motor_eventos import MotorEventos
+from servicios.racion_service import RacionService
+from servicios.registro_service import registro
+
+POLITICAS = ("automatica", "normal", "intensiva")
+CAPACIDAD_CORRAL = 50
+
+
+def simular_escenario(escenario: tuple) -> dict:
+    """
+    Simula un escenario en su propio feedlot y lo saca del registro al terminar.
+
+    Args:
+        escenario: (política de ración, semilla, días, animales)
+
+    Returns:
+        Diccionario con la ganancia total, las lecturas y los segundos reales
+    """
+    politica, semilla, dias, cantidad = escenario
+    nombre = f"{politica}-{semilla}"
+    sistema = registro.obtener(nombre)
+    motor = MotorEventos(semilla)
+    sistema.usar_planificador(motor)
+    sistema.usar_fuente_aleatoria(FuenteAleatoria(semilla))
+
+    animales = [Animal(i + 1, ("Ternero", "Novillo", "Toro")[i % 3], 200.0 + (i % 250))
+                for i in range(cantidad)]
+    sistema.agregar_animales(animales, CAPACIDAD_CORRAL)
+    for animal in animales:
+        sistema.agregar_sensor(SensorPeso(animal, INTERVALO_SENSOR_PESO))
+        sistema.agregar_sensor(SensorTemperatura(animal, INTERVALO_SENSOR_TEMP))
+
+    raciones = RacionService(sistema)
+    if politica != "automatica":
+        for animal in animales:
+            raciones.cambiar_estrategia(animal.id, politica)
+    sistema.iniciar_monitoreo()
+    motor.programar_periodico(raciones.intervalo, raciones._aplicar_raciones,
+                              "raciones", MotorEventos.PRIORIDAD_RACION)
+
+    inicio = time.perf_counter()
+    motor.ejecutar_hasta(dias * INTERVALO_REPORTES)
+    segundos = time.perf_counter() - inicio
+    resultado = sistema.obtener_estadisticas()
+    registro.quitar(nombre)
+    return {
+        "nombre": nombre,
+        "politica": politica,
+        "ganancia_total": resultado["ganancia_total"],
+        "lecturas": motor.obtener_estadisticas()["lecturas_realizadas"],
+        "segundos": segundos
+    }
+
+
+def simular_en_proceso(escenario: tuple) -> dict:
+    """simular_escenario en un proceso trabajador, sin salida por consola."""
+    consola.configurar(modo="silencioso")
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        return simular_escenario(escenario)
+
+
+def main():
+    """Función principal"""
+    dias = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    cantidad = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    semillas = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    procesos = int(sys.argv[4]) if len(sys.argv) > 4 else os.cpu_count() or 1
+
+    consola.configurar(modo="silencioso")
+    escenarios = [(politica, semilla, dias, cantidad)
+                  for politica in POLITICAS for semilla in range(1, semillas + 1)]
+    print(f"{len(escenarios)} escenarios ({len(POLITICAS)} políticas x {semillas} semillas): "
+          f"{dias} días, {cantidad:,} animales cada uno\n")
+
+    corridas = {}
+    tiempos = {}
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        inicio = time.perf_counter()
+        corridas["secuencial"] = [simular_escenario(e) for e in escenarios]
+        tiempos["secuencial"] = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(len(escenarios)) as hilos:
+            corridas["hilos"] = list(hilos.map(simular_escenario, escenarios))
+        tiempos["hilos"] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(procesos) as pool:
+        corridas["procesos"] = list(pool.map(simular_en_proceso, escenarios))
+    tiempos["procesos"] = time.perf_counter() - inicio
+
+    referencia = [r["ganancia_total"] for r in corridas["secuencial"]]
+    for forma, resultados in corridas.items():
+        assert [r["ganancia_total"] for r in resultados] == referencia, forma
+    assert len(registro) == 0
+
+    print(f"{'Forma':<14}{'segundos':>10}{'escenarios/s':>15}")
+    for forma, segundos in tiempos.items():
+        etiqueta = f"procesos ({procesos})" if forma == "procesos" else forma
+        print(f"{etiqueta:<14}{segundos:>10.2f}{len(escenarios) / segundos:>15.2f}")
+
+    print(f"\n{'Política':<14}{'ganancia media (kg)':>22}")
+    for politica in POLITICAS:
+        ganancias = [r["ganancia_total"] for r in corridas["secuencial"] if r["politica"] == politica]
+        print(f"{politica:<14}{sum(ganancias) / len(ganancias):>22.2f}")
+    print("\nLas tres formas dan la misma ganancia en cada escenario")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark de carga masiva: agregar_animales contra agregar_animal uno por uno
+
+Arma camiones de animales de tipos y pesos mezclados y los ingresa de dos
+formas: con FeedlotSystem.agregar_animal, un animal por llamada en
+corrales de 50 asignados en orden de llegada, y con
+FeedlotSystem.agregar_animales, que reparte el camión por tipo y peso. El
+segundo camión entra sobre el rodeo del primero (completa corrales con
+lugar). Informa animales por segundo y qué tan parejos quedan los
+corrales: corrales con un solo tipo y rango de pesos promedio por corral.
+
+Uso:
+    python3 benchmarks/benchmark_ingesta.py [animales_por_camion] [camiones]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entidades.animal import Animal
+from patrones.factory import AnimalFactory
+from consola import consola
+from servicios.feedlot_service import FeedlotSystem
+from servicios.reloj_service import Reloj
+
+CAPACIDAD_CORRAL = 50
+
+
+def camion(cantidad: int, id_inicial: int, generador: random.Random):
+    """
+    Args:
+        cantidad: Animales del camión
+        id_inicial: ID del primero
+        generador: Fuente aleatoria
+
+    Returns:
+        Animales de tipos al azar, con pesos dentro del rango de su tipo
+    """
+    tipos = list(AnimalFactory.TIPOS_CONFIG)
+    animales = []
+    for id_animal in range(id_inicial, id_inicial + cantidad):
+        tipo = generador.choice(tipos)
+        configuracion = AnimalFactory.TIPOS_CONFIG[tipo]
+        peso = generador.uniform(configuracion["peso_min"], configuracion["peso_max"])
+        animales.append(Animal(id_animal, tipo, peso))
+    return animales
+
+
+def uno_por_uno(sistema: FeedlotSystem, animales) -> dict:
+    """Ingresa un animal por llamada, llenando corrales en orden de llegada."""
+    inicio = time.perf_counter()
+    base = max(sistema.corrales, default=0)
+    ocupados = sum(len(corral) for corral in sistema.corrales.values())
+    for i, animal in enumerate(animales, ocupados):
+        sistema.agregar_animal(animal, numero_corral=base + 1 + (i - ocupados) // CAPACIDAD_CORRAL)
+    segundos = time.perf_counter() - inicio
+    return {"segundos": segundos, "animales_por_segundo": len(animales) / segundos}
+
+
+def calidad(sistema: FeedlotSystem):
+    """
+    Returns:
+        (porcentaje de corrales con un solo tipo, rango medio de pesos por corral en kg)
+    """
+    puros = 0
+    rangos = []
+    for corral in sistema.corrales.values():
+        if not len(corral):
+            continue
+        puros += len({animal.tipo for animal in corral.animales}) == 1
+        pesos = [animal.peso for animal in corral.animales]
+        rangos.append(max(pesos) - min(pesos))
+    return puros / len(rangos) * 100, sum(rangos) / len(rangos)
+
+
+def verificar(sistema: FeedlotSystem, esperado: int):
+    """Comprueba que el rodeo quedó completo en todas sus estructuras."""
+    assert len(sistema.animales) == esperado
+    assert len(sistema.corral_por_animal) == esperado
+    assert sum(len(corral) for corral in sistema.corrales.values()) == esperado
+    assert len(sistema.indices) == esperado
+    assert len(sistema.ranking) == esperado
+    if sistema.almacen is not None:
+        assert len(sistema.almacen) == esperado
+    for id_animal, numero in sistema.corral_por_animal.items():
+        assert id_animal in sistema.corrales[numero]
+
+
+def main():
+    """Función principal"""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    camiones = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+
+    consola.configurar(modo="silencioso")
+    print(f"{camiones} camiones de {cantidad:,} animales, corrales de {CAPACIDAD_CORRAL}\n")
+    print(f"{'Método':<22}{'camión':>7}{'segundos':>10}{'animales/s':>13}"
+          f"{'corrales':>10}{'1 tipo (%)':>12}{'rango kg':>10}")
+    for nombre in ("agregar_animal", "agregar_animales"):
+        sistema = FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+        generador = random.Random(7)
+        for numero in range(camiones):
+            animales = camion(cantidad, numero * cantidad + 1, generador)
+            if nombre == "agregar_animal":
+                resultado = uno_por_uno(sistema, animales)
+            else:
+                resultado = sistema.agregar_animales(animales, CAPACIDAD_CORRAL)
+            verificar(sistema, (numero + 1) * cantidad)
+            puros, rango = calidad(sistema)
+            print(f"{nombre:<22}{numero + 1:>7}{resultado['segundos']:>10.3f}"
+                  f"{resultado['animales_por_segundo']:>13,.0f}{len(sistema.corrales):>10,}"
+                  f"{puros:>12.1f}{rango:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
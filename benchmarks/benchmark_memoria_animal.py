@@ -0,0 +1,63 @@
+"""
+Benchmark de memoria por animal
+
+Crea un rodeo sintético, le aplica lecturas y mide los bytes por animal
+en memoria (tracemalloc), la estimación de Animal.tamanio_bytes() y el
+tamaño del pickle que usa PersistenciaService.guardar_estado.
+
+Uso:
+    python3 benchmarks/benchmark_memoria_animal.py [animales] [lecturas_por_animal]
+"""
+
+import os
+import pickle
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entidades.animal import Animal
+
+
+def crear_rodeo(cantidad: int, lecturas: int) -> list:
+    """
+    Crea animales y les aplica lecturas de peso y temperatura.
+
+    Args:
+        cantidad: Animales a crear
+        lecturas: Lecturas por animal
+
+    Returns:
+        Lista de animales
+    """
+    animales = [Animal(i + 1, ("Ternero", "Novillo", "Toro")[i % 3], 200.0 + (i % 250))
+                for i in range(cantidad)]
+    for animal in animales:
+        for k in range(lecturas):
+            animal.actualizar_peso(0.9)
+            animal.actualizar_temperatura(38.6 + k * 0.01)
+    return animales
+
+
+def main():
+    """Función principal"""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    lecturas = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    animales = crear_rodeo(cantidad, lecturas)
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    estimado = sum(animal.tamanio_bytes() for animal in animales) / cantidad
+    serializado = len(pickle.dumps(animales)) / cantidad
+
+    print(f"Rodeo: {cantidad:,} animales, {lecturas} lecturas c/u")
+    print(f"  Memoria medida:     {(despues - antes) / cantidad:,.1f} bytes/animal")
+    print(f"  tamanio_bytes():    {estimado:,.1f} bytes/animal")
+    print(f"  Pickle:             {serializado:,.1f} bytes/animal")
+
+
+if __name__ == "__main__":
+    main()
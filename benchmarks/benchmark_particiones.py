@@ -0,0 +1,65 @@
+"""
+Benchmark de la simulación particionada entre procesos
+
+Simula el mismo rodeo con 1, 2, 4... procesos (SimulacionParticionada)
+durante un lapso virtual y muestra lecturas por segundo y aceleración
+respecto de un solo proceso.
+
+Uso:
+    python3 benchmarks/benchmark_particiones.py [animales] [segundos_virtuales] [procesos...]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entidades.animal import Animal
+from consola import consola
+from servicios.feedlot_service import FeedlotSystem
+from servicios.particion_service import SimulacionParticionada
+from servicios.reloj_service import Reloj
+
+CAPACIDAD_CORRAL = 50
+
+
+def armar_sistema(cantidad: int) -> FeedlotSystem:
+    """
+    Arma un feedlot sintético sin sensores (los crea cada proceso).
+
+    Args:
+        cantidad: Animales del rodeo
+
+    Returns:
+        Sistema con los animales repartidos en corrales
+    """
+    sistema = FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+    for i in range(cantidad):
+        animal = Animal(i + 1, ("Ternero", "Novillo", "Toro")[i % 3], 200.0 + (i % 250))
+        sistema.agregar_animal(animal, numero_corral=i // CAPACIDAD_CORRAL + 1)
+    return sistema
+
+
+def main():
+    """Función principal"""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    duracion = float(sys.argv[2]) if len(sys.argv) > 2 else 60.0
+    procesos = [int(p) for p in sys.argv[3:]] or [1, 2, 4, os.cpu_count() or 1]
+
+    consola.configurar(modo="silencioso")
+    print(f"Rodeo: {cantidad:,} animales | {duracion:.0f}s virtuales | "
+          f"núcleos disponibles: {os.cpu_count()}")
+
+    base = None
+    for n in sorted(set(procesos)):
+        sistema = armar_sistema(cantidad)
+        stats = SimulacionParticionada(sistema, n, semilla=42).ejecutar(duracion)
+        tasa = stats["lecturas_por_segundo"]
+        base = base or tasa
+        print(f"  {stats['procesos']:>3} proceso(s): {stats['lecturas_realizadas']:>12,} lecturas "
+              f"en {stats['tiempo_total']:6.2f}s → {tasa:>10,.0f} lecturas/s "
+              f"(x{tasa / base:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark del PlanificadorSensores
+
+Mide lecturas por segundo, hilos y memoria para rodeos de distinto
+tamaño (2 sensores por animal, como en configurar_feedlot).
+
+Uso:
+    python3 benchmarks/benchmark_planificador.py [segundos] [animales...]
+"""
+
+import contextlib
+import os
+import resource
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entidades.animal import Animal
+from entidades.sensor import SensorPeso, SensorTemperatura
+from servicios.planificador_sensores import PlanificadorSensores
+
+
+def medir(cantidad_animales: int, duracion: float, trabajadores: int = 4) -> dict:
+    """
+    Ejecuta el planificador con un rodeo sintético y mide su rendimiento.
+
+    Args:
+        cantidad_animales: Tamaño del rodeo
+        duracion: Segundos de medición
+        trabajadores: Hilos del pool
+
+    Returns:
+        Diccionario con los resultados
+    """
+    planificador = PlanificadorSensores(trabajadores)
+    for i in range(cantidad_animales):
+        animal = Animal(i, "Novillo", 300.0)
+        planificador.registrar(SensorPeso(animal, 8.0))
+        planificador.registrar(SensorTemperatura(animal, 6.0))
+
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        planificador.iniciar()
+        time.sleep(duracion)
+        hilos = threading.active_count()
+        stats = planificador.obtener_estadisticas()
+        planificador.detener()
+
+    return {
+        "animales": cantidad_animales,
+        "sensores": stats["sensores_registrados"],
+        "lecturas": stats["lecturas_realizadas"],
+        "lecturas_por_segundo": stats["lecturas_por_segundo"],
+        "hilos": hilos,
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    }
+
+
+def main():
+    """Función principal"""
+    duracion = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    tamanios = [int(x) for x in sys.argv[2:]] or [1_000, 10_000, 100_000]
+
+    print(f"{'Animales':>10} {'Sensores':>10} {'Lecturas':>10} "
+          f"{'Lect/s':>10} {'Hilos':>6} {'RSS MB':>8}")
+    print("-"*60)
+    for cantidad in tamanios:
+        r = medir(cantidad, duracion)
+        print(f"{r['animales']:>10,} {r['sensores']:>10,} {r['lecturas']:>10,} "
+              f"{r['lecturas_por_segundo']:>10,.0f} {r['hilos']:>6} {r['rss_mb']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
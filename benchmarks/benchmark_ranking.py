@@ -0,0 +1,123 @@
+"""
+Benchmark del ranking de ganancia
+
+Arma un rodeo grande y mide obtener_mejores_animales con el almacén
+columnar (FeedlotSystem elige entre RankingGanancia y argpartition) y
+sin él (sólo RankingGanancia), contra ordenar todo el rodeo (sorted).
+Entre consultas cambia el peso de una fracción del rodeo, como las
+lecturas que llegan entre dos reportes. Después mide los rankings por
+corral y por tipo, los peores y el puesto de un animal con el rodeo quieto.
+
+Uso:
+    python3 benchmarks/benchmark_ranking.py [animales] [repeticiones]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entidades.animal import Animal
+from consola import consola
+from servicios.feedlot_service import FeedlotSystem
+from servicios.reloj_service import Reloj
+
+CAPACIDAD_CORRAL = 500
+FRACCIONES = (0.0, 0.001, 0.01, 0.1, 1.0)
+
+
+def armar_sistema(cantidad: int) -> FeedlotSystem:
+    """
+    Args:
+        cantidad: Animales del rodeo
+
+    Returns:
+        Sistema con los animales repartidos en corrales
+    """
+    sistema = FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+    generador = random.Random(42)
+    for numero in range(1, cantidad // CAPACIDAD_CORRAL + 2):
+        sistema.crear_corral(numero, CAPACIDAD_CORRAL)
+    for i in range(cantidad):
+        animal = Animal(i + 1, ("Ternero", "Novillo", "Toro")[i % 3], 200.0 + (i % 250))
+        sistema.agregar_animal(animal, numero_corral=i // CAPACIDAD_CORRAL + 1)
+        animal.actualizar_peso(generador.uniform(0, 30))
+    return sistema
+
+
+def cronometrar(consulta, repeticiones: int, antes=None) -> float:
+    """
+    Args:
+        consulta: Función sin argumentos
+        repeticiones: Veces a repetir
+        antes: Función que se ejecuta (sin medir) antes de cada consulta
+
+    Returns:
+        Milisegundos por consulta
+    """
+    total = 0.0
+    for _ in range(repeticiones):
+        if antes is not None:
+            antes()
+        inicio = time.perf_counter()
+        consulta()
+        total += time.perf_counter() - inicio
+    return total / repeticiones * 1000
+
+
+def main():
+    """Función principal"""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    consola.configurar(modo="silencioso")
+    inicio = time.perf_counter()
+    sistema = armar_sistema(cantidad)
+    animales = list(sistema.animales.values())
+    generador = random.Random(7)
+    print(f"Rodeo: {cantidad:,} animales en {len(sistema.corrales):,} corrales "
+          f"(armado en {time.perf_counter() - inicio:.1f} s)")
+
+    referencia = sorted(animales, key=lambda a: (a.ganancia_peso_total(), a.id), reverse=True)[:5]
+    assert sistema.obtener_mejores_animales(5) == referencia
+
+    print("\nTop 5 del rodeo según la fracción del rodeo que cambió de peso")
+    print(f"  {'cambió':>8}{'con almacén (ms)':>19}{'sin almacén (ms)':>19}{'sorted (ms)':>14}")
+    almacen = sistema.almacen
+    for fraccion in FRACCIONES:
+        cambios = int(cantidad * fraccion)
+
+        def pesar():
+            for animal in generador.sample(animales, cambios):
+                animal.actualizar_peso(generador.uniform(0.5, 1.5))
+
+        medidas = []
+        for usar in (almacen, None):
+            if usar is None and almacen is None:
+                medidas.append(f"{'-':>19}")
+                continue
+            sistema.almacen = usar
+            tiempo = cronometrar(lambda: sistema.obtener_mejores_animales(5), repeticiones, pesar)
+            medidas.append(f"{tiempo:>19.3f}")
+        sistema.almacen = almacen
+        ordenar = cronometrar(lambda: sorted(animales, key=lambda a: a.ganancia_peso_total(),
+                                             reverse=True)[:5], repeticiones)
+        print(f"  {fraccion:>8.1%}{medidas[0]}{medidas[1]}{ordenar:>14.1f}")
+
+    # Rodeo quieto: la primera consulta pone al día el ranking
+    sistema.obtener_mejores_animales(5)
+    print("\nOtras consultas (rodeo quieto)")
+    consultas = (
+        ("obtener_peores_animales(5)", lambda: sistema.obtener_peores_animales(5)),
+        ("mejores del corral 1", lambda: sistema.obtener_mejores_animales(5, numero_corral=1)),
+        ("mejores Novillos", lambda: sistema.obtener_mejores_animales(5, tipo="Novillo")),
+        ("posicion del animal 1", lambda: sistema.ranking.posicion(1)),
+    )
+    for nombre, consulta in consultas:
+        print(f"  {nombre:<30}{cronometrar(consulta, repeticiones):>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark de reproducción de históricos CSV
+
+Reproduce un histórico (formato de PersistenciaService.exportar_historico_animales)
+tan rápido como sea posible y mide lecturas y alertas por segundo. Sin
+archivo, genera uno sintético del mismo formato.
+
+Uso:
+    python3 benchmarks/benchmark_replay.py [archivo.csv]
+    python3 benchmarks/benchmark_replay.py --generar [animales] [lecturas_por_animal]
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from consola import consola
+from servicios.feedlot_service import FeedlotSystem
+from servicios.reloj_service import Reloj
+from servicios.replay_service import ReproductorHistorico, ENCABEZADOS_POR_LECTURA
+
+
+def generar_historico(archivo: str, cantidad: int, lecturas: int, semilla: int = 42):
+    """
+    Escribe un histórico sintético con el formato exportado por el sistema.
+
+    Args:
+        archivo: Ruta del CSV a crear
+        cantidad: Animales
+        lecturas: Lecturas de cada serie por animal (sin contar la inicial)
+        semilla: Semilla del generador
+    """
+    generador = random.Random(semilla)
+    with open(archivo, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(ENCABEZADOS_POR_LECTURA)
+        for id_animal in range(1, cantidad + 1):
+            tipo = ("Ternero", "Novillo", "Toro")[id_animal % 3]
+            peso = generador.uniform(150, 450)
+            for i in range(lecturas + 1):
+                temperatura = 38.5 if i == 0 else 38.5 + generador.uniform(-0.5, 1.5)
+                writer.writerow([id_animal, tipo, "peso", i, round(peso, 2), float(i)])
+                writer.writerow([id_animal, tipo, "temperatura", i, round(temperatura, 1), float(i)])
+                peso += generador.uniform(0.5, 1.5)
+
+
+def main():
+    """Función principal"""
+    carpeta = None
+    if len(sys.argv) > 1 and sys.argv[1] != "--generar":
+        archivo = sys.argv[1]
+    else:
+        cantidad = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+        lecturas = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+        carpeta = tempfile.TemporaryDirectory()
+        archivo = os.path.join(carpeta.name, "historico_sintetico.csv")
+        generar_historico(archivo, cantidad, lecturas)
+
+    consola.configurar(modo="silencioso")
+    sistema = FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+
+    try:
+        stats = ReproductorHistorico(sistema, archivo).reproducir()
+    finally:
+        if carpeta:
+            carpeta.cleanup()
+
+    alertas = len(sistema.observador_alertas.alertas)
+    print(f"Histórico: {os.path.basename(stats['archivo'])}")
+    print(f"  Animales creados:   {stats['animales_creados']:,}")
+    print(f"  Lecturas:           {stats['lecturas_reproducidas']:,}")
+    print(f"  Alertas:            {alertas:,}")
+    print(f"  Tiempo real:        {stats['tiempo_real']:.2f} s")
+    print(f"  Lecturas/s:         {stats['lecturas_por_segundo']:,.0f}")
+    print(f"  Alertas/s:          {alertas / stats['tiempo_real']:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
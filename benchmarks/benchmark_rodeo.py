@@ -0,0 +1,142 @@
+"""
+Benchmark de estadísticas del rodeo: índices, columnas (AlmacenRodeo) y objetos
+
+Arma un rodeo grande con FeedlotSystem.agregar_animal y mide
+obtener_estadisticas, obtener_mejores/peores_animales, obtener_animales_alerta,
+obtener_estadisticas_corrales, los filtros por banderas de salud y por
+tipo con los índices secundarios (IndicesRodeo), con el almacén columnar
+y recorriendo los objetos Animal.
+
+Uso:
+    python3 benchmarks/benchmark_rodeo.py [animales] [repeticiones]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entidades.animal import Animal
+from entidades.salud import EstadoSalud
+from consola import consola
+from servicios.feedlot_service import FeedlotSystem
+from servicios.indices_service import IndicesRodeo
+from servicios.reloj_service import Reloj
+
+CAPACIDAD_CORRAL = 50
+
+CONSULTAS = (
+    ("obtener_estadisticas", lambda s: s.obtener_estadisticas()),
+    ("obtener_mejores_animales(5)", lambda s: s.obtener_mejores_animales(5)),
+    ("obtener_peores_animales(5)", lambda s: s.obtener_peores_animales(5)),
+    ("obtener_animales_alerta", lambda s: s.obtener_animales_alerta()),
+    ("obtener_estadisticas_corrales", lambda s: s.obtener_estadisticas_corrales()),
+    ("obtener_animales_por_salud(ENF)",
+     lambda s: s.obtener_animales_por_salud(EstadoSalud.ENFERMO)),
+    ("contar_animales_por_salud(TRAT)",
+     lambda s: s.contar_animales_por_salud(EstadoSalud.EN_TRATAMIENTO)),
+    ("obtener_animales_por_tipo(Toro)", lambda s: s.obtener_animales_por_tipo("Toro")),
+)
+
+
+def armar_sistema(cantidad: int) -> FeedlotSystem:
+    """
+    Arma un feedlot sintético con pesos y temperaturas variados.
+
+    Args:
+        cantidad: Animales del rodeo
+
+    Returns:
+        Sistema con los animales repartidos en corrales
+    """
+    sistema = FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+    generador = random.Random(42)
+    for i in range(cantidad):
+        animal = Animal(i + 1, ("Ternero", "Novillo", "Toro")[i % 3], 200.0 + (i % 250))
+        sistema.agregar_animal(animal, numero_corral=i // CAPACIDAD_CORRAL + 1)
+        animal.peso += generador.uniform(0, 30)
+        animal.temperatura = generador.uniform(37.5, 40.0)
+        if animal.temperatura >= 39.5:
+            animal.salud = EstadoSalud.FIEBRE
+            if i % 4 == 0:
+                animal.salud |= EstadoSalud.EN_TRATAMIENTO
+    return sistema
+
+
+def usar_almacen(sistema: FeedlotSystem, almacen):
+    """
+    Activa o desactiva el almacén columnar en el sistema y sus corrales
+    (los animales siguen en él; sólo cambia cómo se consulta).
+
+    Args:
+        sistema: Sistema del benchmark
+        almacen: AlmacenRodeo del sistema, o None para recorrer objetos
+    """
+    sistema.almacen = almacen
+    for corral in sistema.corrales.values():
+        corral.almacen = almacen
+
+
+def usar_indices(sistema: FeedlotSystem, indices: IndicesRodeo):
+    """
+    Cambia los índices que consulta el sistema; con unos vacíos las
+    consultas recurren al almacén o a los objetos.
+
+    Args:
+        sistema: Sistema del benchmark
+        indices: IndicesRodeo del sistema o uno vacío
+    """
+    sistema.indices = indices
+
+
+def medir(sistema: FeedlotSystem, consulta, repeticiones: int) -> float:
+    """
+    Args:
+        sistema: Sistema a consultar
+        consulta: Función que recibe el sistema
+        repeticiones: Veces a repetir
+
+    Returns:
+        Milisegundos por consulta
+    """
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        consulta(sistema)
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def main():
+    """Función principal"""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    consola.configurar(modo="silencioso")
+    inicio = time.perf_counter()
+    sistema = armar_sistema(cantidad)
+    print(f"Rodeo: {cantidad:,} animales en {len(sistema.corrales):,} corrales "
+          f"(armado en {time.perf_counter() - inicio:.1f} s)")
+    if sistema.almacen is None:
+        print("NumPy no está instalado: no hay almacén columnar para comparar")
+        return
+
+    almacen = sistema.almacen
+    indices = sistema.indices
+    sin_indices = IndicesRodeo()
+    print(f"{'Consulta':<32}{'índices (ms)':>15}{'columnas (ms)':>15}{'objetos (ms)':>15}")
+    for nombre, consulta in CONSULTAS:
+        usar_almacen(sistema, almacen)
+        usar_indices(sistema, indices)
+        indexada = medir(sistema, consulta, repeticiones)
+        usar_indices(sistema, sin_indices)
+        columnas = medir(sistema, consulta, repeticiones)
+        usar_almacen(sistema, None)
+        objetos = medir(sistema, consulta, max(1, repeticiones // 5))
+        print(f"{nombre:<32}{indexada:>15.3f}{columnas:>15.3f}{objetos:>15.1f}")
+    usar_almacen(sistema, almacen)
+    usar_indices(sistema, indices)
+
+
+if __name__ == "__main__":
+    main()
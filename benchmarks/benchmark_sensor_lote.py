@@ -0,0 +1,83 @@
+"""
+Benchmark de SensorLote frente a los sensores individuales
+
+Compara el tiempo por lectura de un corral completo leído con un
+SensorLote contra el mismo corral leído con un SensorPeso y un
+SensorTemperatura por animal. El SensorLote se mide con el corral suelto
+(aplica lectura por lectura) y con los animales en un AlmacenRodeo
+(escribe las columnas de una vez).
+
+Uso:
+    python3 benchmarks/benchmark_sensor_lote.py [animales] [rondas]
+"""
+
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entidades.animal import Animal
+from entidades.corral import Corral
+from entidades.rodeo import AlmacenRodeo
+from entidades import sensor as modulo_sensor
+from entidades.sensor import SensorPeso, SensorTemperatura, SensorLote
+
+
+def crear_corral(cantidad: int, almacen: bool = False) -> Corral:
+    """Crea un corral sin límite práctico de capacidad, opcionalmente en un almacén"""
+    corral = Corral(1, capacidad=cantidad)
+    for i in range(cantidad):
+        corral.agregar_animal(Animal(i, "Novillo", 300.0))
+    if almacen:
+        corral.almacen = AlmacenRodeo(cantidad)
+        corral.almacen.adjuntar_varios(list(corral.animales), corral.numero)
+    return corral
+
+
+def medir_individual(corral: Corral, rondas: int) -> float:
+    """Segundos por ronda con dos sensores por animal"""
+    sensores = []
+    for animal in corral.animales:
+        sensores.append(SensorPeso(animal))
+        sensores.append(SensorTemperatura(animal))
+    inicio = time.perf_counter()
+    for _ in range(rondas):
+        for sensor in sensores:
+            sensor.realizar_lectura()
+    return (time.perf_counter() - inicio) / rondas
+
+
+def medir_lote(corral: Corral, rondas: int) -> float:
+    """Segundos por ronda con un SensorLote"""
+    sensor = SensorLote(corral)
+    inicio = time.perf_counter()
+    for _ in range(rondas):
+        sensor.realizar_lectura()
+    return (time.perf_counter() - inicio) / rondas
+
+
+def main():
+    """Función principal"""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rondas = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        t_individual = medir_individual(crear_corral(cantidad), rondas)
+        t_lote = medir_lote(crear_corral(cantidad), rondas)
+        t_almacen = (medir_lote(crear_corral(cantidad, almacen=True), rondas)
+                     if AlmacenRodeo.disponible() else None)
+
+    motor = "NumPy" if modulo_sensor.np is not None else "listas (sin NumPy)"
+    print(f"Animales: {cantidad:,} | Rondas: {rondas} | SensorLote con {motor}")
+    print(f"  Sensores individuales: {t_individual * 1000:8.1f} ms/ronda")
+    print(f"  SensorLote:            {t_lote * 1000:8.1f} ms/ronda "
+          f"({t_individual / t_lote:.1f}x)")
+    if t_almacen is not None:
+        print(f"  SensorLote + almacén:  {t_almacen * 1000:8.1f} ms/ronda "
+              f"({t_individual / t_almacen:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
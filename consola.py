@@ -0,0 +1,276 @@
+"""
+Consola - Salida por consola con niveles y límites
+
+Concentra la salida de los caminos calientes (lecturas de sensores,
+raciones, alertas, fábrica, veterinario) en un único escritor con
+buffer. Permite filtrar por nivel, limitar mensajes por categoría,
+mostrar resúmenes agregados por ventana de tiempo y silenciar todo,
+para que el rendimiento lo marque la simulación y no la terminal.
+
+Es un módulo neutral, como constantes.py: lo usan las entidades, los
+patrones y los servicios sin que las capas de abajo dependan de
+servicios/. Mientras acumula líneas, sys.stdout pasa por SalidaOrdenada,
+que escribe primero lo pendiente: un print directo (reportes, menús,
+alertas de los observadores) no se adelanta a los mensajes ya emitidos.
+"""
+
+import sys
+import threading
+import time
+from enum import IntEnum
+from typing import Dict
+from excepciones.feedlot_exceptions import FeedlotException
+
+
+class NivelConsola(IntEnum):
+    """Niveles de salida por consola"""
+    DEBUG = 10
+    INFO = 20
+    ALERTA = 30
+    ERROR = 40
+
+
+class SalidaOrdenada:
+    """
+    Envoltorio de un flujo de salida (sys.stdout) que vuelca el buffer
+    de la consola antes de cada escritura directa.
+    """
+
+    def __init__(self, consola: "Consola", destino):
+        """
+        Args:
+            consola: Consola cuyo buffer se vuelca primero
+            destino: Flujo real (el sys.stdout que se envuelve)
+        """
+        self._consola = consola
+        self.destino = destino
+
+    def write(self, texto: str) -> int:
+        self._consola.volcar()
+        return self.destino.write(texto)
+
+    def flush(self):
+        self._consola.volcar()
+        self.destino.flush()
+
+    def __getattr__(self, nombre):
+        return getattr(self.destino, nombre)
+
+
+class Consola:
+    """
+    Escritor de consola con buffer, niveles y límite por categoría.
+
+    Modos:
+    - 'normal': muestra todo (respetando límites configurados)
+    - 'resumen': solo resúmenes periódicos de los caminos calientes,
+      alertas y errores
+    - 'silencioso': no escribe nada (los contadores siguen activos)
+    """
+
+    MODOS = ("normal", "resumen", "silencioso")
+
+    # Descripción de cada categoría para los resúmenes
+    CATEGORIAS = {
+        "sensor_peso": "lecturas de peso",
+        "sensor_temp": "lecturas de temperatura",
+        "sensor_lote": "lotes de sensores",
+        "racion": "mensajes de raciones",
+        "alerta": "alertas",
+        "salud": "acciones de salud",
+        "factory": "creaciones de la fábrica",
+        "veterinario": "mensajes veterinarios",
+        "rodeo": "altas y bajas de animales",
+        "reporte": "líneas de detalle de reportes",
+        "sistema": "mensajes del sistema"
+    }
+
+    # Categorías que el modo 'resumen' reduce a un conteo
+    CATEGORIAS_CALIENTES = ("sensor_peso", "sensor_temp", "sensor_lote", "racion",
+                            "salud", "factory", "veterinario", "rodeo", "reporte")
+
+    def __init__(self):
+        """Inicializa la consola en modo normal, sin límites"""
+        self.modo = "normal"
+        self.nivel_minimo = NivelConsola.DEBUG
+        self.ventana = 5.0
+        self.tamanio_buffer = 1
+        self._limites: Dict[str, int] = {}
+
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._inicio_ventana = time.monotonic()
+
+        # Por categoría: mensajes en la ventana actual y suprimidos
+        self._en_ventana: Dict[str, int] = {}
+        self._suprimidos: Dict[str, int] = {}
+        self._totales: Dict[str, int] = {}
+
+    def configurar(self, modo: str = None, nivel_minimo: NivelConsola = None,
+                   ventana: float = None, tamanio_buffer: int = None):
+        """
+        Configura la consola.
+
+        Args:
+            modo: 'normal', 'resumen' o 'silencioso'
+            nivel_minimo: Nivel mínimo a mostrar
+            ventana: Segundos de cada ventana de resumen
+            tamanio_buffer: Líneas acumuladas antes de escribir (1 = inmediato)
+
+        Raises:
+            FeedlotException: Si el modo no es válido
+        """
+        with self._lock:
+            if modo is not None:
+                if modo not in self.MODOS:
+                    raise FeedlotException(f"Modo de consola no válido: '{modo}'. "
+                                           f"Modos válidos: {', '.join(self.MODOS)}")
+                self.modo = modo
+                # Fuera del modo normal conviene acumular antes de escribir
+                if tamanio_buffer is None:
+                    self.tamanio_buffer = 1 if modo == "normal" else 200
+            if nivel_minimo is not None:
+                self.nivel_minimo = nivel_minimo
+            if ventana is not None:
+                self.ventana = ventana
+            if tamanio_buffer is not None:
+                self.tamanio_buffer = max(1, tamanio_buffer)
+            # Con buffer, los print directos vuelcan antes lo pendiente
+            if self.tamanio_buffer > 1 and not isinstance(sys.stdout, SalidaOrdenada):
+                sys.stdout = SalidaOrdenada(self, sys.stdout)
+
+    def limitar(self, categoria: str, maximo_por_ventana: int = None):
+        """
+        Limita los mensajes de una categoría por ventana de tiempo.
+
+        Args:
+            categoria: Categoría a limitar
+            maximo_por_ventana: Máximo de mensajes visibles (None = sin límite)
+        """
+        with self._lock:
+            if maximo_por_ventana is None:
+                self._limites.pop(categoria, None)
+            else:
+                self._limites[categoria] = maximo_por_ventana
+
+    def _limite(self, categoria: str, nivel: NivelConsola):
+        """Límite efectivo de una categoría según el modo (None = sin límite)"""
+        if self.modo == "silencioso":
+            return 0
+        if (self.modo == "resumen" and categoria in self.CATEGORIAS_CALIENTES
+                and nivel < NivelConsola.ALERTA):
+            return 0
+        return self._limites.get(categoria)
+
+    def mostraria(self, categoria: str, nivel: NivelConsola = NivelConsola.INFO) -> bool:
+        """
+        Indica si un mensaje de la categoría podría mostrarse.
+        Sirve para saltear el armado de bloques de salida costosos.
+
+        Args:
+            categoria: Categoría del mensaje
+            nivel: Nivel del mensaje
+
+        Returns:
+            bool: False si el modo o el nivel lo descartan seguro
+        """
+        return nivel >= self.nivel_minimo and self._limite(categoria, nivel) != 0
+
+    def emitir(self, categoria: str, mensaje: str, *args,
+               nivel: NivelConsola = NivelConsola.INFO, **kwargs):
+        """
+        Emite un mensaje. Con argumentos, el formato (str.format) se
+        aplica solo si el mensaje realmente se muestra.
+
+        Args:
+            categoria: Categoría del mensaje (ver CATEGORIAS)
+            mensaje: Texto o formato del mensaje
+            *args: Argumentos de formato posicionales
+            nivel: Nivel del mensaje
+            **kwargs: Argumentos de formato por nombre
+        """
+        with self._lock:
+            ahora = time.monotonic()
+            if ahora - self._inicio_ventana >= self.ventana:
+                self._cerrar_ventana(ahora)
+
+            self._totales[categoria] = self._totales.get(categoria, 0) + 1
+            emitidos = self._en_ventana.get(categoria, 0)
+            self._en_ventana[categoria] = emitidos + 1
+
+            limite = self._limite(categoria, nivel)
+            if nivel < self.nivel_minimo or (limite is not None and emitidos >= limite):
+                self._suprimidos[categoria] = self._suprimidos.get(categoria, 0) + 1
+                return
+
+            self._buffer.append(mensaje.format(*args, **kwargs)
+                                if args or kwargs else mensaje)
+            if len(self._buffer) >= self.tamanio_buffer:
+                self._escribir()
+
+    def _cerrar_ventana(self, ahora: float):
+        """
+        Emite los resúmenes de la ventana y reinicia los contadores
+        (requiere tener tomado el lock).
+
+        Args:
+            ahora: Momento actual (time.monotonic)
+        """
+        duracion = ahora - self._inicio_ventana
+        if self.modo != "silencioso":
+            for categoria, suprimidos in sorted(self._suprimidos.items()):
+                total = self._en_ventana.get(categoria, 0)
+                descripcion = self.CATEGORIAS.get(categoria, categoria)
+                linea = f"[CONSOLA] {total:,} {descripcion} en los últimos {duracion:.1f}s"
+                if suprimidos < total:
+                    linea += f" ({suprimidos:,} sin mostrar)"
+                self._buffer.append(linea)
+
+        self._en_ventana.clear()
+        self._suprimidos.clear()
+        self._inicio_ventana = ahora
+        self._escribir()
+
+    @staticmethod
+    def _salida():
+        """sys.stdout sin el envoltorio SalidaOrdenada (escribir en él no vuelca)"""
+        salida = sys.stdout
+        return salida.destino if isinstance(salida, SalidaOrdenada) else salida
+
+    def _escribir(self):
+        """Escribe el buffer en stdout (requiere tener tomado el lock)"""
+        if self._buffer:
+            self._salida().write("\n".join(self._buffer) + "\n")
+            self._buffer.clear()
+
+    def volcar(self):
+        """Escribe las líneas pendientes del buffer, sin cerrar la ventana"""
+        with self._lock:
+            self._escribir()
+
+    def vaciar(self):
+        """Cierra la ventana actual (con sus resúmenes) y escribe el buffer"""
+        with self._lock:
+            self._cerrar_ventana(time.monotonic())
+            self._salida().flush()
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Genera estadísticas de la consola.
+
+        Returns:
+            Diccionario con el modo y los mensajes totales por categoría
+        """
+        with self._lock:
+            return {
+                "modo": self.modo,
+                "nivel_minimo": self.nivel_minimo.name,
+                "mensajes_por_categoria": dict(self._totales)
+            }
+
+    def __str__(self):
+        return f"Consola(modo={self.modo}, nivel={self.nivel_minimo.name})"
+
+
+# Instancia compartida por todos los módulos
+consola = Consola()
@@ -3,4 +3,17 @@ INTERVALO_SENSOR_PESO = 8.0
 INTERVALO_SENSOR_TEMP = 6.0
 INTERVALO_RACIONES = 10.0
 INTERVALO_REPORTES = 15.0
-INTERVALO_BACKUP = 40.0
\ No newline at end of file
+INTERVALO_BACKUP = 40.0
+INTERVALO_ESTADO = 20.0
+INTERVALO_VETERINARIO = 30.0
+FACTOR_MUESTREO_ALERTA = 0.5
+FACTOR_MUESTREO_ESTABLE = 2.0
+LECTURAS_ESTABLES = 5
+RETENCION_HISTORIAL = 128
+LECTURAS_POR_BLOQUE = 32
+BLOQUES_RESUMEN = 128
+COMPRIMIR_HISTORIAL = False
+RETENCION_ARCHIVO_HISTORIAL = 4096
+LECTURAS_POR_BLOQUE_COMPRIMIDO = 256
+VERIFICAR_ESTADISTICAS = False
+NOMBRE_FEEDLOT = "Estancia Carnes Finas"
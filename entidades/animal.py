@@ -1,9 +1,199 @@
 """
 Clase Animal - Representa un animal en el feedlot
+
+Representación compacta: __slots__ en lugar de __dict__, campos
+categóricos (tipo, ración) codificados como enteros chicos, estado de
+salud como banderas de bits (EstadoSalud, ver entidades/salud.py),
+fecha de ingreso como timestamp e historiales acotados
+(buffer circular con resumen de largo plazo, ver entidades/historial.py).
+El acceso por atributo y el pickle siguen funcionando igual.
+
+Cada lectura actualiza además estadísticas corrientes (media y desvío
+de Welford, extremos, tendencia reciente del peso, lecturas con fiebre)
+que se consultan en O(1), ver entidades/estadisticas.py.
+
+Los campos numéricos viven en una fila propia mientras el animal está
+suelto; al entrar a un FeedlotSystem pasan a las columnas de su
+AlmacenRodeo (entidades/rodeo.py) y el animal queda como vista.
 """
 
+import sys
+import threading
+import time
 from datetime import datetime
 from typing import Optional
+from entidades.historial import Historial
+from entidades.estadisticas import EstadisticasAnimal
+from entidades.salud import EstadoSalud, estado_salud, texto_salud
+
+
+class Codificador:
+    """
+    Tabla de códigos para un campo categórico.
+    Los valores conocidos tienen código fijo; los nuevos se agregan al final.
+    La búsqueda no toma lock; el alta de un valor nuevo sí, para que dos
+    hilos no le den códigos distintos.
+    """
+    
+    __slots__ = ("valores", "codigos", "_lock")
+    
+    def __init__(self, valores):
+        """
+        Args:
+            valores: Valores conocidos, en orden de código
+        """
+        self.valores = list(valores)
+        self.codigos = {valor: i for i, valor in enumerate(self.valores)}
+        self._lock = threading.Lock()
+    
+    def codificar(self, valor) -> int:
+        """
+        Args:
+            valor: Valor del campo
+            
+        Returns:
+            Código del valor (lo registra si es nuevo)
+        """
+        codigo = self.codigos.get(valor)
+        if codigo is None:
+            with self._lock:
+                codigo = self.codigos.get(valor)
+                if codigo is None:
+                    # El valor va a la lista antes de publicar su código
+                    codigo = len(self.valores)
+                    self.valores.append(valor)
+                    self.codigos[valor] = codigo
+        return codigo
+
+
+TIPOS = Codificador(("Ternero", "Novillo", "Toro"))
+RACIONES = Codificador((None, "Normal", "Intensiva", "Mantenimiento"))
+
+# Valores enteros usados en el camino caliente de actualizar_temperatura
+SALUDABLE = int(EstadoSalud.SALUDABLE)
+ENFERMO_FIEBRE = int(EstadoSalud.FIEBRE)
+ENFERMO_HIPOTERMIA = int(EstadoSalud.HIPOTERMIA)
+
+# Umbrales de temperatura en °C (los usa también AlmacenRodeo.aplicar_lecturas)
+UMBRAL_FIEBRE = 39.5
+UMBRAL_HIPOTERMIA = 37.0
+
+# Columnas de la fila del animal (mismo orden en AlmacenRodeo.columnas)
+COLUMNAS = (
+    ("peso", "f8"),
+    ("peso_inicial", "f8"),
+    ("temperatura", "f8"),
+    ("dias_en_feedlot", "i4"),
+    ("salud", "i2"),
+    ("racion", "i2"),
+    ("tipo", "i2"),
+    ("corral", "i4"),
+)
+(COL_PESO, COL_PESO_INICIAL, COL_TEMPERATURA, COL_DIAS,
+ COL_SALUD, COL_RACION, COL_TIPO, COL_CORRAL) = range(len(COLUMNAS))
+
+
+def _columna(indice: int, doc: str, al_cambiar=None) -> property:
+    """
+    Propiedad que lee y escribe un campo en la fila propia del animal
+    o, si está en un almacén, en la columna correspondiente.
+    
+    Args:
+        indice: Índice de la columna en COLUMNAS
+        doc: Descripción del campo
+        al_cambiar: Función (animal, anterior, nuevo) que se llama en cada
+                    escritura si el animal está en un corral. La lectura
+                    del valor anterior, la escritura y el aviso se hacen
+                    con el lock del corral tomado, así dos hilos que
+                    escriben el mismo campo no aplican la misma variación
+                    dos veces
+        
+    Returns:
+        property
+    """
+    def leer(self):
+        almacen = self._almacen
+        if almacen is None:
+            return self._fila[indice]
+        return almacen.columnas[indice].item(self._slot)
+    
+    def escribir(self, valor):
+        almacen = self._almacen
+        if almacen is None:
+            self._fila[indice] = valor
+            return
+        # Con el lock del almacén: la escritura no se pierde si otro hilo
+        # agranda las columnas o mueve el animal de slot
+        with almacen._lock:
+            if self._almacen is almacen:
+                almacen.columnas[indice][self._slot] = valor
+                return
+        # Se desadjuntó mientras tanto: escribir en la fila propia
+        escribir(self, valor)
+    
+    if al_cambiar is None:
+        return property(leer, escribir, doc=doc)
+    
+    def escribir_y_avisar(self, valor):
+        while True:
+            corral = self._corral
+            if corral is None:
+                escribir(self, valor)
+                return
+            with corral._lock:
+                # Si una transferencia lo movió antes de tomar el lock, el
+                # aviso corresponde al corral nuevo: reintentar con ese
+                if self._corral is not corral:
+                    continue
+                anterior = leer(self)
+                escribir(self, valor)
+                al_cambiar(self, anterior, valor)
+                return
+    
+    return property(leer, escribir_y_avisar, doc=doc)
+
+
+# Avisos al corral para mantener sus agregados, los del rodeo, el
+# ranking de ganancia y los índices secundarios (ver Corral.cambiar_salud,
+# EstadisticasRodeo, RankingGanancia e IndicesRodeo). Se llaman con el
+# lock del corral tomado.
+
+def _avisar_peso(animal, anterior: float, nuevo: float):
+    corral = animal._corral
+    corral.peso_total += nuevo - anterior
+    if corral.rodeo is not None:
+        corral.rodeo.ajustar(animal._tipo, peso=nuevo - anterior)
+    if corral.ranking is not None:
+        corral.ranking.actualizar(animal, nuevo - animal.peso_inicial)
+
+
+def _avisar_salud(animal, anterior: int, nuevo: int):
+    if anterior != nuevo:
+        animal._corral.cambiar_salud(animal, anterior, nuevo)
+
+
+def _avisar_racion(animal, anterior: int, nuevo: int):
+    if anterior != nuevo and animal._corral.indices is not None:
+        animal._corral.indices.cambiar_racion(animal, anterior, nuevo)
+
+
+def _avisar_peso_inicial(animal, anterior: float, nuevo: float):
+    corral = animal._corral
+    if corral.rodeo is not None:
+        corral.rodeo.ajustar(animal._tipo, peso_inicial=nuevo - anterior)
+    if corral.ranking is not None:
+        corral.ranking.actualizar(animal, animal.peso - nuevo)
+
+
+def _avisar_tipo(animal, anterior: int, nuevo: int):
+    corral = animal._corral
+    if corral.rodeo is not None:
+        corral.rodeo.cambiar_tipo(animal, anterior, nuevo)
+    if corral.ranking is not None:
+        corral.ranking.cambiar_tipo(animal, anterior, nuevo)
+    if corral.indices is not None and anterior != nuevo:
+        corral.indices.cambiar_tipo(animal, anterior, nuevo)
+
 
 class Animal:
     """
@@ -11,6 +201,9 @@ class Animal:
     Mantiene información sobre peso, temperatura y salud.
     """
     
+    __slots__ = ("id", "_fila", "_almacen", "_slot", "_corral", "_ingreso",
+                 "historial_peso", "historial_temperatura", "estadisticas", "__weakref__")
+    
     def __init__(self, id_animal: int, tipo: str, peso_inicial: float):
         """
         Inicializa un nuevo animal
@@ -21,17 +214,73 @@ class Animal:
             peso_inicial: Peso inicial en kg
         """
         self.id = id_animal
-        self.tipo = tipo
-        self.peso = peso_inicial
-        self.peso_inicial = peso_inicial
-        self.temperatura = 38.5  # Temperatura normal del ganado
-        self.estado_salud = "Saludable"
-        self.racion_actual = None
-        self.fecha_ingreso = datetime.now()
-        self.dias_en_feedlot = 0
-        self.historial_peso = [peso_inicial]
-        self.historial_temperatura = [38.5]
-        
+        self._almacen = None
+        self._slot = -1
+        # Corral que lleva los agregados del animal (lo asigna Corral)
+        self._corral = None
+        # Temperatura normal del ganado: 38.5; corral 0 = sin corral
+        self._fila = [peso_inicial, peso_inicial, 38.5, 0,
+                      SALUDABLE, 0, TIPOS.codificar(tipo), 0]
+        self._ingreso = time.time()
+        self.historial_peso = Historial((peso_inicial,))
+        self.historial_temperatura = Historial((38.5,))
+        self.estadisticas = EstadisticasAnimal()
+    
+    peso = _columna(COL_PESO, "Peso actual en kg", _avisar_peso)
+    # Misma columna sin aviso: actualizar_peso ya conoce la variación
+    _peso = _columna(COL_PESO, "Peso actual en kg (sin avisar al corral)")
+    peso_inicial = _columna(COL_PESO_INICIAL, "Peso de ingreso en kg", _avisar_peso_inicial)
+    temperatura = _columna(COL_TEMPERATURA, "Última temperatura en °C")
+    dias_en_feedlot = _columna(COL_DIAS, "Días desde el ingreso")
+    numero_corral = _columna(COL_CORRAL, "Corral asignado (0 = ninguno)")
+    _estado_salud = _columna(COL_SALUD, "Banderas de EstadoSalud", _avisar_salud)
+    _racion_actual = _columna(COL_RACION, "Código de ración", _avisar_racion)
+    _tipo = _columna(COL_TIPO, "Código de tipo", _avisar_tipo)
+    
+    # Campos categóricos: se leen y asignan como texto, se guardan como código
+    
+    @property
+    def tipo(self) -> str:
+        return TIPOS.valores[self._tipo]
+    
+    @tipo.setter
+    def tipo(self, valor: str):
+        self._tipo = TIPOS.codificar(valor)
+    
+    @property
+    def salud(self) -> EstadoSalud:
+        """Estado de salud como banderas (SALUDABLE = sin ninguna)"""
+        return EstadoSalud(self._estado_salud)
+    
+    @salud.setter
+    def salud(self, valor):
+        self._estado_salud = estado_salud(valor)
+    
+    @property
+    def estado_salud(self) -> str:
+        """Texto del estado de salud, armado al leerlo"""
+        return texto_salud(self._estado_salud)
+    
+    @estado_salud.setter
+    def estado_salud(self, valor):
+        self._estado_salud = estado_salud(valor)
+    
+    @property
+    def racion_actual(self) -> Optional[str]:
+        return RACIONES.valores[self._racion_actual]
+    
+    @racion_actual.setter
+    def racion_actual(self, valor: Optional[str]):
+        self._racion_actual = RACIONES.codificar(valor)
+    
+    @property
+    def fecha_ingreso(self) -> datetime:
+        return datetime.fromtimestamp(self._ingreso)
+    
+    @fecha_ingreso.setter
+    def fecha_ingreso(self, valor):
+        self._ingreso = valor.timestamp() if isinstance(valor, datetime) else float(valor)
+    
     def actualizar_peso(self, incremento: float):
         """
         Actualiza el peso del animal
@@ -39,8 +288,36 @@ class Animal:
         Args:
             incremento: Cantidad de kg a incrementar
         """
-        self.peso += incremento
-        self.historial_peso.append(self.peso)
+        instante = None
+        while True:
+            corral = self._corral
+            if corral is None:
+                peso = self._peso + incremento
+                self._peso = peso
+                break
+            # Con el lock del corral tomado: quien tome los locks de todos
+            # los corrales ve el peso y los totales del rodeo de acuerdo
+            with corral._lock:
+                # Transferido mientras esperaba el lock: reintentar con el nuevo
+                if self._corral is not corral:
+                    continue
+                peso = self._peso + incremento
+                self._peso = peso
+                corral.peso_total += incremento
+                rodeo = corral.rodeo
+                if rodeo is not None:
+                    rodeo.sumar_peso(self._tipo, incremento)
+                break
+        if corral is not None:
+            ranking = corral.ranking
+            if ranking is not None:
+                ranking.marcar(self)
+            if corral.reloj is not None:
+                instante = corral.reloj.ahora()
+        self.historial_peso.append(peso, instante)
+        estadisticas = self.estadisticas
+        estadisticas.peso.agregar(peso)
+        estadisticas.tendencia_peso.agregar(peso)
         
     def actualizar_temperatura(self, nueva_temp: float):
         """
@@ -50,24 +327,47 @@ class Animal:
             nueva_temp: Nueva temperatura en °C
         """
         self.temperatura = nueva_temp
-        self.historial_temperatura.append(nueva_temp)
+        # Fechada con el reloj del sistema del corral (None = reloj compartido)
+        corral = self._corral
+        reloj = corral.reloj if corral is not None else None
+        self.historial_temperatura.append(nueva_temp, reloj.ahora() if reloj is not None else None)
+        estadisticas = self.estadisticas
+        estadisticas.temperatura.agregar(nueva_temp)
         
-        # Detectar problemas de salud
-        if nueva_temp >= 39.5:
-            self.estado_salud = "Enfermo - Fiebre"
-        elif nueva_temp < 37.0:
-            self.estado_salud = "Enfermo - Hipotermia"
+        # Detectar problemas de salud (sólo se escribe, y se toma el lock
+        # del corral, si el estado cambia)
+        if nueva_temp >= UMBRAL_FIEBRE:
+            estado = ENFERMO_FIEBRE
+            estadisticas.lecturas_fiebre += 1
+        elif nueva_temp < UMBRAL_HIPOTERMIA:
+            estado = ENFERMO_HIPOTERMIA
+            estadisticas.lecturas_hipotermia += 1
         else:
-            self.estado_salud = "Saludable"
+            estado = SALUDABLE
+        if estado != self._estado_salud:
+            self._estado_salud = estado
     
     def esta_enfermo(self) -> bool:
         """
         Verifica si el animal está enfermo
         
         Returns:
-            True si está enfermo, False si está saludable
+            True si tiene alguna condición de salud (incluye tratamiento
+            y observación), False si está saludable
         """
-        return self.estado_salud != "Saludable"
+        return self._estado_salud != SALUDABLE
+    
+    def tiene_condicion(self, mascara: int) -> bool:
+        """
+        Verifica si el animal tiene alguna de las condiciones de la máscara
+        
+        Args:
+            mascara: Banderas de EstadoSalud (ej. FIEBRE | HIPOTERMIA)
+            
+        Returns:
+            True si comparte al menos una bandera con la máscara
+        """
+        return bool(self._estado_salud & mascara)
     
     def ganancia_peso_total(self) -> float:
         """
@@ -89,6 +389,15 @@ class Animal:
             return 0
         return self.ganancia_peso_total() / self.dias_en_feedlot
     
+    def tendencia_peso(self) -> float:
+        """
+        Pendiente del peso en las últimas lecturas, sin recorrer el historial
+        
+        Returns:
+            kg por lectura (0 con menos de dos lecturas)
+        """
+        return self.estadisticas.tendencia_peso.pendiente
+    
     def mostrar_info(self) -> str:
         """
         Retorna información detallada del animal
@@ -102,6 +411,67 @@ class Animal:
                 f"Estado: {self.estado_salud} | "
                 f"Ganancia: +{self.ganancia_peso_total():.2f} kg")
     
+    def tamanio_bytes(self) -> int:
+        """
+        Estima la memoria propia del animal (objeto, números e historiales).
+        Los campos categóricos son códigos compartidos y no suman.
+        
+        Returns:
+            Bytes ocupados
+        """
+        if self._almacen is None:
+            fila = sys.getsizeof(self._fila) + sum(sys.getsizeof(v) for v in self._fila[:3])
+        else:
+            fila = self._almacen.bytes_por_fila()
+        return (sys.getsizeof(self) + fila + sys.getsizeof(self._ingreso) +
+                sys.getsizeof(self.historial_peso) +
+                sys.getsizeof(self.historial_temperatura) +
+                sys.getsizeof(self.estadisticas) + sys.getsizeof(self.estadisticas.peso) +
+                sys.getsizeof(self.estadisticas.temperatura) +
+                sys.getsizeof(self.estadisticas.tendencia_peso))
+    
+    def __getstate__(self) -> dict:
+        """
+        Estado para pickle con los nombres públicos de siempre; tipo y
+        ración van como texto porque los códigos nuevos son locales a cada
+        proceso, la salud como sus banderas (fijas).
+        """
+        return {
+            "id": self.id,
+            "tipo": self.tipo,
+            "peso": self.peso,
+            "peso_inicial": self.peso_inicial,
+            "temperatura": self.temperatura,
+            "salud": self._estado_salud,
+            "racion_actual": self.racion_actual,
+            "fecha_ingreso": self._ingreso,
+            "dias_en_feedlot": self.dias_en_feedlot,
+            "historial_peso": self.historial_peso,
+            "historial_temperatura": self.historial_temperatura,
+            "estadisticas": self.estadisticas
+        }
+    
+    def __setstate__(self, estado: dict):
+        """
+        Restaura desde pickle. Acepta también los estados guardados por la
+        versión anterior con __dict__ (datetime e historiales en listas).
+        El animal restaurado queda suelto, fuera de todo almacén y corral
+        (el corral lo vuelve a enlazar al restaurarse).
+        """
+        self._almacen = None
+        self._slot = -1
+        self._corral = None
+        self._fila = [0.0, 0.0, 38.5, 0, SALUDABLE, 0, 0, 0]
+        for nombre, valor in estado.items():
+            setattr(self, nombre, valor)
+        if not isinstance(self.historial_peso, Historial):
+            self.historial_peso = Historial(self.historial_peso)
+        if not isinstance(self.historial_temperatura, Historial):
+            self.historial_temperatura = Historial(self.historial_temperatura)
+        if "estadisticas" not in estado:
+            self.estadisticas = EstadisticasAnimal.desde_historiales(
+                self.historial_peso, self.historial_temperatura)
+    
     def __str__(self):
         """Representación en string del animal"""
         return f"Animal #{self.id} ({self.tipo})"
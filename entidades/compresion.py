@@ -0,0 +1,386 @@
+"""
+Compresión de series de tiempo estilo Gorilla
+
+Codifica pares (instante, valor) en un flujo de bits:
+- instantes en milisegundos con delta-de-delta: con lecturas a ritmo
+  fijo cada instante ocupa un solo bit;
+- valores con XOR contra el anterior: un bit si se repite y, si no,
+  sólo los bits significativos del XOR.
+
+SerieComprimida agrupa las lecturas en bloques que se decodifican por
+separado, así una consulta por rango de tiempo sólo descomprime los
+bloques que se superponen con él.
+"""
+
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+_MASCARA_64 = (1 << 64) - 1
+_DOBLE = struct.Struct("<d")
+_ENTERO = struct.Struct("<Q")
+
+# Cubetas de delta-de-delta: (prefijo, bits del prefijo, bits del valor)
+_CUBETAS_DELTA = ((0b10, 2, 7), (0b110, 3, 9), (0b1110, 4, 12))
+_PREFIJO_DELTA_LARGO = (0b1111, 4, 64)
+
+
+def _a_bits(valor: float) -> int:
+    return _ENTERO.unpack(_DOBLE.pack(valor))[0]
+
+
+def _a_float(bits: int) -> float:
+    return _DOBLE.unpack(_ENTERO.pack(bits))[0]
+
+
+def _zigzag(n: int) -> int:
+    return (n << 1) if n >= 0 else ((-n << 1) - 1)
+
+
+def _deszigzag(n: int) -> int:
+    return (n >> 1) if not n & 1 else -((n + 1) >> 1)
+
+
+class CodificadorGorilla:
+    """
+    Codificador incremental de un bloque: se le agregan lecturas de a
+    una y bytes() devuelve el bloque cerrado.
+    """
+
+    __slots__ = ("cantidad", "_salida", "_acumulado", "_pendientes",
+                 "_instante", "_delta", "_valor", "_ceros_izq", "_ceros_der")
+
+    def __init__(self):
+        """Inicializa un bloque vacío."""
+        self.cantidad = 0
+        self._salida = bytearray()
+        self._acumulado = 0
+        self._pendientes = 0     # bits en _acumulado todavía sin volcar
+        self._instante = 0
+        self._delta = 0
+        self._valor = 0
+        self._ceros_izq = -1     # ventana de bits significativos del XOR anterior
+        self._ceros_der = 0
+
+    def _escribir(self, valor: int, ancho: int):
+        """
+        Agrega los `ancho` bits bajos de `valor` al flujo.
+
+        Args:
+            valor: Bits a escribir
+            ancho: Cantidad de bits
+        """
+        acumulado = (self._acumulado << ancho) | valor
+        pendientes = self._pendientes + ancho
+        salida = self._salida
+        while pendientes >= 8:
+            pendientes -= 8
+            salida.append((acumulado >> pendientes) & 0xFF)
+        self._acumulado = acumulado & ((1 << pendientes) - 1)
+        self._pendientes = pendientes
+
+    def agregar(self, instante: float, valor: float):
+        """
+        Codifica una lectura.
+
+        Args:
+            instante: Segundos (se guarda con resolución de milisegundos)
+            valor: Valor de la lectura (sin pérdida)
+        """
+        milisegundos = int(round(instante * 1000))
+        bits = _a_bits(valor)
+
+        if self.cantidad == 0:
+            self._escribir(milisegundos & _MASCARA_64, 64)
+            self._escribir(bits, 64)
+        else:
+            delta = milisegundos - self._instante
+            self._escribir_delta(delta - self._delta)
+            self._delta = delta
+            self._escribir_xor(bits ^ self._valor)
+
+        self._instante = milisegundos
+        self._valor = bits
+        self.cantidad += 1
+
+    def _escribir_delta(self, delta_de_delta: int):
+        """
+        Args:
+            delta_de_delta: Diferencia entre el delta actual y el anterior (ms)
+        """
+        if delta_de_delta == 0:
+            self._escribir(0, 1)
+            return
+        codigo = _zigzag(delta_de_delta)
+        for prefijo, ancho_prefijo, ancho in _CUBETAS_DELTA:
+            if codigo < (1 << ancho):
+                self._escribir(prefijo, ancho_prefijo)
+                self._escribir(codigo, ancho)
+                return
+        prefijo, ancho_prefijo, ancho = _PREFIJO_DELTA_LARGO
+        self._escribir(prefijo, ancho_prefijo)
+        self._escribir(codigo & _MASCARA_64, ancho)
+
+    def _escribir_xor(self, xor: int):
+        """
+        Args:
+            xor: XOR entre los bits del valor actual y los del anterior
+        """
+        if xor == 0:
+            self._escribir(0, 1)
+            return
+        ceros_izq = min(64 - xor.bit_length(), 31)
+        ceros_der = (xor & -xor).bit_length() - 1
+        if self._ceros_izq >= 0 and ceros_izq >= self._ceros_izq and ceros_der >= self._ceros_der:
+            # Cabe en la ventana anterior: sólo los bits significativos
+            significativos = 64 - self._ceros_izq - self._ceros_der
+            self._escribir(0b10, 2)
+            self._escribir(xor >> self._ceros_der, significativos)
+            return
+        significativos = 64 - ceros_izq - ceros_der
+        self._escribir(0b11, 2)
+        self._escribir(ceros_izq, 5)
+        self._escribir(significativos & 63, 6)   # 64 se guarda como 0
+        self._escribir(xor >> ceros_der, significativos)
+        self._ceros_izq = ceros_izq
+        self._ceros_der = ceros_der
+
+    def __bytes__(self):
+        if self._pendientes:
+            return bytes(self._salida) + bytes(((self._acumulado << (8 - self._pendientes)) & 0xFF,))
+        return bytes(self._salida)
+
+    def __len__(self):
+        return len(self._salida) + (1 if self._pendientes else 0)
+
+
+def decodificar(datos: bytes, cantidad: int) -> Iterator[Tuple[float, float]]:
+    """
+    Decodifica un bloque generado por CodificadorGorilla.
+
+    Args:
+        datos: Bytes del bloque
+        cantidad: Lecturas que contiene
+
+    Yields:
+        Pares (instante, valor) en orden
+    """
+    posicion = 0
+    acumulado = 0
+    disponibles = 0
+
+    def leer(ancho: int) -> int:
+        nonlocal posicion, acumulado, disponibles
+        while disponibles < ancho:
+            acumulado = (acumulado << 8) | datos[posicion]
+            posicion += 1
+            disponibles += 8
+        disponibles -= ancho
+        valor = acumulado >> disponibles
+        acumulado &= (1 << disponibles) - 1
+        return valor
+
+    if cantidad <= 0:
+        return
+    instante = leer(64)
+    if instante >> 63:
+        instante -= 1 << 64
+    bits = leer(64)
+    delta = 0
+    ceros_izq = ceros_der = 0
+    yield instante / 1000, _a_float(bits)
+
+    for _ in range(cantidad - 1):
+        if leer(1):
+            if not leer(1):
+                codigo = leer(7)
+            elif not leer(1):
+                codigo = leer(9)
+            elif not leer(1):
+                codigo = leer(12)
+            else:
+                codigo = leer(64)
+            delta += _deszigzag(codigo)
+        instante += delta
+
+        if leer(1):
+            if leer(1):
+                ceros_izq = leer(5)
+                significativos = leer(6) or 64
+                ceros_der = 64 - ceros_izq - significativos
+            bits ^= leer(64 - ceros_izq - ceros_der) << ceros_der
+        yield instante / 1000, _a_float(bits)
+
+
+class SerieComprimida:
+    """
+    Serie de (instante, valor) comprimida en bloques Gorilla.
+
+    Las lecturas se agregan en orden a un bloque abierto; al llegar a
+    `lecturas_por_bloque` se cierra y queda como bytes. Los instantes se
+    guardan con resolución de milisegundos; los valores, sin pérdida.
+    """
+
+    __slots__ = ("lecturas_por_bloque", "maximo", "_bloques", "_inicios",
+                 "_finales", "_cantidades", "_abierto", "_inicio_abierto")
+
+    def __init__(self, lecturas_por_bloque: int = 256, maximo: Optional[int] = None):
+        """
+        Inicializa la serie.
+
+        Args:
+            lecturas_por_bloque: Lecturas por bloque cerrado
+            maximo: Lecturas a conservar (se descartan bloques enteros
+                    de los más antiguos); None = sin límite
+
+        Raises:
+            ValueError: Si lecturas_por_bloque no es positivo
+        """
+        if lecturas_por_bloque <= 0:
+            raise ValueError("lecturas_por_bloque debe ser positivo")
+        self.lecturas_por_bloque = lecturas_por_bloque
+        self.maximo = maximo
+        self._bloques: List[bytes] = []
+        self._inicios = array('d')     # instante de la primera lectura de cada bloque cerrado
+        self._finales = array('d')     # instante de la última
+        self._cantidades = array('l')
+        self._abierto = CodificadorGorilla()
+        self._inicio_abierto = 0.0
+
+    def agregar(self, instante: float, valor: float):
+        """
+        Args:
+            instante: Segundos, no decrecientes
+            valor: Valor de la lectura
+        """
+        abierto = self._abierto
+        if abierto.cantidad == 0:
+            self._inicio_abierto = instante
+        abierto.agregar(instante, valor)
+        if abierto.cantidad >= self.lecturas_por_bloque:
+            self._cerrar_bloque(instante)
+
+    def extender(self, instantes: Iterable[float], valores: Iterable[float]):
+        """
+        Args:
+            instantes: Instantes en orden
+            valores: Valores paralelos
+        """
+        for instante, valor in zip(instantes, valores):
+            self.agregar(instante, valor)
+
+    def _cerrar_bloque(self, ultimo: float):
+        """
+        Args:
+            ultimo: Instante de la última lectura del bloque abierto
+        """
+        self._bloques.append(bytes(self._abierto))
+        self._inicios.append(self._inicio_abierto)
+        self._finales.append(ultimo)
+        self._cantidades.append(self._abierto.cantidad)
+        self._abierto = CodificadorGorilla()
+        if self.maximo is not None:
+            while self._bloques and len(self) - self._cantidades[0] >= self.maximo:
+                del self._bloques[0]
+                del self._inicios[0]
+                del self._finales[0]
+                del self._cantidades[0]
+
+    def __len__(self):
+        return sum(self._cantidades) + self._abierto.cantidad
+
+    def primer_instante(self) -> Optional[float]:
+        """
+        Returns:
+            Instante de la lectura más antigua que conserva (None si está vacía)
+        """
+        if self._bloques:
+            return self._inicios[0]
+        return self._inicio_abierto if self._abierto.cantidad else None
+
+    def _bloques_en(self, desde: Optional[float], hasta: Optional[float]) -> Iterator[Tuple[bytes, int]]:
+        """
+        Bloques (cerrados y el abierto) que pueden tener lecturas en el rango.
+
+        Args:
+            desde: Instante inicial incluido (None = sin límite)
+            hasta: Instante final excluido (None = sin límite)
+
+        Yields:
+            Pares (bytes del bloque, cantidad de lecturas)
+        """
+        i = 0 if desde is None else bisect_left(self._finales, desde)
+        j = len(self._bloques) if hasta is None else bisect_left(self._inicios, hasta)
+        for k in range(i, j):
+            yield self._bloques[k], self._cantidades[k]
+        abierto = self._abierto
+        if abierto.cantidad and (hasta is None or self._inicio_abierto < hasta):
+            yield bytes(abierto), abierto.cantidad
+
+    def rango(self, desde: Optional[float] = None,
+              hasta: Optional[float] = None) -> Tuple[array, array]:
+        """
+        Decodifica sólo los bloques que se superponen con el rango.
+
+        Args:
+            desde: Instante inicial incluido (None = sin límite)
+            hasta: Instante final excluido (None = sin límite)
+
+        Returns:
+            Tupla (instantes, valores) de array('d') paralelos
+        """
+        instantes, valores = array('d'), array('d')
+        for datos, cantidad in self._bloques_en(desde, hasta):
+            for instante, valor in decodificar(datos, cantidad):
+                if (desde is None or instante >= desde) and (hasta is None or instante < hasta):
+                    instantes.append(instante)
+                    valores.append(valor)
+        return instantes, valores
+
+    def __iter__(self):
+        for datos, cantidad in self._bloques_en(None, None):
+            yield from decodificar(datos, cantidad)
+
+    def bytes_usados(self) -> int:
+        """
+        Returns:
+            Bytes de datos comprimidos (sin contar estructuras de Python)
+        """
+        return sum(len(bloque) for bloque in self._bloques) + len(self._abierto)
+
+    def __sizeof__(self):
+        return (object.__sizeof__(self) + sys.getsizeof(self._bloques) +
+                sum(sys.getsizeof(bloque) for bloque in self._bloques) +
+                sys.getsizeof(self._inicios) + sys.getsizeof(self._finales) +
+                sys.getsizeof(self._cantidades) + sys.getsizeof(self._abierto._salida))
+
+    def __getstate__(self) -> dict:
+        # El bloque abierto se guarda decodificado y se vuelve a codificar al cargar
+        abierto = list(decodificar(bytes(self._abierto), self._abierto.cantidad))
+        return {
+            "lecturas_por_bloque": self.lecturas_por_bloque,
+            "maximo": self.maximo,
+            "bloques": self._bloques,
+            "inicios": self._inicios,
+            "finales": self._finales,
+            "cantidades": self._cantidades,
+            "abierto": abierto
+        }
+
+    def __setstate__(self, estado: dict):
+        self.lecturas_por_bloque = estado["lecturas_por_bloque"]
+        self.maximo = estado["maximo"]
+        self._bloques = estado["bloques"]
+        self._inicios = estado["inicios"]
+        self._finales = estado["finales"]
+        self._cantidades = estado["cantidades"]
+        self._abierto = CodificadorGorilla()
+        self._inicio_abierto = 0.0
+        for instante, valor in estado["abierto"]:
+            self.agregar(instante, valor)
+
+    def __repr__(self):
+        return (f"SerieComprimida(lecturas={len(self)}, bloques={len(self._bloques)}, "
+                f"bytes={self.bytes_usados()})")
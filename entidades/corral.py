@@ -1,9 +1,23 @@
 """
 Clase Corral - Representa un corral que contiene animales
+
+Los animales se guardan en un diccionario por ID: buscar, agregar y
+quitar son O(1) y la iteración sigue el orden de llegada.
+
+El corral lleva además agregados corrientes (suma de pesos y cantidad
+de enfermos) que se ajustan al entrar o salir un animal y cada vez que
+uno cambia de peso o de estado de salud, así sus estadísticas son O(1),
+y los animales con alguna condición de salud aparte, así los enfermos
+del corral salen sin recorrerlo. Si pertenece a un FeedlotSystem
+reenvía esos mismos avisos a las estadísticas del rodeo
+(EstadisticasRodeo), al ranking de ganancia (RankingGanancia) y a los
+índices secundarios (IndicesRodeo).
 """
 
-from typing import List, Optional
+import threading
+from typing import Dict, List, Optional, Sequence, ValuesView
 from entidades.animal import Animal
+from entidades.salud import EstadoSalud
 
 class Corral:
     """
@@ -21,8 +35,29 @@ class Corral:
         """
         self.numero = numero
         self.capacidad = capacidad
-        self.animales: List[Animal] = []
+        self._animales: Dict[int, Animal] = {}
+        # Agregados corrientes (los sensores pueden escribir desde varios hilos)
+        self.peso_total = 0.0
+        self.cantidad_enfermos = 0
+        # Animales con alguna condición de salud, por ID
+        self._atencion: Dict[int, Animal] = {}
+        self._lock = threading.Lock()
+        # AlmacenRodeo del sistema (lo asigna FeedlotSystem); None = recorrer objetos
+        self.almacen = None
+        # EstadisticasRodeo del sistema (lo asigna FeedlotSystem); None = sin reenviar
+        self.rodeo = None
+        # RankingGanancia del sistema (lo asigna FeedlotSystem); None = sin reenviar
+        self.ranking = None
+        # IndicesRodeo del sistema (lo asigna FeedlotSystem); None = sin reenviar
+        self.indices = None
+        # Reloj del sistema para fechar lecturas (lo asigna FeedlotSystem); None = reloj compartido
+        self.reloj = None
         
+    @property
+    def animales(self) -> ValuesView:
+        """Animales del corral en orden de llegada (vista de solo lectura)"""
+        return self._animales.values()
+    
     def agregar_animal(self, animal: Animal) -> bool:
         """
         Agrega un animal al corral si hay espacio disponible
@@ -32,12 +67,67 @@ class Corral:
             
         Returns:
             True si se agregó exitosamente, False si el corral está lleno
+            o ya tiene un animal con ese ID
         """
-        if len(self.animales) < self.capacidad:
-            self.animales.append(animal)
-            return True
-        return False
+        # Con el lock tomado: una lectura de sensor del animal se suma a
+        # los agregados después de contarlo, nunca antes
+        with self._lock:
+            if len(self._animales) >= self.capacidad or animal.id in self._animales:
+                return False
+            self._animales[animal.id] = animal
+            animal._corral = self
+            self.peso_total += animal.peso
+            if animal.esta_enfermo():
+                self.cantidad_enfermos += 1
+                self._atencion[animal.id] = animal
+            if self.rodeo is not None:
+                self.rodeo.agregar(animal)
+            if self.ranking is not None:
+                self.ranking.agregar(animal, self.numero)
+            if self.indices is not None:
+                self.indices.agregar(animal)
+        return True
     
+    def agregar_animales(self, animales: Sequence[Animal], avisar: bool = True) -> List[Animal]:
+        """
+        Agrega varios animales de una vez (carga masiva): los agregados se
+        ajustan con una sola toma del lock y se avisa en bloque a las
+        estadísticas, el ranking y los índices del rodeo.
+
+        Args:
+            animales: Animales a agregar, en orden
+            avisar: False si quien llama avisa al rodeo por su cuenta (una
+                    sola vez para varios corrales)
+
+        Returns:
+            Animales agregados: se detiene al llenarse el corral y omite
+            los IDs que ya tiene
+        """
+        nuevos = []
+        with self._lock:
+            for animal in animales:
+                if len(self._animales) >= self.capacidad:
+                    break
+                if animal.id in self._animales:
+                    continue
+                self._animales[animal.id] = animal
+                animal._corral = self
+                nuevos.append(animal)
+            enfermos = [a for a in nuevos if a.esta_enfermo()]
+            self.peso_total += sum(a.peso for a in nuevos)
+            self.cantidad_enfermos += len(enfermos)
+            for animal in enfermos:
+                self._atencion[animal.id] = animal
+            if not avisar:
+                return nuevos
+            if self.rodeo is not None:
+                self.rodeo.agregar_varios(nuevos)
+            if self.ranking is not None:
+                self.ranking.agregar_varios((animal, self.numero) for animal in nuevos)
+            if self.indices is not None:
+                self.indices.agregar_varios(nuevos)
+        return nuevos
+
     def remover_animal(self, id_animal: int) -> bool:
         """
         Remueve un animal del corral por su ID
@@ -48,11 +138,153 @@ class Corral:
         Returns:
             True si se removió exitosamente, False si no se encontró
         """
-        for animal in self.animales:
-            if animal.id == id_animal:
-                self.animales.remove(animal)
-                return True
-        return False
+        with self._lock:
+            animal = self._animales.pop(id_animal, None)
+            if animal is None:
+                return False
+            if animal._corral is self:
+                animal._corral = None
+            self.peso_total -= animal.peso
+            if self._atencion.pop(id_animal, None) is not None:
+                self.cantidad_enfermos -= 1
+            if self.rodeo is not None:
+                self.rodeo.quitar(animal)
+            if self.ranking is not None:
+                self.ranking.quitar(animal, self.numero)
+            # Si otro corral ya lo había tomado, sigue en los índices
+            if self.indices is not None and animal._corral is None:
+                self.indices.quitar(animal)
+        return True
+    
+    def transferir_animal(self, id_animal: int, destino: "Corral") -> bool:
+        """
+        Pasa un animal de este corral a otro en un solo paso: con los locks
+        de los dos corrales tomados (en orden de número, como
+        FeedlotSystem.verificar_estadisticas) se mueven el animal, su peso
+        y su condición de salud, así ninguna lectura de sensor cae entre la
+        salida y la entrada. Los totales del rodeo y los índices no cambian
+        (el animal sigue en el sistema); el ranking lo pasa al corral de
+        destino.
+        
+        Args:
+            id_animal: ID del animal a transferir
+            destino: Corral de destino
+            
+        Returns:
+            True si se transfirió, False si el animal no está en este
+            corral o el destino está lleno o ya tiene ese ID
+        """
+        if destino is self:
+            return id_animal in self._animales
+        primero, segundo = sorted((self, destino), key=lambda corral: corral.numero)
+        with primero._lock, segundo._lock:
+            animal = self._animales.get(id_animal)
+            if (animal is None or len(destino._animales) >= destino.capacidad
+                    or id_animal in destino._animales):
+                return False
+            del self._animales[id_animal]
+            destino._animales[id_animal] = animal
+            animal._corral = destino
+            peso = animal.peso
+            self.peso_total -= peso
+            destino.peso_total += peso
+            if self._atencion.pop(id_animal, None) is not None:
+                self.cantidad_enfermos -= 1
+                destino.cantidad_enfermos += 1
+                destino._atencion[id_animal] = animal
+            if destino.ranking is not None:
+                destino.ranking.agregar(animal, destino.numero)
+        return True
+    
+    def ajustar_agregados(self, peso: float, enfermos: int, tipo: int):
+        """
+        Suma variaciones a los agregados del corral y las reenvía a las
+        estadísticas del rodeo.
+        
+        Args:
+            peso: Variación de la suma de pesos en kg
+            enfermos: Variación de la cantidad de enfermos
+            tipo: Código de tipo del animal que cambió
+        """
+        with self._lock:
+            self.peso_total += peso
+            self.cantidad_enfermos += enfermos
+        rodeo = self.rodeo
+        if rodeo is not None:
+            rodeo.ajustar(tipo, peso, enfermos)
+    
+    def cambiar_salud(self, animal: Animal, anterior: int, nuevo: int):
+        """
+        Registra el cambio de estado de salud de un animal del corral y lo
+        reenvía a las estadísticas y los índices del rodeo. Lo llama la
+        escritura de Animal._estado_salud con el lock del corral tomado,
+        después de leer el estado anterior y escribir el nuevo.
+        
+        Args:
+            animal: Animal del corral
+            anterior: Banderas de salud que tenía
+            nuevo: Banderas de salud nuevas (distintas de las anteriores)
+        """
+        enfermos = 0
+        if not anterior:
+            enfermos = 1
+            self._atencion[animal.id] = animal
+        elif not nuevo:
+            enfermos = -1
+            self._atencion.pop(animal.id, None)
+        self.cantidad_enfermos += enfermos
+        if enfermos and self.rodeo is not None:
+            self.rodeo.ajustar(animal._tipo, enfermos=enfermos)
+        if self.indices is not None:
+            self.indices.cambiar_salud(animal, nuevo)
+    
+    def aplicar_lecturas(self, animales: Sequence[Animal], variaciones: Sequence[float],
+                         temperaturas: Sequence[float]) -> Optional[List[float]]:
+        """
+        Aplica un lote de lecturas de peso y temperatura a animales del
+        corral sobre las columnas del almacén (AlmacenRodeo.aplicar_lecturas)
+        y ajusta los agregados con una sola toma del lock: una suma de
+        peso por tipo al rodeo, un aviso de salud sólo por cada animal que
+        cambió de estado y una marca en bloque al ranking. Los historiales
+        y las estadísticas de cada animal quedan a cargo de quien llama.
+
+        Args:
+            animales: Animales del corral
+            variaciones: Variación de peso de cada animal en kg
+            temperaturas: Temperatura de cada animal en °C
+
+        Returns:
+            Pesos nuevos, o None si el corral no tiene almacén o alguno de
+            los animales ya no está en él (aplicar lectura por lectura)
+        """
+        almacen = self.almacen
+        if almacen is None:
+            return None
+        with self._lock:
+            if any(animal._corral is not self or animal._almacen is not almacen
+                   for animal in animales):
+                return None
+            pesos, por_tipo, cambios = almacen.aplicar_lecturas(animales, variaciones, temperaturas)
+            rodeo = self.rodeo
+            for tipo, peso in por_tipo.items():
+                self.peso_total += peso
+                if rodeo is not None:
+                    rodeo.sumar_peso(tipo, peso)
+            for posicion, anterior, nuevo in cambios:
+                self.cambiar_salud(animales[posicion], anterior, nuevo)
+        if self.ranking is not None:
+            self.ranking.marcar_varios(animales)
+        return pesos
+    
+    def recalcular_agregados(self):
+        """
+        Recalcula los agregados recorriendo los animales (O(n)); descarta
+        el error de redondeo acumulado.
+        """
+        with self._lock:
+            self.peso_total = sum(a.peso for a in self._animales.values())
+            self._atencion = {a.id: a for a in self._animales.values() if a.esta_enfermo()}
+            self.cantidad_enfermos = len(self._atencion)
     
     def obtener_animal(self, id_animal: int) -> Optional[Animal]:
         """
@@ -64,10 +296,13 @@ class Corral:
         Returns:
             Objeto Animal si se encuentra, None si no existe
         """
-        for animal in self.animales:
-            if animal.id == id_animal:
-                return animal
-        return None
+        return self._animales.get(id_animal)
+    
+    def __contains__(self, id_animal: int) -> bool:
+        return id_animal in self._animales
+    
+    def __len__(self):
+        return len(self._animales)
     
     def peso_promedio(self) -> float:
         """
@@ -76,9 +311,9 @@ class Corral:
         Returns:
             Peso promedio en kg
         """
-        if not self.animales:
+        if not self._animales:
             return 0.0
-        return sum(a.peso for a in self.animales) / len(self.animales)
+        return self.peso_total / len(self._animales)
     
     def animales_enfermos(self) -> List[Animal]:
         """
@@ -87,7 +322,22 @@ class Corral:
         Returns:
             Lista de animales con estado de salud anormal
         """
-        return [a for a in self.animales if a.esta_enfermo()]
+        return self.animales_con_condicion(EstadoSalud.ATENCION)
+    
+    def animales_con_condicion(self, mascara: int) -> List[Animal]:
+        """
+        Animales del corral con alguna de las condiciones de la máscara
+        
+        Args:
+            mascara: Banderas de EstadoSalud (ej. FIEBRE | HIPOTERMIA)
+            
+        Returns:
+            Lista de animales en el orden en que tomaron alguna condición
+            (O(animales con condiciones), no O(animales del corral))
+        """
+        with self._lock:
+            atencion = list(self._atencion.values())
+        return [a for a in atencion if a.tiene_condicion(mascara)]
     
     def esta_lleno(self) -> bool:
         """
@@ -100,12 +350,13 @@ class Corral:
     
     def obtener_estadisticas(self) -> dict:
         """
-        Genera estadísticas del corral
+        Genera estadísticas del corral a partir de sus agregados (O(1))
         
         Returns:
             Diccionario con estadísticas del corral
         """
-        if not self.animales:
+        total = len(self._animales)
+        if not total:
             return {
                 "total_animales": 0,
                 "peso_promedio": 0,
@@ -114,12 +365,48 @@ class Corral:
             }
         
         return {
-            "total_animales": len(self.animales),
-            "peso_promedio": self.peso_promedio(),
-            "animales_enfermos": len(self.animales_enfermos()),
-            "capacidad_usada": (len(self.animales) / self.capacidad) * 100
+            "total_animales": total,
+            "peso_promedio": self.peso_total / total,
+            "animales_enfermos": self.cantidad_enfermos,
+            "capacidad_usada": (total / self.capacidad) * 100
         }
     
+    def __getstate__(self) -> dict:
+        """
+        El almacén, las estadísticas del rodeo, el ranking, los índices y el
+        reloj no se serializan: pertenecen al sistema en ejecución. Los animales con
+        condiciones se recalculan al restaurar.
+        """
+        estado = self.__dict__.copy()
+        estado["almacen"] = None
+        estado["rodeo"] = None
+        estado["ranking"] = None
+        estado["indices"] = None
+        estado["reloj"] = None
+        del estado["_lock"]
+        del estado["_atencion"]
+        return estado
+    
+    def __setstate__(self, estado: dict):
+        """
+        Restaura desde pickle (incluye estados guardados sin almacén o con
+        los animales en una lista).
+        """
+        estado = dict(estado)
+        if "animales" in estado:
+            estado["_animales"] = {animal.id: animal for animal in estado.pop("animales")}
+        self.__dict__.update(estado)
+        self.__dict__.setdefault("almacen", None)
+        self.__dict__.setdefault("rodeo", None)
+        self.__dict__.setdefault("ranking", None)
+        self.__dict__.setdefault("indices", None)
+        self.__dict__.setdefault("reloj", None)
+        self._lock = threading.Lock()
+        # Los animales se restauran sin corral: se enlazan y se recalculan los agregados
+        for animal in self._animales.values():
+            animal._corral = self
+        self.recalcular_agregados()
+    
     def __str__(self):
         """Representación en string del corral"""
         return f"Corral #{self.numero} ({len(self.animales)}/{self.capacidad})"
@@ -0,0 +1,312 @@
+"""
+Estadísticas corrientes - Se actualizan lectura a lectura en O(1)
+
+Reportes, veterinario y muestreo leen estos acumuladores en lugar de
+recorrer los historiales:
+- EstadisticaCorriente: cantidad, media y varianza (Welford), mínimo y máximo
+- PendienteCorriente: pendiente de mínimos cuadrados de las últimas N lecturas
+- EstadisticasAnimal: los acumuladores de un animal
+"""
+
+import math
+import sys
+from array import array
+from typing import Iterable, Iterator, Optional
+
+# Lecturas de peso con las que se estima la tendencia reciente
+LECTURAS_PENDIENTE = 16
+
+
+class EstadisticaCorriente:
+    """
+    Media y varianza por el método de Welford, más mínimo y máximo,
+    sin guardar la serie.
+    """
+
+    __slots__ = ("cantidad", "media", "_m2", "minimo", "maximo")
+
+    def __init__(self, valores: Iterable[float] = ()):
+        """
+        Args:
+            valores: Lecturas iniciales
+        """
+        self.cantidad = 0
+        self.media = 0.0
+        self._m2 = 0.0
+        self.minimo: Optional[float] = None
+        self.maximo: Optional[float] = None
+        for valor in valores:
+            self.agregar(valor)
+
+    def agregar(self, valor: float):
+        """
+        Args:
+            valor: Nueva lectura
+        """
+        cantidad = self.cantidad + 1
+        self.cantidad = cantidad
+        delta = valor - self.media
+        self.media += delta / cantidad
+        self._m2 += delta * (valor - self.media)
+        if cantidad == 1:
+            self.minimo = self.maximo = valor
+        elif valor < self.minimo:
+            self.minimo = valor
+        elif valor > self.maximo:
+            self.maximo = valor
+
+    def combinar(self, otra: "EstadisticaCorriente"):
+        """
+        Suma las lecturas resumidas en otra estadística (fórmula de Chan),
+        por ejemplo las de un proceso que simuló una partición.
+
+        Args:
+            otra: Estadística a incorporar
+        """
+        if not otra.cantidad:
+            return
+        if not self.cantidad:
+            self.cantidad, self.media, self._m2 = otra.cantidad, otra.media, otra._m2
+            self.minimo, self.maximo = otra.minimo, otra.maximo
+            return
+        cantidad = self.cantidad + otra.cantidad
+        delta = otra.media - self.media
+        self._m2 += otra._m2 + delta * delta * self.cantidad * otra.cantidad / cantidad
+        self.media += delta * otra.cantidad / cantidad
+        self.cantidad = cantidad
+        self.minimo = min(self.minimo, otra.minimo)
+        self.maximo = max(self.maximo, otra.maximo)
+
+    @property
+    def varianza(self) -> float:
+        """Varianza muestral (0 con menos de dos lecturas)"""
+        return self._m2 / (self.cantidad - 1) if self.cantidad > 1 else 0.0
+
+    @property
+    def desvio(self) -> float:
+        """Desvío estándar muestral"""
+        return math.sqrt(self.varianza)
+
+    def a_dict(self) -> dict:
+        """
+        Returns:
+            Diccionario con cantidad, media, desvio, minimo y maximo
+        """
+        return {
+            "cantidad": self.cantidad,
+            "media": self.media if self.cantidad else None,
+            "desvio": self.desvio,
+            "minimo": self.minimo,
+            "maximo": self.maximo
+        }
+
+    def __getstate__(self) -> tuple:
+        return (self.cantidad, self.media, self._m2, self.minimo, self.maximo)
+
+    def __setstate__(self, estado: tuple):
+        self.cantidad, self.media, self._m2, self.minimo, self.maximo = estado
+
+    def __repr__(self):
+        return (f"EstadisticaCorriente(cantidad={self.cantidad}, media={self.media:.3f}, "
+                f"desvio={self.desvio:.3f})")
+
+
+class PendienteCorriente:
+    """
+    Pendiente de mínimos cuadrados de las últimas N lecturas contra su
+    número de lectura (unidades por lectura). Las abscisas de la ventana
+    son siempre 0..N-1, así que basta con mantener la suma de los valores
+    y la de valor por posición al desplazarla.
+    """
+
+    __slots__ = ("ventana", "_valores", "_inicio", "_cantidad", "_suma", "_suma_xy")
+
+    def __init__(self, ventana: int = LECTURAS_PENDIENTE):
+        """
+        Args:
+            ventana: Lecturas recientes que entran en la pendiente
+
+        Raises:
+            ValueError: Si la ventana tiene menos de dos lecturas
+        """
+        if ventana < 2:
+            raise ValueError("La ventana de la pendiente necesita al menos dos lecturas")
+        self.ventana = ventana
+        self._valores = array('d', [0.0] * ventana)
+        self._inicio = 0
+        self._cantidad = 0
+        self._suma = 0.0
+        self._suma_xy = 0.0
+
+    def agregar(self, valor: float):
+        """
+        Args:
+            valor: Nueva lectura
+        """
+        cantidad = self._cantidad
+        if cantidad < self.ventana:
+            self._valores[cantidad] = valor
+            self._suma_xy += cantidad * valor
+            self._suma += valor
+            self._cantidad = cantidad + 1
+            return
+        # Ventana llena: sale la más antigua y las demás bajan una posición
+        inicio = self._inicio
+        saliente = self._valores[inicio]
+        self._suma_xy += (cantidad - 1) * valor - (self._suma - saliente)
+        self._suma += valor - saliente
+        self._valores[inicio] = valor
+        inicio += 1
+        if inicio == cantidad:
+            # Cada vuelta completa se recalculan las sumas (O(1) amortizado)
+            # para que el error de redondeo no se acumule en corridas largas
+            valores = self._valores
+            self._suma = sum(valores)
+            self._suma_xy = sum(i * v for i, v in enumerate(valores))
+            inicio = 0
+        self._inicio = inicio
+
+    def valores(self) -> list:
+        """
+        Returns:
+            Lecturas de la ventana, de más antigua a más reciente
+        """
+        inicio, cantidad = self._inicio, self._cantidad
+        return (self._valores[inicio:cantidad] + self._valores[:inicio]).tolist()
+
+    def combinar(self, otra: "PendienteCorriente"):
+        """
+        Agrega las lecturas de la ventana de otra pendiente, posteriores
+        a las propias.
+
+        Args:
+            otra: Pendiente a incorporar
+        """
+        for valor in otra.valores():
+            self.agregar(valor)
+
+    @property
+    def pendiente(self) -> float:
+        """Pendiente por lectura (0 con menos de dos lecturas)"""
+        n = self._cantidad
+        if n < 2:
+            return 0.0
+        suma_x = n * (n - 1) / 2
+        suma_xx = (n - 1) * n * (2 * n - 1) / 6
+        return (n * self._suma_xy - suma_x * self._suma) / (n * suma_xx - suma_x * suma_x)
+
+    def __len__(self):
+        return self._cantidad
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + sys.getsizeof(self._valores)
+
+    def __getstate__(self) -> tuple:
+        return (self.ventana, self.valores())
+
+    def __setstate__(self, estado: tuple):
+        ventana, valores = estado
+        self.__init__(ventana)
+        for valor in valores:
+            self.agregar(valor)
+
+    def __repr__(self):
+        return f"PendienteCorriente(ventana={self.ventana}, pendiente={self.pendiente:.4f})"
+
+
+def _sin_inicial(historial: Iterable[float]) -> Iterator[float]:
+    """
+    Args:
+        historial: Historial (o lista) de un animal
+
+    Returns:
+        Iterador de sus lecturas sin el valor inicial, si todavía lo retiene
+    """
+    valores = iter(historial)
+    if getattr(historial, "total", None) == len(historial):
+        next(valores, None)
+    return valores
+
+
+class EstadisticasAnimal:
+    """
+    Acumuladores de un animal: peso y temperatura (Welford, mínimo,
+    máximo), tendencia reciente del peso y lecturas anormales de temperatura.
+    Sólo cuentan las lecturas, no los valores de ingreso.
+    """
+
+    __slots__ = ("peso", "temperatura", "tendencia_peso",
+                 "lecturas_fiebre", "lecturas_hipotermia")
+
+    def __init__(self):
+        """Inicializa acumuladores vacíos."""
+        self.peso = EstadisticaCorriente()
+        self.temperatura = EstadisticaCorriente()
+        self.tendencia_peso = PendienteCorriente()
+        self.lecturas_fiebre = 0
+        self.lecturas_hipotermia = 0
+
+    @classmethod
+    def desde_historiales(cls, pesos: Iterable[float],
+                          temperaturas: Iterable[float]) -> "EstadisticasAnimal":
+        """
+        Reconstruye los acumuladores a partir de las lecturas retenidas
+        (estados guardados antes de que existieran). Mientras el historial
+        no desalojó nada (total == len) su primer valor es el inicial con
+        que se creó el animal, no una lectura, y se saltea.
+
+        Args:
+            pesos: Historial de peso
+            temperaturas: Historial de temperatura
+
+        Returns:
+            EstadisticasAnimal con esas lecturas
+        """
+        # Importación local: entidades.animal importa este módulo
+        from entidades.animal import UMBRAL_FIEBRE, UMBRAL_HIPOTERMIA
+
+        estadisticas = cls()
+        pesos, temperaturas = _sin_inicial(pesos), _sin_inicial(temperaturas)
+        for peso in pesos:
+            estadisticas.peso.agregar(peso)
+            estadisticas.tendencia_peso.agregar(peso)
+        for temperatura in temperaturas:
+            estadisticas.temperatura.agregar(temperatura)
+            if temperatura >= UMBRAL_FIEBRE:
+                estadisticas.lecturas_fiebre += 1
+            elif temperatura < UMBRAL_HIPOTERMIA:
+                estadisticas.lecturas_hipotermia += 1
+        return estadisticas
+
+    def combinar(self, otra: "EstadisticasAnimal"):
+        """
+        Incorpora lecturas posteriores resumidas en otros acumuladores.
+
+        Args:
+            otra: Acumuladores a incorporar
+        """
+        self.peso.combinar(otra.peso)
+        self.temperatura.combinar(otra.temperatura)
+        self.tendencia_peso.combinar(otra.tendencia_peso)
+        self.lecturas_fiebre += otra.lecturas_fiebre
+        self.lecturas_hipotermia += otra.lecturas_hipotermia
+
+    def proporcion_fiebre(self) -> float:
+        """
+        Returns:
+            Fracción de lecturas de temperatura con fiebre (0 sin lecturas)
+        """
+        cantidad = self.temperatura.cantidad
+        return self.lecturas_fiebre / cantidad if cantidad else 0.0
+
+    def __getstate__(self) -> tuple:
+        return (self.peso, self.temperatura, self.tendencia_peso,
+                self.lecturas_fiebre, self.lecturas_hipotermia)
+
+    def __setstate__(self, estado: tuple):
+        (self.peso, self.temperatura, self.tendencia_peso,
+         self.lecturas_fiebre, self.lecturas_hipotermia) = estado
+
+    def __repr__(self):
+        return (f"EstadisticasAnimal(lecturas_temperatura={self.temperatura.cantidad}, "
+                f"fiebre={self.lecturas_fiebre}, tendencia={self.tendencia_peso.pendiente:+.3f} kg/lectura)")
@@ -0,0 +1,452 @@
+"""
+Clase Historial - Serie de tiempo acotada de lecturas de un animal
+
+Cada lectura se guarda como par (instante, valor) en dos arreglos
+paralelos array('d') que forman un buffer circular de tamaño fijo. Los
+instantes son no decrecientes, así que las consultas por rango de
+tiempo usan bisect sobre el buffer y no recorren el historial.
+
+Las lecturas que salen del buffer no se pierden del todo: se resumen en
+bloques de N lecturas (desde, hasta, mínimo, promedio y máximo) que
+forman un nivel de largo plazo, también acotado. Con compresión activada
+(COMPRIMIR_HISTORIAL) además se archivan completas en una SerieComprimida
+y las consultas por rango las incluyen. Se itera, indexa y mide como la
+lista de valores que reemplaza, de más antigua a más reciente.
+"""
+
+import heapq
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple
+from constantes import (RETENCION_HISTORIAL, LECTURAS_POR_BLOQUE, BLOQUES_RESUMEN,
+                        COMPRIMIR_HISTORIAL, RETENCION_ARCHIVO_HISTORIAL,
+                        LECTURAS_POR_BLOQUE_COMPRIMIDO)
+from entidades.compresion import SerieComprimida
+from servicios.reloj_service import reloj
+
+# Valores por bloque en el arreglo plano del resumen: hasta, mínimo, promedio, máximo
+_CAMPOS_RESUMEN = 4
+
+
+def intercalar(*historiales: "Historial") -> Iterator[Tuple[float, int, int, float]]:
+    """
+    Une varias series lectura por lectura, sin repetir ni descartar
+    valores: primero la lectura más antigua de cada serie (el estado
+    inicial) y después el resto en orden de instante; a igual instante
+    va primero la serie anterior en los argumentos.
+
+    Args:
+        historiales: Series a unir
+
+    Yields:
+        Tuplas (instante, número de serie, número de lectura en su serie, valor)
+    """
+    series = [historial.exportar() for historial in historiales]
+    pendientes = []
+    for numero, (instantes, valores) in enumerate(series):
+        if valores:
+            yield instantes[0], numero, 0, valores[0]
+        pendientes.append(zip(instantes[1:], [numero] * (len(valores) - 1),
+                              range(1, len(valores)), valores[1:]))
+    yield from heapq.merge(*pendientes)
+
+
+class Historial:
+    """
+    Buffer circular de lecturas con instante y un nivel de resumen de largo plazo.
+
+    El buffer desaloja de a un bloque entero: conserva al menos
+    `capacidad` lecturas recientes (redondeada a bloques enteros) y a lo
+    sumo un bloque más, y cada bloque desalojado se resume de una vez
+    (min/sum/max en C) en lugar de lectura por lectura.
+    """
+
+    __slots__ = ("capacidad", "lecturas_por_bloque", "bloques", "total",
+                 "_datos", "_instantes", "_ultimo", "_inicio", "_largo", "_tope",
+                 "_resumen_desde", "_resumen", "_archivo")
+
+    def __init__(self, valores: Iterable[float] = (), capacidad: int = RETENCION_HISTORIAL,
+                 lecturas_por_bloque: int = LECTURAS_POR_BLOQUE, bloques: int = BLOQUES_RESUMEN,
+                 comprimir: bool = COMPRIMIR_HISTORIAL, archivo: int = RETENCION_ARCHIVO_HISTORIAL):
+        """
+        Inicializa el historial.
+
+        Args:
+            valores: Lecturas iniciales, de más antigua a más reciente
+                     (se fechan con la hora actual)
+            capacidad: Lecturas recientes que se conservan completas (como mínimo)
+            lecturas_por_bloque: Lecturas que forman un bloque del resumen
+            bloques: Bloques de resumen que se conservan
+            comprimir: Archivar las lecturas desalojadas completas y comprimidas
+            archivo: Lecturas desalojadas que conserva el archivo comprimido,
+                     independiente del tamaño del resumen
+
+        Raises:
+            ValueError: Si alguna capacidad no es positiva
+        """
+        if capacidad <= 0 or lecturas_por_bloque <= 0 or bloques <= 0 or archivo <= 0:
+            raise ValueError("Las capacidades del historial deben ser positivas")
+
+        self.capacidad = capacidad
+        self.lecturas_por_bloque = lecturas_por_bloque
+        self.bloques = bloques
+        self.total = 0
+        # Tope múltiplo del bloque: los bloques a desalojar nunca cruzan el final
+        self._tope = (-(-capacidad // lecturas_por_bloque) + 1) * lecturas_por_bloque
+        # El buffer crece con append hasta el tope; recién ahí da la vuelta
+        self._datos = array('d')
+        self._instantes = array('d')
+        self._ultimo = float("-inf")
+        self._inicio = 0
+        self._largo = 0
+        # Nivel de largo plazo; se crea al desalojar el primer bloque
+        self._resumen_desde = None   # array('d'): instante inicial de cada bloque
+        self._resumen = None         # array('d') plano: _CAMPOS_RESUMEN valores por bloque
+        self._archivo = SerieComprimida(LECTURAS_POR_BLOQUE_COMPRIMIDO, archivo) if comprimir else None
+        self.extend(valores)
+
+    def append(self, valor: float, instante: Optional[float] = None):
+        """
+        Agrega una lectura; si el buffer está lleno, el bloque más
+        antiguo pasa al resumen.
+
+        Args:
+            valor: Lectura
+            instante: Segundos estilo time.time (default: reloj.ahora()).
+                      Un instante anterior al último se toma como el último,
+                      para que la serie siga ordenada.
+        """
+        if instante is None:
+            instante = reloj.ahora()
+        if instante < self._ultimo:
+            instante = self._ultimo
+        self._ultimo = instante
+        self.total += 1
+        datos = self._datos
+        largo = self._largo
+        if largo == len(datos):
+            if largo < self._tope:
+                datos.append(valor)
+                self._instantes.append(instante)
+                self._largo = largo + 1
+                return
+            self._desalojar_bloque()
+            largo = self._largo
+        posicion = (self._inicio + largo) % self._tope
+        datos[posicion] = valor
+        self._instantes[posicion] = instante
+        self._largo = largo + 1
+
+    def extend(self, valores: Iterable[float]):
+        """
+        Args:
+            valores: Lecturas a agregar en orden, con la hora actual
+        """
+        for valor in valores:
+            self.append(valor)
+
+    def _desalojar_bloque(self):
+        """Resume el bloque más antiguo y libera su lugar en el buffer."""
+        cantidad = self.lecturas_por_bloque
+        inicio = self._inicio
+        fin = inicio + cantidad
+        bloque = self._datos[inicio:fin]
+        if self._resumen is None:
+            self._resumen_desde = array('d')
+            self._resumen = array('d')
+        self._resumen_desde.append(self._instantes[inicio])
+        self._resumen.extend((self._instantes[fin - 1], min(bloque),
+                              sum(bloque) / cantidad, max(bloque)))
+        if len(self._resumen_desde) > self.bloques:
+            # Un bloque cada lecturas_por_bloque lecturas: correr los arreglos es barato
+            del self._resumen_desde[0]
+            del self._resumen[:_CAMPOS_RESUMEN]
+        if self._archivo is not None:
+            self._archivo.extender(self._instantes[inicio:fin], bloque)
+        self._inicio = fin % self._tope
+        self._largo -= cantidad
+
+    # --- Acceso en orden lógico (de más antigua a más reciente) ---
+
+    def _tramo(self, datos: array, i: int, j: int) -> array:
+        """
+        Copia las posiciones lógicas [i, j) de uno de los arreglos del buffer.
+
+        Args:
+            datos: self._datos o self._instantes
+            i: Primera posición lógica
+            j: Posición lógica final (excluida)
+
+        Returns:
+            array('d') con las lecturas en orden
+        """
+        tope = len(datos)
+        desde, hasta = self._inicio + i, self._inicio + j
+        if hasta <= tope:
+            return datos[desde:hasta]
+        if desde >= tope:
+            return datos[desde - tope:hasta - tope]
+        return datos[desde:] + datos[:hasta - tope]
+
+    def _posicion(self, instante: float) -> int:
+        """
+        Busca con bisect la posición lógica de la primera lectura en o
+        después de un instante. El buffer ordenado son a lo sumo dos
+        tramos contiguos del arreglo.
+
+        Args:
+            instante: Instante buscado
+
+        Returns:
+            Posición lógica entre 0 y len(self)
+        """
+        instantes, inicio = self._instantes, self._inicio
+        fin = inicio + self._largo
+        corte = min(fin, len(instantes))
+        i = bisect_left(instantes, instante, inicio, corte)
+        if i < corte or fin <= len(instantes):
+            return i - inicio
+        return (corte - inicio) + bisect_left(instantes, instante, 0, fin - len(instantes))
+
+    def _limites(self, desde: Optional[float], hasta: Optional[float]) -> Tuple[int, int]:
+        """
+        Args:
+            desde: Instante inicial incluido (None = sin límite)
+            hasta: Instante final excluido (None = sin límite)
+
+        Returns:
+            Posiciones lógicas [i, j) de las lecturas en el rango
+        """
+        i = 0 if desde is None else self._posicion(desde)
+        j = self._largo if hasta is None else self._posicion(hasta)
+        return i, max(i, j)
+
+    def rango(self, desde: Optional[float] = None,
+              hasta: Optional[float] = None) -> Tuple[array, array]:
+        """
+        Lecturas en un rango de tiempo, sin recorrer el historial. Con
+        compresión incluye las archivadas (sólo se descomprimen los
+        bloques del archivo que se superponen con el rango). Si el rango
+        empieza antes de la lectura completa más antigua (truncado()),
+        la parte anterior sólo queda en resumen_rango().
+
+        Args:
+            desde: Instante inicial incluido (None = desde la más antigua)
+            hasta: Instante final excluido (None = hasta la más reciente)
+
+        Returns:
+            Tupla (instantes, valores) de array('d') paralelos
+        """
+        i, j = self._limites(desde, hasta)
+        instantes, valores = self._tramo(self._instantes, i, j), self._tramo(self._datos, i, j)
+        if self._archivo is not None:
+            # El archivo sólo tiene lecturas anteriores al buffer: se antepone
+            archivados, valores_archivados = self._archivo.rango(desde, hasta)
+            if archivados:
+                return archivados + instantes, valores_archivados + valores
+        return instantes, valores
+
+    def completo_desde(self) -> Optional[float]:
+        """
+        Returns:
+            Instante de la lectura más antigua que se conserva completa,
+            en el archivo o en el buffer (None si no hay lecturas)
+        """
+        if self._archivo is not None:
+            primero = self._archivo.primer_instante()
+            if primero is not None:
+                return primero
+        return self._instantes[self._inicio] if self._largo else None
+
+    def truncado(self, desde: Optional[float] = None) -> bool:
+        """
+        Indica si rango(desde, ...) deja afuera lecturas que sólo
+        sobreviven en el resumen.
+
+        Args:
+            desde: Instante inicial del rango (None = desde la más antigua)
+
+        Returns:
+            True si hubo lecturas desalojadas sin archivar y el rango
+            empieza antes de la lectura completa más antigua
+        """
+        if self.total <= self._largo + self.archivadas():
+            return False
+        return desde is None or desde < self.completo_desde()
+
+    def estadisticas(self, desde: Optional[float] = None,
+                     hasta: Optional[float] = None) -> dict:
+        """
+        Cantidad, mínimo, promedio y máximo de las lecturas en un rango
+        (recientes y, con compresión, archivadas).
+
+        Args:
+            desde: Instante inicial incluido (None = sin límite)
+            hasta: Instante final excluido (None = sin límite)
+
+        Returns:
+            Diccionario con cantidad, minimo, promedio y maximo (None si no hay lecturas)
+        """
+        valores = self.rango(desde, hasta)[1]
+        if not valores:
+            return {"cantidad": 0, "minimo": None, "promedio": None, "maximo": None}
+        return {
+            "cantidad": len(valores),
+            "minimo": min(valores),
+            "promedio": sum(valores) / len(valores),
+            "maximo": max(valores)
+        }
+
+    def exportar(self) -> Tuple[array, array]:
+        """
+        Returns:
+            Tupla (instantes, valores) con todas las lecturas recientes
+        """
+        return self._tramo(self._instantes, 0, self._largo), self._tramo(self._datos, 0, self._largo)
+
+    def pares(self) -> Iterator[Tuple[float, float]]:
+        """
+        Returns:
+            Iterador de (instante, valor) de más antigua a más reciente
+        """
+        return zip(*self.exportar())
+
+    @property
+    def resumen(self) -> List[Tuple[float, float, float, float, float]]:
+        """
+        Nivel de largo plazo: (desde, hasta, mínimo, promedio, máximo) por
+        bloque completo, del más antiguo al más reciente.
+        """
+        return self.resumen_rango()
+
+    def resumen_rango(self, desde: Optional[float] = None,
+                      hasta: Optional[float] = None) -> List[Tuple[float, float, float, float, float]]:
+        """
+        Bloques del resumen que se superponen con un rango de tiempo.
+
+        Args:
+            desde: Instante inicial (None = sin límite)
+            hasta: Instante final excluido (None = sin límite)
+
+        Returns:
+            Lista de (desde, hasta, mínimo, promedio, máximo)
+        """
+        inicios, resumen = self._resumen_desde, self._resumen
+        if inicios is None:
+            return []
+        i = 0
+        if desde is not None:
+            # El bloque anterior al primero que empieza después de `desde` puede cubrirlo
+            i = max(bisect_right(inicios, desde) - 1, 0)
+            if i < len(inicios) and resumen[i * _CAMPOS_RESUMEN] < desde:
+                i += 1
+        j = len(inicios) if hasta is None else bisect_left(inicios, hasta)
+        return [(inicios[k],) + tuple(resumen[k * _CAMPOS_RESUMEN:(k + 1) * _CAMPOS_RESUMEN])
+                for k in range(i, j)]
+
+    @property
+    def comprimido(self) -> bool:
+        """Si las lecturas desalojadas se archivan comprimidas."""
+        return self._archivo is not None
+
+    def archivadas(self) -> int:
+        """
+        Returns:
+            Lecturas desalojadas que conserva el archivo comprimido (0 sin compresión)
+        """
+        return len(self._archivo) if self._archivo is not None else 0
+
+    def valores(self) -> List[float]:
+        """
+        Returns:
+            Lecturas recientes, de más antigua a más reciente
+        """
+        return self._tramo(self._datos, 0, self._largo).tolist()
+
+    def instantes(self) -> List[float]:
+        """
+        Returns:
+            Instantes de las lecturas recientes, en el mismo orden que valores()
+        """
+        return self._tramo(self._instantes, 0, self._largo).tolist()
+
+    def ultimo(self) -> float:
+        """
+        Returns:
+            Lectura más reciente
+
+        Raises:
+            IndexError: Si el historial está vacío
+        """
+        return self[-1]
+
+    def __len__(self):
+        return self._largo
+
+    def __iter__(self):
+        return iter(self._tramo(self._datos, 0, self._largo))
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return self.valores()[indice]
+        largo = self._largo
+        if indice < 0:
+            indice += largo
+        if not 0 <= indice < largo:
+            raise IndexError("índice de historial fuera de rango")
+        return self._datos[(self._inicio + indice) % self._tope]
+
+    def __eq__(self, otro):
+        if isinstance(otro, Historial):
+            return self.valores() == otro.valores()
+        try:
+            return self.valores() == list(otro)
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __sizeof__(self):
+        tamanio = (object.__sizeof__(self) + sys.getsizeof(self._datos) +
+                   sys.getsizeof(self._instantes))
+        if self._resumen is not None:
+            tamanio += sys.getsizeof(self._resumen_desde) + sys.getsizeof(self._resumen)
+        if self._archivo is not None:
+            tamanio += sys.getsizeof(self._archivo)
+        return tamanio
+
+    def __getstate__(self) -> dict:
+        instantes, valores = self.exportar()
+        return {
+            "capacidad": self.capacidad,
+            "lecturas_por_bloque": self.lecturas_por_bloque,
+            "bloques": self.bloques,
+            "total": self.total,
+            "valores": valores,
+            "instantes": instantes,
+            "ultimo": self._ultimo,
+            "resumen_desde": self._resumen_desde,
+            "resumen": self._resumen,
+            "archivo": self._archivo
+        }
+
+    def __setstate__(self, estado: dict):
+        self.capacidad = estado["capacidad"]
+        self.lecturas_por_bloque = estado["lecturas_por_bloque"]
+        self.bloques = estado["bloques"]
+        self.total = estado["total"]
+        self._tope = (-(-self.capacidad // self.lecturas_por_bloque) + 1) * self.lecturas_por_bloque
+        self._datos = array('d', estado["valores"])
+        self._inicio = 0
+        self._largo = len(self._datos)
+        # Estados guardados sin instantes: las lecturas quedan en el instante 0
+        self._instantes = array('d', estado.get("instantes") or [0.0] * self._largo)
+        self._ultimo = estado.get("ultimo", self._instantes[-1] if self._largo else float("-inf"))
+        self._resumen_desde = estado.get("resumen_desde")
+        self._resumen = estado["resumen"] if self._resumen_desde is not None else None
+        self._archivo = estado.get("archivo")
+
+    def __repr__(self):
+        return (f"Historial({self.valores()!r}, capacidad={self.capacidad}, "
+                f"total={self.total}, bloques_resumen={len(self._resumen_desde or ())})")
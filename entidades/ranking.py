@@ -0,0 +1,190 @@
+"""
+Clase ListaOrdenada - Lista siempre ordenada con altas y bajas baratas
+
+Las claves se guardan en sublistas ordenadas de a lo sumo 2 * CARGA
+elementos, con el máximo de cada una en una lista aparte. Agregar o
+quitar busca la sublista por bisección sobre los máximos y desplaza sólo
+esa sublista, así que cuesta O(log n + CARGA) en lugar del O(n) de
+insertar en una lista plana. Recorrer desde cualquiera de los extremos
+es directo: los k mayores o menores salen en O(k).
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+
+class ListaOrdenada:
+    """
+    Multiconjunto ordenado de claves comparables.
+    """
+
+    CARGA = 256
+
+    __slots__ = ("_listas", "_maximos", "_largo")
+
+    def __init__(self, claves: Iterable = ()):
+        """
+        Args:
+            claves: Claves iniciales, en cualquier orden
+        """
+        ordenadas = sorted(claves)
+        paso = self.CARGA
+        self._listas = [ordenadas[i:i + paso] for i in range(0, len(ordenadas), paso)]
+        self._maximos = [lista[-1] for lista in self._listas]
+        self._largo = len(ordenadas)
+
+    def agregar(self, clave):
+        """
+        Args:
+            clave: Clave a insertar en su posición
+        """
+        maximos = self._maximos
+        if not maximos:
+            self._listas.append([clave])
+            maximos.append(clave)
+            self._largo = 1
+            return
+        i = bisect_left(maximos, clave)
+        if i == len(maximos):
+            # Mayor que todas: va al final de la última sublista
+            i -= 1
+            lista = self._listas[i]
+            lista.append(clave)
+            maximos[i] = clave
+        else:
+            lista = self._listas[i]
+            insort(lista, clave)
+        self._largo += 1
+        if len(lista) > 2 * self.CARGA:
+            self._dividir(i)
+
+    def _dividir(self, i: int):
+        """Parte en dos la sublista i, que superó el doble de CARGA."""
+        lista = self._listas[i]
+        self._listas.insert(i + 1, lista[self.CARGA:])
+        del lista[self.CARGA:]
+        self._maximos[i:i + 1] = [lista[-1], self._listas[i + 1][-1]]
+
+    def quitar(self, clave):
+        """
+        Args:
+            clave: Clave a quitar (una ocurrencia)
+
+        Raises:
+            ValueError: Si la clave no está
+        """
+        i, j = self._ubicar(clave)
+        self._quitar_en(i, j)
+
+    def _ubicar(self, clave) -> tuple:
+        """
+        Returns:
+            (sublista, posición) de la clave
+
+        Raises:
+            ValueError: Si la clave no está
+        """
+        i = bisect_left(self._maximos, clave)
+        if i < len(self._maximos):
+            lista = self._listas[i]
+            j = bisect_left(lista, clave)
+            if lista[j] == clave:
+                return i, j
+        raise ValueError(f"{clave!r} no está en la lista")
+
+    def _quitar_en(self, i: int, j: int):
+        """Quita la clave j de la sublista i."""
+        lista = self._listas[i]
+        maximos = self._maximos
+        del lista[j]
+        self._largo -= 1
+        if not lista:
+            del self._listas[i]
+            del maximos[i]
+        elif j == len(lista):
+            maximos[i] = lista[-1]
+        elif len(lista) < self.CARGA // 2 and i + 1 < len(self._listas):
+            # Sublista chica: se une con la siguiente
+            lista.extend(self._listas.pop(i + 1))
+            del maximos[i]
+            if len(lista) > 2 * self.CARGA:
+                self._dividir(i)
+
+    def reemplazar(self, anterior, nueva):
+        """
+        Cambia una clave por otra. Si la nueva queda entre las mismas
+        vecinas (variaciones chicas) se reemplaza en su lugar sin
+        desplazar nada.
+
+        Args:
+            anterior: Clave presente
+            nueva: Clave que la reemplaza
+
+        Raises:
+            ValueError: Si la clave anterior no está
+        """
+        i, j = self._ubicar(anterior)
+        maximos = self._maximos
+        lista = self._listas[i]
+        ultima = len(lista) - 1
+        # La nueva clave debe quedar entre la anterior y la siguiente de la lista completa
+        if ((lista[j - 1] <= nueva if j else i == 0 or maximos[i - 1] <= nueva) and
+                (nueva <= lista[j + 1] if j < ultima
+                 else i + 1 == len(maximos) or nueva <= self._listas[i + 1][0])):
+            lista[j] = nueva
+            if j == ultima:
+                maximos[i] = nueva
+            return
+        self._quitar_en(i, j)
+        self.agregar(nueva)
+
+    def mayores(self, cantidad: int) -> List:
+        """
+        Returns:
+            Las claves más grandes, de mayor a menor
+        """
+        return list(islice(reversed(self), cantidad))
+
+    def menores(self, cantidad: int) -> List:
+        """
+        Returns:
+            Las claves más chicas, de menor a mayor
+        """
+        return list(islice(self, cantidad))
+
+    def contar_mayores(self, clave) -> int:
+        """
+        Args:
+            clave: Clave de referencia
+
+        Returns:
+            Cantidad de claves estrictamente mayores (O(n / CARGA))
+        """
+        i = bisect_right(self._maximos, clave)
+        if i == len(self._maximos):
+            return 0
+        lista = self._listas[i]
+        mayores = len(lista) - bisect_right(lista, clave)
+        return mayores + sum(len(otra) for otra in self._listas[i + 1:])
+
+    def __contains__(self, clave) -> bool:
+        i = bisect_left(self._maximos, clave)
+        if i == len(self._maximos):
+            return False
+        lista = self._listas[i]
+        return lista[bisect_left(lista, clave)] == clave
+
+    def __iter__(self) -> Iterator:
+        for lista in self._listas:
+            yield from lista
+
+    def __reversed__(self) -> Iterator:
+        for lista in reversed(self._listas):
+            yield from reversed(lista)
+
+    def __len__(self):
+        return self._largo
+
+    def __repr__(self):
+        return f"ListaOrdenada(claves={self._largo}, sublistas={len(self._listas)})"
@@ -0,0 +1,432 @@
+"""
+Clase AlmacenRodeo - Columnas contiguas con los datos numéricos del rodeo
+
+Cada animal del sistema ocupa una posición (slot) y sus campos viven en
+arreglos de NumPy, uno por columna (peso, peso inicial, temperatura,
+días, salud, ración, tipo y corral). Los objetos Animal quedan como
+vistas sobre su slot, y las estadísticas del rodeo se calculan sobre
+columnas enteras en lugar de recorrer objetos de Python.
+
+Los slots ocupados son siempre 0..n-1: al quitar un animal, el último
+ocupa su lugar. Agregar y quitar animales puede hacerse con los sensores
+leyendo: las escrituras de los campos del animal toman el mismo lock que
+_crecer y desadjuntar, así ninguna cae en una columna vieja o en un slot
+ajeno.
+"""
+
+import sys
+import threading
+from typing import Dict, List, Sequence
+from entidades.animal import (
+    Animal, COLUMNAS, COL_PESO, COL_PESO_INICIAL, COL_TEMPERATURA, COL_SALUD, COL_TIPO,
+    COL_CORRAL, SALUDABLE, ENFERMO_FIEBRE, ENFERMO_HIPOTERMIA, UMBRAL_FIEBRE, UMBRAL_HIPOTERMIA
+)
+from entidades.salud import EstadoSalud
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él el sistema recorre los objetos
+    np = None
+
+
+class AlmacenRodeo:
+    """
+    Almacén columnar de los animales de un FeedlotSystem.
+    """
+
+    CAPACIDAD_INICIAL = 1024
+
+    def __init__(self, capacidad: int = CAPACIDAD_INICIAL):
+        """
+        Inicializa el almacén.
+
+        Args:
+            capacidad: Slots reservados inicialmente (crece al doble)
+
+        Raises:
+            ImportError: Si NumPy no está instalado
+        """
+        if np is None:
+            raise ImportError("AlmacenRodeo requiere NumPy")
+
+        self.columnas = [np.zeros(capacidad, dtype=tipo) for _, tipo in COLUMNAS]
+        self.animales: List[Animal] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def disponible() -> bool:
+        """
+        Returns:
+            True si NumPy está instalado y se puede usar el almacén
+        """
+        return np is not None
+
+    def __len__(self):
+        return len(self.animales)
+
+    @property
+    def capacidad(self) -> int:
+        return len(self.columnas[0])
+
+    def columna(self, nombre: str):
+        """
+        Vista de una columna sobre los slots ocupados.
+
+        Args:
+            nombre: Nombre de la columna (ver entidades.animal.COLUMNAS)
+
+        Returns:
+            numpy.ndarray de largo len(self) (vista, no copia)
+        """
+        for indice, (columna, _) in enumerate(COLUMNAS):
+            if columna == nombre:
+                return self.columnas[indice][:len(self.animales)]
+        raise KeyError(nombre)
+
+    def _crecer(self, minimo: int):
+        """
+        Duplica la capacidad de todas las columnas hasta alcanzar el mínimo.
+
+        Args:
+            minimo: Slots requeridos
+        """
+        capacidad = self.capacidad
+        while capacidad < minimo:
+            capacidad *= 2
+        nuevas = []
+        for columna in self.columnas:
+            nueva = np.zeros(capacidad, dtype=columna.dtype)
+            nueva[:len(columna)] = columna
+            nuevas.append(nueva)
+        self.columnas = nuevas
+
+    def adjuntar(self, animal: Animal, numero_corral: int = 0) -> int:
+        """
+        Mueve los datos del animal a un slot nuevo; el animal queda como vista.
+
+        Args:
+            animal: Animal suelto (sin almacén)
+            numero_corral: Corral asignado
+
+        Returns:
+            Slot asignado
+
+        Raises:
+            ValueError: Si el animal ya pertenece a un almacén
+        """
+        with self._lock:
+            if animal._almacen is not None:
+                raise ValueError(f"{animal} ya pertenece a un almacén")
+            slot = len(self.animales)
+            if slot >= self.capacidad:
+                self._crecer(slot + 1)
+            fila = animal._fila
+            fila[COL_CORRAL] = numero_corral
+            for columna, valor in zip(self.columnas, fila):
+                columna[slot] = valor
+            self.animales.append(animal)
+            animal._slot = slot
+            animal._almacen = self
+            animal._fila = None
+            return slot
+
+    def adjuntar_varios(self, animales: Sequence[Animal], numero_corral=0) -> range:
+        """
+        Adjunta varios animales en slots consecutivos, escribiendo cada
+        columna de una vez en lugar de celda por celda.
+
+        Args:
+            animales: Animales sueltos (sin almacén)
+            numero_corral: Corral asignado a todos, o una secuencia con el
+                           corral de cada animal
+
+        Returns:
+            Slots asignados
+
+        Raises:
+            ValueError: Si alguno ya pertenece a un almacén (no se adjunta ninguno)
+        """
+        with self._lock:
+            for animal in animales:
+                if animal._almacen is not None:
+                    raise ValueError(f"{animal} ya pertenece a un almacén")
+            inicio = len(self.animales)
+            fin = inicio + len(animales)
+            if fin > self.capacidad:
+                self._crecer(fin)
+            filas = [animal._fila for animal in animales]
+            for indice, columna in enumerate(self.columnas):
+                if indice == COL_CORRAL:
+                    columna[inicio:fin] = numero_corral
+                else:
+                    columna[inicio:fin] = [fila[indice] for fila in filas]
+            for slot, animal in enumerate(animales, inicio):
+                animal._slot = slot
+                animal._almacen = self
+                animal._fila = None
+            self.animales.extend(animales)
+            return range(inicio, fin)
+
+    def desadjuntar(self, animal: Animal):
+        """
+        Devuelve los datos del animal a su fila propia y libera el slot;
+        el último animal del almacén pasa a ocupar ese slot.
+
+        Args:
+            animal: Animal de este almacén
+
+        Raises:
+            ValueError: Si el animal no pertenece a este almacén
+        """
+        with self._lock:
+            if animal._almacen is not self:
+                raise ValueError(f"{animal} no pertenece a este almacén")
+            slot = animal._slot
+            fila = [columna.item(slot) for columna in self.columnas]
+            fila[COL_CORRAL] = 0
+
+            ultimo = self.animales.pop()
+            if ultimo is not animal:
+                for columna in self.columnas:
+                    columna[slot] = columna[ultimo._slot]
+                self.animales[slot] = ultimo
+                ultimo._slot = slot
+
+            animal._fila = fila
+            animal._almacen = None
+            animal._slot = -1
+
+    def aplicar_lecturas(self, animales: Sequence[Animal], variaciones: Sequence[float],
+                         temperaturas: Sequence[float]):
+        """
+        Aplica lecturas de peso y temperatura a un grupo de animales (por
+        ejemplo, un corral leído por SensorLote) con operaciones sobre
+        columnas: suma las variaciones de peso, escribe las temperaturas y
+        el estado de salud que indican, con los mismos umbrales que
+        Animal.actualizar_temperatura. No avisa a nadie: los agregados
+        los ajusta quien llama (Corral.aplicar_lecturas).
+
+        Args:
+            animales: Animales de este almacén
+            variaciones: Variación de peso de cada animal en kg
+            temperaturas: Temperatura de cada animal en °C
+
+        Returns:
+            Tupla (pesos nuevos, variación de peso por código de tipo,
+            cambios de salud como (posición, anterior, nuevo))
+        """
+        variaciones = np.asarray(variaciones, dtype=np.float64)
+        temperaturas = np.asarray(temperaturas, dtype=np.float64)
+        estados = np.where(temperaturas >= UMBRAL_FIEBRE, ENFERMO_FIEBRE,
+                           np.where(temperaturas < UMBRAL_HIPOTERMIA, ENFERMO_HIPOTERMIA,
+                                    SALUDABLE))
+        with self._lock:
+            slots = np.fromiter((animal._slot for animal in animales), dtype=np.intp,
+                                count=len(animales))
+            peso = self.columnas[COL_PESO]
+            pesos = peso[slots] + variaciones
+            peso[slots] = pesos
+            self.columnas[COL_TEMPERATURA][slots] = temperaturas
+            salud = self.columnas[COL_SALUD]
+            anteriores = salud[slots]
+            salud[slots] = estados
+            tipos = self.columnas[COL_TIPO][slots]
+        por_tipo = np.bincount(tipos, weights=variaciones)
+        cambios = np.flatnonzero(anteriores != estados).tolist()
+        return (pesos.tolist(),
+                {tipo: float(por_tipo[tipo]) for tipo in np.unique(tipos).tolist()},
+                [(i, int(anteriores[i]), int(estados[i])) for i in cambios])
+
+    def vaciar(self):
+        """Desadjunta todos los animales (quedan sueltos con sus datos)."""
+        for animal in reversed(list(self.animales)):
+            self.desadjuntar(animal)
+
+    def bytes_por_fila(self) -> int:
+        """
+        Returns:
+            Bytes de columnas por slot
+        """
+        return sum(columna.itemsize for columna in self.columnas)
+
+    def tamanio_bytes(self) -> int:
+        """
+        Returns:
+            Bytes reservados por las columnas y la lista de animales
+        """
+        return sum(columna.nbytes for columna in self.columnas) + sys.getsizeof(self.animales)
+
+    # --- Estadísticas sobre columnas enteras ---
+
+    def estadisticas(self) -> dict:
+        """
+        Totales del rodeo en una pasada vectorizada.
+
+        Returns:
+            Diccionario con total, peso total, ganancia total y enfermos
+        """
+        n = len(self.animales)
+        peso = self.columnas[COL_PESO][:n]
+        peso_total = float(peso.sum())
+        return {
+            "total_animales": n,
+            "peso_total": peso_total,
+            "ganancia_total": peso_total - float(self.columnas[COL_PESO_INICIAL][:n].sum()),
+            # SALUDABLE es el código 0: contar no nulos evita una comparación
+            "animales_enfermos": int(np.count_nonzero(self.columnas[COL_SALUD][:n]))
+        }
+
+    def mejores(self, cantidad: int) -> List[Animal]:
+        """
+        Animales con mayor ganancia de peso, sin ordenar todo el rodeo.
+
+        Args:
+            cantidad: Animales a retornar
+
+        Returns:
+            Lista de animales de mayor a menor ganancia
+        """
+        return self.por_ganancia(cantidad)
+
+    def por_ganancia(self, cantidad: int, mayores: bool = True, numero_corral: int = None,
+                     tipo: int = None) -> List[Animal]:
+        """
+        Extremo del rodeo por ganancia de peso, sin ordenar todo el rodeo
+        (argpartition). Sigue el orden total (ganancia, id) de
+        RankingGanancia: a igual ganancia, primero el ID mayor entre los
+        mejores y el menor entre los peores.
+
+        Args:
+            cantidad: Animales a retornar
+            mayores: True para los de mayor ganancia, False para los de menor
+            numero_corral: Sólo los de ese corral (None = todos)
+            tipo: Sólo los de ese código de tipo (None = todos)
+
+        Returns:
+            Lista de animales, del extremo hacia adentro
+        """
+        n = len(self.animales)
+        indices = np.arange(n)
+        if numero_corral is not None:
+            indices = indices[self.columnas[COL_CORRAL][:n] == numero_corral]
+        if tipo is not None:
+            indices = indices[self.columnas[COL_TIPO][indices] == tipo]
+        m = len(indices)
+        if cantidad <= 0 or m == 0:
+            return []
+        ganancia = self.columnas[COL_PESO][indices] - self.columnas[COL_PESO_INICIAL][indices]
+        if cantidad < m:
+            # Todos los que empatan con el k-ésimo entran a desempatar por ID
+            if mayores:
+                umbral = np.partition(ganancia, m - cantidad)[m - cantidad]
+                candidatos = np.flatnonzero(ganancia >= umbral)
+            else:
+                umbral = np.partition(ganancia, cantidad - 1)[cantidad - 1]
+                candidatos = np.flatnonzero(ganancia <= umbral)
+        else:
+            candidatos = np.arange(m)
+        animales = self.animales
+        slots = indices[candidatos].tolist()
+        ids = np.fromiter((animales[slot].id for slot in slots), dtype=np.int64, count=len(slots))
+        orden = np.lexsort((ids, ganancia[candidatos]))
+        if mayores:
+            orden = orden[::-1]
+        return [animales[slots[i]] for i in orden[:cantidad].tolist()]
+
+    def enfermos(self) -> List[Animal]:
+        """
+        Returns:
+            Animales con estado de salud distinto de Saludable, por slot
+        """
+        n = len(self.animales)
+        slots = np.flatnonzero(self.columnas[COL_SALUD][:n] != SALUDABLE)
+        return [self.animales[slot] for slot in slots.tolist()]
+
+    def filtrar_salud(self, mascara: int = EstadoSalud.ATENCION) -> List[Animal]:
+        """
+        Animales con alguna de las condiciones de la máscara: un AND de
+        bits sobre la columna de salud de todo el rodeo.
+
+        Args:
+            mascara: Banderas de EstadoSalud (ej. FIEBRE | EN_TRATAMIENTO)
+
+        Returns:
+            Animales que comparten al menos una bandera, por slot
+        """
+        n = len(self.animales)
+        slots = np.flatnonzero(self.columnas[COL_SALUD][:n] & int(mascara))
+        return [self.animales[slot] for slot in slots.tolist()]
+
+    def contar_salud(self, mascara: int = EstadoSalud.ATENCION) -> int:
+        """
+        Args:
+            mascara: Banderas de EstadoSalud
+
+        Returns:
+            Cantidad de animales con alguna de las condiciones
+        """
+        n = len(self.animales)
+        return int(np.count_nonzero(self.columnas[COL_SALUD][:n] & int(mascara)))
+
+    def posiciones_salud(self, slots: Sequence[int], mascara: int = EstadoSalud.ATENCION) -> List[int]:
+        """
+        Filtra un grupo de animales (por ejemplo, un corral) por salud
+        reuniendo sólo sus slots.
+
+        Args:
+            slots: Slots del grupo, en el orden del grupo
+            mascara: Banderas de EstadoSalud
+
+        Returns:
+            Posiciones dentro de `slots` de los animales con alguna condición
+        """
+        indices = np.fromiter(slots, dtype=np.intp, count=len(slots))
+        return np.flatnonzero(self.columnas[COL_SALUD][indices] & int(mascara)).tolist()
+
+    def estadisticas_slots(self, slots: List[int]) -> dict:
+        """
+        Totales de un grupo de animales (por ejemplo, un corral). Reúne
+        sólo esos slots, así el costo depende del grupo y no del rodeo.
+
+        Args:
+            slots: Slots de los animales
+
+        Returns:
+            Diccionario con total, peso total y enfermos del grupo
+        """
+        indices = np.fromiter(slots, dtype=np.intp, count=len(slots))
+        return {
+            "total_animales": len(indices),
+            "peso_total": float(self.columnas[COL_PESO][indices].sum()),
+            "animales_enfermos": int(np.count_nonzero(self.columnas[COL_SALUD][indices]))
+        }
+
+    def estadisticas_por_corral(self) -> Dict[int, dict]:
+        """
+        Totales de todos los corrales en una sola pasada (bincount).
+
+        Returns:
+            Diccionario número de corral -> total, peso total y enfermos
+        """
+        n = len(self.animales)
+        if n == 0:
+            return {}
+        corral = self.columnas[COL_CORRAL][:n]
+        totales = np.bincount(corral)
+        pesos = np.bincount(corral, weights=self.columnas[COL_PESO][:n])
+        enfermos = np.bincount(corral[self.columnas[COL_SALUD][:n] != SALUDABLE],
+                               minlength=len(totales))
+        return {
+            numero: {
+                "total_animales": int(totales[numero]),
+                "peso_total": float(pesos[numero]),
+                "animales_enfermos": int(enfermos[numero])
+            }
+            for numero in np.flatnonzero(totales).tolist()
+        }
+
+    def __str__(self):
+        return f"AlmacenRodeo({len(self.animales)}/{self.capacidad} slots)"
+
+    def __repr__(self):
+        return f"AlmacenRodeo(animales={len(self.animales)}, capacidad={self.capacidad})"
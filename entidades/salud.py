@@ -0,0 +1,85 @@
+"""
+Estado de salud - Banderas de bits en lugar de texto libre
+
+Cada condición es un bit (fiebre, hipotermia, en tratamiento, bajo
+observación) y un estado es la combinación; Saludable es 0. Así la
+columna de salud del AlmacenRodeo se filtra con una sola operación de
+máscara sobre todo el rodeo, y el texto sólo se arma al mostrarlo.
+"""
+
+from enum import IntFlag
+from typing import Union
+
+
+class EstadoSalud(IntFlag):
+    """Condiciones de salud de un animal, combinables."""
+
+    SALUDABLE = 0
+    FIEBRE = 1
+    HIPOTERMIA = 2
+    EN_TRATAMIENTO = 4
+    BAJO_OBSERVACION = 8
+
+    # Máscaras de consulta
+    ENFERMO = FIEBRE | HIPOTERMIA
+    ATENCION = FIEBRE | HIPOTERMIA | EN_TRATAMIENTO | BAJO_OBSERVACION
+
+
+# Textos que usaba el sistema cuando el estado era un string
+TEXTOS_SALUD = {
+    EstadoSalud.SALUDABLE: "Saludable",
+    EstadoSalud.BAJO_OBSERVACION: "Bajo observación",
+    EstadoSalud.FIEBRE: "Enfermo - Fiebre",
+    EstadoSalud.HIPOTERMIA: "Enfermo - Hipotermia",
+    EstadoSalud.EN_TRATAMIENTO | EstadoSalud.FIEBRE: "En tratamiento - Fiebre",
+    EstadoSalud.EN_TRATAMIENTO | EstadoSalud.HIPOTERMIA: "En tratamiento - Hipotermia",
+}
+ESTADOS_POR_TEXTO = {texto: estado for estado, texto in TEXTOS_SALUD.items()}
+
+_NOMBRES_CONDICION = (
+    (EstadoSalud.EN_TRATAMIENTO, "En tratamiento"),
+    (EstadoSalud.BAJO_OBSERVACION, "Bajo observación"),
+    (EstadoSalud.FIEBRE, "Fiebre"),
+    (EstadoSalud.HIPOTERMIA, "Hipotermia"),
+)
+
+
+def texto_salud(estado: int) -> str:
+    """
+    Texto para mostrar un estado de salud.
+
+    Args:
+        estado: EstadoSalud o su valor entero
+
+    Returns:
+        El texto histórico si la combinación lo tiene; si no, las
+        condiciones separadas por " - "
+    """
+    texto = TEXTOS_SALUD.get(estado)
+    if texto is not None:
+        return texto
+    return " - ".join(nombre for bandera, nombre in _NOMBRES_CONDICION if estado & bandera)
+
+
+def estado_salud(valor: Union[int, str]) -> EstadoSalud:
+    """
+    Convierte un texto histórico o un entero en EstadoSalud.
+
+    Args:
+        valor: EstadoSalud, entero o texto como "Enfermo - Fiebre"
+
+    Returns:
+        EstadoSalud correspondiente
+
+    Raises:
+        ValueError: Si el texto no es un estado conocido o el entero
+                    tiene bits fuera de las condiciones definidas
+    """
+    if isinstance(valor, str):
+        try:
+            return ESTADOS_POR_TEXTO[valor]
+        except KeyError:
+            raise ValueError(f"Estado de salud desconocido: {valor!r}") from None
+    if valor & ~EstadoSalud.ATENCION:
+        raise ValueError(f"Estado de salud inválido: {valor!r}")
+    return EstadoSalud(valor)
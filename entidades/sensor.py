@@ -7,7 +7,16 @@ import threading
 import time
 import random
 from abc import ABC, abstractmethod
-from typing import List
+from collections import deque
+from typing import Iterable, List
+from consola import consola
+from servicios.aleatorio_service import FlujoAleatorio
+from servicios.reloj_service import reloj
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él, SensorLote usa listas
+    np = None
 
 class Sensor(ABC):
     """
@@ -29,6 +38,38 @@ class Sensor(ABC):
         self.thread = None
         self.observadores = []
         
+        # Canal de ingesta opcional (IngestaLecturas). Si está definido,
+        # la lectura se encola y la aplica el consumidor por lotes.
+        self.ingesta = None
+        
+        # Muestreo adaptativo opcional (MuestreoAdaptativo). Si está
+        # definido, el intervalo efectivo varía según el estado de salud.
+        self.intervalo_base = intervalo
+        self.muestreo = None
+        self.lecturas_estables = 0
+        
+        # Flujo aleatorio propio (sin estado global compartido entre hilos).
+        # Con sembrar() se deriva de la semilla maestra de la corrida.
+        self.aleatorio = FlujoAleatorio(random.getrandbits(64))
+        
+    def nombre_flujo(self) -> str:
+        """
+        Nombre estable del flujo aleatorio del sensor.
+        
+        Returns:
+            Clase del sensor e ID del animal (por ejemplo 'SensorPeso:17')
+        """
+        return f"{self.__class__.__name__}:{self.animal.id}"
+    
+    def sembrar(self, fuente):
+        """
+        Reemplaza el flujo aleatorio por uno derivado de una FuenteAleatoria.
+        
+        Args:
+            fuente: FuenteAleatoria de la corrida
+        """
+        self.aleatorio = fuente.generador(self.nombre_flujo())
+        
     def agregar_observador(self, observador):
         """
         Agrega un observador (patrón Observer)
@@ -38,27 +79,96 @@ class Sensor(ABC):
         """
         self.observadores.append(observador)
         
-    def notificar_observadores(self, mensaje: str, tipo: str):
+    def notificar_observadores(self, mensaje: str, tipo: str, animal=None):
         """
         Notifica a todos los observadores registrados
         
         Args:
             mensaje: Mensaje de la notificación
             tipo: Tipo de alerta (FIEBRE, BAJO_RENDIMIENTO, etc.)
+            animal: Animal afectado (default: el animal del sensor)
         """
+        if animal is None:
+            animal = self.animal
         for obs in self.observadores:
-            obs.actualizar(self.animal, mensaje, tipo)
+            obs.actualizar(animal, mensaje, tipo)
     
     @abstractmethod
-    def realizar_lectura(self):
+    def medir(self):
         """
-        Método abstracto para realizar lectura del sensor.
+        Método abstracto que genera una lectura sin aplicarla.
         Debe ser implementado por las subclases.
+        
+        Returns:
+            Valor compacto de la lectura (se encola tal cual)
+        """
+        pass
+    
+    @abstractmethod
+    def aplicar_lectura(self, valor):
+        """
+        Método abstracto que aplica una lectura al animal y
+        notifica las alertas que correspondan.
+        Debe ser implementado por las subclases.
+        
+        Args:
+            valor: Valor devuelto por medir()
         """
         pass
     
+    def adaptar_intervalo(self, atencion: bool):
+        """
+        Recalcula el intervalo efectivo si hay muestreo adaptativo.
+        Los planificadores releen sensor.intervalo al reprogramar.
+        
+        Lo llama el hilo que aplica la lectura: el trabajador que la hizo
+        o, con canal de ingesta, el consumidor, mientras el planificador
+        puede estar leyendo el intervalo desde otro hilo. No hace falta
+        lock: intervalo es un float que se reemplaza con una sola
+        asignación (nunca se lee a medio escribir) y lecturas_estables
+        sólo lo escribe ese hilo. Con ingesta el planificador reprograma
+        al encolar, así que el intervalo nuevo rige desde la lectura
+        siguiente a la ya agendada.
+        
+        Args:
+            atencion: True si la lectura o el animal requieren seguimiento
+        """
+        if self.muestreo is not None:
+            self.intervalo = self.muestreo.calcular_intervalo(self, atencion)
+    
+    def realizar_lectura(self):
+        """
+        Realiza una lectura del sensor.
+        Si hay canal de ingesta la encola; si no, la aplica directamente.
+        """
+        self.entregar(self.medir())
+    
+    def entregar(self, valor):
+        """
+        Entrega una lectura ya medida al canal de ingesta o al rodeo.
+        
+        Args:
+            valor: Valor con el formato de medir()
+        """
+        if self.ingesta is not None:
+            self.ingesta.publicar(self, valor)
+        else:
+            self.aplicar_lectura(valor)
+    
+    async def realizar_lectura_async(self):
+        """
+        Versión corrutina de realizar_lectura, usada por RuntimeAsyncio.
+        Las lecturas simuladas no bloquean, así que delega en la versión
+        sincrónica; un sensor real con E/S puede sobrescribirla.
+        """
+        self.realizar_lectura()
+    
     def iniciar(self):
-        """Inicia el sensor en un hilo separado (daemon thread)"""
+        """
+        Inicia el sensor en un hilo separado (daemon thread).
+        Uso autónomo; dentro del feedlot los sensores los ejecuta
+        el PlanificadorSensores con un pool fijo de hilos.
+        """
         if not self.activo:
             self.activo = True
             self.thread = threading.Thread(target=self._ejecutar, daemon=True)
@@ -80,32 +190,124 @@ class Sensor(ABC):
             time.sleep(self.intervalo)
 
 
+def tasa_muestreo(sensores: Iterable[Sensor]) -> float:
+    """
+    Tasa de lecturas efectiva de un conjunto de sensores según sus
+    intervalos actuales (con muestreo adaptativo, varía). La comparten
+    PlanificadorSensores, RuntimeAsyncio y MotorEventos.
+    
+    Args:
+        sensores: Sensores registrados
+        
+    Returns:
+        Lecturas por segundo (virtual en el MotorEventos)
+    """
+    return sum(1.0 / s.intervalo for s in sensores if s.intervalo > 0)
+
+
+def _aplicar_peso(sensor: Sensor, variacion: float) -> bool:
+    """
+    Aplica una variación de peso al animal del sensor, la muestra y
+    notifica el bajo rendimiento. La comparten SensorPeso y SensorReplay.
+    
+    Args:
+        sensor: Sensor que hizo la lectura
+        variacion: Variación de peso en kg
+        
+    Returns:
+        True si la lectura es de bajo rendimiento
+    """
+    animal = sensor.animal
+    animal.actualizar_peso(variacion)
+    
+    # Log de la lectura (se formatea solo si la consola la muestra)
+    consola.emitir("sensor_peso", "[SensorPeso] {} → +{:.2f} kg (Total: {:.2f} kg)",
+                   animal, variacion, animal.peso)
+    
+    # Notificar si hay bajo rendimiento (< 0.7 kg/día)
+    if variacion < 0.7:
+        sensor.notificar_observadores(
+            f"Bajo rendimiento en {animal}: +{variacion:.2f} kg",
+            "BAJO_RENDIMIENTO"
+        )
+        return True
+    return False
+
+
+def _aplicar_temperatura(sensor: Sensor, nueva_temp: float) -> bool:
+    """
+    Aplica una temperatura al animal del sensor, la muestra si cambió o
+    es anómala y notifica fiebre (>=39.5°C) o hipotermia (<37.0°C). La
+    comparten SensorTemperatura y SensorReplay.
+    
+    Args:
+        sensor: Sensor que hizo la lectura
+        nueva_temp: Temperatura en °C
+        
+    Returns:
+        True si la temperatura es de fiebre o hipotermia
+    """
+    animal = sensor.animal
+    temp_anterior = animal.temperatura
+    animal.actualizar_temperatura(nueva_temp)
+    fiebre = nueva_temp >= 39.5
+    hipotermia = nueva_temp < 37.0
+    
+    # Mostrar solo si hay cambio significativo o anomalía
+    if abs(nueva_temp - temp_anterior) > 0.3 or fiebre or hipotermia:
+        # Determinar estado
+        if fiebre:
+            estado = " FIEBRE"
+        elif hipotermia:
+            estado = " HIPOTERMIA"
+        else:
+            estado = "✓ Normal"
+        
+        consola.emitir("sensor_temp", "[SensorTemp] {} → {:.1f}°C {}",
+                       animal, nueva_temp, estado)
+        
+        # Notificar si hay fiebre
+        if fiebre:
+            sensor.notificar_observadores(
+                f"Fiebre detectada en {animal}: {nueva_temp:.1f}°C",
+                "FIEBRE"
+            )
+        # Notificar si hay hipotermia
+        elif hipotermia:
+            sensor.notificar_observadores(
+                f"Hipotermia en {animal}: {nueva_temp:.1f}°C",
+                "HIPOTERMIA"
+            )
+    return fiebre or hipotermia
+
+
 class SensorPeso(Sensor):
     """
     Sensor de peso - simula ganancia diaria de peso.
     Monitorea el incremento de peso y detecta bajo rendimiento.
     """
     
-    def realizar_lectura(self):
+    def medir(self) -> float:
         """
         Realiza una lectura de peso simulada.
         Simula variación natural de peso diaria.
+        
+        Returns:
+            Variación de peso en kg
         """
         # Simula variación natural de peso (0.5 a 1.5 kg)
-        variacion = random.uniform(0.5, 1.5)
-        self.animal.actualizar_peso(variacion)
-        
-        # Log de la lectura
-        mensaje = (f"[SensorPeso] {self.animal} → "
-                  f"+{variacion:.2f} kg (Total: {self.animal.peso:.2f} kg)")
-        print(mensaje)
+        return self.aleatorio.uniform(0.5, 1.5)
+    
+    def aplicar_lectura(self, variacion: float):
+        """
+        Aplica la variación de peso y detecta bajo rendimiento.
         
-        # Notificar si hay bajo rendimiento (< 0.7 kg/día)
-        if variacion < 0.7:
-            self.notificar_observadores(
-                f"Bajo rendimiento en {self.animal}: +{variacion:.2f} kg",
-                "BAJO_RENDIMIENTO"
-            )
+        Args:
+            variacion: Variación de peso en kg
+        """
+        alerta = _aplicar_peso(self, variacion)
+        if self.muestreo is not None:
+            self.adaptar_intervalo(alerta or self.muestreo.requiere_atencion(self.animal))
 
 
 class SensorTemperatura(Sensor):
@@ -114,41 +316,335 @@ class SensorTemperatura(Sensor):
     Monitorea la temperatura corporal del animal.
     """
     
-    def realizar_lectura(self):
+    def medir(self) -> float:
         """
         Realiza una lectura de temperatura simulada.
-        Detecta fiebre (>39.5°C) e hipotermia (<37.0°C).
+        
+        Returns:
+            Temperatura en °C
         """
         # Temperatura base normal: 38.5°C
         temperatura_base = 38.5
-        variacion = random.uniform(-0.5, 1.5)
-        nueva_temp = temperatura_base + variacion
-        
-        temp_anterior = self.animal.temperatura
-        self.animal.actualizar_temperatura(nueva_temp)
-        
-        # Mostrar solo si hay cambio significativo o anomalía
-        if abs(nueva_temp - temp_anterior) > 0.3 or nueva_temp >= 39.5 or nueva_temp < 37.0:
-            # Determinar estado
-            if nueva_temp >= 39.5:
-                estado = " FIEBRE"
-            elif nueva_temp < 37.0:
-                estado = " HIPOTERMIA"
-            else:
-                estado = "✓ Normal"
+        variacion = self.aleatorio.uniform(-0.5, 1.5)
+        return temperatura_base + variacion
+    
+    def aplicar_lectura(self, nueva_temp: float):
+        """
+        Aplica la temperatura al animal.
+        Detecta fiebre (>39.5°C) e hipotermia (<37.0°C).
+        
+        Args:
+            nueva_temp: Temperatura en °C
+        """
+        alerta = _aplicar_temperatura(self, nueva_temp)
+        if self.muestreo is not None:
+            self.adaptar_intervalo(alerta or self.muestreo.requiere_atencion(self.animal))
+
+
+class SensorLote(Sensor):
+    """
+    Sensor por lotes - lee peso y temperatura de todo un corral.
+    
+    Genera las lecturas de todos los animales en un solo paso vectorizado
+    (NumPy si está disponible) y evalúa los umbrales de bajo rendimiento,
+    fiebre e hipotermia como máscaras. Solo se notifica a los observadores
+    por los animales cuya máscara está activa.
+    """
+    
+    def __init__(self, corral, intervalo: float = 6.0):
+        """
+        Inicializa un sensor por lotes
+        
+        Args:
+            corral: Corral cuyos animales se monitorean
+            intervalo: Tiempo entre lecturas en segundos
+        """
+        super().__init__(None, intervalo)
+        self.corral = corral
+        self.aleatorio_numpy = np.random.default_rng() if np is not None else None
+    
+    def nombre_flujo(self) -> str:
+        """Nombre estable del flujo aleatorio (por corral)"""
+        return f"SensorLote:{self.corral.numero}"
+    
+    def sembrar(self, fuente):
+        """
+        Reemplaza los flujos escalar y vectorizado por otros derivados
+        de una FuenteAleatoria.
+        
+        Args:
+            fuente: FuenteAleatoria de la corrida
+        """
+        super().sembrar(fuente)
+        if np is not None:
+            self.aleatorio_numpy = fuente.generador_numpy(self.nombre_flujo())
+    
+    def medir(self):
+        """
+        Genera las variaciones de peso y las temperaturas de todo el corral.
+        
+        Returns:
+            Tupla (animales, variaciones, temperaturas, bajo_rendimiento,
+            fiebre, hipotermia) con listas de valores e índices de animales
+            en alerta, o None si el corral está vacío
+        """
+        animales = list(self.corral.animales)
+        cantidad = len(animales)
+        if not cantidad:
+            return None
+        
+        if np is not None:
+            variaciones = self.aleatorio_numpy.uniform(0.5, 1.5, cantidad)
+            temperaturas = 38.5 + self.aleatorio_numpy.uniform(-0.5, 1.5, cantidad)
+            return (animales,
+                    variaciones.tolist(),
+                    temperaturas.tolist(),
+                    np.flatnonzero(variaciones < 0.7).tolist(),
+                    np.flatnonzero(temperaturas >= 39.5).tolist(),
+                    np.flatnonzero(temperaturas < 37.0).tolist())
+        
+        uniforme = self.aleatorio.uniform
+        variaciones = [uniforme(0.5, 1.5) for _ in range(cantidad)]
+        temperaturas = [38.5 + uniforme(-0.5, 1.5) for _ in range(cantidad)]
+        return (animales,
+                variaciones,
+                temperaturas,
+                [i for i, v in enumerate(variaciones) if v < 0.7],
+                [i for i, t in enumerate(temperaturas) if t >= 39.5],
+                [i for i, t in enumerate(temperaturas) if t < 37.0])
+    
+    def aplicar_lectura(self, lote):
+        """
+        Aplica las lecturas del lote y notifica las alertas enmascaradas.
+        
+        Args:
+            lote: Tupla devuelta por medir()
+        """
+        if lote is None:
+            return
+        
+        animales, variaciones, temperaturas, bajo, fiebre, hipotermia = lote
+        
+        # Con almacén: columnas de peso, temperatura y salud de una vez;
+        # por animal sólo historiales, estadísticas y alertas
+        pesos = self.corral.aplicar_lecturas(animales, variaciones, temperaturas)
+        if pesos is None:
+            for animal, variacion, temperatura in zip(animales, variaciones, temperaturas):
+                animal.actualizar_peso(variacion)
+                animal.actualizar_temperatura(temperatura)
+        else:
+            self._registrar_lecturas(animales, pesos, temperaturas, fiebre, hipotermia)
+        
+        # Una línea de resumen por lote en lugar de una por lectura
+        consola.emitir("sensor_lote",
+                       "[SensorLote] Corral #{} → {} lecturas | "
+                       "Bajo rend.: {} | Fiebre: {} | Hipotermia: {}",
+                       self.corral.numero, len(animales), len(bajo),
+                       len(fiebre), len(hipotermia))
+        
+        # Notificar solo a los animales con máscara activa
+        for i in bajo:
+            self.notificar_observadores(
+                f"Bajo rendimiento en {animales[i]}: +{variaciones[i]:.2f} kg",
+                "BAJO_RENDIMIENTO", animales[i]
+            )
+        for i in fiebre:
+            self.notificar_observadores(
+                f"Fiebre detectada en {animales[i]}: {temperaturas[i]:.1f}°C",
+                "FIEBRE", animales[i]
+            )
+        for i in hipotermia:
+            self.notificar_observadores(
+                f"Hipotermia en {animales[i]}: {temperaturas[i]:.1f}°C",
+                "HIPOTERMIA", animales[i]
+            )
+        
+        # El corral se acelera si cualquiera de sus animales lo requiere
+        if self.muestreo is not None:
+            self.adaptar_intervalo(bool(bajo or fiebre or hipotermia) or
+                                   any(map(self.muestreo.requiere_atencion, animales)))
+
+
+    def _registrar_lecturas(self, animales, pesos, temperaturas, fiebre, hipotermia):
+        """
+        Agrega las lecturas de un lote ya escrito en el almacén a los
+        historiales y las estadísticas de cada animal, fechadas todas con
+        el mismo instante.
+        
+        Args:
+            animales: Animales del lote
+            pesos: Peso nuevo de cada animal
+            temperaturas: Temperatura de cada animal
+            fiebre: Posiciones con fiebre
+            hipotermia: Posiciones con hipotermia
+        """
+        instante = (self.corral.reloj or reloj).ahora()
+        for animal, peso, temperatura in zip(animales, pesos, temperaturas):
+            animal.historial_peso.append(peso, instante)
+            animal.historial_temperatura.append(temperatura, instante)
+            estadisticas = animal.estadisticas
+            estadisticas.peso.agregar(peso)
+            estadisticas.tendencia_peso.agregar(peso)
+            estadisticas.temperatura.agregar(temperatura)
+        for i in fiebre:
+            animales[i].estadisticas.lecturas_fiebre += 1
+        for i in hipotermia:
+            animales[i].estadisticas.lecturas_hipotermia += 1
+
+
+class SensorReplay(Sensor):
+    """
+    Sensor de reproducción - devuelve lecturas grabadas en lugar de
+    generarlas al azar.
+    
+    Cada lectura es un par (peso, temperatura) absoluto, como en los CSV
+    de PersistenciaService.exportar_historico_animales; un None indica que
+    la lectura no es de esa serie y no se aplica. Un tercer elemento opcional es la
+    espera en segundos hasta la lectura siguiente (la separación grabada):
+    si está, reemplaza al intervalo y al muestreo adaptativo. Se aplica con
+    la misma lógica y los mismos umbrales que SensorPeso y
+    SensorTemperatura, así un incidente grabado dispara las mismas alertas.
+    """
+    
+    def __init__(self, animal, lecturas=(), intervalo: float = 6.0, peso_previo: float = None):
+        """
+        Inicializa un sensor de reproducción
+        
+        Args:
+            animal: Animal asociado al sensor
+            lecturas: Tuplas (peso, temperatura) o (peso, temperatura, espera)
+                      a reproducir en orden
+            intervalo: Tiempo entre lecturas en segundos (sin espera grabada)
+            peso_previo: Peso grabado anterior a la primera lectura
+                         (default: peso actual del animal)
+        """
+        super().__init__(animal, intervalo)
+        self.lecturas = deque(lecturas)
+        self.peso_previo = animal.peso if peso_previo is None else peso_previo
+        self.reproducidas = 0
+        # True mientras el ritmo lo marcan las esperas grabadas
+        self.espaciado_grabado = False
+        
+        # Función opcional que recibe el sensor al agotarse las lecturas
+        # (ReproductorHistorico la usa para sacarlo del planificador)
+        self.al_agotarse = None
+    
+    @property
+    def agotado(self) -> bool:
+        """True si ya no quedan lecturas grabadas"""
+        return not self.lecturas
+    
+    def medir(self):
+        """
+        Toma la próxima lectura grabada y, si trae espera, la usa como
+        intervalo hasta la siguiente. Al tomar la última el sensor se
+        desactiva, así no sigue despertando al planificador.
+        
+        Returns:
+            Par (peso, temperatura), o None si no quedan lecturas
+        """
+        lectura = self.lecturas.popleft() if self.lecturas else None
+        if lectura is not None and len(lectura) > 2:
+            peso, temperatura, espera = lectura
+            lectura = (peso, temperatura)
+            if espera is not None:
+                self.espaciado_grabado = True
+                self.intervalo = espera
+        if not self.lecturas and self.activo:
+            self.activo = False
+            if self.al_agotarse is not None:
+                self.al_agotarse(self)
+        return lectura
+    
+    def aplicar_lectura(self, lectura):
+        """
+        Aplica una lectura grabada: la diferencia de peso con la lectura
+        anterior y la temperatura registrada (lo que no sea None).
+        
+        Args:
+            lectura: Par (peso, temperatura) o None
+        """
+        if lectura is None:
+            return
+        peso, temperatura = lectura
+        self.reproducidas += 1
+        
+        # Misma lógica de log y umbrales que los sensores simulados
+        alerta = False
+        if peso is not None:
+            variacion = peso - self.peso_previo
+            self.peso_previo = peso
+            alerta = _aplicar_peso(self, variacion)
+        if temperatura is not None:
+            alerta = _aplicar_temperatura(self, temperatura) or alerta
+        if self.muestreo is not None and not self.espaciado_grabado:
+            self.adaptar_intervalo(alerta or self.muestreo.requiere_atencion(self.animal))
+
+
+class MuestreoAdaptativo:
+    """
+    Política de muestreo adaptativo según el estado de salud.
+    
+    - Animales en tratamiento, enfermos o 'Bajo observación' (o lecturas
+      anómalas): intervalo_base * factor_alerta
+    - Sensores estables durante N lecturas seguidas: intervalo_base * factor_estable
+    - Resto: intervalo_base
+    
+    Así un rodeo mayormente sano genera menos lecturas, y los animales
+    con problemas se detectan antes.
+    """
+    
+    def __init__(self, factor_alerta: float = 0.5, factor_estable: float = 2.0,
+                 lecturas_estables: int = 5, observador_salud=None):
+        """
+        Inicializa la política
+        
+        Args:
+            factor_alerta: Multiplicador del intervalo para animales con atención
+            factor_estable: Multiplicador del intervalo para sensores estables
+            lecturas_estables: Lecturas normales seguidas para espaciar el muestreo
+            observador_salud: SaludObserver opcional (consulta animales_en_tratamiento)
+        """
+        self.factor_alerta = factor_alerta
+        self.factor_estable = factor_estable
+        self.lecturas_estables = lecturas_estables
+        self.observador_salud = observador_salud
+    
+    def requiere_atencion(self, animal) -> bool:
+        """
+        Indica si un animal debe muestrearse más seguido.
+        
+        Args:
+            animal: Animal a evaluar
             
-            mensaje = f"[SensorTemp] {self.animal} → {nueva_temp:.1f}°C {estado}"
-            print(mensaje)
+        Returns:
+            bool: True si está en tratamiento o no está saludable
+        """
+        if (self.observador_salud is not None and
+                animal.id in self.observador_salud.animales_en_tratamiento):
+            return True
+        return animal.esta_enfermo()
+    
+    def calcular_intervalo(self, sensor: Sensor, atencion: bool) -> float:
+        """
+        Calcula el intervalo efectivo y actualiza la racha de lecturas estables.
+        
+        Args:
+            sensor: Sensor a ajustar
+            atencion: True si la última lectura requiere seguimiento
             
-            # Notificar si hay fiebre
-            if nueva_temp >= 39.5:
-                self.notificar_observadores(
-                    f"Fiebre detectada en {self.animal}: {nueva_temp:.1f}°C",
-                    "FIEBRE"
-                )
-            # Notificar si hay hipotermia
-            elif nueva_temp < 37.0:
-                self.notificar_observadores(
-                    f"Hipotermia en {self.animal}: {nueva_temp:.1f}°C",
-                    "HIPOTERMIA"
-                )
\ No newline at end of file
+        Returns:
+            Intervalo en segundos
+        """
+        if atencion:
+            sensor.lecturas_estables = 0
+            return sensor.intervalo_base * self.factor_alerta
+        
+        sensor.lecturas_estables += 1
+        if sensor.lecturas_estables >= self.lecturas_estables:
+            return sensor.intervalo_base * self.factor_estable
+        return sensor.intervalo_base
+    
+    def __str__(self):
+        return (f"MuestreoAdaptativo(alerta=x{self.factor_alerta}, "
+                f"estable=x{self.factor_estable} tras {self.lecturas_estables} lecturas)")
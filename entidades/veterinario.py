@@ -5,6 +5,8 @@ Similar al Trabajador del sistema forestal.
 
 from datetime import datetime
 from typing import List, Dict
+from consola import consola
+from entidades.salud import EstadoSalud
 
 class Veterinario:
     """
@@ -47,7 +49,8 @@ class Veterinario:
         Returns:
             dict: Diagnóstico detallado
         """
-        print(f"\n [VET. {self.nombre}] Revisando Animal #{animal.id} ({animal.tipo})")
+        consola.emitir("veterinario", "\n [VET. {}] Revisando Animal #{} ({})",
+                       self.nombre, animal.id, animal.tipo)
         
         # Realizar diagnóstico
         diagnostico = self._diagnosticar(animal)
@@ -58,16 +61,17 @@ class Veterinario:
             self.animales_atendidos.append(animal.id)
         
         # Mostrar diagnóstico
-        print(f"    Diagnóstico: {diagnostico['estado']}")
-        print(f"     Temperatura: {diagnostico['temperatura']:.1f}°C - {diagnostico['eval_temperatura']}")
-        print(f"     Peso: {diagnostico['peso']:.1f} kg - {diagnostico['eval_peso']}")
-        print(f"    Ganancia: {diagnostico['ganancia']:.2f} kg - {diagnostico['eval_ganancia']}")
+        consola.emitir("veterinario",
+                       "    Diagnóstico: {estado}\n"
+                       "     Temperatura: {temperatura:.1f}°C - {eval_temperatura}\n"
+                       "     Peso: {peso:.1f} kg - {eval_peso}\n"
+                       "    Ganancia: {ganancia:.2f} kg - {eval_ganancia}",
+                       **diagnostico)
         
         # Recomendaciones
         if diagnostico['recomendaciones']:
-            print(f"    Recomendaciones:")
-            for rec in diagnostico['recomendaciones']:
-                print(f"      • {rec}")
+            consola.emitir("veterinario", "    Recomendaciones:{}",
+                           "".join(f"\n      • {rec}" for rec in diagnostico['recomendaciones']))
         
         return diagnostico
     
@@ -90,6 +94,12 @@ class Veterinario:
             'peso': animal.peso,
             'ganancia': animal.ganancia_peso_total(),
             'estado_salud': animal.estado_salud,
+            # Acumuladas lectura a lectura: no se recorre el historial
+            'temperatura_media': animal.estadisticas.temperatura.media,
+            'temperatura_desvio': animal.estadisticas.temperatura.desvio,
+            'lecturas_temperatura': animal.estadisticas.temperatura.cantidad,
+            'lecturas_fiebre': animal.estadisticas.lecturas_fiebre,
+            'tendencia_peso': animal.tendencia_peso(),
             'recomendaciones': []
         }
         
@@ -148,7 +158,8 @@ class Veterinario:
         Returns:
             bool: True si se aplicó exitosamente
         """
-        print(f"\n [VET. {self.nombre}] Aplicando tratamiento a Animal #{animal.id}")
+        consola.emitir("veterinario", "\n [VET. {}] Aplicando tratamiento a Animal #{}",
+                       self.nombre, animal.id)
         
         tratamientos_disponibles = {
             'antipiretrico': {
@@ -192,9 +203,9 @@ class Veterinario:
         
         self.tratamientos_realizados.append(tratamiento)
         
-        print(f"    {tratamiento_info['nombre']} aplicado")
-        print(f"    Indicación: {tratamiento_info['indicacion']}")
-        print(f"    Dosis: {tratamiento_info['dosis']}")
+        consola.emitir("veterinario", "    {nombre} aplicado\n"
+                       "    Indicación: {indicacion}\n"
+                       "    Dosis: {dosis}", **tratamiento_info)
         
         return True
     
@@ -208,7 +219,7 @@ class Veterinario:
         Returns:
             bool: True si se dio de alta
         """
-        if animal.estado_salud == "Saludable":
+        if animal.salud == EstadoSalud.SALUDABLE:
             print(f"     Animal #{animal.id} ya está saludable")
             return False
         
@@ -218,7 +229,7 @@ class Veterinario:
         print(f"   Peso actual: {animal.peso:.1f} kg")
         
         # Cambiar estado
-        animal.estado_salud = "Saludable"
+        animal.salud = EstadoSalud.SALUDABLE
         
         print(f"   ✓ Animal dado de alta - Estado: Saludable")
         
@@ -271,6 +282,14 @@ class Veterinario:
         # Obtener diagnóstico
         diagnostico = self._diagnosticar(animal)
         
+        if diagnostico['lecturas_temperatura']:
+            informe += "SEGUIMIENTO:\n"
+            informe += (f"  Temperatura media: {diagnostico['temperatura_media']:.2f} ± "
+                        f"{diagnostico['temperatura_desvio']:.2f}°C "
+                        f"({diagnostico['lecturas_temperatura']} lecturas, "
+                        f"{diagnostico['lecturas_fiebre']} con fiebre)\n")
+            informe += f"  Tendencia de peso: {diagnostico['tendencia_peso']:+.2f} kg/lectura\n\n"
+        
         informe += "DIAGNÓSTICO:\n"
         informe += f"  Estado general: {diagnostico['estado']}\n"
         informe += f"  Temperatura: {diagnostico['eval_temperatura']}\n"
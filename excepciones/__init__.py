@@ -9,7 +9,8 @@ from .feedlot_exceptions import (
     CorralLlenoException,
     PersistenciaException,
     EstrategiaInvalidaException,
-    SensorException
+    SensorException,
+    ConsultaInvalidaException
 )
 
 __all__ = [
@@ -19,5 +20,6 @@ __all__ = [
     'CorralLlenoException',
     'PersistenciaException',
     'EstrategiaInvalidaException',
-    'SensorException'
+    'SensorException',
+    'ConsultaInvalidaException'
 ]
\ No newline at end of file
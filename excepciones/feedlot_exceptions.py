@@ -34,4 +34,9 @@ class EstrategiaInvalidaException(FeedlotException):
 
 class SensorException(FeedlotException):
     """Se lanza cuando hay error en los sensores"""
-    pass
\ No newline at end of file
+    pass
+
+
+class ConsultaInvalidaException(FeedlotException):
+    """Se lanza cuando una consulta sobre el rodeo usa un campo u operador desconocido"""
+    pass
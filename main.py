@@ -30,6 +30,12 @@ from servicios.reporte_service import ReporteService
 # Servicios avanzados (NUEVOS)
 from servicios.persistencia_service import PersistenciaService
 from servicios.log_service import LogService
+from servicios.runtime_asyncio import RuntimeAsyncio
+from servicios.motor_eventos import MotorEventos
+from servicios.ingesta_service import IngestaLecturas
+from servicios.particion_service import SimulacionParticionada
+from servicios.aleatorio_service import FuenteAleatoria
+from consola import consola
 
 # Patrones
 from patrones.factory import AnimalFactory
@@ -41,6 +47,14 @@ from estrategias.racion_mantenimiento import RacionMantenimiento
 
 # Entidades
 from entidades.veterinario import Veterinario
+from entidades.sensor import MuestreoAdaptativo
+
+from constantes import INTERVALO_ESTADO, INTERVALO_VETERINARIO, INTERVALO_BACKUP
+from constantes import FACTOR_MUESTREO_ALERTA, FACTOR_MUESTREO_ESTABLE, LECTURAS_ESTABLES
+
+
+# Modos de ejecución del monitoreo
+MODOS_EJECUCION = ("hilos", "asyncio", "eventos", "procesos")
 
 
 def limpiar_pantalla():
@@ -72,7 +86,8 @@ def mostrar_info_patrones():
     print("-"*70)
     print(" PROGRAMACIÓN CONCURRENTE:")
     print("-"*70)
-    print("✓ Hilos de sensores (peso y temperatura)")
+    print("✓ Planificador central de sensores (pool fijo de hilos)")
+    print("✓ Simulación particionada por corrales entre procesos")
     print("✓ Servicio de raciones automático")
     print("✓ Servicio de reportes periódicos")
     print("-"*70)
@@ -130,14 +145,65 @@ def configurar_feedlot(log_service=None):
     return sistema
 
 
-def ejecutar_simulacion(duracion_segundos: int = 60, continuar: bool = False):
+def ronda_veterinaria(sistema, veterinario, observador_salud):
+    """
+    Ronda médica: revisa los animales con alerta y trata la fiebre.
+    
+    Args:
+        sistema: FeedlotSystem
+        veterinario: Veterinario a cargo
+        observador_salud: SaludObserver del sistema
+    """
+    print("\n [VETERINARIO] Ronda médica...")
+    for animal in sistema.obtener_animales_alerta():
+        veterinario.revisar_animal(animal)
+        
+        # Aplicar tratamiento si es necesario
+        if animal.temperatura >= 39.5:
+            veterinario.aplicar_tratamiento(animal, 'antipiretrico')
+    
+    observador_salud.mostrar_estado_tratamientos()
+
+
+def backup_automatico(sistema, persistencia, log_service):
+    """
+    Crea un backup automático del estado del sistema.
+    
+    Args:
+        sistema: FeedlotSystem
+        persistencia: PersistenciaService
+        log_service: LogService
+    """
+    print("\n Creando backup automático...")
+    persistencia.crear_backup(sistema)
+    log_service.persistencia("Backup automático creado")
+
+
+def ejecutar_simulacion(duracion_segundos: int = 60, continuar: bool = False,
+                        modo: str = "hilos", salida: str = "normal", semilla: int = None):
     """
     Ejecuta la simulación completa con todos los módulos.
     
     Args:
-        duracion_segundos: Duración en segundos
+        duracion_segundos: Duración en segundos (virtuales en 'eventos' y 'procesos')
         continuar: Si True, intenta cargar estado anterior
+        modo: 'hilos' (planificador con pool de hilos),
+              'asyncio' (un único event loop para sensores y servicios) o
+              'eventos' (motor de eventos discretos con reloj virtual) o
+              'procesos' (corrales repartidos entre procesos, reloj virtual)
+        salida: Modo de consola: 'normal', 'resumen' (conteos periódicos de
+                lecturas, raciones, etc. más alertas y errores) o 'silencioso'
+        semilla: Semilla maestra; cada sensor usa un flujo aleatorio derivado
+                 de ella (None = una al azar, que se muestra para repetir la corrida)
     """
+    if modo not in MODOS_EJECUCION:
+        print(f" Modo inválido: '{modo}'. Modos: {', '.join(MODOS_EJECUCION)}")
+        return
+    if salida not in consola.MODOS:
+        print(f" Salida inválida: '{salida}'. Salidas: {', '.join(consola.MODOS)}")
+        return
+    consola.configurar(modo=salida)
+    
     # Banner
     mostrar_banner()
     mostrar_info_patrones()
@@ -163,6 +229,32 @@ def ejecutar_simulacion(duracion_segundos: int = 60, continuar: bool = False):
     else:
         sistema = configurar_feedlot(log_service)
     
+    # Flujos aleatorios por sensor derivados de una semilla maestra
+    fuente = FuenteAleatoria(semilla)
+    sistema.usar_fuente_aleatoria(fuente)
+    print(f" Semilla de la corrida: {fuente.semilla}\n")
+    
+    # Modos alternativos: reemplazan al planificador de hilos
+    runtime = None
+    motor = None
+    particionada = None
+    if modo == "asyncio":
+        runtime = RuntimeAsyncio()
+        sistema.usar_planificador(runtime)
+        print(" Modo de ejecución: asyncio (event loop único)\n")
+    elif modo == "eventos":
+        motor = MotorEventos(fuente.semilla)
+        sistema.usar_planificador(motor)
+        print(" Modo de ejecución: eventos discretos (reloj virtual)\n")
+    elif modo == "procesos":
+        particionada = SimulacionParticionada(sistema, semilla=fuente.semilla)
+        print(f" Modo de ejecución: {particionada.num_procesos} proceso(s) "
+              f"por particiones de corrales (reloj virtual)\n")
+    
+    # Con reloj real, las lecturas pasan por una cola acotada
+    if not motor and not particionada:
+        sistema.usar_ingesta(IngestaLecturas())
+    
     # Crear servicios
     servicio_raciones = RacionService(sistema)
     servicio_reportes = ReporteService(sistema)
@@ -172,6 +264,10 @@ def ejecutar_simulacion(duracion_segundos: int = 60, continuar: bool = False):
     for sensor in sistema.sensores:
         sensor.agregar_observador(observador_salud)
     
+    # Muestreo adaptativo: más seguido en tratamiento, más espaciado si es estable
+    sistema.usar_muestreo(MuestreoAdaptativo(FACTOR_MUESTREO_ALERTA, FACTOR_MUESTREO_ESTABLE,
+                                             LECTURAS_ESTABLES, observador_salud))
+    
     # NUEVO: Crear veterinario
     veterinario = Veterinario("Dra. María González", "MP-8745", "Bovinos")
     log_service.info(f"Veterinario {veterinario.nombre} incorporado")
@@ -189,52 +285,80 @@ def ejecutar_simulacion(duracion_segundos: int = 60, continuar: bool = False):
     log_service.info("Estrategias de alimentación configuradas")
     
     try:
-        # Iniciar servicios
-        sistema.iniciar_monitoreo()
-        servicio_raciones.iniciar()
-        servicio_reportes.iniciar()
+        # Iniciar servicios (en modo procesos los ejecuta cada partición)
+        if not particionada:
+            sistema.iniciar_monitoreo()
+        if runtime:
+            runtime.registrar_servicio(servicio_raciones)
+            runtime.registrar_servicio(servicio_reportes)
+        elif motor:
+            motor.programar_periodico(servicio_raciones.intervalo,
+                                      servicio_raciones._aplicar_raciones,
+                                      "raciones", MotorEventos.PRIORIDAD_RACION)
+            motor.programar_periodico(servicio_reportes.intervalo,
+                                      servicio_reportes.generar_reporte,
+                                      "reportes", MotorEventos.PRIORIDAD_REPORTE)
+            motor.programar_periodico(INTERVALO_VETERINARIO,
+                                      lambda: ronda_veterinaria(sistema, veterinario, observador_salud),
+                                      "veterinario", MotorEventos.PRIORIDAD_VETERINARIO)
+            motor.programar_periodico(INTERVALO_BACKUP,
+                                      lambda: backup_automatico(sistema, persistencia, log_service),
+                                      "backup", MotorEventos.PRIORIDAD_BACKUP)
+            motor.programar_periodico(INTERVALO_ESTADO, sistema.mostrar_estado,
+                                      "estado", MotorEventos.PRIORIDAD_ESTADO)
+        elif not particionada:
+            servicio_raciones.iniciar()
+            servicio_reportes.iniciar()
         
         log_service.registrar_inicio_sistema(
             len(sistema.animales),
             len(sistema.sensores)
         )
         
-        print(f"  SIMULACIÓN - Duración: {duracion_segundos}s")
+        print(f"  SIMULACIÓN - Duración: {duracion_segundos}s - Modo: {modo} - Salida: {salida}")
         print(" Presiona Ctrl+C para detener\n")
         print("="*70 + "\n")
         
+        if motor:
+            # Sin esperas: el reloj virtual avanza de evento en evento
+            motor.ejecutar_hasta(duracion_segundos)
+            stats_motor = motor.obtener_estadisticas()
+            print(f"\n Motor de eventos: {stats_motor['eventos_procesados']} eventos | "
+                  f"{stats_motor['reloj_virtual']:.0f}s virtuales en "
+                  f"{stats_motor['tiempo_real']:.2f}s reales")
+        
+        if particionada:
+            # Cada proceso simula sus corrales (con sus protocolos de salud);
+            # el reporte y el informe veterinario ven el rodeo fusionado
+            stats_particiones = particionada.ejecutar(duracion_segundos, servicio_raciones,
+                                                      observador_salud, veterinario)
+            servicio_reportes.generar_reporte()
+            print(f"\n Particiones: {stats_particiones['procesos']} proceso(s) | "
+                  f"{stats_particiones['lecturas_realizadas']} lecturas en "
+                  f"{stats_particiones['tiempo_total']:.2f}s reales")
+        
         tiempo_inicio = time.time()
         ultimo_estado = tiempo_inicio
         ultimo_chequeo_salud = tiempo_inicio
         ultimo_backup = tiempo_inicio
         
         # Ciclo principal
-        while time.time() - tiempo_inicio < duracion_segundos:
+        while not (motor or particionada) and time.time() - tiempo_inicio < duracion_segundos:
             time.sleep(1)
             
             # Mostrar estado cada 20s
-            if time.time() - ultimo_estado >= 20:
+            if time.time() - ultimo_estado >= INTERVALO_ESTADO:
                 sistema.mostrar_estado()
                 ultimo_estado = time.time()
             
             # Chequeo veterinario cada 30s
-            if time.time() - ultimo_chequeo_salud >= 30:
-                print("\n [VETERINARIO] Ronda médica...")
-                for animal in sistema.obtener_animales_alerta():
-                    veterinario.revisar_animal(animal)
-                    
-                    # Aplicar tratamiento si es necesario
-                    if animal.temperatura >= 39.5:
-                        veterinario.aplicar_tratamiento(animal, 'antipiretrico')
-                
-                observador_salud.mostrar_estado_tratamientos()
+            if time.time() - ultimo_chequeo_salud >= INTERVALO_VETERINARIO:
+                ronda_veterinaria(sistema, veterinario, observador_salud)
                 ultimo_chequeo_salud = time.time()
             
             # Backup automático cada 40s
-            if time.time() - ultimo_backup >= 40:
-                print("\n Creando backup automático...")
-                persistencia.crear_backup(sistema)
-                log_service.persistencia("Backup automático creado")
+            if time.time() - ultimo_backup >= INTERVALO_BACKUP:
+                backup_automatico(sistema, persistencia, log_service)
                 ultimo_backup = time.time()
         
         print("\n Simulación completada\n")
@@ -245,12 +369,19 @@ def ejecutar_simulacion(duracion_segundos: int = 60, continuar: bool = False):
         log_service.warning("Simulación interrumpida por usuario")
     
     finally:
+        # Tasa de muestreo efectiva frente a la de intervalos fijos
+        if sistema.activo:
+            tasa_fija = sum(1.0 / s.intervalo_base for s in sistema.sensores)
+            print(f"\n Muestreo: {sistema.planificador.tasa_muestreo():.2f} lecturas/s efectivas "
+                  f"(intervalos fijos: {tasa_fija:.2f} lecturas/s)")
+        
         # Detener servicios
         print(" Finalizando sistema...")
         print("-"*70)
         sistema.detener_monitoreo()
         servicio_raciones.detener()
         servicio_reportes.detener()
+        consola.vaciar()
         print("-"*70 + "\n")
         
         time.sleep(1)
@@ -260,6 +391,8 @@ def ejecutar_simulacion(duracion_segundos: int = 60, continuar: bool = False):
         sistema.listar_corrales()
         servicio_raciones.mostrar_resumen_estrategias()
         observador_salud.mostrar_estado_tratamientos()
+        if sistema.ingesta:
+            sistema.ingesta.mostrar_resumen()
         
         # Reporte final
         servicio_reportes.generar_reporte_final()
@@ -391,14 +524,20 @@ def main():
         if len(sys.argv) > 1:
             try:
                 duracion = int(sys.argv[1])
-                if 1 <= duracion <= 600:
-                    ejecutar_simulacion(duracion)
+                modo = sys.argv[2] if len(sys.argv) > 2 else "hilos"
+                salida = sys.argv[3] if len(sys.argv) > 3 else "normal"
+                semilla = int(sys.argv[4]) if len(sys.argv) > 4 else None
+                # Con reloj virtual no hay límite práctico de duración
+                if 1 <= duracion <= 600 or (modo in ("eventos", "procesos") and duracion >= 1):
+                    ejecutar_simulacion(duracion, modo=modo, salida=salida, semilla=semilla)
                 else:
                     print(" Duración: 1-600 segundos")
-                    print(" Uso: python main.py [segundos]")
+                    print(" Uso: python main.py [segundos] [hilos|asyncio|eventos|procesos] "
+                          "[normal|resumen|silencioso] [semilla]")
             except ValueError:
                 print(" Argumento inválido")
-                print(" Uso: python main.py [segundos]")
+                print(" Uso: python main.py [segundos] [hilos|asyncio|eventos|procesos] "
+                      "[normal|resumen|silencioso] [semilla]")
                 time.sleep(2)
                 menu_interactivo()
         else:
@@ -4,7 +4,8 @@ Patrón Factory - Creación de objetos
 """
 
 from entidades.animal import Animal
-from entidades.sensor import SensorPeso, SensorTemperatura
+from entidades.sensor import SensorPeso, SensorTemperatura, SensorLote
+from consola import consola
 from typing import Tuple, List
 import random
 from excepciones.feedlot_exceptions import FeedlotException
@@ -26,7 +27,8 @@ class AnimalFactory:
     }
     
     @staticmethod
-    def crear_animal(id_animal: int, tipo: str, peso_inicial: float = None) -> Animal:
+    def crear_animal(id_animal: int, tipo: str, peso_inicial: float = None,
+                     aleatorio=None) -> Animal:
         """
         Crea un animal del tipo especificado.
         
@@ -34,6 +36,7 @@ class AnimalFactory:
             id_animal: Identificador único del animal
             tipo: Tipo de animal (Ternero, Novillo, Toro)
             peso_inicial: Peso inicial en kg (opcional)
+            aleatorio: Flujo aleatorio para el peso (default: módulo random)
             
         Returns:
             Objeto Animal creado
@@ -48,13 +51,14 @@ class AnimalFactory:
         # Si no se especifica peso, usar valor aleatorio del rango
         if peso_inicial is None:
             config = AnimalFactory.TIPOS_CONFIG[tipo]
-            peso_inicial = random.uniform(config["peso_min"], config["peso_max"])
+            peso_inicial = (aleatorio or random).uniform(config["peso_min"], config["peso_max"])
         
         # Crear el animal
         animal = Animal(id_animal, tipo, peso_inicial)
         
         # Log de creación
-        print(f"[FACTORY] ✓ Creado {tipo} #{id_animal} (peso inicial: {peso_inicial:.1f} kg)")
+        consola.emitir("factory", "[FACTORY] ✓ Creado {} #{} (peso inicial: {:.1f} kg)",
+                       tipo, id_animal, peso_inicial)
         
         return animal
     
@@ -76,16 +80,36 @@ class AnimalFactory:
         sensor_peso = SensorPeso(animal, intervalo_peso)
         sensor_temp = SensorTemperatura(animal, intervalo_temp)
         
-        print(f"[FACTORY] ✓ Sensores creados para {animal}")
+        consola.emitir("factory", "[FACTORY] ✓ Sensores creados para {}", animal)
         
         return sensor_peso, sensor_temp
     
+    @staticmethod
+    def crear_sensor_lote(corral, intervalo: float = 6.0) -> SensorLote:
+        """
+        Crea un sensor por lotes que monitorea todo un corral.
+        Alternativa a los dos sensores por animal para corrales grandes.
+        
+        Args:
+            corral: Corral a monitorear
+            intervalo: Intervalo de lectura en segundos
+            
+        Returns:
+            SensorLote asociado al corral
+        """
+        sensor = SensorLote(corral, intervalo)
+        
+        consola.emitir("factory", "[FACTORY] ✓ Sensor por lotes creado para {}", corral)
+        
+        return sensor
+    
     @staticmethod
     def crear_animal_completo(id_animal: int, 
                              tipo: str, 
                              peso_inicial: float = None,
                              intervalo_peso: float = 8.0,
-                             intervalo_temp: float = 6.0) -> Tuple[Animal, SensorPeso, SensorTemperatura]:
+                             intervalo_temp: float = 6.0,
+                             aleatorio=None) -> Tuple[Animal, SensorPeso, SensorTemperatura]:
         """
         Crea un animal con todos sus sensores en una sola llamada.
         Este es el método más conveniente para uso general.
@@ -96,11 +120,12 @@ class AnimalFactory:
             peso_inicial: Peso inicial en kg (opcional)
             intervalo_peso: Intervalo del sensor de peso en segundos
             intervalo_temp: Intervalo del sensor de temperatura en segundos
+            aleatorio: Flujo aleatorio para el peso (default: módulo random)
             
         Returns:
             Tupla (Animal, SensorPeso, SensorTemperatura)
         """
-        animal = AnimalFactory.crear_animal(id_animal, tipo, peso_inicial)
+        animal = AnimalFactory.crear_animal(id_animal, tipo, peso_inicial, aleatorio)
         sensor_peso, sensor_temp = AnimalFactory.crear_sensores(
             animal, 
             intervalo_peso, 
@@ -112,7 +137,8 @@ class AnimalFactory:
     @staticmethod
     def crear_lote_animales(cantidad: int, 
                            tipo: str, 
-                           id_inicial: int = 1) -> List[Tuple[Animal, SensorPeso, SensorTemperatura]]:
+                           id_inicial: int = 1,
+                           fuente=None) -> List[Tuple[Animal, SensorPeso, SensorTemperatura]]:
         """
         Crea un lote de animales del mismo tipo.
         
@@ -120,19 +146,26 @@ class AnimalFactory:
             cantidad: Cantidad de animales a crear
             tipo: Tipo de animal
             id_inicial: ID inicial para la secuencia
+            fuente: FuenteAleatoria opcional; el lote usa su propio flujo
+                    y sus sensores quedan sembrados
             
         Returns:
             Lista de tuplas (Animal, SensorPeso, SensorTemperatura)
         """
         lote = []
+        aleatorio = fuente.generador(f"lote:{tipo}:{id_inicial}") if fuente else None
         print(f"\n[FACTORY] Creando lote de {cantidad} {tipo}(s)...")
         
         for i in range(cantidad):
-            animal_completo = AnimalFactory.crear_animal_completo(
+            animal, sensor_peso, sensor_temp = AnimalFactory.crear_animal_completo(
                 id_inicial + i, 
-                tipo
+                tipo,
+                aleatorio=aleatorio
             )
-            lote.append(animal_completo)
+            if fuente:
+                sensor_peso.sembrar(fuente)
+                sensor_temp.sembrar(fuente)
+            lote.append((animal, sensor_peso, sensor_temp))
         
         print(f"[FACTORY] Lote completado: {cantidad} animales creados\n")
         return lote
@@ -1,10 +1,17 @@
 """
 Patrón Observer - Sistema de notificaciones
+
+ObservadorAlerta indexa cada alerta por animal y por tipo al
+registrarla: las consultas por animal o por tipo y el resumen cuestan
+O(resultado) en lugar de recorrer todas las alertas.
 """
 
+import heapq
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Dict
+from typing import Iterable, List, Dict
+from consola import consola, NivelConsola
+from entidades.salud import EstadoSalud, texto_salud
 
 class Observador(ABC):
     """
@@ -40,6 +47,9 @@ class ObservadorAlerta(Observador):
         self.alertas: List[Dict] = []
         self.alertas_activas = 0
         self.alertas_por_tipo: Dict[str, int] = {}
+        # Índices: ID de animal / tipo de alerta -> alertas en orden de llegada
+        self._por_animal: Dict[int, List[Dict]] = {}
+        self._por_tipo: Dict[str, List[Dict]] = {}
         
     def actualizar(self, animal, mensaje: str, tipo: str):
         """
@@ -59,15 +69,10 @@ class ObservadorAlerta(Observador):
             "tipo": tipo,
             "peso_actual": animal.peso,
             "temperatura": animal.temperatura,
-            "estado_salud": animal.estado_salud
+            "estado_salud": animal.salud
         }
         
-        # Agregar a la lista de alertas
-        self.alertas.append(alerta)
-        self.alertas_activas += 1
-        
-        # Contar por tipo
-        self.alertas_por_tipo[tipo] = self.alertas_por_tipo.get(tipo, 0) + 1
+        self.registrar(alerta)
         
         # Mostrar alerta en consola
         self._mostrar_alerta(alerta)
@@ -75,18 +80,49 @@ class ObservadorAlerta(Observador):
         # Tomar acciones según el tipo
         self._tomar_accion(animal, tipo)
     
+    def registrar(self, alerta: Dict):
+        """
+        Agrega una alerta ya armada a la lista, los contadores y los índices.
+        
+        Args:
+            alerta: Diccionario con al menos "animal_id" y "tipo"
+        """
+        self.alertas.append(alerta)
+        self.alertas_activas += 1
+        tipo = alerta["tipo"]
+        self.alertas_por_tipo[tipo] = self.alertas_por_tipo.get(tipo, 0) + 1
+        self._por_animal.setdefault(alerta["animal_id"], []).append(alerta)
+        self._por_tipo.setdefault(tipo, []).append(alerta)
+    
+    def restaurar_alertas(self, alertas: Iterable[Dict]):
+        """
+        Reemplaza las alertas registradas (por ejemplo, al restaurar un
+        estado guardado) y rearma contadores e índices.
+        
+        Args:
+            alertas: Alertas en orden de llegada
+        """
+        self.alertas = []
+        self.alertas_activas = 0
+        self.alertas_por_tipo = {}
+        self._por_animal = {}
+        self._por_tipo = {}
+        for alerta in alertas:
+            self.registrar(alerta)
+    
     def _mostrar_alerta(self, alerta: Dict):
         """Muestra una alerta formateada en consola"""
-        hora = alerta["timestamp"].strftime("%H:%M:%S")
-    
-        print("\n" + "="*70)
-        print(f"ALERTA [{alerta['tipo']}] - {hora}")
-        print(f"Animal: #{alerta['animal_id']} ({alerta['animal_tipo']})")
-        print(f"Mensaje: {alerta['mensaje']}")
-        print(f"Estado: Peso {alerta['peso_actual']:.1f} kg | "
-          f"Temp {alerta['temperatura']:.1f}°C | "
-          f"Salud: {alerta['estado_salud']}")
-        print("="*70 + "\n")
+        consola.emitir(
+            "alerta",
+            "\n{0}\nALERTA [{1}] - {2:%H:%M:%S}\n"
+            "Animal: #{3} ({4})\n"
+            "Mensaje: {5}\n"
+            "Estado: Peso {6:.1f} kg | Temp {7:.1f}°C | Salud: {8}\n"
+            "{0}\n",
+            "="*70, alerta["tipo"], alerta["timestamp"],
+            alerta["animal_id"], alerta["animal_tipo"], alerta["mensaje"],
+            alerta["peso_actual"], alerta["temperatura"], texto_salud(alerta["estado_salud"]),
+            nivel=NivelConsola.ALERTA)
     
     def _obtener_icono(self, tipo: str) -> str:
         """Retorna string vacío (sin emojis)"""
@@ -101,18 +137,18 @@ class ObservadorAlerta(Observador):
             tipo: Tipo de alerta
         """
         if tipo == "FIEBRE":
-            print(f"[ACCIÓN]  Separando {animal} para tratamiento veterinario...")
-            print(f"[ACCIÓN]  Administrando antipirético...")
-            animal.estado_salud = "En tratamiento - Fiebre"
+            consola.emitir("alerta", "[ACCIÓN]  Separando {} para tratamiento veterinario...\n"
+                           "[ACCIÓN]  Administrando antipirético...", animal)
+            animal.salud = EstadoSalud.EN_TRATAMIENTO | EstadoSalud.FIEBRE
             
         elif tipo == "BAJO_RENDIMIENTO":
-            print(f"[ACCIÓN]  Revisando alimentación de {animal}...")
-            print(f"[ACCIÓN]  Programando análisis nutricional...")
+            consola.emitir("alerta", "[ACCIÓN]  Revisando alimentación de {}...\n"
+                           "[ACCIÓN]  Programando análisis nutricional...", animal)
             
         elif tipo == "HIPOTERMIA":
-            print(f"[ACCIÓN]  Proporcionando abrigo a {animal}...")
-            print(f"[ACCIÓN]  Suministrando alimento calórico...")
-            animal.estado_salud = "En tratamiento - Hipotermia"
+            consola.emitir("alerta", "[ACCIÓN]  Proporcionando abrigo a {}...\n"
+                           "[ACCIÓN]  Suministrando alimento calórico...", animal)
+            animal.salud = EstadoSalud.EN_TRATAMIENTO | EstadoSalud.HIPOTERMIA
     
     def obtener_resumen_alertas(self) -> str:
         """Genera un resumen de las alertas registradas"""
@@ -126,18 +162,12 @@ class ObservadorAlerta(Observador):
         for tipo, cantidad in sorted(self.alertas_por_tipo.items()):
             resumen += f"• {tipo}: {cantidad} alerta(s)\n"  # <-- Sin icono
     
-    # Animales más afectados
-        animales_con_alertas = {}
-        for alerta in self.alertas:
-            animal_id = alerta["animal_id"]
-            animales_con_alertas[animal_id] = animales_con_alertas.get(animal_id, 0) + 1
-    
-        if animales_con_alertas:
+    # Animales más afectados (O(animales con alertas), sin recorrer las alertas)
+        mas_afectados = heapq.nlargest(3, self._por_animal.items(), key=lambda x: len(x[1]))
+        if mas_afectados:
            resumen += "\nAnimales con más alertas:\n"
-           for animal_id, count in sorted(animales_con_alertas.items(), 
-                                      key=lambda x: x[1], 
-                                      reverse=True)[:3]:
-               resumen += f"  Animal #{animal_id}: {count} alerta(s)\n"
+           for animal_id, alertas in mas_afectados:
+               resumen += f"  Animal #{animal_id}: {len(alertas)} alerta(s)\n"
     
         return resumen
     
@@ -163,7 +193,7 @@ class ObservadorAlerta(Observador):
         Returns:
             Lista de alertas del tipo especificado
         """
-        return [a for a in self.alertas if a["tipo"] == tipo]
+        return list(self._por_tipo.get(tipo, ()))
     
     def obtener_alertas_por_animal(self, animal_id: int) -> List[Dict]:
         """
@@ -175,13 +205,15 @@ class ObservadorAlerta(Observador):
         Returns:
             Lista de alertas del animal
         """
-        return [a for a in self.alertas if a["animal_id"] == animal_id]
+        return list(self._por_animal.get(animal_id, ()))
     
     def limpiar_alertas(self):
         """Limpia todas las alertas registradas"""
         self.alertas.clear()
         self.alertas_activas = 0
         self.alertas_por_tipo.clear()
+        self._por_animal.clear()
+        self._por_tipo.clear()
         print(" Alertas limpiadas")
     
     def exportar_alertas(self, archivo: str = "alertas.txt"):
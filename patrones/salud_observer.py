@@ -7,6 +7,8 @@ Similar al controlador de riego del sistema forestal.
 from patrones.observer import Observador
 from datetime import datetime
 from typing import List, Dict
+from consola import consola
+from entidades.salud import EstadoSalud, texto_salud
 
 class SaludObserver(Observador):
     """
@@ -51,7 +53,7 @@ class SaludObserver(Observador):
             'mensaje': mensaje,
             'temperatura': animal.temperatura,
             'peso': animal.peso,
-            'estado_previo': animal.estado_salud
+            'estado_previo': animal.salud
         }
         self.alertas_salud.append(alerta)
         
@@ -71,7 +73,7 @@ class SaludObserver(Observador):
             tipo: Tipo de alerta
             alerta: Diccionario con datos de la alerta
         """
-        estado_anterior = animal.estado_salud
+        estado_anterior = animal.salud
         
         if tipo == "FIEBRE":
             self._tratar_fiebre(animal)
@@ -83,9 +85,10 @@ class SaludObserver(Observador):
             self._mejorar_alimentacion(animal)
         
         # Registrar cambio de estado si hubo
-        if animal.estado_salud != estado_anterior:
+        if animal.salud != estado_anterior:
             if self.log_service:
-                self.log_service.registrar_cambio_estado(animal, estado_anterior, animal.estado_salud)
+                self.log_service.registrar_cambio_estado(animal, texto_salud(estado_anterior),
+                                                         animal.estado_salud)
     
     def _tratar_fiebre(self, animal):
         """
@@ -94,10 +97,10 @@ class SaludObserver(Observador):
         Args:
             animal: Animal con fiebre
         """
-        print(f"\n [SALUD] Protocolo de fiebre activado para Animal #{animal.id}")
+        consola.emitir("salud", "\n [SALUD] Protocolo de fiebre activado para Animal #{}", animal.id)
         
         # Cambiar estado
-        animal.estado_salud = "En tratamiento - Fiebre"
+        animal.salud = EstadoSalud.EN_TRATAMIENTO | EstadoSalud.FIEBRE
         
         # Registrar tratamiento
         tratamiento = {
@@ -116,10 +119,10 @@ class SaludObserver(Observador):
         self.tratamientos_aplicados += 1
         
         # Mostrar acciones
-        print(f"    Separando {animal} del lote principal")
-        print(f"    Administrando antipirético")
-        print(f"    Reforzando hidratación")
-        print(f"    Programando monitoreo intensivo")
+        consola.emitir("salud", "    Separando {} del lote principal\n"
+                       "    Administrando antipirético\n"
+                       "    Reforzando hidratación\n"
+                       "    Programando monitoreo intensivo", animal)
         
         if self.log_service:
             self.log_service.ok(f"Tratamiento de fiebre iniciado - Animal #{animal.id}")
@@ -131,10 +134,10 @@ class SaludObserver(Observador):
         Args:
             animal: Animal con hipotermia
         """
-        print(f"\n [SALUD] Protocolo de hipotermia activado para Animal #{animal.id}")
+        consola.emitir("salud", "\n [SALUD] Protocolo de hipotermia activado para Animal #{}", animal.id)
         
         # Cambiar estado
-        animal.estado_salud = "En tratamiento - Hipotermia"
+        animal.salud = EstadoSalud.EN_TRATAMIENTO | EstadoSalud.HIPOTERMIA
         
         # Registrar tratamiento
         tratamiento = {
@@ -153,9 +156,9 @@ class SaludObserver(Observador):
         self.tratamientos_aplicados += 1
         
         # Mostrar acciones
-        print(f"    Trasladando {animal} a zona climatizada")
-        print(f"    Proporcionando abrigo térmico")
-        print(f"    Suministrando alimento calórico")
+        consola.emitir("salud", "    Trasladando {} a zona climatizada\n"
+                       "    Proporcionando abrigo térmico\n"
+                       "    Suministrando alimento calórico", animal)
         
         if self.log_service:
             self.log_service.ok(f"Tratamiento de hipotermia iniciado - Animal #{animal.id}")
@@ -167,15 +170,15 @@ class SaludObserver(Observador):
         Args:
             animal: Animal con bajo rendimiento
         """
-        print(f"\n [SALUD] Revisión nutricional para Animal #{animal.id}")
+        consola.emitir("salud", "\n [SALUD] Revisión nutricional para Animal #{}", animal.id)
         
         # No cambiar estado a enfermo, solo advertencia
-        if animal.estado_salud == "Saludable":
-            animal.estado_salud = "Bajo observación"
+        if animal.salud == EstadoSalud.SALUDABLE:
+            animal.salud = EstadoSalud.BAJO_OBSERVACION
         
-        print(f"    Programando análisis nutricional")
-        print(f"    Revisando calidad del alimento")
-        print(f"    Evaluando suplementación")
+        consola.emitir("salud", "    Programando análisis nutricional\n"
+                       "    Revisando calidad del alimento\n"
+                       "    Evaluando suplementación")
         
         if self.log_service:
             self.log_service.warning(f"Bajo rendimiento detectado - Animal #{animal.id}")
@@ -218,13 +221,15 @@ class SaludObserver(Observador):
         """
         duracion = datetime.now() - tratamiento['inicio']
         
-        print(f"\n [SALUD] Alta médica - Animal #{animal.id}")
-        print(f"   Tipo: {tratamiento['tipo'].capitalize()}")
-        print(f"   Duración: {duracion.seconds // 3600}h {(duracion.seconds % 3600) // 60}m")
-        print(f"   Estado: Recuperado")
+        consola.emitir("salud", "\n [SALUD] Alta médica - Animal #{}\n"
+                       "   Tipo: {}\n"
+                       "   Duración: {}h {}m\n"
+                       "   Estado: Recuperado",
+                       animal.id, tratamiento['tipo'].capitalize(),
+                       duracion.seconds // 3600, (duracion.seconds % 3600) // 60)
         
         # Cambiar estado
-        animal.estado_salud = "Saludable"
+        animal.salud = EstadoSalud.SALUDABLE
         
         # Remover de tratamiento
         del self.animales_en_tratamiento[animal.id]
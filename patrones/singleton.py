@@ -41,6 +41,27 @@ class SingletonMeta(type):
         
         return cls._instances[cls]
     
+    def crear_independiente(cls, *args, **kwargs):
+        """
+        Crea una instancia aparte, que no pasa por el registro del
+        singleton: la instancia única (la que devuelve cls()) no cambia y
+        se pueden tener varias independientes a la vez. La instancia
+        lleva `_independiente = True` desde antes de __init__, así la
+        clase sabe cómo se creó.
+        
+        Uso:
+            a = MiClase.crear_independiente()
+            b = MiClase.crear_independiente()
+            assert a is not b and a is not MiClase()  # True
+        
+        Returns:
+            Instancia nueva de la clase
+        """
+        instancia = cls.__new__(cls)
+        instancia._independiente = True
+        instancia.__init__(*args, **kwargs)
+        return instancia
+    
     @classmethod
     def reset_instances(cls):
         """
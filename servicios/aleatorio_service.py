@@ -0,0 +1,137 @@
+"""
+Servicio Aleatorio - Flujos de números aleatorios con semilla
+
+Cada sensor, lote de la fábrica y corrida obtiene su propio flujo,
+derivado de una semilla maestra y de un nombre estable (por ejemplo
+'SensorPeso:17'). Así una corrida se reproduce con la misma semilla,
+el resultado no depende del orden de creación ni de cuántos procesos
+se usen, y los hilos no compiten por el estado global de `random`.
+"""
+
+import hashlib
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él no hay generadores vectorizados
+    np = None
+
+_MASCARA_64 = (1 << 64) - 1
+
+
+class FlujoAleatorio:
+    """
+    Generador SplitMix64 liviano (un solo entero de estado).
+
+    Un random.Random ocupa ~2.5 KB de estado; con cientos de miles de
+    sensores eso pesa cientos de MB. Este flujo ocupa unos pocos bytes y
+    tiene la misma interfaz que usan los sensores (random/uniform).
+    """
+
+    __slots__ = ("estado",)
+
+    def __init__(self, semilla: int):
+        """
+        Inicializa el flujo.
+
+        Args:
+            semilla: Entero de 64 bits
+        """
+        self.estado = semilla & _MASCARA_64
+
+    def siguiente(self) -> int:
+        """
+        Avanza el flujo.
+
+        Returns:
+            Entero de 64 bits
+        """
+        self.estado = (self.estado + 0x9E3779B97F4A7C15) & _MASCARA_64
+        z = self.estado
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASCARA_64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASCARA_64
+        return z ^ (z >> 31)
+
+    def random(self) -> float:
+        """
+        Returns:
+            Número en [0, 1)
+        """
+        return (self.siguiente() >> 11) * (1.0 / (1 << 53))
+
+    def uniform(self, a: float, b: float) -> float:
+        """
+        Args:
+            a: Extremo inferior
+            b: Extremo superior
+
+        Returns:
+            Número uniforme entre a y b
+        """
+        # siguiente() en línea: es el camino caliente de los sensores
+        z = self.estado = (self.estado + 0x9E3779B97F4A7C15) & _MASCARA_64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASCARA_64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASCARA_64
+        return a + (b - a) * (((z ^ (z >> 31)) >> 11) * (1.0 / (1 << 53)))
+
+    def __repr__(self):
+        return f"FlujoAleatorio(estado={self.estado:#018x})"
+
+
+class FuenteAleatoria:
+    """
+    Fuente de flujos independientes derivados de una semilla maestra.
+    """
+
+    def __init__(self, semilla: int = None):
+        """
+        Inicializa la fuente.
+
+        Args:
+            semilla: Semilla maestra (None = una al azar, visible en self.semilla
+                     para poder repetir la corrida)
+        """
+        self.semilla = random.SystemRandom().getrandbits(32) if semilla is None else semilla
+
+    def derivar_semilla(self, nombre: str) -> int:
+        """
+        Deriva la semilla de un flujo a partir de su nombre.
+        Es estable entre procesos y ejecuciones (no usa hash()).
+
+        Args:
+            nombre: Nombre estable del flujo
+
+        Returns:
+            Entero de 64 bits
+        """
+        digesto = hashlib.sha256(f"{self.semilla}:{nombre}".encode()).digest()
+        return int.from_bytes(digesto[:8], "big")
+
+    def generador(self, nombre: str) -> FlujoAleatorio:
+        """
+        Crea el flujo escalar de un nombre.
+
+        Args:
+            nombre: Nombre estable del flujo
+
+        Returns:
+            FlujoAleatorio independiente
+        """
+        return FlujoAleatorio(self.derivar_semilla(nombre))
+
+    def generador_numpy(self, nombre: str):
+        """
+        Crea el generador vectorizado de un nombre.
+
+        Args:
+            nombre: Nombre estable del flujo
+
+        Returns:
+            numpy.random.Generator, o None si NumPy no está instalado
+        """
+        if np is None:
+            return None
+        return np.random.default_rng(self.derivar_semilla(nombre))
+
+    def __str__(self):
+        return f"FuenteAleatoria(semilla={self.semilla})"
@@ -0,0 +1,11 @@
+"""
+Servicio de Consola - Alias de compatibilidad
+
+La consola vive en el módulo neutral consola.py (la usan también las
+entidades y los patrones); este módulo la reexporta para el código que
+la importa desde servicios.
+"""
+
+from consola import Consola, NivelConsola, SalidaOrdenada, consola
+
+__all__ = ["Consola", "NivelConsola", "SalidaOrdenada", "consola"]
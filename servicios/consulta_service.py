@@ -0,0 +1,805 @@
+"""
+Servicio de Consultas - Preguntas ad hoc sobre el rodeo
+
+ConsultaRodeo arma una consulta con filtros, proyección, agrupamiento y
+agregados, por ejemplo "Novillos del corral 2 de menos de 300 kg con
+fiebre en las últimas 24 h":
+
+    (sistema.consultar()
+        .donde("tipo", "==", "Novillo")
+        .donde("corral", "==", 2)
+        .donde("peso", "<", 300)
+        .con_fiebre(horas=24)
+        .seleccionar("id", "peso", "temperatura")
+        .filas())
+
+Antes de ejecutar se elige un plan (explicar() lo muestra):
+1. Acceso: si algún filtro de igualdad sobre tipo, ración o corral, o de
+   condiciones de salud, tiene un índice (IndicesRodeo o el propio
+   corral) y deja pocos candidatos, se parte de ese grupo; si no, de
+   todo el rodeo.
+2. Filtros sobre columnas: con el AlmacenRodeo completo se evalúan como
+   operaciones vectorizadas sobre los slots que quedan, uno tras otro,
+   así cada filtro recorre sólo lo que dejó el anterior.
+3. Filtros por objeto: los que no tienen columna (ID, lecturas de los
+   historiales) se evalúan al final, animal por animal, sobre los
+   sobrevivientes.
+Sin NumPy (o con colecciones cargadas a mano) los filtros de columna
+también se evalúan por objeto.
+"""
+
+import operator
+import time
+from typing import Dict, List, Optional, Sequence
+from entidades.animal import (
+    Animal, TIPOS, RACIONES, COL_PESO, COL_PESO_INICIAL, COL_TEMPERATURA,
+    COL_DIAS, COL_SALUD, COL_RACION, COL_TIPO, COL_CORRAL, UMBRAL_FIEBRE
+)
+from entidades.salud import EstadoSalud, estado_salud, texto_salud
+from excepciones.feedlot_exceptions import ConsultaInvalidaException
+from servicios.reloj_service import Reloj, reloj
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él los filtros se evalúan por objeto
+    np = None
+
+# Campo -> columna del AlmacenRodeo (None = sólo se lee del objeto Animal)
+CAMPOS = {
+    "id": None,
+    "peso": COL_PESO,
+    "peso_inicial": COL_PESO_INICIAL,
+    "ganancia": None,
+    "temperatura": COL_TEMPERATURA,
+    "dias_en_feedlot": COL_DIAS,
+    "salud": COL_SALUD,
+    "racion": COL_RACION,
+    "tipo": COL_TIPO,
+    "corral": COL_CORRAL,
+}
+# La ganancia se calcula sobre columnas aunque no tenga una propia
+_VECTORIZABLES = {campo for campo, columna in CAMPOS.items() if columna is not None} | {"ganancia"}
+# Campos que se muestran como texto y se guardan como código
+_CATEGORICOS = ("tipo", "racion", "salud")
+
+_LECTORES = {
+    "id": lambda a: a.id,
+    "peso": lambda a: a.peso,
+    "peso_inicial": lambda a: a.peso_inicial,
+    "ganancia": lambda a: a.peso - a.peso_inicial,
+    "temperatura": lambda a: a.temperatura,
+    "dias_en_feedlot": lambda a: a.dias_en_feedlot,
+    "salud": lambda a: a._estado_salud,
+    "racion": lambda a: a._racion_actual,
+    "tipo": lambda a: a._tipo,
+    "corral": lambda a: a._corral.numero if a._corral is not None else 0,
+}
+
+_COMPARACIONES = {
+    "==": operator.eq, "!=": operator.ne,
+    "<": operator.lt, "<=": operator.le,
+    ">": operator.gt, ">=": operator.ge,
+}
+# "en": pertenencia a una lista de valores; "tiene": alguna bandera de salud en común
+OPERADORES = tuple(_COMPARACIONES) + ("en", "tiene")
+
+AGREGADOS = ("cantidad", "suma", "promedio", "minimo", "maximo")
+
+# Series de los historiales que se pueden filtrar por rango de tiempo
+SERIES = ("peso", "temperatura")
+
+# Partir de un índice conviene si deja a lo sumo esta fracción del
+# rodeo: juntar los slots de los candidatos cuesta por animal lo que un
+# filtro vectorizado sobre unos veinte slots (medido con
+# benchmarks/benchmark_consultas.py; sin columnas siempre conviene)
+FRACCION_INDICE = 0.05
+
+
+def _codificar(campo: str, valor):
+    """Valor de un filtro en la representación de la columna."""
+    if campo == "tipo":
+        return TIPOS.codigos.get(valor, -1)
+    if campo == "racion":
+        return RACIONES.codigos.get(valor, -1)
+    if campo == "salud":
+        try:
+            return int(estado_salud(valor))
+        except ValueError as e:
+            raise ConsultaInvalidaException(str(e)) from None
+    return valor
+
+
+def _decodificar(campo: str, codigo):
+    """Valor para mostrar de un código de columna."""
+    if campo == "tipo":
+        return TIPOS.valores[codigo]
+    if campo == "racion":
+        return RACIONES.valores[codigo]
+    if campo == "salud":
+        return texto_salud(codigo)
+    return codigo
+
+
+def _mostrar(valor) -> str:
+    """Valor de un filtro para explicar(); las banderas de salud por nombre."""
+    if isinstance(valor, EstadoSalud):
+        return valor.name or "SALUDABLE"
+    if isinstance(valor, (list, tuple, set)):
+        return "[" + ", ".join(_mostrar(v) for v in valor) + "]"
+    return repr(valor)
+
+
+class Condicion:
+    """
+    Filtro campo-operador-valor sobre el estado actual de cada animal.
+    """
+
+    __slots__ = ("campo", "operador", "valor", "_codigo")
+
+    def __init__(self, campo: str, operador: str, valor):
+        """
+        Args:
+            campo: Campo de CAMPOS
+            operador: Operador de OPERADORES
+            valor: Valor a comparar (texto para tipo, ración y salud;
+                   lista de valores para "en")
+
+        Raises:
+            ConsultaInvalidaException: Si el campo o el operador no existen
+        """
+        if campo not in CAMPOS:
+            raise ConsultaInvalidaException(f"Campo desconocido: {campo!r}")
+        if operador not in OPERADORES:
+            raise ConsultaInvalidaException(f"Operador desconocido: {operador!r}")
+        if operador == "tiene" and campo != "salud":
+            raise ConsultaInvalidaException("El operador 'tiene' sólo se aplica a 'salud'")
+        self.campo = campo
+        self.operador = operador
+        self.valor = valor
+        if operador == "en":
+            self._codigo = tuple(_codificar(campo, v) for v in valor)
+        else:
+            self._codigo = _codificar(campo, valor)
+
+    @property
+    def vectorizable(self) -> bool:
+        return self.campo in _VECTORIZABLES
+
+    def evaluar(self, animal: Animal) -> bool:
+        """
+        Args:
+            animal: Animal a evaluar
+
+        Returns:
+            True si el animal cumple la condición
+        """
+        valor = _LECTORES[self.campo](animal)
+        if self.operador == "en":
+            return valor in self._codigo
+        if self.operador == "tiene":
+            return bool(valor & self._codigo)
+        return _COMPARACIONES[self.operador](valor, self._codigo)
+
+    def evaluar_columnas(self, columnas: Sequence, slots):
+        """
+        Evalúa la condición sobre las columnas de un grupo de slots.
+
+        Args:
+            columnas: AlmacenRodeo.columnas
+            slots: numpy.ndarray de slots
+
+        Returns:
+            numpy.ndarray de booleanos, uno por slot
+        """
+        if self.campo == "ganancia":
+            valores = columnas[COL_PESO][slots] - columnas[COL_PESO_INICIAL][slots]
+        else:
+            valores = columnas[CAMPOS[self.campo]][slots]
+        if self.operador == "en":
+            return np.isin(valores, self._codigo)
+        if self.operador == "tiene":
+            return (valores & self._codigo) != 0
+        return _COMPARACIONES[self.operador](valores, self._codigo)
+
+    def __str__(self):
+        return f"{self.campo} {self.operador} {_mostrar(self.valor)}"
+
+
+class CondicionSerie:
+    """
+    Filtro sobre las lecturas de un historial en un rango de tiempo: se
+    cumple si alguna lectura del rango cumple la comparación.
+
+    Si parte del rango ya salió del historial sin archivarse, para las
+    desigualdades se usa el mínimo o el máximo de los bloques del resumen
+    que la cubren; si ni así se puede decidir (== y !=, o bloques que ya
+    salieron también del resumen), el animal no cumple y se cuenta en
+    `truncados`.
+    """
+
+    __slots__ = ("serie", "operador", "valor", "desde", "hasta", "truncados")
+
+    def __init__(self, serie: str, operador: str, valor: float,
+                 desde: Optional[float] = None, hasta: Optional[float] = None):
+        """
+        Args:
+            serie: "peso" o "temperatura"
+            operador: Comparación (==, !=, <, <=, >, >=)
+            valor: Valor a comparar
+            desde: Instante inicial incluido (None = sin límite)
+            hasta: Instante final excluido (None = sin límite)
+
+        Raises:
+            ConsultaInvalidaException: Si la serie o el operador no existen
+        """
+        if serie not in SERIES:
+            raise ConsultaInvalidaException(f"Serie desconocida: {serie!r}")
+        if operador not in _COMPARACIONES:
+            raise ConsultaInvalidaException(f"Operador inválido para una serie: {operador!r}")
+        self.serie = serie
+        self.operador = operador
+        self.valor = valor
+        self.desde = desde
+        self.hasta = hasta
+        # Animales de la última ejecución cuyo rango no se pudo evaluar entero
+        self.truncados = 0
+
+    vectorizable = False
+
+    def evaluar(self, animal: Animal) -> bool:
+        """
+        Args:
+            animal: Animal a evaluar
+
+        Returns:
+            True si alguna lectura del rango (o, para lo ya desalojado,
+            algún extremo del resumen) cumple la comparación
+        """
+        historial = animal.historial_peso if self.serie == "peso" else animal.historial_temperatura
+        valores = historial.rango(self.desde, self.hasta)[1]
+        comparar = _COMPARACIONES[self.operador]
+        # Para las desigualdades alcanza con el extremo del rango (min/max en C)
+        if valores:
+            if self.operador in (">", ">="):
+                if comparar(max(valores), self.valor):
+                    return True
+            elif self.operador in ("<", "<="):
+                if comparar(min(valores), self.valor):
+                    return True
+            elif any(comparar(v, self.valor) for v in valores):
+                return True
+        if not historial.truncado(self.desde):
+            return False
+
+        # Lo anterior a las lecturas completas sólo queda en el resumen
+        limite = historial.completo_desde()
+        bloques = historial.resumen_rango(self.desde, limite if self.hasta is None
+                                          else min(self.hasta, limite))
+        if bloques and self.operador in (">", ">="):
+            if comparar(max(bloque[4] for bloque in bloques), self.valor):
+                return True
+        elif bloques and self.operador in ("<", "<="):
+            if comparar(min(bloque[2] for bloque in bloques), self.valor):
+                return True
+        if self.operador in ("==", "!=") or not self._resumen_cubre(historial):
+            self.truncados += 1
+        return False
+
+    def _resumen_cubre(self, historial) -> bool:
+        """True si el resumen conserva todo lo desalojado desde el inicio del rango."""
+        resumen = historial.resumen
+        if not resumen:
+            return False
+        if self.desde is not None and resumen[0][0] <= self.desde:
+            return True
+        return historial.total - len(historial) <= len(resumen) * historial.lecturas_por_bloque
+
+    def __str__(self):
+        rango = []
+        if self.desde is not None:
+            rango.append(f"desde {time.strftime('%Y-%m-%d %H:%M', time.localtime(self.desde))}")
+        if self.hasta is not None:
+            rango.append(f"hasta {time.strftime('%Y-%m-%d %H:%M', time.localtime(self.hasta))}")
+        return f"alguna lectura de {self.serie} {self.operador} {self.valor!r} " + " ".join(rango)
+
+
+class PlanConsulta:
+    """
+    Plan elegido para una consulta: de dónde salen los candidatos y qué
+    filtros se evalúan sobre columnas y cuáles por objeto. Al ejecutarse
+    con analizar se anotan las filas reales de cada paso.
+    """
+
+    def __init__(self, total: int):
+        """
+        Args:
+            total: Animales del rodeo
+        """
+        self.total = total
+        self.acceso = "recorrido de todo el rodeo"
+        # Condición de índice elegida y animales que deja (estimado exacto)
+        self.indice: Optional[Condicion] = None
+        self.estimado = total
+        self.vectorizado = False
+        self.columnas: List[Condicion] = []
+        self.objetos: list = []
+        self.salida = ""
+        # Paso -> filas que quedaron, y tiempo total (sólo con analizar)
+        self.filas: Dict[str, int] = {}
+        self.milisegundos: Optional[float] = None
+
+    def __str__(self):
+        lineas = [f"Plan de consulta ({self.total:,} animales)"]
+        lineas.append(f"  acceso:     {self.acceso} (~{self.estimado:,} animales)"
+                      + self._filas("acceso"))
+        modo = "columnas (vectorizado)" if self.vectorizado else "por objeto"
+        for i, condicion in enumerate(self.columnas):
+            lineas.append(f"  {'filtro:':<12}{condicion}  [{modo}]" + self._filas(f"columna{i}"))
+        for i, condicion in enumerate(self.objetos):
+            truncados = self.filas.get(f"truncados{i}")
+            aviso = f" ({truncados:,} con el rango truncado)" if truncados else ""
+            lineas.append(f"  {'filtro:':<12}{condicion}  [por objeto]" + self._filas(f"objeto{i}") + aviso)
+        lineas.append(f"  salida:     {self.salida}")
+        if self.milisegundos is not None:
+            lineas.append(f"  tiempo:     {self.milisegundos:.3f} ms")
+        return "\n".join(lineas)
+
+    def _filas(self, paso: str) -> str:
+        filas = self.filas.get(paso)
+        return "" if filas is None else f" -> {filas:,} filas"
+
+
+class ConsultaRodeo:
+    """
+    Consulta sobre los animales de un FeedlotSystem. Los métodos de
+    armado devuelven la misma consulta para encadenarlos.
+    """
+
+    def __init__(self, animales: Dict[int, Animal], corrales: Dict, indices=None, almacen=None,
+                 reloj_sistema: Optional[Reloj] = None):
+        """
+        Args:
+            animales: Animales del sistema por ID
+            corrales: Corrales del sistema por número
+            indices: IndicesRodeo del sistema (None = sin índices)
+            almacen: AlmacenRodeo del sistema (None = sin columnas)
+            reloj_sistema: Reloj de las lecturas del sistema (None = el
+                           reloj compartido del proceso)
+        """
+        self._animales = animales
+        self._corrales = corrales
+        self._indices = indices
+        self._almacen = almacen
+        self._reloj = reloj if reloj_sistema is None else reloj_sistema
+        self._condiciones: list = []
+        self._campos: Sequence[str] = ()
+        self._grupo: Optional[str] = None
+        self._agregados: Dict[str, tuple] = {}
+        # Animales descartados en la última ejecución porque parte del
+        # rango de un filtro de serie ya no está en su historial
+        self.truncados = 0
+
+    # --- Armado ---
+
+    def donde(self, campo: str, operador: str, valor) -> "ConsultaRodeo":
+        """
+        Agrega un filtro sobre el estado actual (se combinan con Y).
+
+        Args:
+            campo: Campo de CAMPOS (id, peso, peso_inicial, ganancia,
+                   temperatura, dias_en_feedlot, salud, racion, tipo, corral)
+            operador: ==, !=, <, <=, >, >=, "en" (lista de valores) o
+                      "tiene" (banderas de EstadoSalud, sólo para salud)
+            valor: Valor a comparar
+
+        Returns:
+            La misma consulta
+
+        Raises:
+            ConsultaInvalidaException: Si el campo o el operador no existen
+        """
+        self._condiciones.append(Condicion(campo, operador, valor))
+        return self
+
+    def donde_serie(self, serie: str, operador: str, valor: float,
+                    desde: Optional[float] = None, hasta: Optional[float] = None) -> "ConsultaRodeo":
+        """
+        Agrega un filtro sobre las lecturas de un historial en un rango
+        de tiempo (alguna lectura del rango cumple la comparación).
+
+        Args:
+            serie: "peso" o "temperatura"
+            operador: ==, !=, <, <=, >, >=
+            valor: Valor a comparar
+            desde: Instante inicial incluido (None = sin límite)
+            hasta: Instante final excluido (None = sin límite)
+
+        Returns:
+            La misma consulta
+
+        Raises:
+            ConsultaInvalidaException: Si la serie o el operador no existen
+        """
+        self._condiciones.append(CondicionSerie(serie, operador, valor, desde, hasta))
+        return self
+
+    def con_fiebre(self, horas: float = 24.0) -> "ConsultaRodeo":
+        """
+        Animales con alguna lectura de fiebre en las últimas horas (según
+        el reloj del sistema, virtual con el MotorEventos). Las lecturas
+        ya desalojadas de la ventana cuentan por el máximo de su bloque
+        del resumen; lo que no se pudo evaluar queda en `truncados`.
+
+        Args:
+            horas: Ventana hacia atrás desde ahora
+
+        Returns:
+            La misma consulta
+        """
+        return self.donde_serie("temperatura", ">=", UMBRAL_FIEBRE,
+                                desde=self._reloj.ahora() - horas * 3600)
+
+    def seleccionar(self, *campos: str) -> "ConsultaRodeo":
+        """
+        Elige los campos de cada fila de filas().
+
+        Args:
+            campos: Campos de CAMPOS (sin campos = todos)
+
+        Returns:
+            La misma consulta
+
+        Raises:
+            ConsultaInvalidaException: Si algún campo no existe
+        """
+        for campo in campos:
+            if campo not in CAMPOS:
+                raise ConsultaInvalidaException(f"Campo desconocido: {campo!r}")
+        self._campos = campos
+        return self
+
+    def agrupar_por(self, campo: str) -> "ConsultaRodeo":
+        """
+        Args:
+            campo: Campo de agrupamiento (ej. "corral" o "tipo")
+
+        Returns:
+            La misma consulta
+
+        Raises:
+            ConsultaInvalidaException: Si el campo no existe
+        """
+        if campo not in CAMPOS:
+            raise ConsultaInvalidaException(f"Campo desconocido: {campo!r}")
+        self._grupo = campo
+        return self
+
+    def agregar(self, **agregados) -> "ConsultaRodeo":
+        """
+        Define los agregados de agrupado(), por ejemplo
+        agregar(animales="cantidad", peso_medio=("promedio", "peso")).
+
+        Args:
+            agregados: Nombre -> "cantidad" o (función, campo), con
+                       función en AGREGADOS
+
+        Returns:
+            La misma consulta
+
+        Raises:
+            ConsultaInvalidaException: Si la función o el campo no existen
+        """
+        for nombre, definicion in agregados.items():
+            funcion, campo = (definicion, "id") if isinstance(definicion, str) else definicion
+            if funcion not in AGREGADOS:
+                raise ConsultaInvalidaException(f"Agregado desconocido: {funcion!r}")
+            if campo not in CAMPOS:
+                raise ConsultaInvalidaException(f"Campo desconocido: {campo!r}")
+            self._agregados[nombre] = (funcion, campo)
+        return self
+
+    # --- Plan ---
+
+    def _almacen_completo(self) -> bool:
+        almacen = self._almacen
+        return almacen is not None and len(almacen) == len(self._animales)
+
+    def _indices_completos(self) -> bool:
+        indices = self._indices
+        return indices is not None and len(indices) == len(self._animales)
+
+    def _estimar(self, condicion: Condicion) -> Optional[int]:
+        """
+        Returns:
+            Animales que deja la condición según su índice, o None si no
+            tiene índice
+        """
+        campo, operador, codigo = condicion.campo, condicion.operador, condicion._codigo
+        if campo == "salud" and operador == "tiene":
+            return self._indices.contar_salud(codigo) if self._indices_completos() else None
+        if operador not in ("==", "en"):
+            return None
+        codigos = codigo if operador == "en" else (codigo,)
+        if campo == "corral":
+            return sum(len(self._corrales[c]) for c in set(codigos) if c in self._corrales)
+        if not self._indices_completos():
+            return None
+        if campo == "tipo":
+            return sum(self._indices.contar_tipo(c) for c in set(codigos))
+        if campo == "racion":
+            return sum(self._indices.contar_racion(c) for c in set(codigos))
+        return None
+
+    def planificar(self) -> PlanConsulta:
+        """
+        Returns:
+            Plan con el que se ejecutaría la consulta
+        """
+        plan = PlanConsulta(len(self._animales))
+        plan.vectorizado = np is not None and self._almacen_completo()
+        condiciones = list(self._condiciones)
+
+        # El índice más selectivo, si deja pocos candidatos (sin columnas, cualquiera)
+        mejor = None
+        for condicion in condiciones:
+            if isinstance(condicion, Condicion):
+                estimado = self._estimar(condicion)
+                if estimado is not None and (mejor is None or estimado < mejor[1]):
+                    mejor = (condicion, estimado)
+        if mejor is not None and (not plan.vectorizado or mejor[1] <= FRACCION_INDICE * plan.total):
+            plan.indice, plan.estimado = mejor
+            origen = "animales del corral" if plan.indice.campo == "corral" else "índice"
+            plan.acceso = f"{origen}: {plan.indice}"
+            condiciones.remove(plan.indice)
+        elif plan.vectorizado:
+            plan.acceso = "todas las columnas del almacén"
+
+        # Primero los filtros de columna (baratos), los más selectivos según
+        # los índices adelante; al final los de objeto y entre éstos los de
+        # historial, que recorren lecturas
+        estimados = {}
+        for condicion in condiciones:
+            if isinstance(condicion, Condicion):
+                estimado = self._estimar(condicion)
+                if estimado is not None:
+                    estimados[id(condicion)] = estimado
+        condiciones.sort(key=lambda condicion: estimados.get(id(condicion), plan.total))
+        for condicion in condiciones:
+            if plan.vectorizado and condicion.vectorizable:
+                plan.columnas.append(condicion)
+            else:
+                plan.objetos.append(condicion)
+        plan.objetos.sort(key=lambda condicion: isinstance(condicion, CondicionSerie))
+
+        if self._grupo is not None or self._agregados:
+            agregados = ", ".join(f"{nombre}={funcion}({campo})"
+                                  for nombre, (funcion, campo) in self._agregados_efectivos().items())
+            grupo = f"agrupar por {self._grupo}: " if self._grupo is not None else "agregar: "
+            plan.salida = grupo + agregados
+        else:
+            plan.salida = "campos " + ", ".join(self._campos or CAMPOS)
+        return plan
+
+    def explicar(self, analizar: bool = False) -> str:
+        """
+        Args:
+            analizar: Ejecutar la consulta y anotar las filas de cada paso
+                      y el tiempo total
+
+        Returns:
+            Descripción del plan
+        """
+        plan = self.planificar()
+        if analizar:
+            inicio = time.perf_counter()
+            self._producir(*self._ejecutar(plan, anotar=True))
+            plan.milisegundos = (time.perf_counter() - inicio) * 1000
+        return str(plan)
+
+    # --- Ejecución ---
+
+    def _candidatos(self, plan: PlanConsulta) -> List[Animal]:
+        """Animales del índice elegido en el plan."""
+        condicion = plan.indice
+        campo, codigo = condicion.campo, condicion._codigo
+        codigos = sorted(set(codigo)) if condicion.operador == "en" else (codigo,)
+        if campo == "corral":
+            return [a for c in codigos if c in self._corrales for a in self._corrales[c].animales]
+        if campo == "salud":
+            return self._indices.por_salud(codigo)
+        buscar = self._indices.por_tipo if campo == "tipo" else self._indices.por_racion
+        return [a for c in codigos for a in buscar(c)]
+
+    def _ejecutar(self, plan: PlanConsulta, anotar: bool = False):
+        """
+        Returns:
+            (slots, animales): numpy.ndarray de slots si el plan es
+            vectorizado (animales None), o lista de animales (slots None)
+        """
+        filas = plan.filas if anotar else {}
+        animales = None
+        slots = None
+        if plan.indice is not None:
+            animales = self._candidatos(plan)
+            if plan.vectorizado:
+                slots = np.sort(np.fromiter((a._slot for a in animales), dtype=np.intp,
+                                            count=len(animales)))
+                animales = None
+        elif plan.vectorizado:
+            slots = np.arange(len(self._almacen))
+        else:
+            animales = list(self._animales.values())
+        filas["acceso"] = len(slots if animales is None else animales)
+
+        if plan.vectorizado:
+            columnas = self._almacen.columnas
+            for i, condicion in enumerate(plan.columnas):
+                slots = slots[condicion.evaluar_columnas(columnas, slots)]
+                filas[f"columna{i}"] = len(slots)
+            if plan.objetos:
+                todos = self._almacen.animales
+                animales = [todos[slot] for slot in slots.tolist()]
+        self.truncados = 0
+        for i, condicion in enumerate(plan.objetos):
+            serie = isinstance(condicion, CondicionSerie)
+            if serie:
+                condicion.truncados = 0
+            animales = [a for a in animales if condicion.evaluar(a)]
+            filas[f"objeto{i}"] = len(animales)
+            if serie and condicion.truncados:
+                filas[f"truncados{i}"] = condicion.truncados
+                self.truncados += condicion.truncados
+        if plan.vectorizado and plan.objetos:
+            slots = np.fromiter((a._slot for a in animales), dtype=np.intp, count=len(animales))
+            animales = None
+        return slots, animales
+
+    def animales(self) -> List[Animal]:
+        """
+        Returns:
+            Animales que cumplen todos los filtros
+        """
+        slots, animales = self._ejecutar(self.planificar())
+        if animales is None:
+            todos = self._almacen.animales
+            animales = [todos[slot] for slot in slots.tolist()]
+        return animales
+
+    def contar(self) -> int:
+        """
+        Returns:
+            Cantidad de animales que cumplen todos los filtros (con el
+            plan vectorizado no arma objetos)
+        """
+        slots, animales = self._ejecutar(self.planificar())
+        return len(slots if animales is None else animales)
+
+    def _vector(self, campo: str, slots):
+        """Valores de un campo para los slots del resultado, como numpy.ndarray."""
+        columnas = self._almacen.columnas
+        if campo == "ganancia":
+            return columnas[COL_PESO][slots] - columnas[COL_PESO_INICIAL][slots]
+        if campo in _VECTORIZABLES:
+            return columnas[CAMPOS[campo]][slots]
+        todos = self._almacen.animales
+        lector = _LECTORES[campo]
+        return np.fromiter((lector(todos[slot]) for slot in slots.tolist()),
+                           dtype=np.int64 if campo == "id" else np.float64, count=len(slots))
+
+    def _valores(self, campo: str, slots, animales) -> list:
+        """Valores crudos (códigos para los categóricos) de un campo para el resultado."""
+        if animales is None:
+            return self._vector(campo, slots).tolist()
+        lector = _LECTORES[campo]
+        return [lector(a) for a in animales]
+
+    def filas(self) -> List[dict]:
+        """
+        Returns:
+            Una fila (campo -> valor) por animal, con los campos de
+            seleccionar() (todos si no se eligieron)
+        """
+        return self._filas(*self._ejecutar(self.planificar()))
+
+    def _filas(self, slots, animales) -> List[dict]:
+        campos = self._campos or tuple(CAMPOS)
+        columnas = []
+        for campo in campos:
+            valores = self._valores(campo, slots, animales)
+            if campo in _CATEGORICOS:
+                # Se decodifica cada código distinto una sola vez
+                textos = {codigo: _decodificar(campo, codigo) for codigo in set(valores)}
+                valores = [textos[codigo] for codigo in valores]
+            columnas.append(valores)
+        return [dict(zip(campos, fila)) for fila in zip(*columnas)]
+
+    def _agregados_efectivos(self) -> Dict[str, tuple]:
+        return self._agregados or {"cantidad": ("cantidad", "id")}
+
+    def agrupado(self) -> dict:
+        """
+        Calcula los agregados de agregar() (por defecto, la cantidad)
+        por grupo de agrupar_por(), o sobre todo el resultado si no se
+        agrupó. Con el plan vectorizado se calculan sobre columnas.
+
+        Returns:
+            Valor del grupo -> {agregado: valor}, en orden de grupo; sin
+            agrupar, directamente {agregado: valor}
+        """
+        return self._agrupado(*self._ejecutar(self.planificar()))
+
+    def _agrupado(self, slots, animales) -> dict:
+        agregados = self._agregados_efectivos()
+        grupo = self._grupo
+        if animales is None:
+            resultado = self._agrupar_columnas(slots, grupo, agregados)
+        else:
+            resultado = self._agrupar_objetos(animales, grupo, agregados)
+        if grupo is None:
+            return resultado.get(0, {nombre: 0 for nombre in agregados})
+        if grupo in _CATEGORICOS:
+            return {_decodificar(grupo, clave): fila for clave, fila in resultado.items()}
+        return resultado
+
+    def _agrupar_columnas(self, slots, grupo: Optional[str], agregados: Dict[str, tuple]) -> dict:
+        """Agregados por grupo con bincount sobre las columnas del resultado."""
+        if grupo is None:
+            posicion = np.zeros(len(slots), dtype=np.intp)
+            grupos = [0] if len(slots) else []
+        else:
+            claves, posicion = np.unique(self._vector(grupo, slots), return_inverse=True)
+            grupos = claves.tolist()
+        cantidades = np.bincount(posicion, minlength=len(grupos))
+        resultado = {clave: {} for clave in grupos}
+        for nombre, (funcion, campo) in agregados.items():
+            if funcion == "cantidad":
+                valores = cantidades
+            else:
+                datos = self._vector(campo, slots).astype(np.float64, copy=False)
+                if funcion in ("suma", "promedio"):
+                    valores = np.bincount(posicion, weights=datos, minlength=len(grupos))
+                    if funcion == "promedio":
+                        valores = valores / cantidades
+                else:
+                    valores = np.full(len(grupos), np.inf if funcion == "minimo" else -np.inf)
+                    (np.minimum if funcion == "minimo" else np.maximum).at(valores, posicion, datos)
+            for fila, valor in zip(resultado.values(), valores.tolist()):
+                fila[nombre] = valor
+        return resultado
+
+    def _agrupar_objetos(self, animales: List[Animal], grupo: Optional[str],
+                         agregados: Dict[str, tuple]) -> dict:
+        """Agregados por grupo recorriendo los animales del resultado."""
+        lector = _LECTORES[grupo] if grupo is not None else (lambda a: 0)
+        por_grupo: Dict = {}
+        for animal in animales:
+            por_grupo.setdefault(lector(animal), []).append(animal)
+        funciones = {"suma": sum, "minimo": min, "maximo": max,
+                     "promedio": lambda valores: sum(valores) / len(valores)}
+        resultado = {}
+        for clave in sorted(por_grupo):
+            miembros = por_grupo[clave]
+            fila = resultado[clave] = {}
+            for nombre, (funcion, campo) in agregados.items():
+                if funcion == "cantidad":
+                    fila[nombre] = len(miembros)
+                else:
+                    leer = _LECTORES[campo]
+                    fila[nombre] = funciones[funcion]([leer(a) for a in miembros])
+        return resultado
+
+    def ejecutar(self):
+        """
+        Returns:
+            agrupado() si se pidió agrupar o agregar, filas() si no
+        """
+        return self._producir(*self._ejecutar(self.planificar()))
+
+    def _producir(self, slots, animales):
+        if self._grupo is not None or self._agregados:
+            return self._agrupado(slots, animales)
+        return self._filas(slots, animales)
+
+    def __repr__(self):
+        filtros = " y ".join(str(condicion) for condicion in self._condiciones) or "todos"
+        return f"ConsultaRodeo({filtros})"
@@ -0,0 +1,255 @@
+"""
+Servicio de Estadísticas - Totales del rodeo mantenidos por avisos
+
+FeedlotSystem.obtener_estadisticas ya no recorre el rodeo: los corrales
+del sistema reenvían a EstadisticasRodeo cada alta, baja y cambio de
+peso, peso de ingreso, tipo o estado de salud de sus animales, y los
+totales (cantidad, peso, ganancia, enfermos, desglosados por tipo) se
+leen en O(1). Con el modo de verificación cada lectura se compara contra
+un recálculo completo.
+"""
+
+import threading
+from typing import Dict, Iterable, List
+from entidades.animal import Animal, TIPOS
+
+# Posiciones de los acumuladores de cada tipo
+_CANTIDAD, _PESO, _PESO_INICIAL, _ENFERMOS = range(4)
+
+# Error relativo admitido en las sumas de pesos al verificar
+TOLERANCIA_VERIFICACION = 1e-9
+
+
+class EstadisticasRodeo:
+    """
+    Acumuladores del rodeo por tipo de animal. La ganancia se obtiene
+    como peso total menos peso de ingreso total, así que basta con
+    seguir las dos sumas.
+
+    Los corrales avisan las altas, las bajas y cada cambio con su lock
+    tomado (las transferencias no avisan: el animal sigue en el rodeo),
+    así quien tome los locks de todos los corrales ve los acumuladores
+    de acuerdo con los animales.
+    """
+
+    def __init__(self):
+        """Inicializa acumuladores vacíos."""
+        # Código de tipo -> [cantidad, peso, peso de ingreso, enfermos]
+        self._por_tipo: Dict[int, list] = {}
+        self._lock = threading.Lock()
+
+    def _fila(self, tipo: int) -> list:
+        fila = self._por_tipo.get(tipo)
+        if fila is None:
+            fila = self._por_tipo[tipo] = [0, 0.0, 0.0, 0]
+        return fila
+
+    def agregar(self, animal: Animal):
+        """
+        Suma un animal que entra a un corral del sistema.
+
+        Args:
+            animal: Animal que entra
+        """
+        with self._lock:
+            fila = self._fila(animal._tipo)
+            fila[_CANTIDAD] += 1
+            fila[_PESO] += animal.peso
+            fila[_PESO_INICIAL] += animal.peso_inicial
+            fila[_ENFERMOS] += animal.esta_enfermo()
+
+    def agregar_varios(self, animales: Iterable[Animal]):
+        """
+        Suma varios animales que entran juntos (carga masiva) con una sola
+        toma del lock.
+
+        Args:
+            animales: Animales que entran
+        """
+        parciales = self._contar(animales)
+        with self._lock:
+            for tipo, parcial in parciales.items():
+                fila = self._fila(tipo)
+                for posicion, valor in enumerate(parcial):
+                    fila[posicion] += valor
+
+    def quitar(self, animal: Animal):
+        """
+        Resta un animal que sale de un corral del sistema.
+
+        Args:
+            animal: Animal que sale
+        """
+        with self._lock:
+            fila = self._fila(animal._tipo)
+            fila[_CANTIDAD] -= 1
+            fila[_PESO] -= animal.peso
+            fila[_PESO_INICIAL] -= animal.peso_inicial
+            fila[_ENFERMOS] -= animal.esta_enfermo()
+
+    def ajustar(self, tipo: int, peso: float = 0.0, enfermos: int = 0,
+                peso_inicial: float = 0.0):
+        """
+        Suma variaciones de un animal ya contado.
+
+        Args:
+            tipo: Código de tipo del animal
+            peso: Variación del peso en kg
+            enfermos: Variación de la cantidad de enfermos (-1, 0 o 1)
+            peso_inicial: Variación del peso de ingreso en kg
+        """
+        with self._lock:
+            fila = self._fila(tipo)
+            fila[_PESO] += peso
+            fila[_ENFERMOS] += enfermos
+            fila[_PESO_INICIAL] += peso_inicial
+
+    def sumar_peso(self, tipo: int, peso: float):
+        """
+        Variación de peso de un animal ya contado (el aviso más frecuente,
+        uno por lectura de los sensores de peso).
+
+        Args:
+            tipo: Código de tipo del animal
+            peso: Variación del peso en kg
+        """
+        with self._lock:
+            try:
+                self._por_tipo[tipo][_PESO] += peso
+            except KeyError:
+                self._fila(tipo)[_PESO] += peso
+
+    def cambiar_tipo(self, animal: Animal, anterior: int, nuevo: int):
+        """
+        Pasa los valores de un animal de un tipo a otro.
+
+        Args:
+            animal: Animal que cambia de tipo
+            anterior: Código de tipo actual
+            nuevo: Código de tipo nuevo
+        """
+        if anterior == nuevo:
+            return
+        peso, peso_inicial, enfermo = animal.peso, animal.peso_inicial, animal.esta_enfermo()
+        with self._lock:
+            for fila, signo in ((self._fila(anterior), -1), (self._fila(nuevo), 1)):
+                fila[_CANTIDAD] += signo
+                fila[_PESO] += signo * peso
+                fila[_PESO_INICIAL] += signo * peso_inicial
+                fila[_ENFERMOS] += signo * enfermo
+
+    def vaciar(self):
+        """Descarta todos los acumuladores."""
+        with self._lock:
+            self._por_tipo = {}
+
+    def recalcular(self, animales: Iterable[Animal]):
+        """
+        Rearma los acumuladores recorriendo los animales (O(n)); descarta
+        el error de redondeo acumulado.
+
+        Args:
+            animales: Animales en los corrales del sistema
+        """
+        with self._lock:
+            self._por_tipo = self._contar(animales)
+
+    @classmethod
+    def calcular(cls, animales: Iterable[Animal]) -> dict:
+        """
+        Totales recorriendo los animales (O(n)), con el mismo formato que resumen().
+
+        Args:
+            animales: Animales a resumir
+
+        Returns:
+            Diccionario como el de resumen()
+        """
+        return cls._resumir(cls._contar(animales))
+
+    @staticmethod
+    def _contar(animales: Iterable[Animal]) -> Dict[int, list]:
+        por_tipo: Dict[int, list] = {}
+        for animal in animales:
+            fila = por_tipo.get(animal._tipo)
+            if fila is None:
+                fila = por_tipo[animal._tipo] = [0, 0.0, 0.0, 0]
+            fila[_CANTIDAD] += 1
+            fila[_PESO] += animal.peso
+            fila[_PESO_INICIAL] += animal.peso_inicial
+            fila[_ENFERMOS] += animal.esta_enfermo()
+        return por_tipo
+
+    @staticmethod
+    def _resumir(por_tipo: Dict[int, list]) -> dict:
+        total = peso = peso_inicial = enfermos = 0
+        desglose = {}
+        for codigo, (cantidad, peso_tipo, inicial_tipo, enfermos_tipo) in sorted(por_tipo.items()):
+            total += cantidad
+            peso += peso_tipo
+            peso_inicial += inicial_tipo
+            enfermos += enfermos_tipo
+            if cantidad:
+                desglose[TIPOS.valores[codigo]] = {
+                    "total_animales": cantidad,
+                    "peso_total": peso_tipo,
+                    "peso_promedio": peso_tipo / cantidad,
+                    "ganancia_total": peso_tipo - inicial_tipo,
+                    "ganancia_promedio": (peso_tipo - inicial_tipo) / cantidad,
+                    "animales_enfermos": enfermos_tipo
+                }
+        return {
+            "total_animales": total,
+            "peso_total": float(peso),
+            "ganancia_total": float(peso - peso_inicial),
+            "animales_enfermos": enfermos,
+            "por_tipo": desglose
+        }
+
+    def resumen(self) -> dict:
+        """
+        Totales del rodeo. Recorre sólo los tipos de animal, no los animales.
+
+        Returns:
+            Diccionario con total, peso total, ganancia total, enfermos y
+            el desglose por tipo
+        """
+        with self._lock:
+            por_tipo = {codigo: list(fila) for codigo, fila in self._por_tipo.items()}
+        return self._resumir(por_tipo)
+
+    def comparar(self, animales: Iterable[Animal],
+                 tolerancia: float = TOLERANCIA_VERIFICACION) -> List[str]:
+        """
+        Compara los acumuladores contra un recálculo completo.
+
+        Args:
+            animales: Animales en los corrales del sistema
+            tolerancia: Error relativo admitido en las sumas de pesos
+
+        Returns:
+            Descripción de cada diferencia (vacía si coinciden)
+        """
+        esperado = self.calcular(animales)
+        obtenido = self.resumen()
+        diferencias = []
+        vacio = {"total_animales": 0, "animales_enfermos": 0, "peso_total": 0.0, "ganancia_total": 0.0}
+        grupos = [("", obtenido, esperado)] + [
+            (f"{tipo}.", obtenido["por_tipo"].get(tipo, vacio), esperado["por_tipo"].get(tipo, vacio))
+            for tipo in sorted(set(obtenido["por_tipo"]) | set(esperado["por_tipo"]))
+        ]
+        for prefijo, propio, referencia in grupos:
+            # El redondeo de las sumas es proporcional al peso total, también en la ganancia
+            margen = tolerancia * max(1.0, abs(referencia["peso_total"]))
+            for clave in ("total_animales", "animales_enfermos", "peso_total", "ganancia_total"):
+                valor, correcto = propio[clave], referencia[clave]
+                distinto = (valor != correcto if clave in ("total_animales", "animales_enfermos")
+                            else abs(valor - correcto) > margen)
+                if distinto:
+                    diferencias.append(f"{prefijo}{clave}: {valor} (recalculado: {correcto})")
+        return diferencias
+
+    def __repr__(self):
+        resumen = self.resumen()
+        return (f"EstadisticasRodeo(animales={resumen['total_animales']}, "
+                f"enfermos={resumen['animales_enfermos']})")
@@ -2,18 +2,41 @@
 Servicio Principal del Feedlot - Implementa Patrón Singleton
 
 Este es el corazón del sistema. Gestiona todo el feedlot de forma centralizada.
+
+FeedlotSystem() devuelve siempre el sistema único del proceso, que fecha
+las lecturas con el reloj compartido (servicios.reloj_service.reloj).
+Para correr varios feedlots aislados en el mismo proceso (comparar
+políticas, barridos de parámetros) se crean instancias independientes
+con FeedlotSystem.crear_independiente o con RegistroFeedlots, cada una
+con su propio reloj.
 """
 
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Tuple
+from constantes import INTERVALO_REPORTES, VERIFICAR_ESTADISTICAS, NOMBRE_FEEDLOT
 from patrones.singleton import SingletonMeta
-from entidades.animal import Animal
+from entidades.animal import Animal, TIPOS, RACIONES
 from entidades.corral import Corral
+from entidades.rodeo import AlmacenRodeo
+from entidades.salud import EstadoSalud
 from entidades.sensor import Sensor
 from patrones.observer import ObservadorAlerta
+from servicios.planificador_sensores import PlanificadorSensores
+from consola import consola
+from servicios.estadisticas_service import EstadisticasRodeo
+from servicios.indices_service import IndicesRodeo
+from servicios.consulta_service import ConsultaRodeo
+from servicios.ranking_service import RankingGanancia, FRACCION_COLUMNAS, FRACCION_OBJETOS
+from servicios.reloj_service import Reloj, reloj
 from estrategias.estrategia_racion import EstrategiaRacion
 from estrategias.racion_normal import RacionNormal
+import contextlib
+import gc
+import heapq
+import threading
 import time
+from collections import Counter
 from excepciones.feedlot_exceptions import (
+    FeedlotException,
     AnimalNoEncontradoException,
     CorralLlenoException
 )
@@ -33,20 +56,61 @@ class FeedlotSystem(metaclass=SingletonMeta):
     - Generar estadísticas
     """
     
-    def __init__(self):
+    def __init__(self, nombre: str = NOMBRE_FEEDLOT, reloj_propio: Optional[Reloj] = None):
         """
         Inicializa el sistema (solo se ejecuta una vez gracias al Singleton)
+        
+        Args:
+            nombre: Nombre del feedlot
+            reloj_propio: Reloj con el que fechar las lecturas de este
+                          sistema (None = el reloj compartido del proceso
+                          para el singleton, uno nuevo para las
+                          instancias independientes)
         """
         # Evitar reinicialización en llamadas subsecuentes
         if not hasattr(self, 'initialized'):
+            self.nombre = nombre
+            # Creada con crear_independiente (SingletonMeta) o como instancia única
+            self.independiente = getattr(self, "_independiente", False)
+            if reloj_propio is None:
+                reloj_propio = Reloj() if self.independiente else reloj
+            self.reloj = reloj_propio
+            
             # Colecciones principales
             self.animales: Dict[int, Animal] = {}
             self.corrales: Dict[int, Corral] = {}
             self.sensores: List[Sensor] = []
+            # Índice inverso: ID de animal -> número de corral
+            self.corral_por_animal: Dict[int, int] = {}
+            
+            # Columnas numéricas del rodeo (None si NumPy no está instalado)
+            self.almacen = AlmacenRodeo() if AlmacenRodeo.disponible() else None
+            
+            # Totales del rodeo que los corrales mantienen al día
+            self.estadisticas_rodeo = EstadisticasRodeo()
+            # Comparar cada lectura de estadísticas contra un recálculo completo
+            self.modo_verificacion = VERIFICAR_ESTADISTICAS
+            # Ganancia de peso ordenada por tipo y por corral
+            self.ranking = RankingGanancia()
+            # Animales agrupados por tipo, estado de salud y ración
+            self.indices = IndicesRodeo()
             
             # Observer para alertas
             self.observador_alertas = ObservadorAlerta()
             
+            # Agenda central de lecturas (pool fijo de hilos)
+            self.planificador = PlanificadorSensores()
+            self.reloj.usar(self.planificador.ahora)
+            
+            # Canal de ingesta opcional entre sensores y rodeo
+            self.ingesta = None
+            
+            # Política de muestreo adaptativo opcional
+            self.muestreo = None
+            
+            # Fuente de flujos aleatorios con semilla (reproducibilidad)
+            self.fuente_aleatoria = None
+            
             # Estrategia por defecto
             self.estrategia_default = RacionNormal()
             
@@ -54,11 +118,19 @@ class FeedlotSystem(metaclass=SingletonMeta):
             self.activo = False
             self.dia_actual = 0
             self.fecha_inicio = None
+            # Instante (reloj del planificador) en que empezó el día 1
+            self.inicio_reloj = None
+            
+            # Altas, bajas y traslados de animales (también las cargas masivas)
+            self._mutacion = threading.RLock()
             
             # Marcador de inicialización
             self.initialized = True
             
-            print(" [SINGLETON] Sistema Feedlot 'Estancia Carnes Finas' inicializado")
+            if not self.independiente:
+                print(f" [SINGLETON] Sistema Feedlot '{nombre}' inicializado")
+            else:
+                consola.emitir("sistema", " Sistema Feedlot '{}' (independiente) inicializado", nombre)
     
     def agregar_animal(self, animal: Animal, numero_corral: int = 1) -> bool:
         """
@@ -71,20 +143,19 @@ class FeedlotSystem(metaclass=SingletonMeta):
         Returns:
             bool: True si se agregó exitosamente
         """
-    
-        if animal.id in self.animales:
-           raise AnimalNoEncontradoException(f"Animal #{animal.id} ya existe en el sistema")
-    
-        self.animales[animal.id] = animal
-    
-        if numero_corral not in self.corrales:
-           self.corrales[numero_corral] = Corral(numero_corral)
-  
-        if self.corrales[numero_corral].agregar_animal(animal):
-           print(f"✓ {animal} agregado al {self.corrales[numero_corral]}")
-           return True
-        else:
-            raise CorralLlenoException(f"{self.corrales[numero_corral]} está lleno")
+        with self._mutacion:
+            if animal.id in self.animales:
+                raise AnimalNoEncontradoException(f"Animal #{animal.id} ya existe en el sistema")
+            
+            corral = self.crear_corral(numero_corral)
+            if not corral.agregar_animal(animal):
+                raise CorralLlenoException(f"{corral} está lleno")
+        
+            self.animales[animal.id] = animal
+            self.corral_por_animal[animal.id] = numero_corral
+            self._adjuntar(animal, numero_corral)
+            consola.emitir("rodeo", "✓ {} agregado al {}", animal, corral)
+            return True
     
     def remover_animal(self, id_animal: int) -> bool:
         """
@@ -96,19 +167,296 @@ class FeedlotSystem(metaclass=SingletonMeta):
         Returns:
             bool: True si se removió exitosamente
         """
-        if id_animal not in self.animales:
-            print(f"✗ Animal #{id_animal} no encontrado")
-            return False
+        with self._mutacion:
+            if id_animal not in self.animales:
+                print(f"✗ Animal #{id_animal} no encontrado")
+                return False
+        
+            # Remover de su corral
+            corral = self.obtener_corral_de_animal(id_animal)
+            if corral is not None:
+                corral.remover_animal(id_animal)
+            self.corral_por_animal.pop(id_animal, None)
+        
+            # Remover de la colección
+            animal = self.animales.pop(id_animal)
+            if self.almacen is not None and animal._almacen is self.almacen:
+                self.almacen.desadjuntar(animal)
+            consola.emitir("rodeo", "✓ {} removido del sistema", animal)
+            return True
+    
+    def transferir_animal(self, id_animal: int, numero_corral: int) -> Corral:
+        """
+        Mueve un animal a otro corral (lo crea si no existe).
+        
+        Args:
+            id_animal: ID del animal
+            numero_corral: Corral de destino
+            
+        Returns:
+            Corral de destino
+            
+        Raises:
+            AnimalNoEncontradoException: Si el animal no está en el sistema
+            CorralLlenoException: Si el corral de destino está lleno
+        """
+        with self._mutacion:
+            animal = self.animales.get(id_animal)
+            if animal is None:
+                raise AnimalNoEncontradoException(f"Animal #{id_animal} no encontrado")
+        
+            origen = self.obtener_corral_de_animal(id_animal)
+            if origen is not None and origen.numero == numero_corral:
+                return origen
+        
+            destino = self.crear_corral(numero_corral)
+            # Con origen, salida y entrada son un solo paso (Corral.transferir_animal)
+            if origen is not None:
+                movido = origen.transferir_animal(id_animal, destino)
+            else:
+                movido = destino.agregar_animal(animal)
+            if not movido:
+                raise CorralLlenoException(f"{destino} está lleno")
+            self.corral_por_animal[id_animal] = numero_corral
+            animal.numero_corral = numero_corral
+            consola.emitir("rodeo", "✓ {} transferido al {}", animal, destino)
+            return destino
+
+    def agregar_animales(self, animales: Iterable[Animal], capacidad_corral: int = 50) -> Dict:
+        """
+        Carga masiva (p. ej. un camión completo): agrega todos los animales
+        de una vez, repartidos en corrales por capacidad, tipo y peso (ver
+        _repartir_en_corrales). Todo ocurre bajo el lock de altas y con un
+        solo mensaje al final, no uno por animal.
+
+        Args:
+            animales: Animales nuevos
+            capacidad_corral: Capacidad de los corrales que haya que crear
+
+        Returns:
+            Diccionario con los animales agregados, los animales por
+            corral, los corrales creados, los segundos y los animales por
+            segundo de la carga
+
+        Raises:
+            AnimalNoEncontradoException: Si algún ID ya está en el sistema o
+                se repite en la carga (no se agrega ninguno)
+        """
+        inicio = time.perf_counter()
+        animales = list(animales)
+        with self._mutacion:
+            ids = set()
+            for animal in animales:
+                if animal.id in self.animales or animal.id in ids:
+                    raise AnimalNoEncontradoException(f"Animal #{animal.id} ya existe en el sistema")
+                ids.add(animal.id)
+
+            # La carga crea decenas de miles de contenedores: sin pausar el
+            # recolector de ciclos, cada pasada recorre todo el rodeo
+            recolector = gc.isenabled()
+            gc.disable()
+            try:
+                reparto = self._repartir_en_corrales(animales, capacidad_corral)
+                creados = [numero for numero, _ in reparto if numero not in self.corrales]
+                altas = []
+                for numero, grupo in reparto:
+                    self.crear_corral(numero, capacidad_corral).agregar_animales(grupo, avisar=False)
+                    altas.extend((animal, numero) for animal in grupo)
+                    for animal in grupo:
+                        self.animales[animal.id] = animal
+                        self.corral_por_animal[animal.id] = numero
+                # Un solo aviso al rodeo para toda la carga (antes de pasar
+                # los datos al almacén: leer la fila propia es más barato)
+                self.estadisticas_rodeo.agregar_varios(animales)
+                self.ranking.agregar_varios(altas)
+                self.indices.agregar_varios(animales)
+                if self.almacen is not None:
+                    for animal, _ in altas:
+                        if animal._almacen is not None:
+                            animal._almacen.desadjuntar(animal)
+                    self.almacen.adjuntar_varios([animal for animal, _ in altas],
+                                                 [numero for _, numero in altas])
+            finally:
+                if recolector:
+                    gc.enable()
+
+        por_corral: Dict[int, int] = {}
+        for numero, grupo in reparto:
+            por_corral[numero] = por_corral.get(numero, 0) + len(grupo)
+        segundos = time.perf_counter() - inicio
+        ritmo = len(animales) / segundos if segundos > 0 else 0.0
+        consola.emitir("rodeo", "✓ {} animales agregados en {} corrales ({} nuevos), {:,.0f} animales/s",
+                       len(animales), len(por_corral), len(creados), ritmo)
+        return {
+            "animales": len(animales),
+            "por_corral": por_corral,
+            "corrales_creados": creados,
+            "segundos": segundos,
+            "animales_por_segundo": ritmo
+        }
+
+    def _repartir_en_corrales(self, animales: List[Animal],
+                              capacidad_corral: int) -> List[Tuple[int, List[Animal]]]:
+        """
+        Reparte una carga en corrales sin mezclar tipos: cada tipo, ordenado
+        por peso, completa primero los corrales con lugar donde ese tipo es
+        mayoría (del de menor peso medio al de mayor), después los corrales
+        vacíos y por último corrales nuevos. Así cada corral recibe un
+        tramo continuo de pesos de un mismo tipo.
+
+        Args:
+            animales: Animales a repartir
+            capacidad_corral: Capacidad de los corrales nuevos
+
+        Returns:
+            Lista de (número de corral, animales para ese corral)
+        """
+        por_tipo: Dict[int, List[Animal]] = {}
+        for animal in animales:
+            por_tipo.setdefault(animal._tipo, []).append(animal)
+
+        # Corrales con lugar: (peso medio, número, lugar) por tipo mayoritario
+        con_lugar: Dict[int, List[Tuple[float, int, int]]] = {}
+        vacios: List[Tuple[int, int]] = []
+        for numero, corral in sorted(self.corrales.items()):
+            lugar = corral.capacidad - len(corral)
+            if lugar <= 0:
+                continue
+            if not len(corral):
+                vacios.append((numero, lugar))
+                continue
+            mayoria = Counter(animal._tipo for animal in corral.animales).most_common(1)[0][0]
+            con_lugar.setdefault(mayoria, []).append((corral.peso_promedio(), numero, lugar))
+        vacios.reverse()
+        proximo = max(self.corrales, default=0) + 1
+
+        reparto = []
+        for tipo in sorted(por_tipo):
+            grupo = sorted(por_tipo[tipo], key=lambda a: (a.peso, a.id))
+            i = 0
+            for _, numero, lugar in sorted(con_lugar.get(tipo, ())):
+                if i == len(grupo):
+                    break
+                reparto.append((numero, grupo[i:i + lugar]))
+                i += lugar
+            while i < len(grupo):
+                if vacios:
+                    numero, lugar = vacios.pop()
+                else:
+                    numero, lugar = proximo, capacidad_corral
+                    proximo += 1
+                reparto.append((numero, grupo[i:i + lugar]))
+                i += lugar
+        return reparto
+
+    def crear_corral(self, numero_corral: int, capacidad: int = 50) -> Corral:
+        """
+        Devuelve el corral con ese número, creándolo si no existe. Los
+        corrales del sistema comparten su almacén, sus estadísticas del
+        rodeo, su ranking de ganancia, sus índices y su reloj.
+        
+        Args:
+            numero_corral: Número del corral
+            capacidad: Capacidad si hay que crearlo
+            
+        Returns:
+            Corral del sistema
+        """
+        corral = self.corrales.get(numero_corral)
+        if corral is None:
+            corral = self.corrales[numero_corral] = Corral(numero_corral, capacidad)
+            corral.almacen = self.almacen
+            corral.rodeo = self.estadisticas_rodeo
+            corral.ranking = self.ranking
+            corral.indices = self.indices
+            corral.reloj = self.reloj
+        return corral
+    
+    def obtener_corral_de_animal(self, id_animal: int) -> Optional[Corral]:
+        """
+        Busca el corral de un animal en el índice inverso. Si el índice
+        no lo tiene (colecciones cargadas a mano sin reconstruir_indices)
+        se busca en los corrales.
         
-        # Remover de corrales
+        Args:
+            id_animal: ID del animal
+            
+        Returns:
+            Corral del animal, o None si no está asignado
+        """
+        corral = self.corrales.get(self.corral_por_animal.get(id_animal))
+        if corral is not None and id_animal in corral:
+            return corral
         for corral in self.corrales.values():
-            if corral.remover_animal(id_animal):
-                break
+            if id_animal in corral:
+                return corral
+        return None
+    
+    def _adjuntar(self, animal: Animal, numero_corral: int):
+        """
+        Pasa los datos del animal a las columnas del almacén del sistema.
         
-        # Remover de la colección
-        animal = self.animales.pop(id_animal)
-        print(f"✓ {animal} removido del sistema")
-        return True
+        Args:
+            animal: Animal ya registrado en un corral
+            numero_corral: Corral asignado
+        """
+        if self.almacen is None:
+            return
+        if animal._almacen is not None:
+            # Viene de otro sistema (una instancia independiente o tras reset_instances)
+            animal._almacen.desadjuntar(animal)
+        self.almacen.adjuntar(animal, numero_corral)
+    
+    def _almacen_completo(self) -> bool:
+        """
+        Returns:
+            True si todos los animales del sistema están en el almacén
+            (no lo están si se cargaron colecciones a mano sin
+            reconstruir_almacen)
+        """
+        return self.almacen is not None and len(self.almacen) == len(self.animales)
+    
+    def reconstruir_indices(self):
+        """
+        Rearma el índice animal -> corral, los índices por tipo, salud y
+        ración, el almacén columnar, las estadísticas del rodeo y el
+        ranking a partir de animales y corrales, por ejemplo tras
+        restaurar un estado guardado o poblar las colecciones directamente.
+        """
+        self.corral_por_animal = {
+            animal.id: numero
+            for numero, corral in self.corrales.items()
+            for animal in corral.animales
+            if self.animales.get(animal.id) is animal
+        }
+        for corral in self.corrales.values():
+            corral.rodeo = self.estadisticas_rodeo
+            corral.ranking = self.ranking
+            corral.indices = self.indices
+            corral.reloj = self.reloj
+        self.indices.recalcular(
+            animal for corral in self.corrales.values() for animal in corral.animales
+        )
+        self.estadisticas_rodeo.recalcular(
+            animal for corral in self.corrales.values() for animal in corral.animales
+        )
+        self.ranking.recalcular(self.corrales.values())
+        self.reconstruir_almacen()
+    
+    def reconstruir_almacen(self):
+        """
+        Rearma el almacén columnar a partir de animales y corrales, por
+        ejemplo tras restaurar un estado guardado o poblar las
+        colecciones directamente.
+        """
+        if self.almacen is None:
+            return
+        self.almacen.vaciar()
+        for numero, corral in self.corrales.items():
+            corral.almacen = self.almacen
+            for animal in corral.animales:
+                if self.animales.get(animal.id) is animal:
+                    self._adjuntar(animal, numero)
     
     def agregar_sensor(self, sensor: Sensor):
         """
@@ -120,13 +468,86 @@ class FeedlotSystem(metaclass=SingletonMeta):
         # Suscribir al observador de alertas
         sensor.agregar_observador(self.observador_alertas)
         
+        # Encolar sus lecturas si hay canal de ingesta
+        sensor.ingesta = self.ingesta
+        
+        # Ajustar su intervalo si hay muestreo adaptativo
+        sensor.muestreo = self.muestreo
+        
+        # Derivar su flujo aleatorio de la semilla de la corrida
+        if self.fuente_aleatoria is not None:
+            sensor.sembrar(self.fuente_aleatoria)
+        
         # Agregar a la lista de sensores
         self.sensores.append(sensor)
+        
+        # Si el monitoreo ya está activo, planificarlo de inmediato
+        if self.activo:
+            self.planificador.registrar(sensor)
+    
+    def usar_planificador(self, planificador):
+        """
+        Reemplaza el planificador de sensores (por ejemplo, por RuntimeAsyncio).
+        Solo puede hacerse con el monitoreo detenido.
+        
+        Args:
+            planificador: Objeto con registrar/desregistrar/iniciar/detener
+        """
+        if self.activo:
+            raise FeedlotException("No se puede cambiar el planificador con el monitoreo activo")
+        self.planificador = planificador
+        # Las lecturas se fechan con el reloj del planificador (virtual en MotorEventos)
+        self.reloj.usar(planificador.ahora)
+    
+    def usar_ingesta(self, ingesta):
+        """
+        Conecta los sensores a un canal de ingesta (IngestaLecturas).
+        Solo puede hacerse con el monitoreo detenido.
+        
+        Args:
+            ingesta: Canal de ingesta, o None para aplicar lecturas directamente
+        """
+        if self.activo:
+            raise FeedlotException("No se puede cambiar la ingesta con el monitoreo activo")
+        self.ingesta = ingesta
+        for sensor in self.sensores:
+            sensor.ingesta = ingesta
+    
+    def usar_muestreo(self, muestreo):
+        """
+        Aplica una política de muestreo adaptativo (MuestreoAdaptativo)
+        a todos los sensores. Puede cambiarse con el monitoreo activo:
+        cada sensor toma el nuevo intervalo en su próxima lectura.
+        
+        Args:
+            muestreo: Política de muestreo, o None para intervalos fijos
+        """
+        self.muestreo = muestreo
+        for sensor in self.sensores:
+            sensor.muestreo = muestreo
+            sensor.lecturas_estables = 0
+            if muestreo is None:
+                sensor.intervalo = sensor.intervalo_base
+    
+    def usar_fuente_aleatoria(self, fuente):
+        """
+        Siembra los sensores actuales y futuros con flujos derivados de
+        una FuenteAleatoria. Solo puede hacerse con el monitoreo detenido.
+        
+        Args:
+            fuente: FuenteAleatoria de la corrida
+        """
+        if self.activo:
+            raise FeedlotException("No se puede cambiar la fuente aleatoria con el monitoreo activo")
+        self.fuente_aleatoria = fuente
+        for sensor in self.sensores:
+            sensor.sembrar(fuente)
     
     def iniciar_monitoreo(self):
         """
         Inicia el monitoreo del feedlot.
-        Activa todos los sensores en hilos concurrentes.
+        Registra todos los sensores en el planificador central,
+        que los ejecuta con un pool fijo de hilos.
         """
         if not self.activo:
             self.activo = True
@@ -134,16 +555,23 @@ class FeedlotSystem(metaclass=SingletonMeta):
             # Registrar inicio
             from datetime import datetime
             self.fecha_inicio = datetime.now()
+            if self.inicio_reloj is None:
+                self.inicio_reloj = self.reloj.ahora()
             
             print("\n" + "="*70)
-            print(" INICIANDO MONITOREO DE ESTANCIA CARNES FINAS")
+            print(f" INICIANDO MONITOREO DE {self.nombre.upper()}")
             print("="*70)
             
-            # Iniciar todos los sensores
+            # El consumidor de ingesta arranca antes que los sensores
+            if self.ingesta:
+                self.ingesta.iniciar()
+            
+            # Registrar todos los sensores en el planificador
             for sensor in self.sensores:
-                sensor.iniciar()
+                self.planificador.registrar(sensor)
+            self.planificador.iniciar()
             
-            print(f"✓ {len(self.sensores)} sensores activos")
+            print(f"✓ {len(self.sensores)} sensores activos ({self.planificador})")
             print(f"✓ {len(self.animales)} animales bajo monitoreo")
             print(f"✓ {len(self.corrales)} corrales operativos")
             print(f" Inicio: {self.fecha_inicio.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -158,9 +586,14 @@ class FeedlotSystem(metaclass=SingletonMeta):
             self.activo = False
             print("\n Deteniendo monitoreo...")
             
-            # Detener todos los sensores
+            # Desregistrar todos los sensores y detener el planificador
             for sensor in self.sensores:
-                sensor.detener()
+                self.planificador.desregistrar(sensor)
+            self.planificador.detener()
+            
+            # Aplicar las lecturas que quedaron en cola
+            if self.ingesta:
+                self.ingesta.detener()
             
             print("✓ Todos los sensores detenidos")
             print("✓ Monitoreo finalizado\n")
@@ -206,10 +639,17 @@ class FeedlotSystem(metaclass=SingletonMeta):
     
     def obtener_estadisticas(self) -> Dict:
         """
-        Genera estadísticas generales del feedlot.
+        Genera estadísticas generales del feedlot. Los totales salen de
+        EstadisticasRodeo en O(1); sólo se recorre el rodeo si las
+        colecciones se cargaron a mano sin reconstruir_indices, o para
+        verificar los totales con modo_verificacion.
         
         Returns:
-            Diccionario con estadísticas completas
+            Diccionario con estadísticas completas (incluye el desglose "por_tipo")
+            
+        Raises:
+            FeedlotException: En modo verificación, si los totales no
+                              coinciden con el recálculo
         """
         if not self.animales:
             return {
@@ -221,24 +661,46 @@ class FeedlotSystem(metaclass=SingletonMeta):
                 "alertas_activas": 0
             }
         
-        # Calcular métricas
-        pesos = [a.peso for a in self.animales.values()]
-        ganancias = [a.ganancia_peso_total() for a in self.animales.values()]
-        enfermos = [a for a in self.animales.values() if a.esta_enfermo()]
+        rodeo = self.estadisticas_rodeo.resumen()
+        if rodeo["total_animales"] != len(self.animales):
+            rodeo = EstadisticasRodeo.calcular(self.animales.values())
+        elif self.modo_verificacion:
+            self.verificar_estadisticas()
         
+        total = rodeo["total_animales"]
         return {
-            "total_animales": len(self.animales),
-            "peso_promedio": sum(pesos) / len(pesos),
-            "peso_total": sum(pesos),
-            "ganancia_promedio": sum(ganancias) / len(ganancias),
-            "ganancia_total": sum(ganancias),
-            "animales_enfermos": len(enfermos),
-            "porcentaje_enfermos": (len(enfermos) / len(self.animales)) * 100,
+            "total_animales": total,
+            "peso_promedio": rodeo["peso_total"] / total,
+            "peso_total": rodeo["peso_total"],
+            "ganancia_promedio": rodeo["ganancia_total"] / total,
+            "ganancia_total": rodeo["ganancia_total"],
+            "animales_enfermos": rodeo["animales_enfermos"],
+            "porcentaje_enfermos": (rodeo["animales_enfermos"] / total) * 100,
             "total_corrales": len(self.corrales),
             "alertas_activas": len(self.observador_alertas.alertas),
-            "dia_actual": self.dia_actual
+            "dia_actual": self.dia_actual,
+            "por_tipo": rodeo["por_tipo"]
         }
     
+    def verificar_estadisticas(self):
+        """
+        Compara las estadísticas del rodeo contra un recálculo completo (O(n)).
+        Toma los locks de todos los corrales mientras compara: los animales
+        cambian de peso y de salud con el lock de su corral tomado, así que
+        puede llamarse con los sensores leyendo.
+        
+        Raises:
+            FeedlotException: Si algún total no coincide
+        """
+        with self._mutacion, contextlib.ExitStack() as locks:
+            for numero in sorted(self.corrales):
+                locks.enter_context(self.corrales[numero]._lock)
+            diferencias = self.estadisticas_rodeo.comparar(self.animales.values())
+        if diferencias:
+            raise FeedlotException(
+                "Estadísticas del rodeo inconsistentes: " + "; ".join(diferencias)
+            )
+    
     def mostrar_estado(self):
         """
         Muestra el estado actual del feedlot en consola.
@@ -289,29 +751,156 @@ class FeedlotSystem(metaclass=SingletonMeta):
         if not self.corrales:
             print("  No hay corrales creados")
         else:
+            estadisticas = self.obtener_estadisticas_corrales()
             for corral in sorted(self.corrales.values(), key=lambda c: c.numero):
-                stats = corral.obtener_estadisticas()
+                stats = estadisticas[corral.numero]
                 print(f"{corral} | Peso prom: {stats['peso_promedio']:.1f} kg | "
                       f"Enfermos: {stats['animales_enfermos']} | "
                       f"Uso: {stats['capacidad_usada']:.1f}%")
         
         print("-"*70 + "\n")
     
-    def obtener_mejores_animales(self, cantidad: int = 5) -> List[Animal]:
+    def obtener_mejores_animales(self, cantidad: int = 5, numero_corral: int = None,
+                                 tipo: str = None) -> List[Animal]:
         """
-        Obtiene los animales con mejor ganancia de peso.
+        Obtiene los animales con mejor ganancia de peso, sin ordenar el
+        rodeo (a igual ganancia, primero el de ID mayor).
         
         Args:
             cantidad: Número de animales a retornar
+            numero_corral: Sólo los de ese corral (None = todo el rodeo)
+            tipo: Sólo los de ese tipo, ej. "Novillo" (None = todos)
             
         Returns:
-            Lista de animales ordenados por ganancia
+            Lista de animales ordenados por ganancia, de mayor a menor
         """
-        return sorted(
-            self.animales.values(),
-            key=lambda a: a.ganancia_peso_total(),
-            reverse=True
-        )[:cantidad]
+        return self._por_ganancia(cantidad, True, numero_corral, tipo)
+    
+    def obtener_peores_animales(self, cantidad: int = 5, numero_corral: int = None,
+                                tipo: str = None) -> List[Animal]:
+        """
+        Obtiene los animales con menor ganancia de peso (a igual
+        ganancia, primero el de ID menor).
+        
+        Args:
+            cantidad: Número de animales a retornar
+            numero_corral: Sólo los de ese corral (None = todo el rodeo)
+            tipo: Sólo los de ese tipo (None = todos)
+            
+        Returns:
+            Lista de animales ordenados por ganancia, de menor a mayor
+        """
+        return self._por_ganancia(cantidad, False, numero_corral, tipo)
+    
+    def _por_ganancia(self, cantidad: int, mayores: bool, numero_corral: Optional[int],
+                      tipo: Optional[str]) -> List[Animal]:
+        """
+        Elige la fuente más barata: el ranking si está al día (O(k) más
+        los cambios pendientes); si cambió gran parte del rodeo, una
+        selección sobre columnas o un heap sobre los objetos (O(n log k)).
+        """
+        columnas = self._almacen_completo()
+        if len(self.ranking) == len(self.animales):
+            if not self.ranking.desactualizado(FRACCION_COLUMNAS if columnas else FRACCION_OBJETOS):
+                if mayores:
+                    return self.ranking.mejores(cantidad, numero_corral, tipo)
+                return self.ranking.peores(cantidad, numero_corral, tipo)
+        if columnas:
+            codigo = None if tipo is None else TIPOS.codigos.get(tipo, -1)
+            return self.almacen.por_ganancia(cantidad, mayores, numero_corral, codigo)
+        
+        if numero_corral is not None:
+            corral = self.corrales.get(numero_corral)
+            animales = corral.animales if corral is not None else ()
+        else:
+            animales = self.animales.values()
+        if tipo is not None:
+            animales = [a for a in animales if a.tipo == tipo]
+        seleccionar = heapq.nlargest if mayores else heapq.nsmallest
+        return seleccionar(cantidad, animales, key=lambda a: (a.ganancia_peso_total(), a.id))
+    
+    def rango_dias(self, desde_dia: int, hasta_dia: int) -> Tuple[float, float]:
+        """
+        Convierte días de operación en instantes del reloj de las lecturas.
+        Un día dura INTERVALO_REPORTES segundos (un ciclo de reportes) y el
+        día 1 empieza al iniciar el monitoreo por primera vez.
+        
+        Args:
+            desde_dia: Primer día incluido (desde 1)
+            hasta_dia: Último día incluido
+            
+        Returns:
+            Tupla (desde, hasta) con hasta excluido
+        """
+        inicio = self.inicio_reloj if self.inicio_reloj is not None else self.reloj.ahora()
+        return (inicio + (desde_dia - 1) * INTERVALO_REPORTES,
+                inicio + hasta_dia * INTERVALO_REPORTES)
+    
+    def obtener_serie(self, id_animal: int, serie: str = "temperatura",
+                      desde_dia: int = None, hasta_dia: int = None) -> Tuple:
+        """
+        Obtiene la serie de tiempo de un animal en un rango de días,
+        por ejemplo la temperatura del animal 42 entre el día 10 y el 20.
+        Si el rango empieza antes de la lectura completa más antigua del
+        historial, esa parte llega como bloques del resumen.
+        
+        Args:
+            id_animal: ID del animal
+            serie: "peso" o "temperatura"
+            desde_dia: Primer día incluido (None = desde la lectura más antigua)
+            hasta_dia: Último día incluido (None = hasta la más reciente)
+            
+        Returns:
+            Tupla (instantes, valores, resumen): array('d') paralelos con
+            las lecturas completas y la lista de bloques (desde, hasta,
+            mínimo, promedio, máximo) que cubren la parte del rango
+            anterior a ellas (vacía si el rango no está truncado)
+            
+        Raises:
+            AnimalNoEncontradoException: Si el animal no existe
+            FeedlotException: Si la serie no existe
+        """
+        animal = self.animales.get(id_animal)
+        if animal is None:
+            raise AnimalNoEncontradoException(f"Animal #{id_animal} no encontrado")
+        if serie == "peso":
+            historial = animal.historial_peso
+        elif serie == "temperatura":
+            historial = animal.historial_temperatura
+        else:
+            raise FeedlotException(f"Serie desconocida: {serie}")
+        
+        desde = hasta = None
+        if desde_dia is not None:
+            desde = self.rango_dias(desde_dia, desde_dia)[0]
+        if hasta_dia is not None:
+            hasta = self.rango_dias(hasta_dia, hasta_dia)[1]
+        instantes, valores = historial.rango(desde, hasta)
+        resumen = []
+        if historial.truncado(desde):
+            # Lo desalojado sin archivar sólo sobrevive como bloques del resumen
+            limite = historial.completo_desde()
+            resumen = historial.resumen_rango(desde, limite if hasta is None else min(hasta, limite))
+        return instantes, valores, resumen
+    
+    def obtener_estadisticas_corrales(self) -> Dict[int, Dict]:
+        """
+        Genera las estadísticas de todos los corrales. Cada corral lleva
+        sus agregados, así que el costo es O(corrales) y no O(animales).
+        
+        Returns:
+            Diccionario número de corral -> estadísticas (como Corral.obtener_estadisticas)
+        """
+        return {numero: corral.obtener_estadisticas() for numero, corral in self.corrales.items()}
+    
+    def _indices_completos(self) -> bool:
+        """
+        Returns:
+            True si los índices tienen a todos los animales del sistema
+            (no los tienen si se cargaron colecciones a mano sin
+            reconstruir_indices)
+        """
+        return len(self.indices) == len(self.animales)
     
     def obtener_animales_alerta(self) -> List[Animal]:
         """
@@ -320,7 +909,92 @@ class FeedlotSystem(metaclass=SingletonMeta):
         Returns:
             Lista de animales enfermos o con problemas
         """
-        return [a for a in self.animales.values() if a.esta_enfermo()]
+        return self.obtener_animales_por_salud(EstadoSalud.ATENCION)
+    
+    def obtener_animales_por_salud(self, mascara: int = EstadoSalud.ATENCION) -> List[Animal]:
+        """
+        Filtra el rodeo por condiciones de salud. Con los índices cuesta
+        O(animales con las condiciones); sin ellos es una operación de
+        máscara sobre la columna de salud del almacén o un recorrido.
+        
+        Args:
+            mascara: Banderas de EstadoSalud (ej. EstadoSalud.FIEBRE | EstadoSalud.EN_TRATAMIENTO)
+            
+        Returns:
+            Animales con al menos una de las condiciones
+        """
+        if self._indices_completos():
+            return self.indices.por_salud(mascara)
+        if self._almacen_completo():
+            return self.almacen.filtrar_salud(mascara)
+        return [a for a in self.animales.values() if a.tiene_condicion(mascara)]
+    
+    def contar_animales_por_salud(self, mascara: int = EstadoSalud.ATENCION) -> int:
+        """
+        Args:
+            mascara: Banderas de EstadoSalud
+            
+        Returns:
+            Cantidad de animales con al menos una de las condiciones
+        """
+        if self._indices_completos():
+            return self.indices.contar_salud(mascara)
+        if self._almacen_completo():
+            return self.almacen.contar_salud(mascara)
+        return sum(1 for a in self.animales.values() if a.tiene_condicion(mascara))
+    
+    def obtener_animales_por_tipo(self, tipo: str) -> List[Animal]:
+        """
+        Args:
+            tipo: Tipo de animal (Ternero, Novillo, Toro)
+            
+        Returns:
+            Animales de ese tipo
+        """
+        codigo = TIPOS.codigos.get(tipo)
+        if codigo is None:
+            return []
+        if self._indices_completos():
+            return self.indices.por_tipo(codigo)
+        return [a for a in self.animales.values() if a._tipo == codigo]
+    
+    def obtener_animales_por_racion(self, racion: Optional[str]) -> List[Animal]:
+        """
+        Args:
+            racion: Ración actual ("Normal", "Intensiva", "Mantenimiento"
+                    o None para los que todavía no recibieron ninguna)
+            
+        Returns:
+            Animales con esa ración
+        """
+        codigo = RACIONES.codigos.get(racion)
+        if codigo is None:
+            return []
+        if self._indices_completos():
+            return self.indices.por_racion(codigo)
+        return [a for a in self.animales.values() if a._racion_actual == codigo]
+    
+    def obtener_animales_por_corral(self, numero_corral: int) -> List[Animal]:
+        """
+        Args:
+            numero_corral: Número del corral
+            
+        Returns:
+            Animales del corral en orden de llegada (vacía si no existe)
+        """
+        corral = self.corrales.get(numero_corral)
+        return [] if corral is None else list(corral.animales)
+    
+    def consultar(self) -> ConsultaRodeo:
+        """
+        Empieza una consulta ad hoc sobre el rodeo (filtros, proyección,
+        agrupamiento y agregados). Usa los índices y el almacén columnar
+        del sistema cuando están completos.
+        
+        Returns:
+            ConsultaRodeo sin filtros (todo el rodeo)
+        """
+        return ConsultaRodeo(self.animales, self.corrales, self.indices, self.almacen, self.reloj)
     
     def resetear_sistema(self):
         """
@@ -334,24 +1008,32 @@ class FeedlotSystem(metaclass=SingletonMeta):
             self.detener_monitoreo()
         
         # Limpiar colecciones
+        if self.almacen is not None:
+            self.almacen.vaciar()
+        self.estadisticas_rodeo.vaciar()
+        self.ranking.vaciar()
+        self.indices.vaciar()
         self.animales.clear()
         self.corrales.clear()
+        self.corral_por_animal.clear()
         self.sensores.clear()
         self.observador_alertas.limpiar_alertas()
         
         # Resetear contadores
         self.dia_actual = 0
         self.fecha_inicio = None
+        self.inicio_reloj = None
         
         print("✓ Sistema reseteado completamente\n")
     
     def __str__(self):
         """Representación en string del sistema"""
-        return f"FeedlotSystem(animales={len(self.animales)}, corrales={len(self.corrales)})"
+        return (f"FeedlotSystem('{self.nombre}', animales={len(self.animales)}, "
+                f"corrales={len(self.corrales)})")
     
     def __repr__(self):
         """Representación para debugging"""
-        return (f"FeedlotSystem(animales={len(self.animales)}, "
+        return (f"FeedlotSystem(nombre={self.nombre!r}, animales={len(self.animales)}, "
                 f"corrales={len(self.corrales)}, "
                 f"sensores={len(self.sensores)}, "
                 f"activo={self.activo})")
@@ -0,0 +1,257 @@
+"""
+Servicio de Índices - Animales del rodeo agrupados por tipo, salud y ración
+
+Los filtros del sistema (animales con alerta, enfermos de un tipo,
+animales con cierta ración) ya no recorren el rodeo: los corrales del
+sistema avisan a IndicesRodeo cada alta, baja y cambio de tipo, de
+estado de salud o de ración de sus animales, y cada consulta junta sólo
+los grupos pedidos, en O(tamaño del resultado). El índice por corral es
+el propio corral (Corral.animales y FeedlotSystem.corral_por_animal).
+
+Los animales saludables no se indexan por salud: son la mayoría, las
+consultas siempre piden alguna condición y así una lectura normal de un
+animal sano no toca el índice. El grupo de salud en que quedó cada
+animal se anota aparte, así un cambio de estado lo saca del grupo en
+que está y no del que crea quien avisa.
+"""
+
+import threading
+from typing import Dict, Iterable, List
+from entidades.animal import Animal
+from entidades.salud import EstadoSalud
+
+
+class IndicesRodeo:
+    """
+    Índices secundarios del rodeo: código de tipo, banderas de salud y
+    código de ración -> {ID: animal}.
+    """
+
+    def __init__(self):
+        """Inicializa índices vacíos."""
+        self._por_tipo: Dict[int, Dict[int, Animal]] = {}
+        self._por_salud: Dict[int, Dict[int, Animal]] = {}
+        self._por_racion: Dict[int, Dict[int, Animal]] = {}
+        # ID -> banderas del grupo de _por_salud en que está (sólo con condición)
+        self._salud_de: Dict[int, int] = {}
+        self._cantidad = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _grupo(indice: Dict[int, Dict[int, Animal]], clave: int) -> Dict[int, Animal]:
+        grupo = indice.get(clave)
+        if grupo is None:
+            grupo = indice[clave] = {}
+        return grupo
+
+    def _mover(self, indice: Dict[int, Dict[int, Animal]], animal: Animal,
+               anterior: int, nuevo: int):
+        """Pasa un animal de un grupo a otro (llamar con el lock tomado)."""
+        grupo = indice.get(anterior)
+        if grupo is not None:
+            grupo.pop(animal.id, None)
+        self._grupo(indice, nuevo)[animal.id] = animal
+
+    def agregar(self, animal: Animal):
+        """
+        Indexa un animal que entra al rodeo (no hace nada si ya estaba).
+
+        Args:
+            animal: Animal que entra
+        """
+        with self._lock:
+            tipo = self._grupo(self._por_tipo, animal._tipo)
+            if animal.id in tipo:
+                return
+            tipo[animal.id] = animal
+            salud = animal._estado_salud
+            if salud:
+                self._grupo(self._por_salud, salud)[animal.id] = animal
+                self._salud_de[animal.id] = salud
+            self._grupo(self._por_racion, animal._racion_actual)[animal.id] = animal
+            self._cantidad += 1
+
+    def agregar_varios(self, animales: Iterable[Animal]):
+        """
+        Indexa varios animales que entran juntos (carga masiva) con una
+        sola toma del lock; omite los que ya estaban.
+
+        Args:
+            animales: Animales que entran
+        """
+        with self._lock:
+            por_tipo, por_salud, por_racion = self._por_tipo, self._por_salud, self._por_racion
+            salud_de = self._salud_de
+            for animal in animales:
+                tipo = self._grupo(por_tipo, animal._tipo)
+                if animal.id in tipo:
+                    continue
+                tipo[animal.id] = animal
+                salud = animal._estado_salud
+                if salud:
+                    self._grupo(por_salud, salud)[animal.id] = animal
+                    salud_de[animal.id] = salud
+                self._grupo(por_racion, animal._racion_actual)[animal.id] = animal
+                self._cantidad += 1
+
+    def quitar(self, animal: Animal):
+        """
+        Saca un animal que deja el rodeo.
+
+        Args:
+            animal: Animal que sale
+        """
+        with self._lock:
+            tipo = self._por_tipo.get(animal._tipo)
+            if tipo is None or tipo.pop(animal.id, None) is None:
+                return
+            self._quitar_salud(animal.id)
+            racion = self._por_racion.get(animal._racion_actual)
+            if racion is not None:
+                racion.pop(animal.id, None)
+            self._cantidad -= 1
+
+    def cambiar_tipo(self, animal: Animal, anterior: int, nuevo: int):
+        """
+        Args:
+            animal: Animal indexado
+            anterior: Código de tipo actual
+            nuevo: Código de tipo nuevo
+        """
+        with self._lock:
+            self._mover(self._por_tipo, animal, anterior, nuevo)
+
+    def _quitar_salud(self, id_animal: int):
+        """Saca un animal del grupo de salud en que está (llamar con el lock tomado)."""
+        anterior = self._salud_de.pop(id_animal, 0)
+        if anterior:
+            grupo = self._por_salud.get(anterior)
+            if grupo is not None:
+                grupo.pop(id_animal, None)
+
+    def cambiar_salud(self, animal: Animal, nuevo: int):
+        """
+        Pasa un animal al grupo de su nuevo estado de salud. El grupo
+        anterior se lee con el lock del índice tomado, no lo indica quien
+        avisa: dos avisos que se cruzan no dejan al animal en un grupo viejo.
+
+        Args:
+            animal: Animal indexado
+            nuevo: Banderas de salud nuevas
+        """
+        with self._lock:
+            self._quitar_salud(animal.id)
+            if nuevo:
+                self._grupo(self._por_salud, nuevo)[animal.id] = animal
+                self._salud_de[animal.id] = nuevo
+
+    def cambiar_racion(self, animal: Animal, anterior: int, nuevo: int):
+        """
+        Args:
+            animal: Animal indexado
+            anterior: Código de ración actual
+            nuevo: Código de ración nuevo
+        """
+        with self._lock:
+            self._mover(self._por_racion, animal, anterior, nuevo)
+
+    def vaciar(self):
+        """Descarta todos los índices."""
+        with self._lock:
+            self._por_tipo = {}
+            self._por_salud = {}
+            self._por_racion = {}
+            self._salud_de = {}
+            self._cantidad = 0
+
+    def recalcular(self, animales: Iterable[Animal]):
+        """
+        Rearma los índices recorriendo los animales (O(n)).
+
+        Args:
+            animales: Animales en los corrales del sistema
+        """
+        self.vaciar()
+        for animal in animales:
+            self.agregar(animal)
+
+    @staticmethod
+    def _juntar(grupos: Iterable[Dict[int, Animal]]) -> List[Animal]:
+        """Animales de los grupos, cada grupo en el orden en que entraron a él."""
+        return [animal for grupo in grupos for animal in grupo.values()]
+
+    def por_tipo(self, codigo: int) -> List[Animal]:
+        """
+        Args:
+            codigo: Código de tipo (ver TIPOS)
+
+        Returns:
+            Animales de ese tipo
+        """
+        with self._lock:
+            grupo = self._por_tipo.get(codigo)
+            return self._juntar(() if grupo is None else (grupo,))
+
+    def por_salud(self, mascara: int = EstadoSalud.ATENCION) -> List[Animal]:
+        """
+        Args:
+            mascara: Banderas de EstadoSalud (ej. FIEBRE | HIPOTERMIA)
+
+        Returns:
+            Animales con al menos una de las condiciones, agrupados por
+            estado de salud
+        """
+        with self._lock:
+            return self._juntar(grupo for estado, grupo in self._por_salud.items()
+                                if estado & mascara)
+
+    def contar_salud(self, mascara: int = EstadoSalud.ATENCION) -> int:
+        """
+        Args:
+            mascara: Banderas de EstadoSalud
+
+        Returns:
+            Cantidad de animales con al menos una de las condiciones (O(estados))
+        """
+        with self._lock:
+            return sum(len(grupo) for estado, grupo in self._por_salud.items()
+                       if estado & mascara)
+
+    def contar_tipo(self, codigo: int) -> int:
+        """
+        Args:
+            codigo: Código de tipo
+
+        Returns:
+            Cantidad de animales de ese tipo (O(1))
+        """
+        return len(self._por_tipo.get(codigo, ()))
+
+    def contar_racion(self, codigo: int) -> int:
+        """
+        Args:
+            codigo: Código de ración
+
+        Returns:
+            Cantidad de animales con esa ración (O(1))
+        """
+        return len(self._por_racion.get(codigo, ()))
+
+    def por_racion(self, codigo: int) -> List[Animal]:
+        """
+        Args:
+            codigo: Código de ración (ver RACIONES; 0 = sin ración)
+
+        Returns:
+            Animales con esa ración
+        """
+        with self._lock:
+            grupo = self._por_racion.get(codigo)
+            return self._juntar(() if grupo is None else (grupo,))
+
+    def __len__(self):
+        return self._cantidad
+
+    def __repr__(self):
+        return (f"IndicesRodeo(animales={self._cantidad}, "
+                f"con_condicion={self.contar_salud()})")
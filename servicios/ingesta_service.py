@@ -0,0 +1,258 @@
+"""
+Servicio de Ingesta - Cola acotada de lecturas de sensores
+
+Los sensores encolan registros compactos (sensor, valor, momento) y un
+consumidor los aplica al rodeo por lotes, despachando las alertas.
+Así una ráfaga de lecturas no queda frenada por observadores lentos ni
+por E/S de archivos, y el atraso de la cola queda a la vista.
+"""
+
+import queue
+import threading
+import time
+from excepciones.feedlot_exceptions import FeedlotException
+from consola import consola, NivelConsola
+
+
+class IngestaLecturas:
+    """
+    Canal de ingesta acotado con aplicación por lotes y contrapresión.
+
+    Políticas ante cola llena:
+    - 'bloquear': el sensor espera a que haya lugar, hasta espera_maxima
+      segundos; si no se libera, o si el consumidor no está corriendo
+      (nadie va a vaciar la cola), la lectura se descarta
+    - 'descartar_nueva': se descarta la lectura entrante
+    - 'descartar_antigua': se descarta la lectura más vieja de la cola
+    """
+
+    POLITICAS = ("bloquear", "descartar_nueva", "descartar_antigua")
+
+    def __init__(self, capacidad: int = 10_000, politica: str = "bloquear",
+                 tamanio_lote: int = 500, espera_maxima: float = 1.0):
+        """
+        Inicializa el canal de ingesta.
+
+        Args:
+            capacidad: Cantidad máxima de lecturas en cola
+            politica: Política ante cola llena (ver POLITICAS)
+            tamanio_lote: Lecturas aplicadas por lote
+            espera_maxima: Segundos que un sensor espera lugar con 'bloquear'
+
+        Raises:
+            FeedlotException: Si la política no es válida
+        """
+        if politica not in self.POLITICAS:
+            raise FeedlotException(f"Política no válida: '{politica}'. "
+                                   f"Políticas válidas: {', '.join(self.POLITICAS)}")
+
+        self.capacidad = capacidad
+        self.politica = politica
+        self.tamanio_lote = max(1, tamanio_lote)
+        self.espera_maxima = espera_maxima
+        self._cola: queue.Queue = queue.Queue(maxsize=capacidad)
+
+        self.activo = False
+        self._hilo = None
+        self._lock = threading.Lock()
+
+        # Contadores
+        self.publicadas = 0
+        self.aplicadas = 0
+        self.descartadas = 0
+        self.bloqueos = 0
+        self.errores = 0
+        self.lotes = 0
+        self.profundidad_maxima = 0
+        self._suma_atraso = 0.0
+        self.atraso_maximo = 0.0
+
+    def publicar(self, sensor, valor) -> bool:
+        """
+        Encola una lectura según la política configurada.
+
+        Args:
+            sensor: Sensor que generó la lectura
+            valor: Valor devuelto por sensor.medir()
+
+        Returns:
+            bool: True si la lectura quedó encolada
+        """
+        registro = (sensor, valor, time.monotonic())
+
+        try:
+            self._cola.put_nowait(registro)
+        except queue.Full:
+            if self.politica == "descartar_nueva":
+                with self._lock:
+                    self.descartadas += 1
+                return False
+
+            if self.politica == "descartar_antigua":
+                try:
+                    self._cola.get_nowait()
+                    with self._lock:
+                        self.descartadas += 1
+                except queue.Empty:
+                    pass
+                try:
+                    self._cola.put_nowait(registro)
+                except queue.Full:
+                    with self._lock:
+                        self.descartadas += 1
+                    return False
+            else:
+                with self._lock:
+                    self.bloqueos += 1
+                try:
+                    if not self.activo:
+                        raise queue.Full
+                    self._cola.put(registro, timeout=self.espera_maxima)
+                except queue.Full:
+                    with self._lock:
+                        self.descartadas += 1
+                    return False
+
+        with self._lock:
+            self.publicadas += 1
+            profundidad = self._cola.qsize()
+            if profundidad > self.profundidad_maxima:
+                self.profundidad_maxima = profundidad
+        return True
+
+    def iniciar(self):
+        """Inicia el consumidor en un hilo separado"""
+        if not self.activo:
+            self.activo = True
+            self._hilo = threading.Thread(target=self._consumir, daemon=True)
+            self._hilo.start()
+
+    def detener(self):
+        """Detiene el consumidor y aplica las lecturas que quedaron en cola"""
+        if self.activo:
+            self.activo = False
+            if self._hilo:
+                self._hilo.join(timeout=2)
+        self.drenar()
+
+    def _consumir(self):
+        """
+        Ciclo del consumidor.
+        Espera la primera lectura y aplica un lote con lo disponible.
+        """
+        while self.activo:
+            try:
+                primero = self._cola.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            self._aplicar_lote(self._tomar_lote(primero))
+
+    def _tomar_lote(self, primero) -> list:
+        """
+        Arma un lote con la lectura dada y las disponibles en la cola.
+
+        Args:
+            primero: Primera lectura del lote (o None)
+
+        Returns:
+            Lista de registros
+        """
+        lote = [primero] if primero is not None else []
+        while len(lote) < self.tamanio_lote:
+            try:
+                lote.append(self._cola.get_nowait())
+            except queue.Empty:
+                break
+        return lote
+
+    def _aplicar_lote(self, lote: list):
+        """
+        Aplica un lote de lecturas al rodeo y despacha sus alertas.
+
+        Args:
+            lote: Lista de registros (sensor, valor, momento)
+        """
+        if not lote:
+            return
+
+        ahora = time.monotonic()
+        errores = 0
+        suma_atraso = 0.0
+        atraso_maximo = 0.0
+
+        for sensor, valor, momento in lote:
+            try:
+                sensor.aplicar_lectura(valor)
+            except Exception as e:
+                errores += 1
+                consola.emitir("sistema", "✗ Error al aplicar lectura de {}: {}",
+                               sensor.__class__.__name__, e, nivel=NivelConsola.ERROR)
+            atraso = ahora - momento
+            suma_atraso += atraso
+            if atraso > atraso_maximo:
+                atraso_maximo = atraso
+
+        with self._lock:
+            self.lotes += 1
+            self.aplicadas += len(lote)
+            self.errores += errores
+            self._suma_atraso += suma_atraso
+            if atraso_maximo > self.atraso_maximo:
+                self.atraso_maximo = atraso_maximo
+
+    def drenar(self) -> int:
+        """
+        Aplica sincrónicamente todas las lecturas pendientes.
+
+        Returns:
+            Cantidad de lecturas aplicadas
+        """
+        total = 0
+        while True:
+            lote = self._tomar_lote(None)
+            if not lote:
+                return total
+            self._aplicar_lote(lote)
+            total += len(lote)
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Genera estadísticas del canal de ingesta.
+
+        Returns:
+            Diccionario con contadores y atraso de la cola
+        """
+        with self._lock:
+            return {
+                "politica": self.politica,
+                "capacidad": self.capacidad,
+                "profundidad": self._cola.qsize(),
+                "profundidad_maxima": self.profundidad_maxima,
+                "publicadas": self.publicadas,
+                "aplicadas": self.aplicadas,
+                "descartadas": self.descartadas,
+                "bloqueos": self.bloqueos,
+                "errores": self.errores,
+                "lotes": self.lotes,
+                "atraso_promedio": self._suma_atraso / self.aplicadas if self.aplicadas else 0.0,
+                "atraso_maximo": self.atraso_maximo
+            }
+
+    def mostrar_resumen(self):
+        """Muestra un resumen del canal de ingesta"""
+        stats = self.obtener_estadisticas()
+
+        print("\n INGESTA DE LECTURAS:")
+        print("-"*70)
+        print(f"Política: {stats['politica']} | Capacidad: {stats['capacidad']}")
+        print(f"Publicadas: {stats['publicadas']} | Aplicadas: {stats['aplicadas']} | "
+              f"Descartadas: {stats['descartadas']} | Bloqueos: {stats['bloqueos']}")
+        print(f"Cola: {stats['profundidad']} (máx. {stats['profundidad_maxima']}) | "
+              f"Lotes: {stats['lotes']}")
+        print(f"Atraso promedio: {stats['atraso_promedio'] * 1000:.1f} ms | "
+              f"Atraso máximo: {stats['atraso_maximo'] * 1000:.1f} ms")
+        print("-"*70 + "\n")
+
+    def __str__(self):
+        return (f"IngestaLecturas(politica={self.politica}, "
+                f"cola={self._cola.qsize()}/{self.capacidad})")
@@ -0,0 +1,251 @@
+"""
+Motor de Eventos Discretos - Simulación con reloj virtual
+
+Ejecuta sensores, raciones, reportes, rondas veterinarias y backups
+sobre un reloj virtual: en lugar de dormir con time.sleep, el motor
+toma el próximo evento de una cola de prioridad y avanza el reloj
+hasta su momento. Una temporada completa se simula tan rápido como
+lo permite la CPU (ver benchmarks/benchmark_temporada.py para los
+tiempos medidos).
+"""
+
+import heapq
+import itertools
+import time
+from typing import Callable, Dict, Optional
+from consola import consola, NivelConsola
+from entidades.sensor import tasa_muestreo
+
+
+class Evento:
+    """
+    Evento programado en el motor.
+    Si tiene intervalo se reprograma solo después de ejecutarse.
+    """
+
+    __slots__ = ("accion", "intervalo", "nombre", "prioridad", "sensor", "activo")
+
+    def __init__(self, accion: Callable, intervalo: Optional[float], nombre: str,
+                 prioridad: int, sensor=None):
+        """
+        Inicializa un evento.
+
+        Args:
+            accion: Función a ejecutar
+            intervalo: Período en segundos virtuales (None = evento único)
+            nombre: Nombre descriptivo
+            prioridad: Desempate entre eventos simultáneos (menor = primero)
+            sensor: Sensor asociado (su intervalo se relee en cada ciclo)
+        """
+        self.accion = accion
+        self.intervalo = intervalo
+        self.nombre = nombre
+        self.prioridad = prioridad
+        self.sensor = sensor
+        self.activo = True
+
+    def __repr__(self):
+        return f"Evento(nombre='{self.nombre}', intervalo={self.intervalo})"
+
+
+class MotorEventos:
+    """
+    Motor de simulación por eventos discretos.
+
+    Implementa la misma interfaz registrar/desregistrar/iniciar/detener
+    que PlanificadorSensores, por lo que FeedlotSystem.usar_planificador()
+    lo acepta directamente. Los demás servicios se agregan con
+    programar_periodico().
+    """
+
+    # Prioridades de desempate para eventos en el mismo instante
+    PRIORIDAD_SENSOR = 0
+    PRIORIDAD_RACION = 1
+    PRIORIDAD_REPORTE = 2
+    PRIORIDAD_VETERINARIO = 3
+    PRIORIDAD_BACKUP = 4
+    PRIORIDAD_ESTADO = 5
+
+    def __init__(self, semilla: int = None):
+        """
+        Inicializa el motor.
+
+        Args:
+            semilla: Semilla de la corrida, sólo informativa (se muestra en
+                     obtener_estadisticas). El motor no genera números al
+                     azar: la reproducibilidad de las lecturas viene de los
+                     flujos de FuenteAleatoria del sistema
+        """
+        self.reloj = 0.0
+        # Hora real que corresponde al reloj virtual 0 (para fechar lecturas)
+        self.origen = time.time()
+        self.activo = False
+        self._cola = []
+        self._secuencia = itertools.count()
+        self._eventos_sensores: Dict = {}
+
+        self.semilla = semilla
+
+        # Métricas
+        self.eventos_procesados = 0
+        self.lecturas_realizadas = 0
+        self.errores = 0
+        self.tiempo_real = 0.0
+
+    def programar(self, evento: Evento, momento: float):
+        """
+        Agrega un evento a la cola.
+
+        Args:
+            evento: Evento a programar
+            momento: Momento virtual de ejecución
+        """
+        heapq.heappush(self._cola, (momento, evento.prioridad, next(self._secuencia), evento))
+
+    def programar_periodico(self, intervalo: float, accion: Callable, nombre: str = "",
+                            prioridad: int = 0, inicio: float = None) -> Evento:
+        """
+        Programa una acción periódica.
+
+        Args:
+            intervalo: Período en segundos virtuales
+            accion: Función a ejecutar
+            nombre: Nombre descriptivo
+            prioridad: Desempate entre eventos simultáneos
+            inicio: Primer momento de ejecución (default: reloj + intervalo,
+                    igual que los servicios que duermen antes de actuar)
+
+        Returns:
+            El evento creado (se cancela con cancelar())
+        """
+        evento = Evento(accion, intervalo, nombre, prioridad)
+        self.programar(evento, self.reloj + intervalo if inicio is None else inicio)
+        return evento
+
+    def cancelar(self, evento: Evento):
+        """
+        Cancela un evento; se descarta al llegar su turno.
+
+        Args:
+            evento: Evento a cancelar
+        """
+        evento.activo = False
+
+    def registrar(self, sensor):
+        """
+        Registra un sensor. Su primera lectura es inmediata,
+        como en el ciclo de un hilo de sensor.
+
+        Args:
+            sensor: Sensor a simular
+        """
+        if sensor in self._eventos_sensores:
+            return
+        evento = Evento(sensor.realizar_lectura, sensor.intervalo,
+                        f"sensor:{sensor.__class__.__name__}",
+                        self.PRIORIDAD_SENSOR, sensor)
+        self._eventos_sensores[sensor] = evento
+        sensor.activo = True
+        self.programar(evento, self.reloj)
+
+    def desregistrar(self, sensor):
+        """
+        Quita un sensor de la simulación.
+
+        Args:
+            sensor: Sensor a quitar
+        """
+        evento = self._eventos_sensores.pop(sensor, None)
+        if evento:
+            self.cancelar(evento)
+        sensor.activo = False
+
+    def iniciar(self):
+        """Marca el motor como activo (la ejecución es con ejecutar_hasta)"""
+        self.activo = True
+
+    def detener(self):
+        """Detiene el motor y descarta los eventos pendientes"""
+        self.activo = False
+        for sensor in self._eventos_sensores:
+            sensor.activo = False
+        self._eventos_sensores.clear()
+        self._cola.clear()
+
+    def ejecutar_hasta(self, tiempo_final: float) -> int:
+        """
+        Procesa eventos en orden hasta el momento virtual indicado.
+
+        Args:
+            tiempo_final: Momento virtual (segundos) donde termina la corrida
+
+        Returns:
+            Cantidad de eventos procesados en esta corrida
+        """
+        inicio_real = time.perf_counter()
+        procesados = 0
+
+        while self._cola and self._cola[0][0] <= tiempo_final:
+            momento, _, _, evento = heapq.heappop(self._cola)
+            if not evento.activo:
+                continue
+
+            self.reloj = momento
+            try:
+                evento.accion()
+                if evento.sensor is not None:
+                    self.lecturas_realizadas += 1
+            except Exception as e:
+                self.errores += 1
+                consola.emitir("sistema", "✗ Error en evento '{}': {}", evento.nombre, e,
+                               nivel=NivelConsola.ERROR)
+            procesados += 1
+
+            if evento.activo and evento.intervalo is not None:
+                intervalo = evento.sensor.intervalo if evento.sensor else evento.intervalo
+                self.programar(evento, momento + intervalo)
+
+        self.reloj = max(self.reloj, tiempo_final)
+        self.eventos_procesados += procesados
+        self.tiempo_real += time.perf_counter() - inicio_real
+        return procesados
+
+    def ahora(self) -> float:
+        """
+        Returns:
+            Hora simulada en segundos (estilo time.time): origen + reloj virtual
+        """
+        return self.origen + self.reloj
+
+    def tasa_muestreo(self) -> float:
+        """
+        Calcula la tasa de lecturas efectiva según los intervalos actuales
+        de los sensores registrados (con muestreo adaptativo, varía).
+
+        Returns:
+            Lecturas por segundo virtual
+        """
+        return tasa_muestreo(list(self._eventos_sensores))
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Genera estadísticas del motor.
+
+        Returns:
+            Diccionario con métricas de la simulación
+        """
+        return {
+            "reloj_virtual": self.reloj,
+            "eventos_procesados": self.eventos_procesados,
+            "eventos_pendientes": len(self._cola),
+            "lecturas_realizadas": self.lecturas_realizadas,
+            "errores": self.errores,
+            "tasa_muestreo": self.tasa_muestreo(),
+            "tiempo_real": self.tiempo_real,
+            "aceleracion": self.reloj / self.tiempo_real if self.tiempo_real > 0 else 0.0,
+            "semilla": self.semilla
+        }
+
+    def __str__(self):
+        return (f"MotorEventos(reloj={self.reloj:.1f}s, "
+                f"sensores={len(self._eventos_sensores)}, pendientes={len(self._cola)})")
@@ -0,0 +1,443 @@
+"""
+Servicio de Particiones - Simulación del rodeo repartida entre procesos
+
+Un único proceso de CPython usa un solo núcleo por el GIL. Este servicio
+reparte los corrales de FeedlotSystem entre procesos trabajadores; cada
+uno simula su partición (sensores, raciones y, si se pasan, los
+protocolos de salud y la ronda veterinaria sobre un MotorEventos) y el
+coordinador fusiona animales, alertas, tratamientos y ranking en el
+sistema original, de modo que obtener_estadisticas(), los reportes y el
+informe veterinario funcionan sin cambios.
+"""
+
+import contextlib
+import heapq
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+from consola import consola
+from constantes import INTERVALO_SENSOR_PESO, INTERVALO_SENSOR_TEMP, INTERVALO_VETERINARIO
+from entidades.animal import UMBRAL_FIEBRE
+from entidades.salud import EstadoSalud
+from estrategias.racion_intensiva import RacionIntensiva
+from estrategias.racion_mantenimiento import RacionMantenimiento
+from excepciones.feedlot_exceptions import FeedlotException
+
+# Cantidad de animales por partición en el ranking que devuelve cada proceso
+TOP_POR_PARTICION = 10
+
+
+def _tipo_estrategia(estrategia) -> str:
+    """
+    Args:
+        estrategia: Estrategia de ración asignada a un animal
+
+    Returns:
+        Tipo que acepta RacionService.cambiar_estrategia
+    """
+    if isinstance(estrategia, RacionIntensiva):
+        return "intensiva"
+    if isinstance(estrategia, RacionMantenimiento):
+        return "mantenimiento"
+    return "normal"
+
+
+def _ronda_veterinaria(sistema, veterinario):
+    """
+    Ronda médica de una partición: revisa los animales con alerta y trata
+    la fiebre (la misma ronda que la simulación en un solo proceso).
+
+    Args:
+        sistema: FeedlotSystem de la partición
+        veterinario: Veterinario de la partición
+    """
+    for animal in sistema.obtener_animales_alerta():
+        veterinario.revisar_animal(animal)
+        if animal.temperatura >= UMBRAL_FIEBRE:
+            veterinario.aplicar_tratamiento(animal, 'antipiretrico')
+
+
+def _simular_particion(datos: dict) -> dict:
+    """
+    Simula una partición del rodeo sobre un sistema propio.
+
+    No configura la consola: en un proceso trabajador lo hace
+    _simular_en_proceso y en el coordinador, SimulacionParticionada.ejecutar.
+
+    Args:
+        datos: Diccionario con corrales, duración, semilla y opciones
+
+    Returns:
+        Diccionario con el estado final de los animales (con las series
+        exportadas de sus historiales), las alertas (tuplas compactas), lo
+        que registraron el observador de salud y el veterinario de la
+        partición (None si no los hubo) y las métricas de la partición
+    """
+    # Importaciones locales: el proceso trabajador arma su propio sistema
+    from entidades.animal import Animal
+    from entidades.historial import Historial
+    from entidades.sensor import SensorPeso, SensorTemperatura, SensorLote, MuestreoAdaptativo
+    from entidades.veterinario import Veterinario
+    from patrones.salud_observer import SaludObserver
+    from servicios.aleatorio_service import FuenteAleatoria
+    from servicios.feedlot_service import FeedlotSystem
+    from servicios.motor_eventos import MotorEventos
+    from servicios.racion_service import RacionService
+    from servicios.reloj_service import Reloj
+
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        motor = MotorEventos(datos["semilla"])
+        # Todas las particiones fechan sus lecturas desde la hora del coordinador
+        motor.origen = datos["origen"]
+        # Instancia propia: con fork el proceso hereda el singleton del coordinador
+        sistema = FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+        sistema.usar_planificador(motor)
+        if datos["semilla"] is not None:
+            # Flujos por animal: el resultado no depende de la partición
+            sistema.usar_fuente_aleatoria(FuenteAleatoria(datos["semilla"]))
+        # Protocolos de salud propios de la partición (se fusionan al volver)
+        observador_salud = SaludObserver() if datos["salud"] else None
+        veterinario = Veterinario(*datos["veterinario"]) if datos["veterinario"] else None
+        if datos["muestreo"]:
+            sistema.usar_muestreo(MuestreoAdaptativo(*datos["muestreo"],
+                                                     observador_salud=observador_salud))
+
+        for numero, capacidad, animales in datos["corrales"]:
+            corral = sistema.crear_corral(numero, capacidad)
+            for id_animal, tipo, peso_inicial, peso, temperatura, estado, racion in animales:
+                animal = Animal(id_animal, tipo, peso_inicial)
+                animal.peso = peso
+                animal.temperatura = temperatura
+                animal.salud = estado
+                animal.racion_actual = racion
+                # Historiales vacíos: sólo viajan de vuelta las lecturas de la partición
+                animal.historial_peso = Historial()
+                animal.historial_temperatura = Historial()
+                sistema.animales[id_animal] = animal
+                corral.agregar_animal(animal)
+                if not datos["por_lote"]:
+                    sistema.agregar_sensor(SensorPeso(animal, INTERVALO_SENSOR_PESO))
+                    sistema.agregar_sensor(SensorTemperatura(animal, INTERVALO_SENSOR_TEMP))
+            if datos["por_lote"]:
+                sistema.agregar_sensor(SensorLote(corral, INTERVALO_SENSOR_TEMP))
+        sistema.reconstruir_indices()
+        if observador_salud is not None:
+            for sensor in sistema.sensores:
+                sensor.agregar_observador(observador_salud)
+
+        raciones = RacionService(sistema)
+        for id_animal, tipo in datos["estrategias"].items():
+            raciones.cambiar_estrategia(id_animal, tipo)
+        sistema.iniciar_monitoreo()
+        motor.programar_periodico(raciones.intervalo, raciones._aplicar_raciones,
+                                  "raciones", MotorEventos.PRIORIDAD_RACION)
+        if veterinario is not None:
+            motor.programar_periodico(INTERVALO_VETERINARIO,
+                                      lambda: _ronda_veterinaria(sistema, veterinario),
+                                      "veterinario", MotorEventos.PRIORIDAD_VETERINARIO)
+        motor.ejecutar_hasta(datos["duracion"])
+        sistema.detener_monitoreo()
+
+    animales = [(a.id, a.peso, a.temperatura, int(a.salud), a.racion_actual, a.estadisticas,
+                 a.historial_peso.exportar(), a.historial_temperatura.exportar())
+                for a in sistema.animales.values()]
+    alertas = [(al["timestamp"], al["animal_id"], al["animal_tipo"], al["mensaje"],
+                al["tipo"], al["peso_actual"], al["temperatura"], int(al["estado_salud"]))
+               for al in sistema.observador_alertas.alertas]
+    top = heapq.nlargest(TOP_POR_PARTICION,
+                         ((a.ganancia_peso_total(), a.id) for a in sistema.animales.values()))
+    stats_motor = motor.obtener_estadisticas()
+    salud = None
+    if observador_salud is not None:
+        salud = (observador_salud.alertas_salud, observador_salud.animales_en_tratamiento,
+                 observador_salud.tratamientos_aplicados)
+    atencion = None
+    if veterinario is not None:
+        atencion = (veterinario.animales_atendidos, veterinario.tratamientos_realizados,
+                    veterinario.diagnosticos)
+
+    return {
+        "animales": animales,
+        "alertas": alertas,
+        "salud": salud,
+        "veterinario": atencion,
+        "top": top,
+        "lecturas": stats_motor["lecturas_realizadas"],
+        "eventos": stats_motor["eventos_procesados"],
+        "errores": stats_motor["errores"],
+        "tiempo_real": stats_motor["tiempo_real"]
+    }
+
+
+def _simular_en_proceso(datos: dict) -> dict:
+    """_simular_particion en un proceso trabajador, sin salida por consola."""
+    consola.configurar(modo="silencioso")
+    return _simular_particion(datos)
+
+
+class SimulacionParticionada:
+    """
+    Coordinador de la simulación repartida por corrales entre procesos.
+
+    Cada proceso recibe una partición de corrales balanceada por cantidad
+    de animales, la simula con reloj virtual y devuelve su estado final.
+    El coordinador lo vuelca en el FeedlotSystem original.
+    """
+
+    def __init__(self, feedlot_system, num_procesos: int = None, semilla: int = None,
+                 por_lote: bool = False):
+        """
+        Inicializa el coordinador.
+
+        Args:
+            feedlot_system: Sistema cuyos corrales se reparten
+            num_procesos: Procesos trabajadores (default: núcleos disponibles)
+            semilla: Semilla maestra; los flujos de cada sensor se derivan de ella
+            por_lote: Si True, un SensorLote por corral en lugar de 2 sensores por animal
+        """
+        self.feedlot_system = feedlot_system
+        self.num_procesos = max(1, num_procesos or os.cpu_count() or 1)
+        self.semilla = semilla
+        self.por_lote = por_lote
+
+        # Métricas de la última ejecución
+        self.particiones: List[List[int]] = []
+        self.metricas_particiones: List[Dict] = []
+        self.ranking: List[tuple] = []
+        self.tiempo_total = 0.0
+
+    def particionar(self) -> List[List[int]]:
+        """
+        Reparte los corrales entre procesos balanceando la cantidad de
+        animales (el corral más grande va a la partición más liviana).
+
+        Returns:
+            Lista de particiones, cada una con números de corral
+        """
+        corrales = sorted(self.feedlot_system.corrales.values(),
+                          key=lambda c: len(c.animales), reverse=True)
+        cantidad = min(self.num_procesos, len(corrales))
+        if cantidad == 0:
+            return []
+
+        cargas = [(0, i) for i in range(cantidad)]
+        particiones: List[List[int]] = [[] for _ in range(cantidad)]
+        for corral in corrales:
+            carga, i = heapq.heappop(cargas)
+            particiones[i].append(corral.numero)
+            heapq.heappush(cargas, (carga + len(corral.animales), i))
+        return particiones
+
+    def _datos_particion(self, numeros: List[int], duracion: float, raciones=None,
+                         observador_salud=None, veterinario=None) -> dict:
+        """
+        Serializa una partición para enviarla a un proceso.
+
+        Args:
+            numeros: Números de corral de la partición
+            duracion: Segundos virtuales a simular
+            raciones: RacionService con las estrategias asignadas (opcional)
+            observador_salud: SaludObserver del coordinador (opcional)
+            veterinario: Veterinario del coordinador (opcional)
+
+        Returns:
+            Diccionario con datos simples (picklables)
+        """
+        corrales = []
+        estrategias = {}
+        asignadas = raciones.estrategias if raciones is not None else {}
+        for numero in numeros:
+            corral = self.feedlot_system.corrales[numero]
+            corrales.append((numero, corral.capacidad,
+                             [(a.id, a.tipo, a.peso_inicial, a.peso, a.temperatura,
+                               int(a.salud), a.racion_actual) for a in corral.animales]))
+            for animal in corral.animales:
+                if animal.id in asignadas:
+                    estrategias[animal.id] = _tipo_estrategia(asignadas[animal.id])
+
+        muestreo = self.feedlot_system.muestreo
+        return {
+            "corrales": corrales,
+            "duracion": duracion,
+            "origen": self.feedlot_system.reloj.ahora(),
+            "semilla": self.semilla,
+            "estrategias": estrategias,
+            "por_lote": self.por_lote,
+            "salud": observador_salud is not None,
+            "veterinario": None if veterinario is None else (veterinario.nombre,
+                                                             veterinario.matricula,
+                                                             veterinario.especialidad),
+            "muestreo": None if muestreo is None else (muestreo.factor_alerta,
+                                                       muestreo.factor_estable,
+                                                       muestreo.lecturas_estables)
+        }
+
+    def ejecutar(self, duracion: float, raciones=None, observador_salud=None,
+                 veterinario=None) -> dict:
+        """
+        Simula todas las particiones en paralelo y fusiona los resultados.
+
+        Args:
+            duracion: Segundos virtuales a simular
+            raciones: RacionService cuyas estrategias por animal se
+                      reasignan en cada partición (opcional)
+            observador_salud: SaludObserver; cada partición aplica los
+                              protocolos de salud con uno propio y sus
+                              alertas y tratamientos se suman a este (opcional)
+            veterinario: Veterinario; cada partición hace la ronda médica
+                         con una copia y sus revisiones y tratamientos se
+                         suman a este (opcional)
+
+        Returns:
+            Estadísticas de la ejecución (ver obtener_estadisticas)
+
+        Raises:
+            FeedlotException: Si el monitoreo del sistema está activo
+        """
+        if self.feedlot_system.activo:
+            raise FeedlotException("No se puede particionar con el monitoreo activo")
+
+        inicio = time.perf_counter()
+        self.particiones = self.particionar()
+        datos = [self._datos_particion(numeros, duracion, raciones, observador_salud, veterinario)
+                 for numeros in self.particiones]
+
+        if len(datos) <= 1:
+            # Sin paralelismo posible no vale la pena lanzar procesos; la
+            # consola del coordinador se silencia sólo durante la simulación
+            modo, tamanio_buffer = consola.modo, consola.tamanio_buffer
+            consola.configurar(modo="silencioso", tamanio_buffer=tamanio_buffer)
+            try:
+                resultados = [_simular_particion(d) for d in datos]
+            finally:
+                consola.configurar(modo=modo, tamanio_buffer=tamanio_buffer)
+        else:
+            with ProcessPoolExecutor(max_workers=len(datos)) as ejecutor:
+                resultados = list(ejecutor.map(_simular_en_proceso, datos))
+
+        self._fusionar(resultados)
+        self._fusionar_salud(resultados, observador_salud, veterinario)
+        self.tiempo_total = time.perf_counter() - inicio
+        return self.obtener_estadisticas()
+
+    def _fusionar(self, resultados: List[dict]):
+        """
+        Vuelca los resultados de las particiones en el sistema coordinador.
+
+        Args:
+            resultados: Resultados devueltos por cada proceso
+        """
+        sistema = self.feedlot_system
+        observador = sistema.observador_alertas
+        alertas = []
+
+        self.metricas_particiones = []
+        for numeros, resultado in zip(self.particiones, resultados):
+            for (id_animal, peso, temperatura, estado, racion, estadisticas,
+                 serie_peso, serie_temperatura) in resultado["animales"]:
+                animal = sistema.animales[id_animal]
+                # Las estadísticas del proceso cubren sólo las lecturas de la partición
+                animal.estadisticas.combinar(estadisticas)
+                animal.peso = peso
+                animal.temperatura = temperatura
+                animal.salud = estado
+                animal.racion_actual = racion
+                # Las lecturas de la partición, con el instante en que se hicieron
+                for historial, (instantes, valores) in ((animal.historial_peso, serie_peso),
+                                                        (animal.historial_temperatura, serie_temperatura)):
+                    for valor, instante in zip(valores, instantes):
+                        historial.append(valor, instante)
+            alertas.extend(resultado["alertas"])
+
+            self.metricas_particiones.append({
+                "corrales": len(numeros),
+                "animales": len(resultado["animales"]),
+                "lecturas": resultado["lecturas"],
+                "eventos": resultado["eventos"],
+                "errores": resultado["errores"],
+                "tiempo_real": resultado["tiempo_real"]
+            })
+
+        # Alertas en orden cronológico, como si vinieran de un solo proceso
+        alertas.sort(key=lambda a: a[0])
+        for timestamp, animal_id, animal_tipo, mensaje, tipo, peso, temperatura, estado in alertas:
+            observador.registrar({
+                "timestamp": timestamp,
+                "animal_id": animal_id,
+                "animal_tipo": animal_tipo,
+                "mensaje": mensaje,
+                "tipo": tipo,
+                "peso_actual": peso,
+                "temperatura": temperatura,
+                "estado_salud": EstadoSalud(estado)
+            })
+
+        # El top global sale del top de cada partición
+        self.ranking = heapq.nlargest(TOP_POR_PARTICION,
+                                      (par for r in resultados for par in r["top"]))
+
+    @staticmethod
+    def _fusionar_salud(resultados: List[dict], observador_salud, veterinario):
+        """
+        Suma al observador de salud y al veterinario del coordinador lo que
+        registraron los de cada partición (los corrales no se comparten, así
+        que los tratamientos por animal no se pisan).
+
+        Args:
+            resultados: Resultados devueltos por cada proceso
+            observador_salud: SaludObserver del coordinador (o None)
+            veterinario: Veterinario del coordinador (o None)
+        """
+        if observador_salud is not None:
+            alertas = []
+            for resultado in resultados:
+                alertas_salud, en_tratamiento, aplicados = resultado["salud"]
+                alertas.extend(alertas_salud)
+                observador_salud.animales_en_tratamiento.update(en_tratamiento)
+                observador_salud.tratamientos_aplicados += aplicados
+            alertas.sort(key=lambda a: a['timestamp'])
+            observador_salud.alertas_salud.extend(alertas)
+        if veterinario is not None:
+            for resultado in resultados:
+                atendidos, tratamientos, diagnosticos = resultado["veterinario"]
+                veterinario.animales_atendidos.extend(
+                    id_animal for id_animal in atendidos
+                    if id_animal not in veterinario.animales_atendidos)
+                veterinario.tratamientos_realizados.extend(tratamientos)
+                veterinario.diagnosticos.extend(diagnosticos)
+
+    def obtener_ranking(self, cantidad: int = 5) -> List:
+        """
+        Obtiene los animales con mayor ganancia de la última ejecución.
+
+        Args:
+            cantidad: Animales a retornar (máximo TOP_POR_PARTICION)
+
+        Returns:
+            Lista de animales ordenada por ganancia descendente
+        """
+        return [self.feedlot_system.animales[id_animal]
+                for _, id_animal in self.ranking[:cantidad]]
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Genera estadísticas de la última ejecución.
+
+        Returns:
+            Diccionario con métricas globales y por partición
+        """
+        lecturas = sum(m["lecturas"] for m in self.metricas_particiones)
+        return {
+            "procesos": len(self.metricas_particiones),
+            "lecturas_realizadas": lecturas,
+            "eventos_procesados": sum(m["eventos"] for m in self.metricas_particiones),
+            "errores": sum(m["errores"] for m in self.metricas_particiones),
+            "tiempo_total": self.tiempo_total,
+            "lecturas_por_segundo": lecturas / self.tiempo_total if self.tiempo_total > 0 else 0.0,
+            "particiones": list(self.metricas_particiones)
+        }
+
+    def __str__(self):
+        return (f"SimulacionParticionada(procesos={self.num_procesos}, "
+                f"corrales={len(self.feedlot_system.corrales)})")
@@ -4,12 +4,16 @@ Permite guardar el estado completo del feedlot y continuar simulaciones.
 """
 
 from excepciones.feedlot_exceptions import PersistenciaException
+from entidades.historial import intercalar
 import pickle
 import os
 import csv
 from datetime import datetime
 from typing import Optional
 
+# Nombres de las series en la columna Serie del histórico CSV
+SERIES_HISTORICO = ("peso", "temperatura")
+
 class PersistenciaService:
     """
     Servicio para persistencia de datos del feedlot.
@@ -57,6 +61,7 @@ class PersistenciaService:
                 'corrales': sistema.corrales,
                 'dia_actual': sistema.dia_actual,
                 'fecha_inicio': sistema.fecha_inicio,
+                'inicio_reloj': sistema.inicio_reloj,
                 'alertas': sistema.observador_alertas.alertas,
                 'timestamp_guardado': datetime.now()
             }
@@ -123,7 +128,9 @@ class PersistenciaService:
             sistema.corrales = estado['corrales']
             sistema.dia_actual = estado['dia_actual']
             sistema.fecha_inicio = estado['fecha_inicio']
-            sistema.observador_alertas.alertas = estado['alertas']
+            sistema.inicio_reloj = estado.get('inicio_reloj')
+            sistema.observador_alertas.restaurar_alertas(estado['alertas'])
+            sistema.reconstruir_indices()
             
             print("[PERSISTENCIA] ✓ Sistema restaurado exitosamente")
             print(f"[INFO] Continuando desde el día {sistema.dia_actual}")
@@ -226,7 +233,12 @@ class PersistenciaService:
     
     def exportar_historico_animales(self, sistema, archivo: str = None) -> bool:
         """
-        Exporta el histórico de peso de todos los animales a CSV.
+        Exporta el histórico de peso y temperatura de todos los animales a CSV.
+        Una fila por lectura: la columna Serie dice de cuál es (peso o
+        temperatura) y Lectura es su número dentro de esa serie (0 = estado
+        inicial). Las lecturas de cada animal van en orden de instante, así
+        ReproductorHistorico las reinyecta tal como llegaron, incluidos los
+        valores repetidos.
         
         Args:
             sistema: Instancia de FeedlotSystem
@@ -244,18 +256,19 @@ class PersistenciaService:
                 writer = csv.writer(f)
                 
                 # Encabezados
-                writer.writerow(['Animal_ID', 'Tipo', 'Lectura', 'Peso_kg', 'Temperatura_C'])
+                writer.writerow(['Animal_ID', 'Tipo', 'Serie', 'Lectura', 'Valor', 'Instante'])
                 
                 # Datos históricos de cada animal
                 for animal in sistema.animales.values():
-                    for i, (peso, temp) in enumerate(zip(animal.historial_peso, 
-                                                         animal.historial_temperatura)):
+                    lecturas = intercalar(animal.historial_peso, animal.historial_temperatura)
+                    for instante, serie, lectura, valor in lecturas:
                         writer.writerow([
                             animal.id,
                             animal.tipo,
-                            i,
-                            round(peso, 2),
-                            round(temp, 1)
+                            SERIES_HISTORICO[serie],
+                            lectura,
+                            round(valor, 2 if serie == 0 else 1),
+                            round(instante, 3)
                         ])
             
             print(f"[PERSISTENCIA] ✓ Histórico exportado: {archivo}")
@@ -0,0 +1,295 @@
+"""
+Planificador de Sensores - Agenda central de lecturas
+
+Reemplaza el modelo "un hilo por sensor" por una agenda única:
+un hilo despachador mantiene una cola de prioridad (heap) con la
+próxima lectura de cada sensor y entrega las lecturas vencidas a un
+pool fijo de hilos trabajadores.
+"""
+
+import heapq
+import itertools
+import queue
+import threading
+import time
+from typing import Dict
+from consola import consola, NivelConsola
+from entidades.sensor import tasa_muestreo
+
+
+class PlanificadorSensores:
+    """
+    Planificador centralizado de lecturas de sensores.
+
+    La cantidad de hilos es fija (1 despachador + N trabajadores)
+    sin importar cuántos sensores estén registrados, por lo que la
+    memoria y los cambios de contexto no crecen con el tamaño del rodeo.
+    """
+
+    def __init__(self, num_trabajadores: int = 4):
+        """
+        Inicializa el planificador.
+
+        Args:
+            num_trabajadores: Cantidad de hilos que ejecutan lecturas
+        """
+        self.num_trabajadores = max(1, num_trabajadores)
+        self.activo = False
+
+        # Agenda: (momento_programado, secuencia, sensor, turno)
+        self._agenda = []
+        self._secuencia = itertools.count()
+        self._condicion = threading.Condition()
+
+        # Sensor -> turno de registro vigente. Las entradas de la agenda
+        # con un turno viejo (sensor desregistrado) se descartan al vencer.
+        self._registrados: Dict = {}
+
+        # Lecturas vencidas pendientes de ejecución (una cola nueva por
+        # corrida: lo que quedó de una corrida anterior no llega a la siguiente)
+        self._pendientes: queue.Queue = queue.Queue()
+
+        # Corrida actual: los hilos de una corrida anterior que no llegaron
+        # a terminar en detener() salen al ver que cambió
+        self._generacion = 0
+
+        self._despachador = None
+        self._trabajadores = []
+
+        # Métricas (el rendimiento se mide sobre la última corrida)
+        self._lock_metricas = threading.Lock()
+        self.lecturas_realizadas = 0
+        self.errores = 0
+        self._inicio = None
+        self._fin = None
+        self._lecturas_al_iniciar = 0
+
+    def registrar(self, sensor):
+        """
+        Registra un sensor en la agenda. Su primera lectura es inmediata.
+
+        Args:
+            sensor: Sensor a planificar
+        """
+        with self._condicion:
+            if sensor in self._registrados:
+                return
+            turno = next(self._secuencia)
+            self._registrados[sensor] = turno
+            sensor.activo = True
+            self._programar(sensor, turno, time.monotonic())
+
+    def desregistrar(self, sensor):
+        """
+        Quita un sensor de la agenda.
+        La entrada pendiente en el heap se descarta al vencer, y una
+        lectura ya entregada a los trabajadores no llega a hacerse.
+
+        Args:
+            sensor: Sensor a quitar
+        """
+        with self._condicion:
+            self._registrados.pop(sensor, None)
+            sensor.activo = False
+
+    def iniciar(self):
+        """Inicia el despachador y el pool de trabajadores"""
+        if self.activo:
+            return
+
+        with self._condicion:
+            self.activo = True
+            self._generacion += 1
+            generacion = self._generacion
+            pendientes = self._pendientes = queue.Queue()
+        with self._lock_metricas:
+            self._inicio = time.monotonic()
+            self._fin = None
+            self._lecturas_al_iniciar = self.lecturas_realizadas
+
+        self._despachador = threading.Thread(target=self._despachar,
+                                             args=(generacion, pendientes), daemon=True)
+        self._despachador.start()
+
+        self._trabajadores = []
+        for _ in range(self.num_trabajadores):
+            trabajador = threading.Thread(target=self._trabajar,
+                                          args=(generacion, pendientes), daemon=True)
+            trabajador.start()
+            self._trabajadores.append(trabajador)
+
+    def detener(self):
+        """
+        Detiene el despachador y los trabajadores de forma segura.
+        Los sensores quedan desregistrados.
+        """
+        if not self.activo:
+            return
+
+        with self._condicion:
+            self.activo = False
+            for sensor in self._registrados:
+                sensor.activo = False
+            self._registrados.clear()
+            self._agenda.clear()
+            self._condicion.notify_all()
+            generacion = self._generacion
+            pendientes = self._pendientes
+        with self._lock_metricas:
+            self._fin = time.monotonic()
+
+        # Aviso de fin marcado con la corrida, en la cola de esa corrida
+        for _ in self._trabajadores:
+            pendientes.put(generacion)
+
+        if self._despachador:
+            self._despachador.join(timeout=2)
+        for trabajador in self._trabajadores:
+            trabajador.join(timeout=2)
+
+        self._trabajadores = []
+
+    def _programar(self, sensor, turno: int, momento: float):
+        """
+        Agrega una lectura a la agenda (requiere tener tomada la condición).
+
+        Args:
+            sensor: Sensor a leer
+            turno: Turno de registro del sensor
+            momento: Momento (time.monotonic) de la lectura
+        """
+        entrada = (momento, next(self._secuencia), sensor, turno)
+        heapq.heappush(self._agenda, entrada)
+
+        # Despertar al despachador si la nueva lectura es la más próxima
+        if self._agenda[0] is entrada:
+            self._condicion.notify()
+
+    def _despachar(self, generacion: int, pendientes: queue.Queue):
+        """
+        Ciclo del despachador.
+        Espera hasta la próxima lectura y entrega todas las vencidas.
+
+        Args:
+            generacion: Corrida a la que pertenece el hilo
+            pendientes: Cola de lecturas de esa corrida
+        """
+        with self._condicion:
+            while self.activo and self._generacion == generacion:
+                if not self._agenda:
+                    self._condicion.wait()
+                    continue
+
+                ahora = time.monotonic()
+                momento = self._agenda[0][0]
+                if momento > ahora:
+                    self._condicion.wait(momento - ahora)
+                    continue
+
+                while self._agenda and self._agenda[0][0] <= ahora:
+                    momento, _, sensor, turno = heapq.heappop(self._agenda)
+                    if self._registrados.get(sensor) == turno:
+                        pendientes.put((sensor, turno, momento))
+
+    def _trabajar(self, generacion: int, pendientes: queue.Queue):
+        """
+        Ciclo de un trabajador del pool.
+        Ejecuta la lectura y reprograma el sensor.
+
+        Args:
+            generacion: Corrida a la que pertenece el hilo
+            pendientes: Cola de lecturas de esa corrida
+        """
+        while True:
+            tarea = pendientes.get()
+            if not isinstance(tarea, tuple):
+                # Aviso de fin: sólo el de la propia corrida detiene al hilo
+                if tarea == generacion:
+                    break
+                continue
+
+            sensor, turno, momento = tarea
+            # La tarea pudo quedar en cola antes de desregistrar() o detener()
+            with self._condicion:
+                if (not self.activo or self._generacion != generacion
+                        or self._registrados.get(sensor) != turno):
+                    continue
+            try:
+                sensor.realizar_lectura()
+                with self._lock_metricas:
+                    self.lecturas_realizadas += 1
+            except Exception as e:
+                with self._lock_metricas:
+                    self.errores += 1
+                consola.emitir("sistema", "✗ Error en lectura de {}: {}",
+                               sensor.__class__.__name__, e, nivel=NivelConsola.ERROR)
+
+            with self._condicion:
+                if (self.activo and self._generacion == generacion
+                        and self._registrados.get(sensor) == turno):
+                    # Ritmo fijo; si hay atraso no se acumulan lecturas
+                    proximo = max(momento + sensor.intervalo, time.monotonic())
+                    self._programar(sensor, turno, proximo)
+
+    def lecturas_por_segundo(self) -> float:
+        """
+        Calcula el rendimiento de la última corrida (desde iniciar() hasta
+        detener(), o hasta ahora si sigue activa).
+
+        Returns:
+            Lecturas por segundo
+        """
+        with self._lock_metricas:
+            if self._inicio is None:
+                return 0.0
+            fin = self._fin if self._fin is not None else time.monotonic()
+            transcurrido = fin - self._inicio
+            lecturas = self.lecturas_realizadas - self._lecturas_al_iniciar
+        if transcurrido <= 0:
+            return 0.0
+        return lecturas / transcurrido
+
+    def ahora(self) -> float:
+        """
+        Returns:
+            Hora actual en segundos (time.time)
+        """
+        return time.time()
+
+    def tasa_muestreo(self) -> float:
+        """
+        Calcula la tasa de lecturas efectiva según los intervalos actuales
+        de los sensores registrados (con muestreo adaptativo, varía).
+
+        Returns:
+            Lecturas por segundo
+        """
+        with self._condicion:
+            sensores = list(self._registrados)
+        return tasa_muestreo(sensores)
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Genera estadísticas del planificador.
+
+        Returns:
+            Diccionario con métricas de operación
+        """
+        with self._condicion:
+            en_agenda = len(self._agenda)
+            registrados = len(self._registrados)
+
+        return {
+            "sensores_registrados": registrados,
+            "lecturas_en_agenda": en_agenda,
+            "lecturas_pendientes": self._pendientes.qsize(),
+            "lecturas_realizadas": self.lecturas_realizadas,
+            "errores": self.errores,
+            "lecturas_por_segundo": self.lecturas_por_segundo(),
+            "tasa_muestreo": self.tasa_muestreo(),
+            "hilos": 1 + len(self._trabajadores)
+        }
+
+    def __str__(self):
+        return (f"PlanificadorSensores(sensores={len(self._registrados)}, "
+                f"trabajadores={self.num_trabajadores}, activo={self.activo})")
@@ -4,9 +4,11 @@ Servicio de Raciones - Aplica estrategias de alimentación
 Servicio concurrente que aplica estrategias de alimentación automáticamente.
 """
 
+import asyncio
 import threading
 import time
-from typing import Dict
+from typing import Dict, Set
+from consola import consola
 from estrategias.estrategia_racion import EstrategiaRacion
 from estrategias.racion_normal import RacionNormal
 from estrategias.racion_intensiva import RacionIntensiva
@@ -29,6 +31,8 @@ class RacionService:
         """
         self.feedlot_system = feedlot_system
         self.estrategias: Dict[int, EstrategiaRacion] = {}
+        # Animales con ración de mantenimiento asignada (los que optimizar revisa además de los enfermos)
+        self._en_mantenimiento: Set[int] = set()
         self.activo = False
         self.thread = None
         self.intervalo = 10.0  # Aplicar raciones cada 10 segundos
@@ -49,8 +53,12 @@ class RacionService:
             estrategia: Estrategia a asignar
         """
         self.estrategias[id_animal] = estrategia
-        print(f"[RACION] Estrategia '{estrategia.obtener_nombre()}' "
-              f"asignada a Animal #{id_animal}")
+        if isinstance(estrategia, RacionMantenimiento):
+            self._en_mantenimiento.add(id_animal)
+        else:
+            self._en_mantenimiento.discard(id_animal)
+        consola.emitir("racion", "[RACION] Estrategia '{}' asignada a Animal #{}",
+                       estrategia.obtener_nombre(), id_animal)
     
     def asignar_estrategia_automatica(self, id_animal: int):
         """
@@ -80,7 +88,7 @@ class RacionService:
             razon = "peso adecuado (>=300 kg)"
         
         self.asignar_estrategia(id_animal, estrategia)
-        print(f"   └─ Razón: {razon}")
+        consola.emitir("racion", "   └─ Razón: {}", razon)
     
     def cambiar_estrategia(self, id_animal: int, tipo_estrategia: str):
         """
@@ -131,6 +139,15 @@ class RacionService:
             time.sleep(self.intervalo)
             self._aplicar_raciones()
     
+    async def _ejecutar_async(self):
+        """
+        Versión corrutina del ciclo de raciones.
+        La ejecuta el RuntimeAsyncio en lugar de un hilo propio.
+        """
+        while self.activo:
+            await asyncio.sleep(self.intervalo)
+            self._aplicar_raciones()
+    
     def _aplicar_raciones(self):
         """
         Aplica las raciones asignadas a cada animal.
@@ -139,7 +156,7 @@ class RacionService:
         if not self.feedlot_system.animales:
             return
         
-        print("\n [RACION] Aplicando raciones programadas...")
+        consola.emitir("racion", "\n [RACION] Aplicando raciones programadas...")
         
         total_incremento = 0
         animales_procesados = 0
@@ -164,13 +181,14 @@ class RacionService:
               else:
                  indicador = "[NORMAL]"
         
-        print(f"  {indicador} {animal}: {estrategia.obtener_nombre()} → +{incremento:.1f} kg")
+        consola.emitir("racion", "  {} {}: {} → +{:.1f} kg",
+                       indicador, animal, estrategia.obtener_nombre(), incremento)
         
         # Resumen
         if animales_procesados > 0:
             promedio = total_incremento / animales_procesados
-            print(f"\n   Total: +{total_incremento:.1f} kg | "
-                  f"Promedio: +{promedio:.2f} kg/animal")
+            consola.emitir("racion", "\n   Total: +{:.1f} kg | Promedio: +{:.2f} kg/animal",
+                           total_incremento, promedio)
     
     def obtener_estadisticas_raciones(self) -> dict:
         """
@@ -235,20 +253,29 @@ class RacionService:
         """
         Revisa y optimiza las estrategias de todos los animales.
         Útil para ajustar estrategias según cambios de estado.
+        
+        Sólo pueden cambiar los enfermos (pasan a mantenimiento) y los que
+        están en mantenimiento (vuelven si se recuperaron): se revisan esos,
+        sacando los enfermos del índice de salud, sin recorrer el rodeo.
         """
         print("\n Optimizando estrategias de alimentación...")
         
         cambios = 0
-        for id_animal in self.feedlot_system.animales.keys():
+        animales = self.feedlot_system.animales
+        enfermos = {animal.id for animal in self.feedlot_system.obtener_animales_alerta()}
+        for id_animal in sorted(enfermos | self._en_mantenimiento):
+            animal = animales.get(id_animal)
+            if animal is None:
+                continue
             estrategia_actual = self.estrategias.get(id_animal)
             
             # Determinar estrategia óptima
-            animal = self.feedlot_system.animales[id_animal]
+            enfermo = id_animal in enfermos
             
-            if animal.esta_enfermo() and not isinstance(estrategia_actual, RacionMantenimiento):
+            if enfermo and not isinstance(estrategia_actual, RacionMantenimiento):
                 self.asignar_estrategia(id_animal, self.racion_mantenimiento)
                 cambios += 1
-            elif not animal.esta_enfermo() and isinstance(estrategia_actual, RacionMantenimiento):
+            elif not enfermo and isinstance(estrategia_actual, RacionMantenimiento):
                 # Animal recuperado, volver a estrategia normal o intensiva
                 if animal.peso < 300:
                     self.asignar_estrategia(id_animal, self.racion_intensiva)
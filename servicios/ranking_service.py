@@ -0,0 +1,372 @@
+"""
+Servicio de Ranking - Tabla de posiciones por ganancia de peso
+
+FeedlotSystem.obtener_mejores_animales ya no ordena el rodeo: los
+corrales del sistema avisan a RankingGanancia cada alta, baja, cambio
+de corral, de tipo o de peso de sus animales, y la ganancia de cada uno
+se mantiene ordenada en una ListaOrdenada por tipo de animal y otra por
+corral. Los k mejores o peores de un corral o de un tipo salen de su
+lista en O(k); los del rodeo, mezclando las listas de los tipos.
+
+Las lecturas de peso (el aviso más frecuente) sólo marcan al animal
+como pendiente; la consulta siguiente reubica a los pendientes, o
+reordena todo de una vez si cambió una buena parte del rodeo. Con los
+sensores activos casi todo el rodeo cambia entre dos reportes y
+reubicarlo costaría más que una selección sobre las columnas del
+AlmacenRodeo (o que un heap sobre los objetos, sin NumPy); en ese caso
+FeedlotSystem recorre el rodeo y el ranking queda para rodeos quietos o
+consultas más frecuentes que las lecturas.
+"""
+
+import heapq
+import threading
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from entidades.animal import Animal, TIPOS
+from entidades.corral import Corral
+from entidades.ranking import ListaOrdenada
+
+# Si cambió más de esta fracción del rodeo se reordena todo en lugar de
+# reubicar animal por animal
+FRACCION_REORDENAR = 0.125
+# Reubicar un animal cuesta unas mil veces más que leer su ganancia en
+# una columna y unas treinta veces más que leerla del objeto: pasadas
+# estas fracciones conviene seleccionar sobre columnas o sobre objetos
+FRACCION_COLUMNAS = 0.001
+FRACCION_OBJETOS = 0.03
+
+
+class RankingGanancia:
+    """
+    Ganancia de peso de los animales de los corrales del sistema, ordenada
+    por tipo y por corral. La clave de cada animal es (ganancia, id).
+    """
+
+    def __init__(self):
+        """Inicializa un ranking vacío."""
+        # ID -> [clave, código de tipo, número de corral, animal]
+        self._entradas: Dict[int, list] = {}
+        self._por_tipo: Dict[int, ListaOrdenada] = {}
+        self._por_corral: Dict[int, ListaOrdenada] = {}
+        # Animales con lecturas de peso aún no reubicadas
+        self._pendientes = set()
+        # Lecturas marcadas en total y hasta la última consulta de desactualizado()
+        self._marcas = 0
+        self._marcas_vistas = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _lista(listas: Dict[int, ListaOrdenada], clave: int) -> ListaOrdenada:
+        lista = listas.get(clave)
+        if lista is None:
+            lista = listas[clave] = ListaOrdenada()
+        return lista
+
+    def agregar(self, animal: Animal, numero_corral: int):
+        """
+        Registra un animal que entra a un corral. Si ya estaba en otro
+        (una transferencia) se lo mueve.
+
+        Args:
+            animal: Animal que entra
+            numero_corral: Corral al que entra
+        """
+        with self._lock:
+            entrada = self._entradas.get(animal.id)
+            if entrada is not None:
+                self._mover(entrada, numero_corral)
+                return
+            clave = (animal.peso - animal.peso_inicial, animal.id)
+            tipo = animal._tipo
+            self._entradas[animal.id] = [clave, tipo, numero_corral, animal]
+            self._lista(self._por_tipo, tipo).agregar(clave)
+            self._lista(self._por_corral, numero_corral).agregar(clave)
+
+    def agregar_varios(self, altas: Iterable[Tuple[Animal, int]]):
+        """
+        Registra varios animales que entran juntos (carga masiva) con una
+        sola toma del lock. Las listas que reciben muchas claves respecto
+        de las que tienen se rearman de una vez en lugar de insertar clave
+        por clave.
+
+        Args:
+            altas: Pares (animal, número de corral al que entra); los ya
+                   registrados se mueven
+        """
+        with self._lock:
+            entradas = self._entradas
+            por_tipo: Dict[int, list] = {}
+            por_corral: Dict[int, list] = {}
+            for animal, numero_corral in altas:
+                entrada = entradas.get(animal.id)
+                if entrada is not None:
+                    self._mover(entrada, numero_corral)
+                    continue
+                clave = (animal.peso - animal.peso_inicial, animal.id)
+                tipo = animal._tipo
+                entradas[animal.id] = [clave, tipo, numero_corral, animal]
+                por_tipo.setdefault(tipo, []).append(clave)
+                por_corral.setdefault(numero_corral, []).append(clave)
+            for tipo, claves in por_tipo.items():
+                self._sumar_claves(self._por_tipo, tipo, claves)
+            for numero, claves in por_corral.items():
+                self._sumar_claves(self._por_corral, numero, claves)
+
+    def _sumar_claves(self, listas: Dict[int, ListaOrdenada], grupo: int, claves: list):
+        """Agrega claves a la lista de un grupo (llamar con el lock tomado)."""
+        lista = listas.get(grupo)
+        if lista is None or len(claves) > FRACCION_REORDENAR * len(lista):
+            listas[grupo] = ListaOrdenada(chain(lista or (), claves))
+            return
+        for clave in claves:
+            lista.agregar(clave)
+
+    def _mover(self, entrada: list, numero_corral: int):
+        """Pasa una entrada a la lista de otro corral (llamar con el lock tomado)."""
+        self._por_corral[entrada[2]].quitar(entrada[0])
+        self._lista(self._por_corral, numero_corral).agregar(entrada[0])
+        entrada[2] = numero_corral
+
+    def quitar(self, animal: Animal, numero_corral: int):
+        """
+        Da de baja un animal que sale de un corral (no hace nada si el
+        animal ya se movió a otro).
+
+        Args:
+            animal: Animal que sale
+            numero_corral: Corral del que sale
+        """
+        with self._lock:
+            entrada = self._entradas.get(animal.id)
+            if entrada is None or entrada[2] != numero_corral:
+                return
+            del self._entradas[animal.id]
+            self._pendientes.discard(animal)
+            self._por_tipo[entrada[1]].quitar(entrada[0])
+            self._por_corral[numero_corral].quitar(entrada[0])
+
+    def actualizar(self, animal: Animal, ganancia: float):
+        """
+        Reubica ya un animal cuya ganancia va a cambiar (asignaciones
+        directas de peso o de peso de ingreso; las lecturas usan marcar).
+
+        Args:
+            animal: Animal registrado
+            ganancia: Ganancia de peso nueva en kg
+        """
+        with self._lock:
+            entrada = self._entradas.get(animal.id)
+            if entrada is None:
+                return
+            anterior = entrada[0]
+            nueva = entrada[0] = (ganancia, anterior[1])
+            self._por_tipo[entrada[1]].reemplazar(anterior, nueva)
+            self._por_corral[entrada[2]].reemplazar(anterior, nueva)
+
+    def marcar(self, animal: Animal):
+        """
+        Anota que la ganancia de un animal cambió; se reubica en la
+        próxima consulta. Se llama después de escribir el peso.
+
+        Args:
+            animal: Animal cuya ganancia cambió
+        """
+        self._pendientes.add(animal)
+        self._marcas += 1
+
+    def marcar_varios(self, animales: Sequence[Animal]):
+        """
+        Anota de una vez que cambió la ganancia de varios animales (un
+        lote de SensorLote).
+
+        Args:
+            animales: Animales cuya ganancia cambió
+        """
+        self._pendientes.update(animales)
+        self._marcas += len(animales)
+
+    def desactualizado(self, fraccion: float = FRACCION_COLUMNAS) -> bool:
+        """
+        Indica si conviene responder sin el ranking, recorriendo el rodeo:
+        cambió más de la fracción dada y siguen llegando lecturas desde la
+        llamada anterior. Con el rodeo quieto devuelve False: se ponen al
+        día las listas una vez y las consultas siguientes salen de ellas
+        en O(k).
+
+        Args:
+            fraccion: Fracción del rodeo con cambios pendientes a partir
+                      de la cual recorrer es más barato (FRACCION_COLUMNAS
+                      o FRACCION_OBJETOS)
+
+        Returns:
+            True si ponerse al día costaría más que recorrer el rodeo y
+            el orden duraría poco
+        """
+        marcas, vistas = self._marcas, self._marcas_vistas
+        self._marcas_vistas = marcas
+        return marcas != vistas and len(self._pendientes) > fraccion * len(self._entradas)
+
+    def _hay_que_reordenar(self) -> bool:
+        return len(self._pendientes) > FRACCION_REORDENAR * len(self._entradas)
+
+    def _aplicar_pendientes(self):
+        """Reubica los animales marcados (llamar con el lock tomado)."""
+        pendientes = self._pendientes
+        if not pendientes:
+            return
+        entradas = self._entradas
+        if self._hay_que_reordenar():
+            # Las marcas que lleguen después del clear se leen al reordenar
+            pendientes.clear()
+            self._reordenar()
+            return
+        while pendientes:
+            try:
+                animal = pendientes.pop()
+            except KeyError:  # otro hilo vació el conjunto
+                break
+            entrada = entradas.get(animal.id)
+            if entrada is None or entrada[3] is not animal:
+                continue
+            anterior = entrada[0]
+            ganancia = animal.peso - animal.peso_inicial
+            if ganancia != anterior[0]:
+                nueva = entrada[0] = (ganancia, anterior[1])
+                self._por_tipo[entrada[1]].reemplazar(anterior, nueva)
+                self._por_corral[entrada[2]].reemplazar(anterior, nueva)
+
+    def _reordenar(self):
+        """Recalcula todas las claves y rearma las listas (llamar con el lock tomado)."""
+        entradas = self._entradas
+        claves = []
+        for id_animal, entrada in entradas.items():
+            animal = entrada[3]
+            clave = entrada[0] = (animal.peso - animal.peso_inicial, id_animal)
+            claves.append(clave)
+        # Un solo ordenamiento: cada grupo recibe sus claves ya en orden
+        claves.sort()
+        claves_tipo: Dict[int, list] = {}
+        claves_corral: Dict[int, list] = {}
+        for clave in claves:
+            entrada = entradas[clave[1]]
+            claves_tipo.setdefault(entrada[1], []).append(clave)
+            claves_corral.setdefault(entrada[2], []).append(clave)
+        self._por_tipo = {tipo: ListaOrdenada(claves) for tipo, claves in claves_tipo.items()}
+        self._por_corral = {numero: ListaOrdenada(claves) for numero, claves in claves_corral.items()}
+
+    def cambiar_tipo(self, animal: Animal, anterior: int, nuevo: int):
+        """
+        Pasa un animal a la lista de otro tipo.
+
+        Args:
+            animal: Animal registrado
+            anterior: Código de tipo actual
+            nuevo: Código de tipo nuevo
+        """
+        with self._lock:
+            entrada = self._entradas.get(animal.id)
+            if entrada is None or anterior == nuevo:
+                return
+            self._por_tipo[anterior].quitar(entrada[0])
+            self._lista(self._por_tipo, nuevo).agregar(entrada[0])
+            entrada[1] = nuevo
+
+    def vaciar(self):
+        """Descarta todas las posiciones."""
+        with self._lock:
+            self._entradas = {}
+            self._por_tipo = {}
+            self._por_corral = {}
+            self._pendientes.clear()
+
+    def recalcular(self, corrales: Iterable[Corral]):
+        """
+        Rearma las listas a partir de los corrales (O(n log n)).
+
+        Args:
+            corrales: Corrales del sistema
+        """
+        with self._lock:
+            self._pendientes.clear()
+            self._entradas = {
+                animal.id: [None, animal._tipo, corral.numero, animal]
+                for corral in corrales for animal in corral.animales
+            }
+            self._reordenar()
+
+    def _claves(self, mayores: bool, numero_corral: Optional[int],
+                tipo: Optional[str]) -> Iterator[tuple]:
+        """Claves en orden de ganancia (descendente si mayores) del grupo pedido."""
+        if numero_corral is not None:
+            lista = self._por_corral.get(numero_corral)
+            claves = iter(()) if lista is None else (reversed(lista) if mayores else iter(lista))
+            if tipo is not None:
+                codigo = TIPOS.codigos.get(tipo)
+                entradas = self._entradas
+                claves = (clave for clave in claves if entradas[clave[1]][1] == codigo)
+            return claves
+        if tipo is not None:
+            lista = self._por_tipo.get(TIPOS.codigos.get(tipo))
+            if lista is None:
+                return iter(())
+            return reversed(lista) if mayores else iter(lista)
+        listas = self._por_tipo.values()
+        if mayores:
+            return heapq.merge(*(reversed(lista) for lista in listas), reverse=True)
+        return heapq.merge(*listas)
+
+    def _seleccionar(self, cantidad: int, mayores: bool, numero_corral: Optional[int],
+                     tipo: Optional[str]) -> List[Animal]:
+        with self._lock:
+            self._aplicar_pendientes()
+            entradas = self._entradas
+            return [entradas[clave[1]][3]
+                    for clave in islice(self._claves(mayores, numero_corral, tipo), cantidad)]
+
+    def mejores(self, cantidad: int, numero_corral: Optional[int] = None,
+                tipo: Optional[str] = None) -> List[Animal]:
+        """
+        Args:
+            cantidad: Animales a devolver
+            numero_corral: Sólo los de ese corral (None = todo el rodeo)
+            tipo: Sólo los de ese tipo (None = todos)
+
+        Returns:
+            Animales de mayor ganancia, de mayor a menor
+        """
+        return self._seleccionar(cantidad, True, numero_corral, tipo)
+
+    def peores(self, cantidad: int, numero_corral: Optional[int] = None,
+               tipo: Optional[str] = None) -> List[Animal]:
+        """
+        Args:
+            cantidad: Animales a devolver
+            numero_corral: Sólo los de ese corral (None = todo el rodeo)
+            tipo: Sólo los de ese tipo (None = todos)
+
+        Returns:
+            Animales de menor ganancia, de menor a mayor
+        """
+        return self._seleccionar(cantidad, False, numero_corral, tipo)
+
+    def posicion(self, id_animal: int) -> Optional[int]:
+        """
+        Args:
+            id_animal: ID del animal
+
+        Returns:
+            Puesto del animal en el rodeo por ganancia (1 = mayor), o
+            None si no está registrado
+        """
+        with self._lock:
+            self._aplicar_pendientes()
+            entrada = self._entradas.get(id_animal)
+            if entrada is None:
+                return None
+            return 1 + sum(lista.contar_mayores(entrada[0]) for lista in self._por_tipo.values())
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def __repr__(self):
+        return f"RankingGanancia(animales={len(self._entradas)}, corrales={len(self._por_corral)})"
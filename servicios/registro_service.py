@@ -0,0 +1,94 @@
+"""
+Servicio de Registro - Varios feedlots independientes en un mismo proceso
+
+FeedlotSystem() devuelve siempre el mismo sistema, el de main.py. Para
+comparar políticas de ración o barrer parámetros sin reiniciar el
+proceso, RegistroFeedlots guarda sistemas independientes por nombre.
+Cada uno tiene sus animales, corrales, almacén, índices, ranking,
+alertas, planificador y reloj propios, así que pueden simularse a la vez
+(cada uno con su MotorEventos, en hilos o en un pool de procesos) sin
+SingletonMeta.reset_instances entre corridas.
+
+Lo único que comparten es la consola (consola.consola).
+"""
+
+import threading
+from typing import Dict, Iterator, List
+from servicios.feedlot_service import FeedlotSystem
+from servicios.reloj_service import Reloj
+
+
+class RegistroFeedlots:
+    """
+    Feedlots independientes por nombre.
+    """
+
+    def __init__(self):
+        """Inicializa un registro vacío."""
+        self._sistemas: Dict[str, FeedlotSystem] = {}
+        self._lock = threading.Lock()
+
+    def obtener(self, nombre: str) -> FeedlotSystem:
+        """
+        Devuelve el feedlot con ese nombre, creándolo si no existe. Los
+        feedlots nuevos fechan sus lecturas con un reloj propio.
+
+        Args:
+            nombre: Nombre del feedlot
+
+        Returns:
+            FeedlotSystem independiente (nunca el sistema único del proceso)
+        """
+        with self._lock:
+            sistema = self._sistemas.get(nombre)
+            if sistema is None:
+                sistema = FeedlotSystem.crear_independiente(nombre, Reloj())
+                self._sistemas[nombre] = sistema
+            return sistema
+
+    def quitar(self, nombre: str) -> bool:
+        """
+        Saca un feedlot del registro, deteniendo su monitoreo si está activo.
+
+        Args:
+            nombre: Nombre del feedlot
+
+        Returns:
+            True si estaba registrado
+        """
+        with self._lock:
+            sistema = self._sistemas.pop(nombre, None)
+        if sistema is None:
+            return False
+        if sistema.activo:
+            sistema.detener_monitoreo()
+        return True
+
+    def vaciar(self):
+        """Saca todos los feedlots del registro."""
+        for nombre in self.nombres():
+            self.quitar(nombre)
+
+    def nombres(self) -> List[str]:
+        """
+        Returns:
+            Nombres de los feedlots registrados, en orden de creación
+        """
+        with self._lock:
+            return list(self._sistemas)
+
+    def __contains__(self, nombre: str) -> bool:
+        return nombre in self._sistemas
+
+    def __iter__(self) -> Iterator[FeedlotSystem]:
+        return iter(list(self._sistemas.values()))
+
+    def __len__(self):
+        return len(self._sistemas)
+
+    def __repr__(self):
+        return f"RegistroFeedlots(feedlots={self.nombres()})"
+
+
+# Registro compartido por todo el proceso
+registro = RegistroFeedlots()
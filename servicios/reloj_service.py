@@ -0,0 +1,47 @@
+"""
+Servicio de Reloj - Hora común para las marcas de tiempo del rodeo
+
+Los historiales de cada animal marcan cada lectura con reloj.ahora().
+Por defecto es la hora del sistema (time.time); FeedlotSystem lo
+conecta al planificador en uso, de modo que con el MotorEventos las
+marcas siguen el reloj virtual y una temporada simulada en minutos de
+CPU queda fechada como si hubiera durado lo que simula.
+
+Las instancias independientes de FeedlotSystem (RegistroFeedlots) tienen
+cada una su propio Reloj, que sus corrales pasan a las lecturas de sus
+animales: varias simulaciones en un mismo proceso no se pisan el tiempo.
+"""
+
+import time
+from typing import Callable
+
+
+class Reloj:
+    """
+    Fuente de tiempo intercambiable (segundos, estilo time.time).
+    """
+
+    def __init__(self):
+        """Inicializa el reloj con la hora del sistema."""
+        # Atributo de instancia: reloj.ahora() es una sola llamada en el camino caliente
+        self.ahora: Callable[[], float] = time.time
+
+    def usar(self, fuente: Callable[[], float]):
+        """
+        Cambia la fuente de tiempo.
+
+        Args:
+            fuente: Función sin argumentos que devuelve segundos
+        """
+        self.ahora = fuente
+
+    def restablecer(self):
+        """Vuelve a la hora del sistema."""
+        self.ahora = time.time
+
+    def __str__(self):
+        return f"Reloj(fuente={getattr(self.ahora, '__qualname__', self.ahora)})"
+
+
+# Instancia compartida por todo el proceso (la usa el FeedlotSystem único)
+reloj = Reloj()
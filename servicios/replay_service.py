@@ -0,0 +1,252 @@
+"""
+Servicio de Reproducción - Reinyecta históricos CSV en el pipeline
+
+Lee archivos con el formato de PersistenciaService.exportar_historico_animales
+(Animal_ID, Tipo, Serie, Lectura, Valor, Instante: una fila por lectura
+de peso o de temperatura) y los pasa por sensores, observadores e
+ingesta como si fueran lecturas en vivo, una por fila. También lee los
+históricos anteriores, con peso y temperatura en la misma fila (y
+opcionalmente Instante); cada una de esas filas se reproduce como una
+lectura de las dos series. Sirve para medir alertas y reportes sobre
+datos reales y para reproducir incidentes sin los generadores aleatorios
+de los sensores simulados.
+"""
+
+import csv
+import glob
+import os
+import time
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+from constantes import INTERVALO_SENSOR_TEMP
+from entidades.animal import Animal
+from entidades.sensor import SensorReplay
+from excepciones.feedlot_exceptions import PersistenciaException
+from servicios.persistencia_service import SERIES_HISTORICO
+
+# Históricos con una fila por lectura (formato actual)
+ENCABEZADOS_POR_LECTURA = ['Animal_ID', 'Tipo', 'Serie', 'Lectura', 'Valor', 'Instante']
+# Históricos anteriores: peso y temperatura en cada fila, con o sin instante
+ENCABEZADOS = ['Animal_ID', 'Tipo', 'Lectura', 'Peso_kg', 'Temperatura_C']
+ENCABEZADOS_CON_INSTANTE = ENCABEZADOS + ['Instante']
+
+
+class ReproductorHistorico:
+    """
+    Reproductor de históricos CSV sobre un FeedlotSystem.
+
+    Dos formas de uso:
+    - cargar_sensores(): crea un SensorReplay por animal; el planificador
+      del sistema los ejecuta a la velocidad grabada (hilos o asyncio) o
+      tan rápido como sea posible (MotorEventos).
+    - reproducir(): recorre el archivo fila por fila en orden de archivo,
+      con memoria constante, y entrega cada lectura directamente.
+    """
+
+    def __init__(self, feedlot_system, archivo: str, intervalo: float = INTERVALO_SENSOR_TEMP):
+        """
+        Inicializa el reproductor.
+
+        Args:
+            feedlot_system: Sistema donde se reproducen las lecturas
+            archivo: Ruta del CSV histórico
+            intervalo: Segundos entre lecturas grabadas consecutivas
+
+        Raises:
+            PersistenciaException: Si el archivo no existe
+        """
+        if not os.path.exists(archivo):
+            raise PersistenciaException(f"Histórico no encontrado: {archivo}")
+
+        self.feedlot_system = feedlot_system
+        self.archivo = archivo
+        self.intervalo = intervalo
+        self._sensores: Dict[int, SensorReplay] = {}
+        self._proximo_corral = 1
+
+        # Métricas de la última reproducción directa
+        self.lecturas_reproducidas = 0
+        self.animales_creados = 0
+        self.tiempo_real = 0.0
+
+    @staticmethod
+    def buscar_historicos(carpeta: str = "reportes_csv") -> List[str]:
+        """
+        Lista los históricos exportados, del más antiguo al más reciente.
+
+        Args:
+            carpeta: Carpeta de CSV de PersistenciaService
+
+        Returns:
+            Lista de rutas
+        """
+        return sorted(glob.glob(os.path.join(carpeta, "historico_*.csv")))
+
+    def leer_filas(self) -> Iterator[Tuple[int, str, int, Optional[float], Optional[float],
+                                           Optional[float]]]:
+        """
+        Lee el archivo fila por fila sin cargarlo entero.
+
+        Yields:
+            Tuplas (id_animal, tipo, lectura, peso, temperatura, instante).
+            En el formato por lectura la serie que la fila no trae es None
+            y lectura es el número dentro de su serie; instante es None en
+            los archivos sin columna Instante
+
+        Raises:
+            PersistenciaException: Si el encabezado o una serie no son los esperados
+        """
+        peso, temperatura = SERIES_HISTORICO
+        with open(self.archivo, newline='', encoding='utf-8') as f:
+            lector = csv.reader(f)
+            encabezado = next(lector, None)
+            if encabezado == ENCABEZADOS_POR_LECTURA:
+                for id_animal, tipo, serie, lectura, valor, instante in lector:
+                    if serie == peso:
+                        valores = (float(valor), None)
+                    elif serie == temperatura:
+                        valores = (None, float(valor))
+                    else:
+                        raise PersistenciaException(f"Serie desconocida '{serie}' en {self.archivo}")
+                    yield (int(id_animal), tipo, int(lectura), *valores, float(instante))
+            elif encabezado == ENCABEZADOS:
+                for id_animal, tipo, lectura, peso_kg, temperatura_c in lector:
+                    yield int(id_animal), tipo, int(lectura), float(peso_kg), float(temperatura_c), None
+            elif encabezado == ENCABEZADOS_CON_INSTANTE:
+                for id_animal, tipo, lectura, peso_kg, temperatura_c, instante in lector:
+                    yield (int(id_animal), tipo, int(lectura), float(peso_kg), float(temperatura_c),
+                           float(instante))
+            else:
+                raise PersistenciaException(f"Formato de histórico no válido: {self.archivo}")
+
+    def _obtener_animal(self, id_animal: int, tipo: str, peso: float) -> Animal:
+        """
+        Obtiene el animal del sistema o lo crea en el primer corral con lugar.
+
+        Args:
+            id_animal: ID grabado
+            tipo: Tipo grabado
+            peso: Peso inicial grabado
+
+        Returns:
+            Animal del sistema
+        """
+        animal = self.feedlot_system.animales.get(id_animal)
+        if animal is not None:
+            return animal
+
+        corrales = self.feedlot_system.corrales
+        while (self._proximo_corral in corrales and
+               len(corrales[self._proximo_corral].animales) >= corrales[self._proximo_corral].capacidad):
+            self._proximo_corral += 1
+
+        animal = Animal(id_animal, tipo, peso)
+        self.feedlot_system.agregar_animal(animal, self._proximo_corral)
+        self.animales_creados += 1
+        return animal
+
+    def cargar_sensores(self, velocidad: float = 1.0) -> List[SensorReplay]:
+        """
+        Crea un SensorReplay por animal con sus lecturas grabadas y lo
+        agrega al sistema. La lectura 0 de cada serie es el estado inicial
+        del animal y no se reproduce. Si el archivo tiene columna Instante,
+        cada lectura llega con la separación grabada; si no, cada
+        `intervalo` segundos.
+
+        Args:
+            velocidad: Multiplicador de la velocidad grabada (2.0 = el doble)
+
+        Returns:
+            Lista de sensores creados
+        """
+        lecturas: Dict[int, list] = defaultdict(list)
+        instantes: Dict[int, list] = defaultdict(list)
+        iniciales: Dict[int, Tuple[str, float]] = {}
+        for id_animal, tipo, lectura, peso, temperatura, instante in self.leer_filas():
+            if lectura == 0:
+                if peso is not None:
+                    iniciales[id_animal] = (tipo, peso)
+            else:
+                lecturas[id_animal].append((peso, temperatura))
+                instantes[id_animal].append(instante)
+
+        sensores = []
+        for id_animal, (tipo, peso_inicial) in iniciales.items():
+            animal = self._obtener_animal(id_animal, tipo, peso_inicial)
+            grabadas = lecturas.pop(id_animal, [])
+            momentos = instantes.pop(id_animal, [])
+            if momentos and momentos[0] is not None:
+                # Espera hasta la lectura siguiente según el archivo (la última no espera)
+                esperas = [(siguiente - actual) / velocidad
+                           for actual, siguiente in zip(momentos, momentos[1:])]
+                grabadas = [(peso, temperatura, espera) for (peso, temperatura), espera
+                            in zip(grabadas, esperas + [None])]
+            sensor = SensorReplay(animal, grabadas, self.intervalo / velocidad, peso_inicial)
+            sensor.al_agotarse = self._sensor_agotado
+            self.feedlot_system.agregar_sensor(sensor)
+            sensores.append(sensor)
+        return sensores
+
+    def _sensor_agotado(self, sensor: SensorReplay):
+        """
+        Saca del planificador un sensor que ya reprodujo todas sus lecturas.
+
+        Args:
+            sensor: Sensor agotado
+        """
+        self.feedlot_system.planificador.desregistrar(sensor)
+
+    def reproducir(self, limite: int = None) -> dict:
+        """
+        Reproduce el archivo tan rápido como sea posible, en orden de
+        archivo y con memoria constante. Cada lectura pasa por el
+        canal de ingesta del sistema (si hay) o se aplica directamente.
+
+        Args:
+            limite: Máximo de lecturas a reproducir (None = todo el archivo)
+
+        Returns:
+            Estadísticas de la reproducción (ver obtener_estadisticas)
+        """
+        inicio = time.perf_counter()
+        sensor = None
+
+        for id_animal, tipo, lectura, peso, temperatura, _ in self.leer_filas():
+            if sensor is None or sensor.animal.id != id_animal:
+                sensor = self._sensores.get(id_animal)
+                if sensor is None:
+                    animal = self._obtener_animal(id_animal, tipo, peso)
+                    sensor = SensorReplay(animal, intervalo=self.intervalo, peso_previo=peso)
+                    self.feedlot_system.agregar_sensor(sensor)
+                    self._sensores[id_animal] = sensor
+            if lectura == 0:
+                if peso is not None:
+                    sensor.peso_previo = peso
+                continue
+
+            sensor.entregar((peso, temperatura))
+            self.lecturas_reproducidas += 1
+            if limite is not None and self.lecturas_reproducidas >= limite:
+                break
+
+        self.tiempo_real += time.perf_counter() - inicio
+        return self.obtener_estadisticas()
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Genera estadísticas de la reproducción directa.
+
+        Returns:
+            Diccionario con lecturas, animales creados y rendimiento
+        """
+        return {
+            "archivo": self.archivo,
+            "lecturas_reproducidas": self.lecturas_reproducidas,
+            "animales_creados": self.animales_creados,
+            "tiempo_real": self.tiempo_real,
+            "lecturas_por_segundo": (self.lecturas_reproducidas / self.tiempo_real
+                                     if self.tiempo_real > 0 else 0.0)
+        }
+
+    def __str__(self):
+        return f"ReproductorHistorico(archivo={self.archivo}, intervalo={self.intervalo}s)"
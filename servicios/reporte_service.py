@@ -4,10 +4,12 @@ Servicio de Reportes - Generación automática de reportes
 Servicio concurrente que genera reportes periódicos del feedlot.
 """
 
+import asyncio
 import threading
 import time
 from datetime import datetime
 import os
+from consola import consola
 
 class ReporteService:
     """
@@ -67,6 +69,15 @@ class ReporteService:
             time.sleep(self.intervalo)
             self.generar_reporte()
     
+    async def _ejecutar_async(self):
+        """
+        Versión corrutina del ciclo de reportes.
+        La ejecuta el RuntimeAsyncio en lugar de un hilo propio.
+        """
+        while self.activo:
+            await asyncio.sleep(self.intervalo)
+            self.generar_reporte()
+    
     def generar_reporte(self):
         """
         Genera un reporte completo del feedlot.
@@ -115,14 +126,15 @@ class ReporteService:
                 gdp_animal = animal.ganancia_peso_total() / dias
                 print(f"  {i}. {animal.mostrar_info()} | GDP: {gdp_animal:.2f} kg/día")
         
-        # Detalle por animal
-        print("\n DETALLE POR ANIMAL:")
-        print("-"*70)
-        for animal in sorted(self.feedlot_system.animales.values(), key=lambda a: a.id):
+        # Detalle por animal (se omite entero si la consola no lo mostraría)
+        if consola.mostraria("reporte"):
+            consola.emitir("reporte", "\n DETALLE POR ANIMAL:\n{}", "-"*70)
             dias = max(1, self.feedlot_system.dia_actual)
-            gdp = animal.ganancia_peso_total() / dias
-            racion = animal.racion_actual or "Sin asignar"
-            print(f"{animal.mostrar_info()} | GDP: {gdp:.2f} kg/día | Ración: {racion}")
+            for animal in sorted(self.feedlot_system.animales.values(), key=lambda a: a.id):
+                gdp = animal.ganancia_peso_total() / dias
+                racion = animal.racion_actual or "Sin asignar"
+                consola.emitir("reporte", "{} | GDP: {:.2f} kg/día | Ración: {}",
+                               animal.mostrar_info(), gdp, racion)
         
         print("="*70 + "\n")
         
@@ -193,6 +205,11 @@ class ReporteService:
                     f.write(f"  Ganancia total: +{animal.ganancia_peso_total():.2f} kg\n")
                     f.write(f"  GDP: {gdp:.2f} kg/día\n")
                     f.write(f"  Temperatura: {animal.temperatura:.1f}°C\n")
+                    temperaturas = animal.estadisticas.temperatura
+                    if temperaturas.cantidad:
+                        f.write(f"  Temp. media: {temperaturas.media:.2f} ± {temperaturas.desvio:.2f}°C "
+                               f"({animal.estadisticas.lecturas_fiebre}/{temperaturas.cantidad} con fiebre)\n")
+                    f.write(f"  Tendencia: {animal.tendencia_peso():+.2f} kg/lectura\n")
                     f.write(f"  Estado: {animal.estado_salud}\n")
                     f.write(f"  Ración: {racion}\n")
                     f.write("\n")
@@ -250,6 +267,13 @@ class ReporteService:
             gdp = animal.ganancia_peso_total() / dias
             print(f"  {i}. {animal.mostrar_info()} | GDP: {gdp:.2f} kg/día")
         
+        # Los de menor ganancia (candidatos a revisar ración o salud)
+        peores = self.feedlot_system.obtener_peores_animales(3)
+        if peores:
+            print("\n MENOR GANANCIA:")
+            for i, animal in enumerate(peores, 1):
+                print(f"  {i}. {animal} - Ganancia: {animal.ganancia_peso_total():+.2f} kg")
+        
         # Animales con alertas
         animales_alerta = self.feedlot_system.obtener_animales_alerta()
         if animales_alerta:
@@ -260,8 +284,9 @@ class ReporteService:
         # Estadísticas por corral
         if self.feedlot_system.corrales:
             print("\n ESTADÍSTICAS POR CORRAL:")
+            estadisticas = self.feedlot_system.obtener_estadisticas_corrales()
             for corral in sorted(self.feedlot_system.corrales.values(), key=lambda c: c.numero):
-                stats_corral = corral.obtener_estadisticas()
+                stats_corral = estadisticas[corral.numero]
                 print(f"  {corral}: Peso prom. {stats_corral['peso_promedio']:.1f} kg, "
                       f"Uso {stats_corral['capacidad_usada']:.0f}%")
         
@@ -270,15 +295,16 @@ class ReporteService:
         print("="*70 + "\n")
         
         # Guardar reporte final
-        self._guardar_reporte_final(stats, mejores)
+        self._guardar_reporte_final(stats, mejores, peores)
     
-    def _guardar_reporte_final(self, stats: dict, mejores: list):
+    def _guardar_reporte_final(self, stats: dict, mejores: list, peores: list = ()):
         """
         Guarda el reporte final en un archivo especial.
         
         Args:
             stats: Diccionario con estadísticas
             mejores: Lista de mejores animales
+            peores: Lista de animales con menor ganancia
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         nombre_archivo = f"{self.carpeta_reportes}/REPORTE_FINAL_{timestamp}.txt"
@@ -314,6 +340,12 @@ class ReporteService:
                     f.write(f"{i}. {animal} - Ganancia: +{animal.ganancia_peso_total():.2f} kg "
                            f"(GDP: {gdp:.2f} kg/día)\n")
                 
+                if peores:
+                    f.write("\nMENOR GANANCIA\n")
+                    f.write("-"*70 + "\n")
+                    for i, animal in enumerate(peores, 1):
+                        f.write(f"{i}. {animal} - Ganancia: {animal.ganancia_peso_total():+.2f} kg\n")
+                
                 f.write("\n" + "="*70 + "\n")
                 f.write("Fin del reporte final\n")
             
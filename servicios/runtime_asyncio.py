@@ -0,0 +1,237 @@
+"""
+Runtime Asyncio - Un único event loop para todo el monitoreo
+
+Alternativa al PlanificadorSensores: cada sensor y cada servicio
+periódico (raciones, reportes) es una corrutina, y un solo event loop
+(en un solo hilo) los ejecuta a todos. Expone la misma interfaz
+registrar/desregistrar/iniciar/detener que el planificador, por lo que
+FeedlotSystem lo usa sin cambios. Con el loop corriendo, las altas y
+bajas que llegan desde otros hilos se pasan al loop con
+call_soon_threadsafe: los sensores y servicios sólo se tocan desde él.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, List
+from consola import consola, NivelConsola
+from entidades.sensor import tasa_muestreo
+
+
+class RuntimeAsyncio:
+    """
+    Ejecuta sensores y servicios como corrutinas en un event loop.
+
+    Sin hilos por sensor ni pool de trabajadores: la latencia depende
+    solo de la carga del loop, no de la planificación del sistema operativo.
+    """
+
+    def __init__(self):
+        """Inicializa el runtime (el loop se crea al iniciar)"""
+        self.activo = False
+        self._loop = None
+        self._hilo = None
+        self._evento_detener = None
+        self._listo = threading.Event()
+        # Protege el paso de "sin loop" a "con loop" (altas directas o por el loop)
+        self._lock = threading.Lock()
+
+        # Sensor -> tarea asyncio (None hasta que el loop la crea)
+        self._sensores: Dict = {}
+        self._servicios: List = []
+        self._tareas_servicios: List = []
+
+        # Métricas
+        self.lecturas_realizadas = 0
+        self.errores = 0
+
+    def _en_loop(self, funcion, *args):
+        """
+        Ejecuta funcion(*args) en el loop si está corriendo, o ya mismo
+        si todavía no arrancó.
+        """
+        with self._lock:
+            loop = self._loop
+            if loop is None:
+                funcion(*args)
+                return
+        try:
+            loop.call_soon_threadsafe(funcion, *args)
+        except RuntimeError:
+            # El loop terminó entre tanto (detener): ya no corre nada en él
+            funcion(*args)
+
+    def registrar(self, sensor):
+        """
+        Registra un sensor; su corrutina se crea dentro del loop.
+
+        Args:
+            sensor: Sensor a ejecutar
+        """
+        self._en_loop(self._agregar_sensor, sensor)
+
+    def desregistrar(self, sensor):
+        """
+        Quita un sensor y cancela su corrutina. El sensor deja de leer
+        en su próxima vuelta aunque la baja llegue al loop después.
+
+        Args:
+            sensor: Sensor a quitar
+        """
+        sensor.activo = False
+        self._en_loop(self._quitar_sensor, sensor)
+
+    def registrar_servicio(self, servicio):
+        """
+        Registra un servicio periódico (RacionService, ReporteService).
+        El servicio debe implementar la corrutina _ejecutar_async().
+
+        Args:
+            servicio: Servicio a ejecutar en el loop
+        """
+        servicio.activo = True
+        self._en_loop(self._agregar_servicio, servicio)
+
+    def _agregar_sensor(self, sensor):
+        """Alta de un sensor (en el loop, o antes de que arranque)"""
+        if sensor in self._sensores:
+            return
+        sensor.activo = True
+        self._sensores[sensor] = None
+        if self._loop:
+            self._lanzar_sensor(sensor)
+
+    def _quitar_sensor(self, sensor):
+        """Baja de un sensor (en el loop, o antes de que arranque)"""
+        tarea = self._sensores.pop(sensor, None)
+        if tarea:
+            tarea.cancel()
+
+    def _agregar_servicio(self, servicio):
+        """Alta de un servicio (en el loop, o antes de que arranque)"""
+        self._servicios.append(servicio)
+        if self._loop:
+            self._lanzar_servicio(servicio)
+
+    def iniciar(self):
+        """Inicia el event loop en un hilo dedicado"""
+        if self.activo:
+            return
+
+        self.activo = True
+        self._listo.clear()
+        self._hilo = threading.Thread(target=self._correr_loop, daemon=True)
+        self._hilo.start()
+        self._listo.wait(timeout=5)
+
+    def detener(self):
+        """Detiene el loop, cancelando todas las corrutinas"""
+        if not self.activo:
+            return
+
+        self.activo = False
+        for servicio in list(self._servicios):
+            servicio.activo = False
+        for sensor in list(self._sensores):
+            sensor.activo = False
+
+        with self._lock:
+            loop = self._loop
+        if loop:
+            loop.call_soon_threadsafe(self._evento_detener.set)
+        if self._hilo:
+            self._hilo.join(timeout=5)
+
+        with self._lock:
+            self._loop = None
+        self._sensores.clear()
+        self._servicios.clear()
+
+    def _correr_loop(self):
+        """Punto de entrada del hilo del loop"""
+        asyncio.run(self._principal())
+
+    async def _principal(self):
+        """Corrutina principal: lanza todas las tareas y espera la detención"""
+        self._evento_detener = asyncio.Event()
+        # Desde acá las altas y bajas de otros hilos llegan por el loop
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            sensores = list(self._sensores)
+            servicios = list(self._servicios)
+
+        for sensor in sensores:
+            self._lanzar_sensor(sensor)
+        for servicio in servicios:
+            self._lanzar_servicio(servicio)
+
+        self._listo.set()
+        await self._evento_detener.wait()
+
+        tareas = [t for t in self._sensores.values() if t] + self._tareas_servicios
+        for tarea in tareas:
+            tarea.cancel()
+        await asyncio.gather(*tareas, return_exceptions=True)
+        self._tareas_servicios = []
+
+    def _lanzar_sensor(self, sensor):
+        """Crea la tarea de un sensor (se ejecuta dentro del loop)"""
+        if sensor in self._sensores and self._sensores[sensor] is None:
+            self._sensores[sensor] = self._loop.create_task(self._ciclo_sensor(sensor))
+
+    def _lanzar_servicio(self, servicio):
+        """Crea la tarea de un servicio (se ejecuta dentro del loop)"""
+        self._tareas_servicios.append(self._loop.create_task(servicio._ejecutar_async()))
+
+    async def _ciclo_sensor(self, sensor):
+        """
+        Ciclo de lectura de un sensor como corrutina.
+
+        Args:
+            sensor: Sensor a ejecutar
+        """
+        while sensor.activo:
+            try:
+                await sensor.realizar_lectura_async()
+                self.lecturas_realizadas += 1
+            except Exception as e:
+                self.errores += 1
+                consola.emitir("sistema", "✗ Error en lectura de {}: {}",
+                               sensor.__class__.__name__, e, nivel=NivelConsola.ERROR)
+            await asyncio.sleep(sensor.intervalo)
+
+    def ahora(self) -> float:
+        """
+        Returns:
+            Hora actual en segundos (time.time)
+        """
+        return time.time()
+
+    def tasa_muestreo(self) -> float:
+        """
+        Calcula la tasa de lecturas efectiva según los intervalos actuales
+        de los sensores registrados (con muestreo adaptativo, varía).
+
+        Returns:
+            Lecturas por segundo
+        """
+        return tasa_muestreo(list(self._sensores))
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Genera estadísticas del runtime.
+
+        Returns:
+            Diccionario con métricas de operación
+        """
+        return {
+            "sensores_registrados": len(self._sensores),
+            "servicios": len(self._servicios),
+            "lecturas_realizadas": self.lecturas_realizadas,
+            "errores": self.errores,
+            "tasa_muestreo": self.tasa_muestreo(),
+            "hilos": 1 if self.activo else 0
+        }
+
+    def __str__(self):
+        return f"RuntimeAsyncio(sensores={len(self._sensores)}, activo={self.activo})"
@@ -0,0 +1,24 @@
+"""
+Configuración común de las pruebas
+
+Las pruebas importan los paquetes del proyecto desde la raíz (como los
+benchmarks) y corren con la consola en silencio.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from consola import consola
+
+
+@pytest.fixture(autouse=True)
+def consola_silenciosa():
+    """Silencia la consola durante cada prueba y restaura el modo anterior."""
+    modo = consola.modo
+    consola.configurar(modo="silencioso")
+    yield
+    consola.configurar(modo=modo)
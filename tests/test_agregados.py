@@ -0,0 +1,178 @@
+"""
+Pruebas de los agregados del rodeo (corrales y EstadisticasRodeo) con
+sensores leyendo en hilos mientras se transfieren animales y cambia su
+estado de salud.
+"""
+
+import random
+import threading
+import time
+
+import pytest
+
+from entidades.animal import Animal
+from entidades.salud import EstadoSalud
+from entidades.sensor import SensorPeso, SensorTemperatura
+from excepciones.feedlot_exceptions import CorralLlenoException
+from servicios.feedlot_service import FeedlotSystem
+from servicios.planificador_sensores import PlanificadorSensores
+from servicios.reloj_service import Reloj
+
+CAPACIDAD_CORRAL = 20
+INTERVALO_SENSOR = 0.001
+SEGUNDOS = 1.5
+ESTADOS = (EstadoSalud.SALUDABLE, EstadoSalud.BAJO_OBSERVACION,
+           EstadoSalud.EN_TRATAMIENTO | EstadoSalud.FIEBRE)
+
+
+def verificar_corrales(sistema: FeedlotSystem):
+    """Comprueba los agregados de cada corral contra sus animales."""
+    for corral in sistema.corrales.values():
+        enfermos = [a for a in corral.animales if a.esta_enfermo()]
+        assert corral.cantidad_enfermos == len(enfermos), corral
+        assert corral.peso_total == pytest.approx(sum(a.peso for a in corral.animales)), corral
+        for animal in corral.animales:
+            assert animal._corral is corral
+            assert sistema.corral_por_animal[animal.id] == corral.numero
+
+
+@pytest.fixture
+def sistema():
+    """Rodeo de 120 animales en 8 corrales con un sensor de peso y uno de temperatura cada uno."""
+    sistema = FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+    sistema.usar_planificador(PlanificadorSensores(num_trabajadores=6))
+    animales = [Animal(i + 1, ("Ternero", "Novillo", "Toro")[i % 3], 200.0 + (i % 250))
+                for i in range(120)]
+    sistema.agregar_animales(animales, CAPACIDAD_CORRAL)
+    # Lugar libre para que las transferencias no fallen siempre
+    for numero in range(max(sistema.corrales) + 1, max(sistema.corrales) + 3):
+        sistema.crear_corral(numero, CAPACIDAD_CORRAL)
+    for animal in animales:
+        sistema.agregar_sensor(SensorPeso(animal, INTERVALO_SENSOR))
+        sistema.agregar_sensor(SensorTemperatura(animal, INTERVALO_SENSOR))
+    yield sistema
+    sistema.detener_monitoreo()
+
+
+def test_agregados_con_sensores_y_transferencias(sistema):
+    animales = list(sistema.animales.values())
+    numeros = sorted(sistema.corrales)
+    activo = threading.Event()
+    activo.set()
+    errores = []
+    transferencias = [0]
+
+    def transferir(semilla: int):
+        generador = random.Random(semilla)
+        try:
+            while activo.is_set():
+                try:
+                    sistema.transferir_animal(generador.choice(animales).id, generador.choice(numeros))
+                    transferencias[0] += 1
+                except CorralLlenoException:
+                    pass
+        except Exception as error:  # pragma: no cover - se informa abajo
+            errores.append(error)
+
+    def veterinario(semilla: int):
+        generador = random.Random(semilla)
+        while activo.is_set():
+            generador.choice(animales).salud = generador.choice(ESTADOS)
+
+    hilos = ([threading.Thread(target=transferir, args=(semilla,)) for semilla in range(3)]
+             + [threading.Thread(target=veterinario, args=(semilla,)) for semilla in range(10, 12)])
+    sistema.iniciar_monitoreo()
+    for hilo in hilos:
+        hilo.start()
+    inicio = time.perf_counter()
+    try:
+        while time.perf_counter() - inicio < SEGUNDOS:
+            sistema.verificar_estadisticas()
+    finally:
+        activo.clear()
+        for hilo in hilos:
+            hilo.join()
+        sistema.detener_monitoreo()
+
+    assert not errores
+    assert transferencias[0] > 0
+    assert sistema.planificador.lecturas_realizadas > 0
+    sistema.verificar_estadisticas()
+    verificar_corrales(sistema)
+    assert sum(len(corral) for corral in sistema.corrales.values()) == len(animales)
+
+
+def test_estadisticas_rodeo_con_altas_y_bajas(sistema):
+    animales = list(sistema.animales.values())
+    activo = threading.Event()
+    activo.set()
+    errores = []
+
+    def rotar(semilla: int):
+        # Da de baja un animal y lo vuelve a dar de alta en otro corral
+        generador = random.Random(semilla)
+        propios = animales[semilla::3]
+        try:
+            while activo.is_set():
+                animal = generador.choice(propios)
+                sistema.remover_animal(animal.id)
+                for numero in generador.sample(sorted(sistema.corrales), len(sistema.corrales)):
+                    try:
+                        sistema.agregar_animal(animal, numero)
+                        break
+                    except CorralLlenoException:
+                        pass
+                animal.salud = generador.choice(ESTADOS)
+        except Exception as error:  # pragma: no cover - se informa abajo
+            errores.append(error)
+
+    hilos = [threading.Thread(target=rotar, args=(semilla,)) for semilla in range(3)]
+    sistema.iniciar_monitoreo()
+    for hilo in hilos:
+        hilo.start()
+    inicio = time.perf_counter()
+    try:
+        while time.perf_counter() - inicio < SEGUNDOS:
+            sistema.verificar_estadisticas()
+    finally:
+        activo.clear()
+        for hilo in hilos:
+            hilo.join()
+        sistema.detener_monitoreo()
+
+    assert not errores
+    sistema.verificar_estadisticas()
+    verificar_corrales(sistema)
+    assert len(sistema.animales) == len(animales)
+
+
+def test_transferencia_mueve_peso_y_enfermos():
+    sistema = FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+    animal = Animal(1, "Novillo", 300.0)
+    sistema.agregar_animal(animal, 1)
+    animal.salud = EstadoSalud.EN_TRATAMIENTO
+    origen = sistema.corrales[1]
+
+    destino = sistema.transferir_animal(1, 2)
+
+    assert animal._corral is destino and 1 not in origen
+    assert (origen.peso_total, origen.cantidad_enfermos) == (0.0, 0)
+    assert (destino.peso_total, destino.cantidad_enfermos) == (300.0, 1)
+    assert destino.animales_enfermos() == [animal]
+    assert sistema.ranking.mejores(5, numero_corral=2) == [animal]
+    assert sistema.ranking.mejores(5, numero_corral=1) == []
+    sistema.verificar_estadisticas()
+
+
+def test_transferencia_a_corral_lleno():
+    sistema = FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+    sistema.crear_corral(2, capacidad=1)
+    sistema.agregar_animal(Animal(1, "Toro", 500.0), 1)
+    sistema.agregar_animal(Animal(2, "Toro", 480.0), 2)
+
+    with pytest.raises(CorralLlenoException):
+        sistema.transferir_animal(1, 2)
+
+    assert 1 in sistema.corrales[1] and sistema.corral_por_animal[1] == 1
+    verificar_corrales(sistema)
+    sistema.verificar_estadisticas()
@@ -0,0 +1,89 @@
+"""
+Pruebas del motor de consultas: el mismo resultado con filtros
+vectorizados sobre el AlmacenRodeo (e índices) que evaluando animal por
+animal.
+"""
+
+import random
+
+import pytest
+
+from entidades.animal import Animal
+from entidades.rodeo import AlmacenRodeo
+from entidades.salud import EstadoSalud
+from servicios.consulta_service import ConsultaRodeo
+from servicios.feedlot_service import FeedlotSystem
+from servicios.reloj_service import Reloj
+
+pytestmark = pytest.mark.skipif(not AlmacenRodeo.disponible(), reason="requiere NumPy")
+
+TIPOS = ("Ternero", "Novillo", "Toro", "Vaquillona")
+RACIONES = ("Normal", "Intensiva", "Mantenimiento")
+ESTADOS = (EstadoSalud.SALUDABLE, EstadoSalud.BAJO_OBSERVACION, EstadoSalud.FIEBRE,
+           EstadoSalud.EN_TRATAMIENTO | EstadoSalud.HIPOTERMIA)
+
+# (filtros, campos de filas(), agrupamiento)
+CONSULTAS = [
+    ([("peso", "<", 300)], ("id", "peso", "tipo"), None),
+    ([("corral", "==", 2), ("peso", "<", 350)], ("id", "temperatura"), None),
+    ([("tipo", "==", "Novillo"), ("peso", ">=", 280)], ("id", "racion", "dias_en_feedlot"), None),
+    ([("ganancia", ">=", 5.0), ("racion", "en", ["Intensiva", "Mantenimiento"])], ("id",), "corral"),
+    ([("salud", "tiene", EstadoSalud.FIEBRE | EstadoSalud.HIPOTERMIA)], ("id", "salud"), "tipo"),
+    ([("temperatura", ">=", 39.5), ("peso", ">", 250), ("id", "<", 300)], ("id", "corral"), None),
+    ([], ("id",), "racion"),
+]
+
+
+@pytest.fixture(scope="module")
+def sistema():
+    """Rodeo con pesos, temperaturas, raciones y estados de salud al azar."""
+    generador = random.Random(11)
+    sistema = FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+    animales = [Animal(i + 1, TIPOS[i % len(TIPOS)], generador.uniform(150, 450))
+                for i in range(400)]
+    sistema.agregar_animales(animales, 40)
+    for animal in animales:
+        animal.actualizar_peso(generador.uniform(-2, 12))
+        animal.temperatura = round(generador.uniform(36.5, 40.5), 1)
+        animal.racion_actual = generador.choice(RACIONES)
+        animal.salud = generador.choice(ESTADOS)
+    assert sistema.almacen is not None and len(sistema.almacen) == len(animales)
+    return sistema
+
+
+def armar(consulta: ConsultaRodeo, filtros, campos, grupo) -> ConsultaRodeo:
+    for campo, operador, valor in filtros:
+        consulta.donde(campo, operador, valor)
+    consulta.seleccionar(*campos)
+    if grupo is not None:
+        consulta.agrupar_por(grupo).agregar(animales="cantidad", peso=("suma", "peso"),
+                                            temperatura=("maximo", "temperatura"))
+    return consulta
+
+
+def redondear(valor):
+    return round(valor, 6) if isinstance(valor, float) else valor
+
+
+@pytest.mark.parametrize("filtros,campos,grupo", CONSULTAS)
+def test_columnas_y_objetos_coinciden(sistema, filtros, campos, grupo):
+    vectorizada = armar(sistema.consultar(), filtros, campos, grupo)
+    por_objeto = armar(ConsultaRodeo(sistema.animales, sistema.corrales, reloj_sistema=sistema.reloj),
+                       filtros, campos, grupo)
+
+    ids = sorted(a.id for a in por_objeto.animales())
+    assert sorted(a.id for a in vectorizada.animales()) == ids
+    assert vectorizada.contar() == len(ids)
+    filas = sorted(tuple(redondear(v) for v in fila.values()) for fila in por_objeto.filas())
+    assert sorted(tuple(redondear(v) for v in fila.values()) for fila in vectorizada.filas()) == filas
+    if grupo is not None:
+        esperado = {clave: {nombre: redondear(valor) for nombre, valor in fila.items()}
+                    for clave, fila in por_objeto.agrupado().items()}
+        obtenido = {clave: {nombre: redondear(valor) for nombre, valor in fila.items()}
+                    for clave, fila in vectorizada.agrupado().items()}
+        assert obtenido == esperado
+
+
+def test_plan_vectorizado(sistema):
+    plan = sistema.consultar().donde("peso", "<", 300).explicar()
+    assert "vectorizado" in plan
@@ -0,0 +1,75 @@
+"""
+Pruebas del PlanificadorSensores al detenerlo y volver a iniciarlo.
+"""
+
+import threading
+import time
+
+from servicios.planificador_sensores import PlanificadorSensores
+
+
+class SensorDePrueba:
+    """Sensor mínimo: cuenta lecturas y, si se le pide, se traba en la primera."""
+
+    def __init__(self, intervalo: float = 0.01, traba: threading.Event = None):
+        self.intervalo = intervalo
+        self.activo = False
+        self.lecturas = 0
+        self.traba = traba
+        self.leyendo = threading.Event()
+
+    def realizar_lectura(self):
+        self.lecturas += 1
+        self.leyendo.set()
+        if self.traba is not None:
+            self.traba.wait()
+
+
+def esperar(condicion, segundos: float = 2.0) -> bool:
+    limite = time.monotonic() + segundos
+    while time.monotonic() < limite:
+        if condicion():
+            return True
+        time.sleep(0.01)
+    return condicion()
+
+
+def test_reinicio_con_un_trabajador_demorado():
+    planificador = PlanificadorSensores(num_trabajadores=2)
+    traba = threading.Event()
+    lento = SensorDePrueba(traba=traba)
+    planificador.registrar(lento)
+    planificador.iniciar()
+    try:
+        assert lento.leyendo.wait(2)
+        # Un trabajador sigue en la lectura trabada: no llega a tomar su aviso de fin
+        planificador.detener()
+
+        sensor = SensorDePrueba()
+        planificador.registrar(sensor)
+        planificador.iniciar()
+        traba.set()
+        # El aviso de fin de la corrida anterior no detiene a los trabajadores nuevos
+        time.sleep(0.2)
+        assert all(trabajador.is_alive() for trabajador in planificador._trabajadores)
+        assert esperar(lambda: sensor.lecturas >= 5)
+        assert lento.lecturas == 1
+    finally:
+        traba.set()
+        planificador.detener()
+
+
+def test_lecturas_por_segundo_de_la_ultima_corrida():
+    planificador = PlanificadorSensores(num_trabajadores=1)
+    assert planificador.lecturas_por_segundo() == 0.0
+    for _ in range(2):
+        sensor = SensorDePrueba()
+        planificador.registrar(sensor)
+        planificador.iniciar()
+        assert esperar(lambda: sensor.lecturas >= 3)
+        planificador.detener()
+        tasa = planificador.lecturas_por_segundo()
+        assert tasa > 0
+        # Detenido, la tasa no sigue bajando con el tiempo
+        time.sleep(0.05)
+        assert planificador.lecturas_por_segundo() == tasa
@@ -0,0 +1,108 @@
+"""
+Pruebas de ida y vuelta del histórico CSV: lo que exporta
+PersistenciaService.exportar_historico_animales, ReproductorHistorico lo
+reinyecta lectura por lectura.
+"""
+
+import csv
+
+import pytest
+
+from entidades.animal import Animal
+from servicios.feedlot_service import FeedlotSystem
+from servicios.persistencia_service import PersistenciaService
+from servicios.reloj_service import Reloj
+from servicios.replay_service import ReproductorHistorico, ENCABEZADOS
+
+# Lecturas de un animal: variaciones de peso en kg y temperaturas en °C,
+# con repeticiones (0 kg, 38.5 °C seguidos) que el histórico no debe perder
+VARIACIONES = [1.25, 0.0, 0.0, 0.8, 0.0]
+TEMPERATURAS = [38.5, 38.5, 39.8, 39.8, 38.5, 38.5]
+
+
+def nuevo_sistema() -> FeedlotSystem:
+    return FeedlotSystem.crear_independiente(reloj_propio=Reloj())
+
+
+@pytest.fixture
+def exportado(tmp_path, monkeypatch):
+    """Rodeo de dos animales con lecturas intercaladas, exportado a CSV."""
+    monkeypatch.chdir(tmp_path)
+    sistema = nuevo_sistema()
+    animales = [Animal(7, "Novillo", 310.0), Animal(8, "Toro", 452.5)]
+    for animal in animales:
+        sistema.agregar_animal(animal, 1)
+    for i, temperatura in enumerate(TEMPERATURAS):
+        for animal in animales:
+            animal.actualizar_temperatura(temperatura)
+            if i < len(VARIACIONES):
+                animal.actualizar_peso(VARIACIONES[i])
+    archivo = str(tmp_path / "historico.csv")
+    assert PersistenciaService().exportar_historico_animales(sistema, archivo)
+    return sistema, archivo
+
+
+def test_exporta_una_fila_por_lectura(exportado):
+    sistema, archivo = exportado
+    with open(archivo, newline='', encoding='utf-8') as f:
+        filas = list(csv.DictReader(f))
+    animal = sistema.animales[7]
+    propias = [fila for fila in filas if fila["Animal_ID"] == "7"]
+    pesos = [float(fila["Valor"]) for fila in propias if fila["Serie"] == "peso"]
+    temperaturas = [float(fila["Valor"]) for fila in propias if fila["Serie"] == "temperatura"]
+    assert pesos == pytest.approx(animal.historial_peso.valores())
+    assert temperaturas == pytest.approx(animal.historial_temperatura.valores())
+    assert [int(fila["Lectura"]) for fila in propias if fila["Serie"] == "peso"] == list(range(len(pesos)))
+    instantes = [float(fila["Instante"]) for fila in propias]
+    assert instantes[2:] == sorted(instantes[2:])
+
+
+def test_reproducir_reinyecta_cada_lectura(exportado):
+    original, archivo = exportado
+    sistema = nuevo_sistema()
+    reproductor = ReproductorHistorico(sistema, archivo)
+
+    stats = reproductor.reproducir()
+
+    assert stats["animales_creados"] == 2
+    assert stats["lecturas_reproducidas"] == 2 * (len(VARIACIONES) + len(TEMPERATURAS))
+    for id_animal, animal in original.animales.items():
+        copia = sistema.animales[id_animal]
+        assert copia.historial_peso.valores() == pytest.approx(animal.historial_peso.valores())
+        assert copia.historial_temperatura.valores() == pytest.approx(animal.historial_temperatura.valores())
+        assert copia.peso == pytest.approx(animal.peso)
+        assert copia.salud == animal.salud
+    sistema.verificar_estadisticas()
+
+
+def test_cargar_sensores_respeta_el_orden_grabado(exportado):
+    _, archivo = exportado
+    sistema = nuevo_sistema()
+
+    sensores = ReproductorHistorico(sistema, archivo).cargar_sensores()
+
+    assert len(sensores) == 2
+    sensor = next(s for s in sensores if s.animal.id == 7)
+    lecturas = [lectura[:2] for lectura in sensor.lecturas]
+    assert sum(1 for peso, _ in lecturas if peso is not None) == len(VARIACIONES)
+    assert [t for _, t in lecturas if t is not None] == TEMPERATURAS
+    # Cada lectura trae una sola serie
+    assert all((peso is None) != (temperatura is None) for peso, temperatura in lecturas)
+
+
+def test_reproduce_el_formato_anterior(tmp_path):
+    archivo = tmp_path / "historico_anterior.csv"
+    with open(archivo, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(ENCABEZADOS)
+        writer.writerows([[3, "Ternero", 0, 180.0, 38.5],
+                          [3, "Ternero", 1, 181.0, 38.5],
+                          [3, "Ternero", 2, 181.0, 40.1]])
+    sistema = nuevo_sistema()
+
+    stats = ReproductorHistorico(sistema, str(archivo)).reproducir()
+
+    animal = sistema.animales[3]
+    assert stats["lecturas_reproducidas"] == 2
+    assert animal.historial_peso.valores() == pytest.approx([180.0, 181.0, 181.0])
+    assert animal.historial_temperatura.valores() == pytest.approx([38.5, 38.5, 40.1])